@@ -0,0 +1,35 @@
+"""add_ai_usage_length_tracking
+
+Revision ID: a7c1e5d2f3b4
+Revises: defcab73f28d
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c1e5d2f3b4'
+down_revision: Union[str, None] = 'defcab73f28d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Add length convergence tracking columns to ai_usage table
+    with op.batch_alter_table('ai_usage', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('target_length', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('length_multiplier', sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column('raw_content_length', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('generation_attempts', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('ai_usage', schema=None) as batch_op:
+        batch_op.drop_column('generation_attempts')
+        batch_op.drop_column('raw_content_length')
+        batch_op.drop_column('length_multiplier')
+        batch_op.drop_column('target_length')
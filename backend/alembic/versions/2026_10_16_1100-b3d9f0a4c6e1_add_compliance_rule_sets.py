@@ -0,0 +1,33 @@
+"""add_compliance_rule_sets
+
+Revision ID: b3d9f0a4c6e1
+Revises: a7c1e5d2f3b4
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3d9f0a4c6e1'
+down_revision: Union[str, None] = 'a7c1e5d2f3b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Store forbidden words alongside medical law rules
+    with op.batch_alter_table('medical_law_rules', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('rule_set', sa.String(length=30), nullable=False, server_default='medical_law'))
+        batch_op.add_column(sa.Column('is_literal', sa.Boolean(), nullable=True))
+        batch_op.create_index(batch_op.f('ix_medical_law_rules_rule_set'), ['rule_set'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('medical_law_rules', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_medical_law_rules_rule_set'))
+        batch_op.drop_column('is_literal')
+        batch_op.drop_column('rule_set')
@@ -0,0 +1,61 @@
+"""add_hot_query_composite_indexes
+
+Revision ID: c4e8a1b7d2f5
+Revises: b3d9f0a4c6e1
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8a1b7d2f5'
+down_revision: Union[str, None] = 'b3d9f0a4c6e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, index name, columns) - matches the Index declarations on the models
+INDEXES = [
+    ('posts', 'ix_posts_user_id_created_at', ['user_id', 'created_at']),
+    ('post_analytics', 'ix_post_analytics_post_id', ['post_id']),
+    ('place_rankings', 'ix_place_rankings_keyword_id_checked_at', ['keyword_id', 'checked_at']),
+    ('conversion_events', 'ix_conversion_events_user_id_event_date_event_type', ['user_id', 'event_date', 'event_type']),
+    ('publish_schedules', 'ix_publish_schedules_status_next_execution_at', ['status', 'next_execution_at']),
+    ('publish_schedules', 'ix_publish_schedules_user_id_next_execution_at', ['user_id', 'next_execution_at']),
+    ('schedule_executions', 'ix_schedule_executions_schedule_id_executed_at', ['schedule_id', 'executed_at']),
+    ('performance_events', 'ix_performance_events_user_id_event_at', ['user_id', 'event_at']),
+    ('notification_logs', 'ix_notification_logs_user_id_created_at', ['user_id', 'created_at']),
+    ('knowledge_questions', 'ix_knowledge_questions_user_id_relevance_score', ['user_id', 'relevance_score']),
+    ('naver_blogs', 'ix_naver_blogs_user_id_lead_score', ['user_id', 'lead_score']),
+    ('blog_contacts', 'ix_blog_contacts_blog_id', ['blog_id']),
+    ('email_logs', 'ix_email_logs_user_id_sent_at', ['user_id', 'sent_at']),
+]
+
+
+def _existing_indexes():
+    # Most of these tables are created by create_all at startup rather than by
+    # migrations, so only touch tables that exist and skip indexes already built.
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+    return tables, {
+        table: {index['name'] for index in inspector.get_indexes(table)}
+        for table in tables
+    }
+
+
+def upgrade() -> None:
+    tables, existing = _existing_indexes()
+    for table, name, columns in INDEXES:
+        if table in tables and name not in existing[table]:
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    tables, existing = _existing_indexes()
+    for table, name, _ in reversed(INDEXES):
+        if table in tables and name in existing[table]:
+            op.drop_index(name, table_name=table)
@@ -0,0 +1,56 @@
+"""add_aggregated_pattern_running_totals
+
+Revision ID: d5f2b9c3e8a6
+Revises: c4e8a1b7d2f5
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5f2b9c3e8a6'
+down_revision: Union[str, None] = 'c4e8a1b7d2f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SUM_COLUMNS = [
+    'sum_title_length',
+    'sum_content_length',
+    'sum_image_count',
+    'sum_video_count',
+    'sum_heading_count',
+    'sum_paragraph_count',
+    'sum_keyword_count',
+    'sum_keyword_density',
+]
+
+COUNT_COLUMNS = [
+    'title_keyword_posts',
+    'map_posts',
+    'video_posts',
+    'position_front_posts',
+    'position_middle_posts',
+    'position_end_posts',
+]
+
+
+def upgrade() -> None:
+    # Running totals for incremental pattern updates.
+    # Existing rows keep NULLs and are rebuilt from top_post_analysis on their next update.
+    with op.batch_alter_table('aggregated_patterns', schema=None) as batch_op:
+        for name in SUM_COLUMNS:
+            batch_op.add_column(sa.Column(name, sa.Float(), nullable=True))
+        for name in COUNT_COLUMNS:
+            batch_op.add_column(sa.Column(name, sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('aggregated_patterns', schema=None) as batch_op:
+        for name in reversed(COUNT_COLUMNS):
+            batch_op.drop_column(name)
+        for name in reversed(SUM_COLUMNS):
+            batch_op.drop_column(name)
@@ -7,7 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import List, Optional
-from datetime import datetime
+from datetime import date, datetime
 from uuid import UUID
 from pydantic import BaseModel
 import anthropic
@@ -25,7 +25,13 @@ from app.db.database import get_db
 from app.schemas.user import UserResponse
 from app.schemas.admin import UserApprovalRequest, UserSubscriptionRequest
 from app.api.deps import get_current_user
-from app.models import User, APIKey
+from app.models import User, APIKey, MedicalLawRule
+from app.models.medical_law import ViolationSeverity
+from app.services.compliance_rules import (
+    compliance_rule_store, validate_pattern, RULE_SET_MEDICAL_LAW, RULE_SET_FORBIDDEN_WORDS,
+)
+from app.services.rollup_service import rollup_service
+from app.services.top_post_analyzer import rebuild_aggregated_patterns
 
 router = APIRouter()
 
@@ -462,3 +468,244 @@ async def get_all_api_keys_status(
             }
 
     return statuses
+
+
+# 의료법/금칙어 규칙 관련 스키마
+class ComplianceRuleRequest(BaseModel):
+    rule_set: str = "medical_law"  # medical_law, forbidden_words
+    category: str
+    pattern: str
+    is_literal: bool = False
+    severity: str = "medium"  # low, medium, high, critical
+    alternative_suggestion: Optional[str] = None
+    is_active: bool = True
+    description: Optional[str] = None
+
+
+class ComplianceRuleResponse(BaseModel):
+    id: str
+    rule_set: str
+    category: str
+    pattern: str
+    is_literal: bool
+    severity: str
+    alternative_suggestion: Optional[str]
+    is_active: bool
+    description: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+
+
+def _to_compliance_rule_response(rule: MedicalLawRule) -> ComplianceRuleResponse:
+    return ComplianceRuleResponse(
+        id=str(rule.id),
+        rule_set=rule.rule_set,
+        category=rule.category,
+        pattern=rule.pattern,
+        is_literal=bool(rule.is_literal),
+        severity=rule.severity.value if rule.severity else "medium",
+        alternative_suggestion=rule.alternative_suggestion,
+        is_active=bool(rule.is_active),
+        description=rule.description,
+        created_at=rule.created_at,
+        updated_at=rule.updated_at,
+    )
+
+
+def _validate_compliance_rule(request: ComplianceRuleRequest):
+    """규칙 세트/심각도/패턴 검증"""
+    if request.rule_set not in [RULE_SET_MEDICAL_LAW, RULE_SET_FORBIDDEN_WORDS]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="지원하지 않는 규칙 세트입니다. (medical_law, forbidden_words 중 선택)"
+        )
+    if request.severity not in [s.value for s in ViolationSeverity]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="지원하지 않는 심각도입니다. (low, medium, high, critical 중 선택)"
+        )
+    error = validate_pattern(request.pattern, request.is_literal)
+    if error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
+
+
+async def _commit_compliance_rules(db: AsyncSession):
+    """변경된 규칙으로 규칙 세트가 컴파일되는지 먼저 확인하고 커밋 (실패하면 롤백 후 400)"""
+    await db.flush()
+    error = await compliance_rule_store.validate_rules(db)
+    if error:
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
+    await db.commit()
+
+
+@router.get("/compliance-rules", response_model=List[ComplianceRuleResponse])
+async def get_compliance_rules(
+    rule_set: Optional[str] = Query(None, description="규칙 세트 필터 (medical_law, forbidden_words)"),
+    db: AsyncSession = Depends(get_db),
+    admin_user: User = Depends(get_current_admin_user)
+):
+    """
+    의료법/금칙어 규칙 목록 조회 (관리자 전용)
+    """
+    query = select(MedicalLawRule).order_by(MedicalLawRule.created_at)
+    if rule_set:
+        query = query.where(MedicalLawRule.rule_set == rule_set)
+    result = await db.execute(query)
+    return [_to_compliance_rule_response(rule) for rule in result.scalars().all()]
+
+
+@router.post("/compliance-rules", response_model=ComplianceRuleResponse)
+async def create_compliance_rule(
+    request: ComplianceRuleRequest,
+    db: AsyncSession = Depends(get_db),
+    admin_user: User = Depends(get_current_admin_user)
+):
+    """
+    의료법/금칙어 규칙 추가 (관리자 전용)
+    - 저장 즉시 새 규칙 세트로 교체됩니다
+    """
+    _validate_compliance_rule(request)
+
+    import uuid
+    rule = MedicalLawRule(
+        id=uuid.uuid4(),
+        rule_set=request.rule_set,
+        category=request.category,
+        pattern=request.pattern,
+        is_literal=request.is_literal,
+        severity=ViolationSeverity(request.severity),
+        alternative_suggestion=request.alternative_suggestion,
+        is_active=request.is_active,
+        description=request.description,
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow()
+    )
+    db.add(rule)
+    await _commit_compliance_rules(db)
+    await db.refresh(rule)
+
+    await compliance_rule_store.reload()
+    return _to_compliance_rule_response(rule)
+
+
+@router.put("/compliance-rules/{rule_id}", response_model=ComplianceRuleResponse)
+async def update_compliance_rule(
+    rule_id: UUID,
+    request: ComplianceRuleRequest,
+    db: AsyncSession = Depends(get_db),
+    admin_user: User = Depends(get_current_admin_user)
+):
+    """
+    의료법/금칙어 규칙 수정 (관리자 전용)
+    - 저장 즉시 새 규칙 세트로 교체됩니다
+    """
+    _validate_compliance_rule(request)
+
+    result = await db.execute(select(MedicalLawRule).where(MedicalLawRule.id == rule_id))
+    rule = result.scalar_one_or_none()
+    if not rule:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="규칙을 찾을 수 없습니다"
+        )
+
+    rule.rule_set = request.rule_set
+    rule.category = request.category
+    rule.pattern = request.pattern
+    rule.is_literal = request.is_literal
+    rule.severity = ViolationSeverity(request.severity)
+    rule.alternative_suggestion = request.alternative_suggestion
+    rule.is_active = request.is_active
+    rule.description = request.description
+    rule.updated_at = datetime.utcnow()
+    await _commit_compliance_rules(db)
+    await db.refresh(rule)
+
+    await compliance_rule_store.reload()
+    return _to_compliance_rule_response(rule)
+
+
+@router.delete("/compliance-rules/{rule_id}")
+async def delete_compliance_rule(
+    rule_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    admin_user: User = Depends(get_current_admin_user)
+):
+    """
+    의료법/금칙어 규칙 삭제 (관리자 전용)
+    """
+    result = await db.execute(select(MedicalLawRule).where(MedicalLawRule.id == rule_id))
+    rule = result.scalar_one_or_none()
+    if not rule:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="규칙을 찾을 수 없습니다"
+        )
+
+    await db.delete(rule)
+    await db.commit()
+
+    rule_set = await compliance_rule_store.reload()
+    return {"message": "규칙이 삭제되었습니다", "version": rule_set.version}
+
+
+@router.get("/compliance-rules/status")
+async def get_compliance_rules_status(
+    admin_user: User = Depends(get_current_admin_user)
+):
+    """
+    현재 적용 중인 규칙 세트 버전/규칙 수 조회 (관리자 전용)
+    """
+    return compliance_rule_store.current.summary()
+
+
+@router.post("/compliance-rules/reload")
+async def reload_compliance_rules(
+    admin_user: User = Depends(get_current_admin_user)
+):
+    """
+    DB에서 규칙을 다시 읽어 규칙 세트 교체 (관리자 전용)
+    """
+    rule_set = await compliance_rule_store.reload()
+    return rule_set.summary()
+
+
+# ==================== 일별 집계 ====================
+
+@router.post("/rollups/rebuild")
+async def rebuild_rollups(
+    start_date: Optional[date] = Query(None, description="YYYY-MM-DD (없으면 전체 기간)"),
+    end_date: Optional[date] = Query(None, description="YYYY-MM-DD"),
+    db: AsyncSession = Depends(get_db),
+    admin_user: User = Depends(get_current_admin_user)
+):
+    """
+    원본 이벤트로 대시보드 일별 집계를 다시 계산 (관리자 전용)
+
+    ROI 전환 이벤트, 플레이스 리뷰, 바이럴 성과 이벤트의 집계 테이블을 기간 단위로 교체합니다.
+    """
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="시작일이 종료일보다 늦습니다."
+        )
+    rebuilt = await rollup_service.rebuild_all(db, start_date=start_date, end_date=end_date)
+    return {"rebuilt_rows": rebuilt}
+
+
+@router.post("/patterns/rebuild")
+async def rebuild_patterns(
+    category: Optional[str] = Query(None, description="카테고리 (없으면 전체)"),
+    db: AsyncSession = Depends(get_db),
+    admin_user: User = Depends(get_current_admin_user)
+):
+    """
+    상위글 분석 결과로 카테고리별 패턴 집계를 다시 계산 (관리자 전용)
+
+    평소에는 분석 결과 저장 시 증분 갱신되므로, 원본을 직접 수정/삭제한 뒤 누적값을 맞출 때 사용합니다.
+    """
+    rebuilt = await db.run_sync(
+        lambda s: rebuild_aggregated_patterns(s, [category] if category else None)
+    )
+    return {"rebuilt_categories": rebuilt}
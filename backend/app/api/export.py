@@ -3,14 +3,17 @@ Export API
 블로그 복붙용 문서 다운로드 API
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Response, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, BinaryIO
 from pydantic import BaseModel
 from uuid import UUID
+import asyncio
 import os
 import tempfile
 import shutil
+import urllib.parse
 
 from app.db.database import get_db
 from app.api.deps import get_current_user_optional
@@ -23,6 +26,47 @@ from app.services.ai_service import AIService
 
 router = APIRouter()
 
+DOCX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _iter_file(file: BinaryIO):
+    """내보내기 결과 파일을 청크 단위로 읽고, 전송이 끝나면(중단돼도) 닫기"""
+    try:
+        while chunk := file.read(STREAM_CHUNK_SIZE):
+            yield chunk
+    finally:
+        file.close()
+
+
+def _docx_response(docx_file: BinaryIO, filename: str) -> StreamingResponse:
+    """DOCX 파일 스트리밍 응답 (전체를 bytes로 복사하지 않음)"""
+    size = docx_file.seek(0, os.SEEK_END)
+    docx_file.seek(0)
+
+    # URL 인코딩된 파일명 생성 (한글 지원)
+    filename_encoded = urllib.parse.quote(filename)
+
+    return StreamingResponse(
+        _iter_file(docx_file),
+        media_type=DOCX_MEDIA_TYPE,
+        headers={
+            # RFC 5987: filename*=UTF-8''encoded_filename
+            "Content-Disposition": f"attachment; filename*=UTF-8''{filename_encoded}",
+            "Content-Length": str(size),
+        }
+    )
+
+
+def _save_uploads(temp_dir: str, images: List[UploadFile], log: bool = False):
+    """업로드된 이미지를 임시 폴더에 저장 (동기 - asyncio.to_thread로 실행)"""
+    for i, upload_file in enumerate(images):
+        file_path = os.path.join(temp_dir, upload_file.filename)
+        if log:
+            print(f"💾 이미지 저장 중 ({i+1}/{len(images)}): {upload_file.filename}")
+        with open(file_path, "wb") as f:
+            shutil.copyfileobj(upload_file.file, f)
+
 
 class ExportRequest(BaseModel):
     """문서 내보내기 요청"""
@@ -55,8 +99,8 @@ async def export_to_docx(
     - ✅ 100% 완벽한 스타일 재현
     """
     try:
-        # DOCX 파일 생성
-        docx_file = blog_exporter.export_to_docx(
+        # DOCX 파일 생성 (이미지 변환/문서 조립은 작업 스레드에서)
+        docx_file = await blog_exporter.export_to_docx_async(
             content=request.content,
             title=request.title,
             images=request.images,
@@ -65,23 +109,11 @@ async def export_to_docx(
         )
 
         # 파일명 생성 (한글 파일명 URL 인코딩 - RFC 5987)
-        import urllib.parse
-
         filename = f"{request.title or 'blog_post'}.docx"
         filename = filename.replace(' ', '_').replace('/', '_')
 
-        # URL 인코딩된 파일명 생성 (한글 지원)
-        filename_encoded = urllib.parse.quote(filename)
-
         # 응답 반환
-        return Response(
-            content=docx_file.getvalue(),
-            media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            headers={
-                # RFC 5987: filename*=UTF-8''encoded_filename
-                "Content-Disposition": f"attachment; filename*=UTF-8''{filename_encoded}"
-            }
-        )
+        return _docx_response(docx_file, filename)
 
     except Exception as e:
         import traceback
@@ -112,7 +144,7 @@ async def export_to_html(
     - 워드 문서(.docx) 방식 추천
     """
     try:
-        html_content = blog_exporter.export_to_naver_html(
+        html_content = await blog_exporter.export_to_naver_html_async(
             content=request.content,
             title=request.title,
             keywords=request.keywords,
@@ -153,7 +185,7 @@ async def auto_export_with_ai_analysis(
         keywords, emphasis_phrases = await _extract_with_ai(content, title)
 
         # DOCX 생성
-        docx_file = blog_exporter.export_to_docx(
+        docx_file = await blog_exporter.export_to_docx_async(
             content=content,
             title=title,
             keywords=keywords,
@@ -161,22 +193,10 @@ async def auto_export_with_ai_analysis(
         )
 
         # 파일명 생성 (한글 파일명 URL 인코딩)
-        import urllib.parse
-
         filename = f"{title or 'blog_post'}_auto.docx"
         filename = filename.replace(' ', '_')
 
-        # URL 인코딩된 파일명 생성 (한글 지원)
-        filename_encoded = urllib.parse.quote(filename)
-
-        return Response(
-            content=docx_file.getvalue(),
-            media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            headers={
-                # RFC 5987: filename*=UTF-8''encoded_filename
-                "Content-Disposition": f"attachment; filename*=UTF-8''{filename_encoded}"
-            }
-        )
+        return _docx_response(docx_file, filename)
 
     except Exception as e:
         raise HTTPException(
@@ -223,7 +243,8 @@ async def _extract_with_ai(content: str, title: Optional[str] = "") -> tuple:
             prompt=prompt,
             max_tokens=500,
             temperature=0.3,
-            system_prompt=system_prompt
+            system_prompt=system_prompt,
+            use_cache=True  # 같은 본문이면 같은 키워드 (내보낼 때마다 재호출하지 않음)
         )
 
         # JSON 파싱 시도
@@ -329,15 +350,12 @@ async def export_with_image_folder(
         print(f"📁 임시 폴더 생성: {temp_dir}")
 
         # 업로드된 이미지 저장
-        for i, upload_file in enumerate(images):
-            file_path = os.path.join(temp_dir, upload_file.filename)
-            print(f"💾 이미지 저장 중 ({i+1}/{len(images)}): {upload_file.filename}")
-            with open(file_path, "wb") as f:
-                shutil.copyfileobj(upload_file.file, f)
+        await asyncio.to_thread(_save_uploads, temp_dir, images, True)
 
         print(f"🖼️ 이미지 자동 배치 시작...")
         # 이미지 자동 배치
-        positioned_images = image_analyzer.prepare_images_for_export(
+        positioned_images = await asyncio.to_thread(
+            image_analyzer.prepare_images_for_export,
             folder_path=temp_dir,
             content=content,
             strategy=distribution_strategy,
@@ -347,7 +365,7 @@ async def export_with_image_folder(
 
         print(f"📄 DOCX 생성 시작...")
         # DOCX 생성
-        docx_file = blog_exporter.export_to_docx(
+        docx_file = await blog_exporter.export_to_docx_async(
             content=content,
             title=title,
             keywords=keywords_list,
@@ -357,22 +375,11 @@ async def export_with_image_folder(
         print(f"✅ DOCX 생성 완료")
 
         # 파일명 생성 (한글 파일명 URL 인코딩)
-        import urllib.parse
-
         filename = f"{title or 'blog_post'}_with_images.docx"
         filename = filename.replace(' ', '_').replace('/', '_')
 
-        # URL 인코딩된 파일명 생성 (한글 지원)
-        filename_encoded = urllib.parse.quote(filename)
-
-        return Response(
-            content=docx_file.getvalue(),
-            media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            headers={
-                # RFC 5987: filename*=UTF-8''encoded_filename
-                "Content-Disposition": f"attachment; filename*=UTF-8''{filename_encoded}"
-            }
-        )
+        # 이미지는 문서에 이미 포함되어 있으므로 임시 폴더는 아래 finally에서 바로 정리
+        return _docx_response(docx_file, filename)
 
     except Exception as e:
         error_trace = traceback.format_exc()
@@ -405,13 +412,10 @@ async def analyze_image_folder(
         temp_dir = tempfile.mkdtemp(dir='/data')
 
         # 업로드된 이미지 저장
-        for upload_file in images:
-            file_path = os.path.join(temp_dir, upload_file.filename)
-            with open(file_path, "wb") as f:
-                shutil.copyfileobj(upload_file.file, f)
+        await asyncio.to_thread(_save_uploads, temp_dir, images)
 
         # 이미지 스캔
-        scanned_images = image_analyzer.scan_folder(temp_dir)
+        scanned_images = await asyncio.to_thread(image_analyzer.scan_folder, temp_dir)
 
         return {
             "total": len(scanned_images),
@@ -519,9 +523,8 @@ async def export_docx_with_auto_images(
 
         # 2. 이미지 다운로드
         temp_dir = tempfile.mkdtemp(dir='/data')
-        downloaded_images = []
 
-        for i, img_data in enumerate(images_data):
+        async def download(i: int, img_data: Dict):
             try:
                 # 이미지 다운로드
                 img_bytes = await image_search_service.download_image(img_data["url"])
@@ -531,19 +534,17 @@ async def export_docx_with_auto_images(
                 with open(img_path, "wb") as f:
                     f.write(img_bytes)
 
-                downloaded_images.append({
-                    "path": img_path,
-                    "caption": img_data.get("caption", ""),
-                })
-
                 print(f"📥 이미지 {i + 1} 다운로드 완료")
 
             except Exception as e:
                 print(f"⚠️ 이미지 {i + 1} 다운로드 실패: {e}")
-                continue
+
+        # 이미지를 동시에 다운로드
+        await asyncio.gather(*(download(i, img_data) for i, img_data in enumerate(images_data)))
 
         # 3. 이미지를 콘텐츠에 자동 배치
-        positioned_images = image_analyzer.prepare_images_for_export(
+        positioned_images = await asyncio.to_thread(
+            image_analyzer.prepare_images_for_export,
             folder_path=temp_dir,
             content=request.content,
             strategy="paragraphs",  # 문단 사이에 배치
@@ -553,7 +554,7 @@ async def export_docx_with_auto_images(
         print(f"📍 이미지 배치 완료: {len(positioned_images)}개")
 
         # 4. DOCX 생성
-        docx_file = blog_exporter.export_to_docx(
+        docx_file = await blog_exporter.export_to_docx_async(
             content=request.content,
             title=request.title,
             keywords=request.keywords,
@@ -562,20 +563,12 @@ async def export_docx_with_auto_images(
         )
 
         # 5. 파일명 생성
-        import urllib.parse
         filename = f"{request.title or 'blog_post'}_auto_images.docx"
         filename = filename.replace(' ', '_').replace('/', '_')
-        filename_encoded = urllib.parse.quote(filename)
 
         print(f"✅ DOCX 생성 완료: {filename}")
 
-        return Response(
-            content=docx_file.getvalue(),
-            media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            headers={
-                "Content-Disposition": f"attachment; filename*=UTF-8''{filename_encoded}"
-            }
-        )
+        return _docx_response(docx_file, filename)
 
     except Exception as e:
         import traceback
@@ -3,18 +3,21 @@ Images API Router
 imgBB를 통한 이미지 업로드
 """
 
-import os
-import base64
-import httpx
-from typing import List
-from fastapi import APIRouter, HTTPException, status, UploadFile, File, Form
+import asyncio
+from typing import List, Optional
+from fastapi import APIRouter, HTTPException, status, UploadFile, File, Query
 from pydantic import BaseModel
 
+from app.services.image_upload_service import (
+    image_uploader,
+    ImageUploadError,
+    ImageTooLargeError,
+    InvalidImageError,
+)
+
 router = APIRouter()
 
-# imgBB API 키 (환경변수에서 가져오기)
-IMGBB_API_KEY = os.getenv("IMGBB_API_KEY", "")
-IMGBB_UPLOAD_URL = "https://api.imgbb.com/1/upload"
+MAX_UPLOAD_FILES = 10
 
 
 class ImageUploadResponse(BaseModel):
@@ -35,169 +38,105 @@ class MultiImageUploadResponse(BaseModel):
     failed: int = 0
 
 
-@router.post("/upload", response_model=ImageUploadResponse)
-async def upload_image(file: UploadFile = File(...)):
-    """
-    이미지 파일을 imgBB에 업로드
+def _to_response(data: dict) -> ImageUploadResponse:
+    return ImageUploadResponse(
+        success=True,
+        url=data["url"],
+        delete_url=data.get("delete_url"),
+        thumbnail=data.get("thumb", {}).get("url")
+    )
 
-    - 지원 형식: JPG, PNG, GIF, WEBP
-    - 최대 크기: 32MB
-    """
-    if not IMGBB_API_KEY:
+
+def _require_api_key():
+    if not image_uploader.configured:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="imgBB API 키가 설정되지 않았습니다"
         )
 
-    # 파일 읽기 및 base64 인코딩
-    content = await file.read()
-    base64_image = base64.b64encode(content).decode('utf-8')
-
-    # imgBB API 호출
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            IMGBB_UPLOAD_URL,
-            data={
-                "key": IMGBB_API_KEY,
-                "image": base64_image,
-                "name": file.filename or "image"
-            },
-            timeout=30.0
-        )
 
-    if response.status_code != 200:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"imgBB 업로드 실패: {response.text}"
-        )
+def _upload_error(e: ImageUploadError) -> HTTPException:
+    if isinstance(e, ImageTooLargeError):
+        return HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e))
+    if isinstance(e, InvalidImageError):
+        return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
-    result = response.json()
 
-    if not result.get("success"):
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"imgBB 업로드 실패: {result.get('error', {}).get('message', 'Unknown error')}"
-        )
+@router.post("/upload", response_model=ImageUploadResponse)
+async def upload_image(
+    file: UploadFile = File(...),
+    max_width: Optional[int] = Query(None, ge=1, description="이 너비보다 크면 업로드 전에 축소"),
+):
+    """
+    이미지 파일을 imgBB에 업로드
 
-    data = result["data"]
+    - 지원 형식: JPG, PNG, GIF, WEBP
+    - 최대 크기: 32MB
+    - max_width: 지정하면 더 넓은 이미지를 비율 유지하며 축소 후 업로드
+    """
+    _require_api_key()
 
-    return ImageUploadResponse(
-        success=True,
-        url=data["url"],
-        delete_url=data.get("delete_url"),
-        thumbnail=data.get("thumb", {}).get("url")
-    )
+    try:
+        data = await image_uploader.upload_file(file.file, file.filename or "image", max_width)
+    except ImageUploadError as e:
+        raise _upload_error(e)
+
+    return _to_response(data)
 
 
 @router.post("/upload-base64", response_model=ImageUploadResponse)
-async def upload_base64_image(request: Base64ImageRequest):
+async def upload_base64_image(
+    request: Base64ImageRequest,
+    max_width: Optional[int] = Query(None, ge=1, description="이 너비보다 크면 업로드 전에 축소"),
+):
     """
     Base64 인코딩된 이미지를 imgBB에 업로드
 
     - image: base64 문자열 (data:image/png;base64,... 형식 또는 순수 base64)
     - name: 파일명 (선택)
     """
-    if not IMGBB_API_KEY:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="imgBB API 키가 설정되지 않았습니다"
-        )
-
-    # data:image/xxx;base64, 접두사 제거
-    image_data = request.image
-    if "," in image_data:
-        image_data = image_data.split(",")[1]
-
-    # imgBB API 호출
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            IMGBB_UPLOAD_URL,
-            data={
-                "key": IMGBB_API_KEY,
-                "image": image_data,
-                "name": request.name or "image"
-            },
-            timeout=30.0
-        )
-
-    if response.status_code != 200:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"imgBB 업로드 실패: {response.text}"
-        )
+    _require_api_key()
 
-    result = response.json()
+    try:
+        data = await image_uploader.upload_base64(request.image, request.name or "image", max_width)
+    except ImageUploadError as e:
+        raise _upload_error(e)
 
-    if not result.get("success"):
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"imgBB 업로드 실패: {result.get('error', {}).get('message', 'Unknown error')}"
-        )
-
-    data = result["data"]
-
-    return ImageUploadResponse(
-        success=True,
-        url=data["url"],
-        delete_url=data.get("delete_url"),
-        thumbnail=data.get("thumb", {}).get("url")
-    )
+    return _to_response(data)
 
 
 @router.post("/upload-multiple", response_model=MultiImageUploadResponse)
-async def upload_multiple_images(files: List[UploadFile] = File(...)):
+async def upload_multiple_images(
+    files: List[UploadFile] = File(...),
+    max_width: Optional[int] = Query(None, ge=1, description="이 너비보다 크면 업로드 전에 축소"),
+):
     """
     여러 이미지를 한 번에 업로드
 
-    - 최대 10개까지 동시 업로드
+    - 최대 10개까지 동시 업로드 (서버 전체 동시 업로드 수는 IMAGE_UPLOAD_CONCURRENCY로 제한)
     """
-    if not IMGBB_API_KEY:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="imgBB API 키가 설정되지 않았습니다"
-        )
+    _require_api_key()
 
-    if len(files) > 10:
+    if len(files) > MAX_UPLOAD_FILES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="최대 10개까지 업로드 가능합니다"
+            detail=f"최대 {MAX_UPLOAD_FILES}개까지 업로드 가능합니다"
         )
 
+    outcomes = await asyncio.gather(
+        *(image_uploader.upload_file(file.file, file.filename or "image", max_width) for file in files),
+        return_exceptions=True,
+    )
+
     results = []
     failed = 0
-
-    async with httpx.AsyncClient() as client:
-        for file in files:
-            try:
-                content = await file.read()
-                base64_image = base64.b64encode(content).decode('utf-8')
-
-                response = await client.post(
-                    IMGBB_UPLOAD_URL,
-                    data={
-                        "key": IMGBB_API_KEY,
-                        "image": base64_image,
-                        "name": file.filename or "image"
-                    },
-                    timeout=30.0
-                )
-
-                if response.status_code == 200:
-                    result = response.json()
-                    if result.get("success"):
-                        data = result["data"]
-                        results.append(ImageUploadResponse(
-                            success=True,
-                            url=data["url"],
-                            delete_url=data.get("delete_url"),
-                            thumbnail=data.get("thumb", {}).get("url")
-                        ))
-                        continue
-
-                failed += 1
-            except Exception as e:
-                print(f"Image upload failed: {e}")
-                failed += 1
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            print(f"Image upload failed: {outcome}")
+            failed += 1
+        else:
+            results.append(_to_response(outcome))
 
     return MultiImageUploadResponse(
         success=len(results) > 0,
@@ -212,6 +151,6 @@ async def get_imgbb_status():
     imgBB API 연결 상태 확인
     """
     return {
-        "configured": bool(IMGBB_API_KEY),
-        "api_key_preview": f"{IMGBB_API_KEY[:8]}..." if IMGBB_API_KEY else None
+        "configured": image_uploader.configured,
+        "api_key_preview": f"{image_uploader.api_key[:8]}..." if image_uploader.configured else None
     }
@@ -7,9 +7,14 @@ from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 import asyncio
+import base64
+import json
+import time
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc, and_, or_
+from sqlalchemy import select, desc, and_, or_, func
+from sqlalchemy.orm import load_only
 from sqlalchemy.exc import OperationalError
 
 from app.db.database import get_db
@@ -17,12 +22,16 @@ from app.schemas.post import (
     PostCreate,
     PostResponse,
     PostListResponse,
+    PostSummaryResponse,
     PostUpdate,
     RewriteRequest,
+    BatchScoreRequest,
 )
 from app.models import User, Post, PostVersion
 from app.api.deps import get_current_user
 from app.services.post_service import post_service
+from app.services.batch_scoring_service import batch_scoring_service, CHECKS
+from app.services.post_search import post_search_index
 from app.api.websocket import get_connection_manager
 
 router = APIRouter()
@@ -58,6 +67,10 @@ async def create_post(
       - STORY: 스토리텔링 구조
       - QA: Q&A 형식
     - **target_length**: 목표 글자 수 500-5000 (기본값: 1500)
+    - **extras_mode**: 제목/소제목/DIA·CRANK 생성 방식 (기본값: separate)
+      - separate: 항목별 개별 AI 호출
+      - combined: 한 번의 구조화(JSON) 호출, 누락 항목만 개별 호출로 보완
+    - **stream**: true면 각색 본문을 WebSocket `delta` 메시지로 실시간 전송 (기본값: false)
     """
     # 재시도 로직 (최대 3회)
     max_retries = 3
@@ -91,6 +104,8 @@ async def create_post(
                 ai_model=post_data.ai_model,
                 seo_optimization=seo_optimization_dict,
                 top_post_rules=top_post_rules_dict,
+                extras_mode=post_data.extras_mode,
+                stream=post_data.stream,
                 websocket_manager=ws_manager,
             )
 
@@ -140,10 +155,105 @@ async def create_post(
         )
 
 
+# 목록 요약 보기에서 읽는 컬럼 (본문/분석 JSON 등 큰 컬럼은 읽지 않음)
+SUMMARY_COLUMNS = (
+    Post.id,
+    Post.user_id,
+    Post.title,
+    Post.persuasion_score,
+    Post.status,
+    Post.is_favorited,
+    Post.published_at,
+    Post.created_at,
+    Post.updated_at,
+)
+
+
+def _encode_cursor(post: Post) -> str:
+    raw = f"{post.created_at.isoformat()}|{post.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str):
+    try:
+        created_at, post_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(post_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="잘못된 커서입니다"
+        )
+
+
+async def _paginate_posts(
+    db: AsyncSession,
+    query,
+    page: int,
+    page_size: int,
+    cursor: Optional[str],
+    summary: bool,
+    rank=None,
+) -> PostListResponse:
+    """
+    포스팅 목록 페이지네이션 공통 처리
+
+    - 전체 개수: id만 뽑은 서브쿼리에 COUNT(*) (행 전체를 읽지 않음)
+    - summary=True: 목록 화면용 컬럼만 로드
+    - cursor가 주어지면 (created_at, id) 키셋 페이지네이션, 아니면 OFFSET 페이지네이션
+    - rank: 관련도 정렬식 (오름차순, OFFSET 모드에서만 적용)
+    """
+    count_query = select(func.count()).select_from(
+        query.with_only_columns(Post.id).order_by(None).subquery()
+    )
+    total = (await db.execute(count_query)).scalar_one()
+
+    if summary:
+        query = query.options(load_only(*SUMMARY_COLUMNS))
+    if rank is not None and cursor is None:
+        query = query.order_by(rank, desc(Post.created_at), desc(Post.id))
+    else:
+        query = query.order_by(desc(Post.created_at), desc(Post.id))
+
+    next_cursor = None
+    if cursor is not None:
+        # 빈 커서는 첫 페이지
+        if cursor:
+            created_at, post_id = _decode_cursor(cursor)
+            query = query.where(
+                or_(
+                    Post.created_at < created_at,
+                    and_(Post.created_at == created_at, Post.id < post_id),
+                )
+            )
+        # 한 건 더 읽어 다음 페이지 존재 여부 판단
+        posts = (await db.execute(query.limit(page_size + 1))).scalars().all()
+        if len(posts) > page_size:
+            posts = posts[:page_size]
+            next_cursor = _encode_cursor(posts[-1])
+    else:
+        offset = (page - 1) * page_size
+        posts = (await db.execute(query.offset(offset).limit(page_size))).scalars().all()
+
+    if summary:
+        posts = [PostSummaryResponse.model_validate(post) for post in posts]
+
+    total_pages = (total + page_size - 1) // page_size if total > 0 else 1
+
+    return PostListResponse(
+        posts=posts,
+        total=total,
+        page=page,
+        page_size=page_size,
+        total_pages=total_pages,
+        next_cursor=next_cursor,
+    )
+
+
 @router.get("/", response_model=PostListResponse)
 async def get_posts(
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=50),
+    cursor: Optional[str] = Query(None, description="커서 페이지네이션 (첫 페이지는 빈 값, 이후 next_cursor)"),
+    summary: bool = Query(False, description="목록용 요약 보기 (본문/분석 결과 제외)"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -153,45 +263,79 @@ async def get_posts(
     **Parameters:**
     - **page**: 페이지 번호 (기본값: 1)
     - **page_size**: 페이지당 항목 수 (기본값: 10, 최대: 50)
+    - **cursor**: 지정하면 page 대신 커서 기반으로 조회 (응답의 next_cursor를 다음 요청에 전달)
+    - **summary**: true면 본문/분석 결과 없이 목록 표시용 필드만 반환
     """
     # 로그인 불필요 버전: 모든 포스트 조회
     user_id = current_user.id if current_user else None
 
-    # 전체 개수 조회
+    query = select(Post)
     if user_id:
-        count_result = await db.execute(
-            select(Post).where(Post.user_id == user_id)
-        )
-    else:
-        count_result = await db.execute(select(Post))
-    total = len(count_result.scalars().all())
+        query = query.where(Post.user_id == user_id)
 
-    # 페이지네이션 적용
-    offset = (page - 1) * page_size
+    return await _paginate_posts(db, query, page, page_size, cursor, summary)
 
-    if user_id:
-        result = await db.execute(
-            select(Post)
-            .where(Post.user_id == user_id)
-            .order_by(desc(Post.created_at))
-            .offset(offset)
-            .limit(page_size)
-        )
-    else:
-        result = await db.execute(
-            select(Post)
-            .order_by(desc(Post.created_at))
-            .offset(offset)
-            .limit(page_size)
-        )
 
-    posts = result.scalars().all()
+@router.post("/batch-score")
+async def batch_score(
+    request: BatchScoreRequest,
+    current_user: User = Depends(get_current_user),
+):
+    """
+    대량 의료법/금칙어 검사 및 점수 계산 (NDJSON 스트리밍)
 
-    total_pages = (total + page_size - 1) // page_size
+    - items로 텍스트를 직접 보내거나, post_ids/all_posts로 저장된 포스팅을 재검사
+    - 한 줄에 결과 하나씩 끝나는 순서대로 전달 (index/id로 매칭), 마지막 줄은 {"done": true, ...} 요약
+    - save=True이면 포스팅의 의료법 검사 결과/설득력 점수/콘텐츠 분석을 갱신
+    """
+    unknown = [check for check in request.checks if check not in CHECKS]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"알 수 없는 검사 항목: {', '.join(unknown)} (가능: {', '.join(CHECKS)})",
+        )
 
-    return PostListResponse(
-        posts=posts, total=total, page=page, page_size=page_size, total_pages=total_pages
-    )
+    from_posts = bool(request.post_ids) or request.all_posts
+    if not from_posts and not request.items:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="items 또는 post_ids/all_posts 중 하나를 지정해주세요",
+        )
+
+    if from_posts:
+        # 관리자가 all_posts로 요청하면 전체 사용자 포스팅 재검사 (규칙 변경 후 일괄 재채점)
+        owner_id = None if (current_user.is_admin and request.all_posts) else current_user.id
+        items = batch_scoring_service.iter_posts(owner_id, request.post_ids)
+    else:
+        items = [item.model_dump() for item in request.items]
+    save = request.save and from_posts
+
+    async def generate():
+        started_at = time.perf_counter()
+        total = errors = saved = 0
+        unsaved = []
+        async for result in batch_scoring_service.stream(items, request.checks):
+            total += 1
+            if "error" in result:
+                errors += 1
+            if save:
+                unsaved.append(result)
+                if len(unsaved) >= 500:
+                    saved += await batch_scoring_service.save_results(unsaved)
+                    unsaved = []
+            yield json.dumps(result, ensure_ascii=False, default=str) + "\n"
+        if unsaved:
+            saved += await batch_scoring_service.save_results(unsaved)
+        summary = {
+            "done": True,
+            "total": total,
+            "errors": errors,
+            "saved": saved,
+            "elapsed_seconds": round(time.perf_counter() - started_at, 2),
+        }
+        yield json.dumps(summary, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @router.get("/search", response_model=PostListResponse)
@@ -206,6 +350,10 @@ async def search_posts(
     date_to: Optional[str] = Query(None, description="종료 날짜 (YYYY-MM-DD)"),
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=50),
+    cursor: Optional[str] = Query(None, description="커서 페이지네이션 (첫 페이지는 빈 값, 이후 next_cursor)"),
+    summary: bool = Query(False, description="목록용 요약 보기 (본문/분석 결과 제외)"),
+    sort: str = Query("recent", pattern="^(recent|relevance)$", description="정렬 (recent: 최신순, relevance: 관련도순)"),
+    highlight: bool = Query(False, description="검색어 주변 본문 발췌 포함"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -221,20 +369,14 @@ async def search_posts(
     - **max_score**: 최대 설득력 점수
     - **date_from**: 시작 날짜
     - **date_to**: 종료 날짜
+    - **cursor**: 지정하면 page 대신 커서 기반으로 조회
+    - **summary**: true면 목록 표시용 필드만 반환
+    - **sort**: relevance면 검색어 관련도순 (커서 모드에서는 최신순)
+    - **highlight**: true면 snippets에 포스팅별 검색어 강조 발췌(<mark>) 포함
     """
     # Build query conditions
     conditions = [Post.user_id == current_user.id]
 
-    if q:
-        search_term = f"%{q}%"
-        conditions.append(
-            or_(
-                Post.title.ilike(search_term),
-                Post.generated_content.ilike(search_term),
-                Post.original_content.ilike(search_term)
-            )
-        )
-
     if status_filter:
         conditions.append(Post.status == status_filter)
 
@@ -276,26 +418,20 @@ async def search_posts(
         except ValueError:
             pass
 
-    # Count total
-    count_result = await db.execute(query)
-    total = len(count_result.scalars().all())
-
-    # Apply pagination
-    offset = (page - 1) * page_size
-    query = query.order_by(desc(Post.created_at)).offset(offset).limit(page_size)
+    # 검색어: 전문 검색 인덱스 사용 (없으면 ilike)
+    rank = None
+    if q and q.strip():
+        query, rank = post_search_index.apply(query, q)
 
-    result = await db.execute(query)
-    posts = result.scalars().all()
-
-    total_pages = (total + page_size - 1) // page_size if total > 0 else 1
-
-    return PostListResponse(
-        posts=posts,
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages
+    response = await _paginate_posts(
+        db, query, page, page_size, cursor, summary,
+        rank=rank if sort == "relevance" else None,
     )
+    if highlight and q:
+        response.snippets = await post_search_index.snippets(
+            db, [post.id for post in response.posts], q
+        )
+    return response
 
 
 @router.get("/{post_id}", response_model=PostResponse)
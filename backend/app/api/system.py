@@ -344,6 +344,64 @@ async def get_ai_pricing():
     }
 
 
+@router.get("/ai-length-stats")
+async def get_ai_length_stats():
+    """
+    AI 각색 글자수 수렴 지표 조회 (모델별 적중률, 평균 생성/부분 보정 횟수, 학습된 보정 배수)
+
+    서버 시작 이후 집계된 값입니다.
+    """
+    from app.services.length_controller import length_controller
+
+    return {
+        "target_range": "±5%",
+        "models": length_controller.get_metrics(),
+    }
+
+
+@router.get("/ai-cache-stats")
+async def get_ai_cache_stats():
+    """
+    AI 응답 캐시 적중/미적중 통계 조회
+
+    서버 시작 이후 집계된 값입니다.
+    """
+    from app.services.llm_cache import llm_cache
+
+    return llm_cache.get_stats()
+
+
+@router.get("/crawler-http-stats")
+async def get_crawler_http_stats():
+    """
+    크롤러 공용 HTTP 클라이언트 통계 조회 (요청 수, 호스트별 간격 대기 횟수, HTTP/2 응답 수,
+    대량 작업의 네이버 요청 예산)
+    """
+    from app.services.crawler_http import crawler_http, naver_rate_budget
+
+    return {**crawler_http.get_stats(), "naver_rate_budget": naver_rate_budget.get_stats()}
+
+
+@router.get("/http-cache-stats")
+async def get_http_cache_stats():
+    """
+    크롤링 응답 캐시 통계 조회 (유효 기간 내 적중, 304 재검증, 디스크 사용량)
+    """
+    from app.services.http_cache import http_response_cache
+
+    return http_response_cache.get_stats()
+
+
+@router.get("/image-cache-stats")
+async def get_image_cache_stats():
+    """
+    내보내기 이미지 변환 캐시 통계 조회 (적중률, 디스크 사용량)
+    """
+    from app.services.image_cache import image_transcode_cache
+
+    return image_transcode_cache.get_stats()
+
+
 @router.get("/ai-usage-stats")
 async def get_ai_usage_stats(db: AsyncSession = Depends(get_db)):
     """
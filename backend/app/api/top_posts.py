@@ -29,6 +29,7 @@ from app.services.keyword_collector import (
 from app.services.bulk_analysis_service import (
     BulkAnalysisService,
     run_bulk_analysis,
+    request_cancel,
     get_analysis_dashboard,
     get_category_rules
 )
@@ -66,11 +67,10 @@ async def analyze_keyword(
     - 결과를 DB에 저장하고 요약 통계 반환
     """
     try:
-        # 동기 DB 세션으로 변환 필요 - 일단 None으로 전달
         result = await analyze_top_posts(
             keyword=request.keyword,
             top_n=request.top_n,
-            db=None  # 비동기 환경에서는 별도 처리 필요
+            db=db
         )
 
         return AnalyzeResponse(**result)
@@ -429,36 +429,30 @@ async def start_bulk_analysis(
         raise HTTPException(status_code=400, detail="target_count must be 100, 500, or 1000")
 
     try:
-        # 동기 세션 생성 (SQLite는 동기 작업 필요)
-        from app.db.database import SessionLocal
-        sync_db = SessionLocal()
-
-        try:
-            # 작업 생성
-            service = BulkAnalysisService(sync_db)
-            job = service.create_job(
+        # 작업 생성 (동기 서비스를 요청 세션 위에서 실행)
+        job = await db.run_sync(
+            lambda s: BulkAnalysisService(s).create_job(
                 category=request.category,
                 target_count=request.target_count,
                 keywords=request.keywords
             )
+        )
 
-            # 백그라운드 작업 시작
-            background_tasks.add_task(
-                run_bulk_analysis_wrapper,
-                job.id,
-                request.category,
-                request.target_count
-            )
+        # 백그라운드 작업 시작
+        background_tasks.add_task(
+            run_bulk_analysis_wrapper,
+            job.id,
+            request.category,
+            request.target_count
+        )
 
-            return BulkAnalyzeResponse(
-                job_id=job.id,
-                category=request.category,
-                target_count=request.target_count,
-                status="pending",
-                message=f"분석 작업이 시작되었습니다. 작업 ID: {job.id}"
-            )
-        finally:
-            sync_db.close()
+        return BulkAnalyzeResponse(
+            job_id=job.id,
+            category=request.category,
+            target_count=request.target_count,
+            status="pending",
+            message=f"분석 작업이 시작되었습니다. 작업 ID: {job.id}"
+        )
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -466,12 +460,9 @@ async def start_bulk_analysis(
 
 async def run_bulk_analysis_wrapper(job_id: str, category: str, target_count: int):
     """백그라운드 분석 실행 래퍼"""
-    from app.db.database import SessionLocal
-    db = SessionLocal()
-    try:
+    from app.db.database import AsyncSessionLocal
+    async with AsyncSessionLocal() as db:
         await run_bulk_analysis(db, job_id, category, target_count)
-    finally:
-        db.close()
 
 
 @router.get("/jobs")
@@ -573,6 +564,8 @@ async def cancel_job(
 
     job.status = 'cancelled'
     await db.commit()
+    # 이 프로세스에서 실행 중이면 워커에 바로 알림 (아니면 다음 진행률 기록 때 감지)
+    request_cancel(job_id)
 
     return {"message": "Job cancelled successfully", "job_id": job_id}
 
@@ -580,7 +573,8 @@ async def cancel_job(
 @router.post("/collect-keywords")
 async def collect_keywords(
     category: str = Query(..., description="카테고리 ID"),
-    max_keywords: int = Query(default=100, le=500, description="최대 수집 키워드 수")
+    max_keywords: int = Query(default=100, le=500, description="최대 수집 키워드 수"),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     연관검색어 수집
@@ -592,7 +586,7 @@ async def collect_keywords(
         raise HTTPException(status_code=400, detail=f"Invalid category: {category}")
 
     try:
-        result = await collect_keywords_for_category(category, max_keywords)
+        result = await collect_keywords_for_category(category, max_keywords, db=db)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
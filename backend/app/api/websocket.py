@@ -78,6 +78,21 @@ class ConnectionManager:
             "data": data or {}
         })
 
+    async def send_delta(
+        self,
+        user_id: str,
+        task_id: str,
+        delta: str,
+        length: int
+    ):
+        """스트리밍 생성 텍스트 조각 전송"""
+        await self.send_message(user_id, {
+            "type": "delta",
+            "task_id": task_id,
+            "delta": delta,
+            "length": length
+        })
+
     async def send_completion(
         self,
         user_id: str,
@@ -21,9 +21,70 @@ class Settings(BaseSettings):
     DATABASE_URL: str = "sqlite:///./doctorvoice.db"
     DATABASE_URL_SYNC: str = "sqlite:///./doctorvoice.db"
 
+    # SQLite 운영 모드 (WAL + 읽기 커넥션 풀 + 단일 쓰기 커넥션, False면 커넥션 하나 공유)
+    SQLITE_WAL_MODE: bool = True
+    SQLITE_READ_POOL_SIZE: int = 4
+    SQLITE_BUSY_TIMEOUT_MS: int = 30000  # 다른 프로세스의 쓰기 잠금 대기 시간
+    SQLITE_WRITER_TIMEOUT: int = 30  # 쓰기/읽기 커넥션 차례 대기 시간(초)
+    SQLITE_MMAP_SIZE_MB: int = 256
+    SQLITE_CACHE_SIZE_MB: int = 64
+
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
 
+    # AI 응답 캐시 (use_cache=True로 호출한 결정적 요청만 - 키워드 추출, 채점 등)
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_MAX_ENTRIES: int = 512
+    LLM_CACHE_TTL_SECONDS: int = 86400
+    LLM_CACHE_REDIS: bool = False  # True면 Redis를 2차(영구) 캐시로 사용
+
+    # 대량 검사/채점 (0이면 CPU 코어 수, 1이면 프로세스 풀 없이 실행)
+    BATCH_SCORING_WORKERS: int = 0
+    BATCH_SCORING_CHUNK_SIZE: int = 50
+
+    # 문서 내보내기 (DOCX 조립/이미지 변환 스레드 수 - 0이면 CPU 코어 수(최대 4),
+    # 이 크기를 넘는 결과는 디스크 임시 파일로)
+    EXPORT_WORKERS: int = 0
+    EXPORT_SPOOL_MAX_MB: int = 8
+
+    # 내보내기 이미지 변환 결과 디스크 캐시 (비우면 시스템 임시 폴더)
+    IMAGE_CACHE_ENABLED: bool = True
+    IMAGE_CACHE_DIR: str = ""
+    IMAGE_CACHE_MAX_MB: int = 512
+
+    # imgBB 이미지 업로드
+    IMGBB_API_KEY: str = ""
+    IMAGE_UPLOAD_MAX_MB: int = 32  # imgBB 제한
+    IMAGE_UPLOAD_CONCURRENCY: int = 4  # 프로세스 전체 동시 업로드 수
+
+    # 크롤러 공용 HTTP 클라이언트
+    CRAWLER_MAX_CONNECTIONS: int = 100
+    CRAWLER_PER_HOST_CONCURRENCY: int = 6  # 호스트별 동시 요청 수
+    CRAWLER_PER_HOST_INTERVAL: float = 0.1  # 호스트별 요청 시작 간격(초)
+    HTML_PARSER: str = "auto"  # auto(설치된 것 중 가장 빠른 것) / selectolax / lxml / html.parser
+
+    # 크롤링 응답 디스크 캐시 (gzip 압축, LRU, 유효 기간이 지나면 ETag/Last-Modified로 재검증)
+    HTTP_CACHE_ENABLED: bool = True
+    HTTP_CACHE_DIR: str = ""  # 비우면 시스템 임시 폴더
+    HTTP_CACHE_MAX_MB: int = 1024
+    HTTP_CACHE_MODE: str = "normal"  # normal / replay(저장된 응답만 사용 - 테스트용)
+    HTTP_CACHE_TTL_SEARCH: int = 3600  # 검색 결과
+    HTTP_CACHE_TTL_POST: int = 86400  # 블로그 본문
+    HTTP_CACHE_TTL_KIN: int = 3600  # 지식인 질문 상세
+
+    # 대량 상위글 분석 (키워드 워커 수, 네이버 호스트별 초당 요청 예산, 진행률/DB 기록 주기)
+    # 예산 기본값은 기존 순차 처리(키워드마다 검색 1 + 글 3, 1초 대기)의 상한과 같음
+    BULK_ANALYSIS_WORKERS: int = 4
+    BULK_ANALYSIS_SEARCH_RPS: float = 1.0  # search.naver.com
+    BULK_ANALYSIS_POST_RPS: float = 3.0  # m.blog.naver.com
+    BULK_ANALYSIS_FLUSH_SECONDS: float = 3.0
+
+    # 키워드 확장 (단계별 동시 워커 수, 확장 깊이, 키워드별 확장 결과 재사용 기간, 자동완성 초당 요청 예산)
+    KEYWORD_EXPANSION_WORKERS: int = 4
+    KEYWORD_EXPANSION_MAX_DEPTH: int = 2
+    KEYWORD_EXPANSION_TTL_HOURS: int = 168
+    KEYWORD_AUTOCOMPLETE_RPS: float = 2.0  # ac.search.naver.com
+
     # AI APIs
     ANTHROPIC_API_KEY: str = ""
     OPENAI_API_KEY: str = ""
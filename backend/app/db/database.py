@@ -1,22 +1,73 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import declarative_base, sessionmaker, Session
 from app.core.config import settings
 
+DML_PREFIXES = ("INSERT", "UPDATE", "DELETE", "REPLACE")
+
+
+def _is_file_sqlite(url: str) -> bool:
+    """파일 기반 SQLite 여부 (메모리 DB는 커넥션마다 별도 DB라 단일 커넥션 유지)"""
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database not in (None, "", ":memory:")
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """커넥션 생성 시 SQLite 운영 모드 PRAGMA 적용"""
+    cursor = dbapi_connection.cursor()
+    if settings.SQLITE_WAL_MODE:
+        # 읽기가 쓰기를 기다리지 않도록 WAL, 커밋마다 fsync하지 않도록 NORMAL
+        cursor.execute("PRAGMA journal_mode = WAL")
+        cursor.execute("PRAGMA synchronous = NORMAL")
+    cursor.execute(f"PRAGMA mmap_size = {settings.SQLITE_MMAP_SIZE_MB * 1024 * 1024}")
+    cursor.execute(f"PRAGMA cache_size = -{settings.SQLITE_CACHE_SIZE_MB * 1024}")  # 음수: KiB 단위
+    cursor.execute("PRAGMA temp_store = MEMORY")
+    cursor.close()
+
+
 # SQLite와 PostgreSQL에 따라 엔진 설정 분리
-if settings.DATABASE_URL.startswith("sqlite"):
-    # SQLite는 StaticPool 사용 (pool_size 지원 안함)
+SQLITE_CONNECT_ARGS = {
+    "timeout": settings.SQLITE_BUSY_TIMEOUT_MS / 1000,  # 다른 프로세스가 잠근 경우 대기 시간
+    "check_same_thread": False,
+}
+
+if _is_file_sqlite(settings.DATABASE_URL) and settings.SQLITE_WAL_MODE:
+    # 쓰기: 커넥션 1개를 순서대로 사용 (대기 요청은 풀 큐에서 기다림)
+    engine = create_async_engine(
+        settings.DATABASE_URL,
+        echo=settings.DEBUG,
+        future=True,
+        connect_args=SQLITE_CONNECT_ARGS,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=settings.SQLITE_WRITER_TIMEOUT,
+    )
+    # 읽기: WAL 스냅샷으로 쓰기와 동시에 실행되는 커넥션 풀
+    read_engine = create_async_engine(
+        settings.DATABASE_URL,
+        echo=settings.DEBUG,
+        future=True,
+        connect_args=SQLITE_CONNECT_ARGS,
+        pool_size=settings.SQLITE_READ_POOL_SIZE,
+        max_overflow=0,
+        pool_timeout=settings.SQLITE_WRITER_TIMEOUT,
+    )
+    event.listen(engine.sync_engine, "connect", _apply_sqlite_pragmas)
+    event.listen(read_engine.sync_engine, "connect", _apply_sqlite_pragmas)
+elif settings.DATABASE_URL.startswith("sqlite"):
+    # 메모리 DB 또는 WAL 모드를 끈 경우: 기존처럼 StaticPool 커넥션 하나 사용
     from sqlalchemy.pool import StaticPool
     engine = create_async_engine(
         settings.DATABASE_URL,
         echo=settings.DEBUG,
         future=True,
-        connect_args={
-            "timeout": 30,
-            "check_same_thread": False,
-        },
+        connect_args=SQLITE_CONNECT_ARGS,
         poolclass=StaticPool,
     )
+    read_engine = engine
+    if _is_file_sqlite(settings.DATABASE_URL):
+        event.listen(engine.sync_engine, "connect", _apply_sqlite_pragmas)
 else:
     # PostgreSQL 등은 connection pool 사용
     engine = create_async_engine(
@@ -28,11 +79,52 @@ else:
         pool_pre_ping=True,
         pool_recycle=3600,
     )
+    read_engine = engine
+
+
+class RoutingSession(Session):
+    """
+    읽기/쓰기 커넥션 분리 세션 (SQLite 운영 모드)
+
+    - 트랜잭션에서 첫 쓰기(flush, INSERT/UPDATE/DELETE) 전까지는 읽기 풀 사용
+    - 한 번 쓰기를 시작하면 커밋/롤백까지 쓰기 커넥션만 사용 (자기 변경분을 읽을 수 있도록)
+
+    쓰기 커넥션은 하나뿐이므로 flush(또는 autoflush) 후 커밋 전에 LLM/HTTP/SMTP 등 외부 호출을
+    기다리면 그동안 다른 쓰기가 모두 막히고 SQLITE_WRITER_TIMEOUT 후 TimeoutError가 납니다.
+    외부 호출 결과로 만드는 레코드는 호출이 끝난 뒤 추가하고 바로 커밋합니다.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if read_engine is engine:
+            return engine.sync_engine
+        if not self.info.get("writer") and (self._flushing or _is_write(clause)):
+            self.info["writer"] = True
+        if self.info.get("writer"):
+            return engine.sync_engine
+        return read_engine.sync_engine
+
+
+def _is_write(clause) -> bool:
+    if clause is None:
+        return False
+    if getattr(clause, "is_dml", False):
+        return True
+    # text("UPDATE ...") 등 문자열 SQL
+    text = getattr(clause, "text", None)
+    return isinstance(text, str) and text.lstrip().upper().startswith(DML_PREFIXES)
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _release_writer(session, transaction):
+    if transaction.parent is None:
+        session.info.pop("writer", None)
+
 
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
+    sync_session_class=RoutingSession,
     expire_on_commit=False,
 )
 
@@ -41,8 +133,10 @@ if settings.DATABASE_URL_SYNC.startswith("sqlite"):
     sync_engine = create_engine(
         settings.DATABASE_URL_SYNC,
         echo=settings.DEBUG,
-        connect_args={"check_same_thread": False},
+        connect_args=SQLITE_CONNECT_ARGS,
     )
+    if _is_file_sqlite(settings.DATABASE_URL_SYNC):
+        event.listen(sync_engine, "connect", _apply_sqlite_pragmas)
 else:
     sync_engine = create_engine(
         settings.DATABASE_URL_SYNC,
@@ -22,6 +22,16 @@ async def lifespan(app: FastAPI):
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
         print("[OK] Database tables created/verified")
+
+        # 포스팅 전문 검색 인덱스 (SQLite FTS5 / PostgreSQL pg_trgm, 불가하면 ilike 검색)
+        from app.services.post_search import post_search_index
+        search_backend = await post_search_index.ensure(engine)
+        print(f"[OK] Post search index: {search_backend or 'ilike fallback'}")
+
+        # 대시보드 일별 집계 테이블 (비어 있으면 원본 이벤트로 백필)
+        from app.services.rollup_service import rollup_service
+        rebuilt = await rollup_service.ensure(engine)
+        print(f"[OK] Daily rollups ready{f' (backfilled {rebuilt})' if rebuilt else ''}")
     except Exception as e:
         print(f"[ERROR] Failed to create database tables: {e}")
 
@@ -114,10 +124,62 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"[WARNING] Error creating default accounts: {e}")
 
+    # 3. 의료법/금칙어 규칙 세트 적재 (비어 있으면 기본 규칙 등록)
+    try:
+        from app.services.compliance_rules import compliance_rule_store
+        seeded = await compliance_rule_store.seed_defaults()
+        if seeded:
+            print(f"[OK] Default compliance rules seeded: {seeded}")
+        rule_set = await compliance_rule_store.reload()
+        print(f"[OK] Compliance rules loaded: v{rule_set.version} ({rule_set.source})")
+    except Exception as e:
+        print(f"[WARNING] Error loading compliance rules: {e}")
+
+    # 4. AI 응답 캐시의 영구(Redis) 계층 연결 (설정 시)
+    if settings.LLM_CACHE_REDIS:
+        from app.services.cache_service import cache_service
+        await cache_service.connect()
+
+    # 5. 크롤러 공용 HTTP 클라이언트 (keep-alive 커넥션 풀)
+    from app.services.crawler_http import crawler_http, HTTP2_AVAILABLE
+    await crawler_http.start()
+    print(f"[OK] Crawler HTTP client ready (HTTP/2: {'on' if HTTP2_AVAILABLE else 'off'})")
+
     yield
 
     # 애플리케이션 종료 시 실행
-    pass
+    # AI 제공자 커넥션 풀 정리
+    try:
+        from app.services.llm_client import llm_client
+        await llm_client.aclose()
+    except Exception as e:
+        print(f"[WARNING] Error closing AI clients: {e}")
+
+    if settings.LLM_CACHE_REDIS:
+        from app.services.cache_service import cache_service
+        await cache_service.disconnect()
+
+    # 크롤러 커넥션 풀 정리
+    try:
+        from app.services.crawler_http import crawler_http
+        await crawler_http.aclose()
+    except Exception as e:
+        print(f"[WARNING] Error closing crawler HTTP client: {e}")
+
+    # 이미지 업로드 커넥션 풀 정리
+    try:
+        from app.services.image_upload_service import image_uploader
+        await image_uploader.aclose()
+    except Exception as e:
+        print(f"[WARNING] Error closing image upload client: {e}")
+
+    # 대량 검사 프로세스 풀 정리 (생성된 경우)
+    from app.services.batch_scoring_service import batch_scoring_service
+    batch_scoring_service.shutdown()
+
+    # 문서 내보내기 스레드 풀 정리
+    from app.services.blog_exporter import blog_exporter
+    blog_exporter.shutdown()
 
 
 # FastAPI 앱 생성
@@ -8,7 +8,7 @@ from app.models.writing_request import WritingRequest
 from app.models.ai_usage import AIUsage, AI_PRICING, USD_TO_KRW, calculate_cost, get_estimated_cost_per_request
 from app.models.api_key import APIKey
 from app.models.top_post_analysis import TopPostAnalysis, AggregatedPattern
-from app.models.analysis_job import AnalysisJob, CollectedKeyword
+from app.models.analysis_job import AnalysisJob, CollectedKeyword, KeywordExpansion
 from app.models.subscription import (
     Plan, Subscription, UsageLog, UsageSummary,
     Payment, CreditTransaction, UserCredit,
@@ -27,7 +27,7 @@ from app.models.sns_connection import (
     SNSPlatform, SNSPostStatus, SNSContentType
 )
 from app.models.roi_tracker import (
-    ConversionEvent, ROISummary, KeywordROI, FunnelStage, MarketingCost,
+    ConversionEvent, ROIDailyRollup, ROISummary, KeywordROI, FunnelStage, MarketingCost,
     EventType
 )
 from app.models.naver_place import (
@@ -35,7 +35,7 @@ from app.models.naver_place import (
     OptimizationStatus
 )
 from app.models.place_review import (
-    PlaceReview, ReviewAlert, ReviewReplyTemplate, ReviewAnalytics, GeneratedReply,
+    PlaceReview, ReviewAlert, ReviewReplyTemplate, ReviewDailyRollup, ReviewAnalytics, GeneratedReply,
     Sentiment
 )
 from app.models.competitor import (
@@ -94,6 +94,7 @@ __all__ = [
     "AggregatedPattern",
     "AnalysisJob",
     "CollectedKeyword",
+    "KeywordExpansion",
     "Plan",
     "Subscription",
     "UsageLog",
@@ -128,6 +129,7 @@ __all__ = [
     "SNSContentType",
     # ROI models
     "ConversionEvent",
+    "ROIDailyRollup",
     "ROISummary",
     "KeywordROI",
     "FunnelStage",
@@ -143,6 +145,7 @@ __all__ = [
     "PlaceReview",
     "ReviewAlert",
     "ReviewReplyTemplate",
+    "ReviewDailyRollup",
     "ReviewAnalytics",
     "GeneratedReply",
     "Sentiment",
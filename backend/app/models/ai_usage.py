@@ -59,6 +59,12 @@ class AIUsage(Base):
     request_type = Column(String(50), default="content_generation")  # 요청 유형
     content_length = Column(Integer, default=0)  # 생성된 콘텐츠 글자수
 
+    # 글자수 수렴 학습 정보 (content_generation)
+    target_length = Column(Integer, nullable=True)  # 목표 글자수
+    length_multiplier = Column(Float, nullable=True)  # 프롬프트에 적용한 보정 배수
+    raw_content_length = Column(Integer, nullable=True)  # 부분 보정 전 전체 생성 글자수
+    generation_attempts = Column(Integer, nullable=True)  # 전체 생성 시도 횟수
+
     # 시간 정보
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
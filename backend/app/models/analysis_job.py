@@ -83,3 +83,18 @@ class CollectedKeyword(Base):
         Index('idx_keyword_category_unique', 'category', 'keyword', unique=True),
         Index('idx_keyword_analyzed', 'is_analyzed'),
     )
+
+
+class KeywordExpansion(Base):
+    """키워드별 연관검색어/자동완성 수집 결과 (작업 간 재사용)"""
+    __tablename__ = "keyword_expansions"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    keyword = Column(String(200), nullable=False)  # 정규화된 키워드 (공백 정리 + 소문자)
+    related = Column(JSON, default=list)  # 연관검색어
+    autocomplete = Column(JSON, default=list)  # 자동완성
+    fetched_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index('idx_keyword_expansion_unique', 'keyword', unique=True),
+    )
@@ -4,7 +4,7 @@
 import uuid
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import Column, String, Text, Integer, Float, Boolean, DateTime, ForeignKey, JSON, Enum as SQLEnum
+from sqlalchemy import Column, String, Text, Integer, Float, Boolean, DateTime, ForeignKey, JSON, Enum as SQLEnum, Index
 from sqlalchemy.orm import relationship
 from app.db.database import Base
 
@@ -74,6 +74,9 @@ class EmailStatus(str, Enum):
 class NaverBlog(Base):
     """수집된 네이버 블로그"""
     __tablename__ = "naver_blogs"
+    __table_args__ = (
+        Index("ix_naver_blogs_user_id_lead_score", "user_id", "lead_score"),  # 리드 스코어순 조회
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
@@ -131,7 +134,7 @@ class BlogContact(Base):
     __tablename__ = "blog_contacts"
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    blog_id = Column(String(36), ForeignKey("naver_blogs.id"), nullable=False)
+    blog_id = Column(String(36), ForeignKey("naver_blogs.id"), nullable=False, index=True)
 
     # 연락처 정보
     email = Column(String(200))
@@ -240,6 +243,9 @@ class EmailCampaign(Base):
 class EmailLog(Base):
     """이메일 발송 기록"""
     __tablename__ = "email_logs"
+    __table_args__ = (
+        Index("ix_email_logs_user_id_sent_at", "user_id", "sent_at"),  # 일일/시간당 발송 한도
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
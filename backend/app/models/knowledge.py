@@ -4,7 +4,7 @@
 import uuid
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import Column, String, Text, Integer, Float, Boolean, DateTime, ForeignKey, JSON, Enum as SQLEnum
+from sqlalchemy import Column, String, Text, Integer, Float, Boolean, DateTime, ForeignKey, JSON, Enum as SQLEnum, Index
 from sqlalchemy.orm import relationship
 from app.db.database import Base
 
@@ -66,6 +66,9 @@ class KnowledgeKeyword(Base):
 class KnowledgeQuestion(Base):
     """수집된 지식인 질문"""
     __tablename__ = "knowledge_questions"
+    __table_args__ = (
+        Index("ix_knowledge_questions_user_id_relevance_score", "user_id", "relevance_score"),  # 관련성순 질문 목록
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
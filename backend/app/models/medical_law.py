@@ -19,9 +19,13 @@ class MedicalLawRule(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
+    # Rule set: medical_law (의료법 위반 검사) / forbidden_words (네이버 금칙어 대체)
+    rule_set = Column(String(30), nullable=False, default="medical_law", index=True)
+
     # Rule details
     category = Column(String(50), nullable=False)  # 절대적_표현, 비교_우위, etc.
     pattern = Column(Text, nullable=False)  # Regex pattern
+    is_literal = Column(Boolean, default=False)  # True면 pattern을 정규식이 아닌 고정 단어로 취급
     severity = Column(Enum(ViolationSeverity), default=ViolationSeverity.MEDIUM)
     alternative_suggestion = Column(Text, nullable=True)
 
@@ -1,5 +1,5 @@
 """플레이스 검색 순위 추적 모델"""
-from sqlalchemy import Column, String, DateTime, Integer, Float, ForeignKey, Boolean, JSON
+from sqlalchemy import Column, String, DateTime, Integer, Float, ForeignKey, Boolean, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid as uuid_pkg
@@ -57,6 +57,9 @@ class PlaceKeyword(Base):
 class PlaceRanking(Base):
     """순위 기록"""
     __tablename__ = "place_rankings"
+    __table_args__ = (
+        Index("ix_place_rankings_keyword_id_checked_at", "keyword_id", "checked_at"),  # 키워드별 최근 순위/기록
+    )
 
     id = Column(GUID(), primary_key=True, default=uuid_pkg.uuid4)
     keyword_id = Column(GUID(), ForeignKey("place_keywords.id"), nullable=False, index=True)
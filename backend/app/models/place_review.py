@@ -1,5 +1,5 @@
 """플레이스 리뷰 관리 모델"""
-from sqlalchemy import Column, String, DateTime, Integer, Float, Text, ForeignKey, Enum, Date, Boolean, JSON
+from sqlalchemy import Column, String, DateTime, Integer, Float, Text, ForeignKey, Enum, Date, Boolean, JSON, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid as uuid_pkg
@@ -129,6 +129,38 @@ class ReviewReplyTemplate(Base):
     user = relationship("User", backref="review_templates")
 
 
+class ReviewDailyRollup(Base):
+    """리뷰 일별 집계 - 리뷰 등록/수정/답변 시 함께 갱신 (작성일 기준)"""
+    __tablename__ = "review_daily_rollups"
+    __table_args__ = (
+        UniqueConstraint("place_id", "date", name="uq_review_daily_rollups_key"),
+    )
+
+    id = Column(GUID(), primary_key=True, default=uuid_pkg.uuid4)
+    place_id = Column(GUID(), ForeignKey("naver_places.id"), nullable=False, index=True)
+    date = Column(Date, nullable=False, index=True)
+
+    # 리뷰 수 / 평점 (평균 = rating_sum / rated)
+    reviews = Column(Integer, nullable=False, default=0)
+    rated = Column(Integer, nullable=False, default=0)
+    rating_sum = Column(Integer, nullable=False, default=0)
+    replied = Column(Integer, nullable=False, default=0)
+
+    # 감성 분포
+    positive = Column(Integer, nullable=False, default=0)
+    negative = Column(Integer, nullable=False, default=0)
+    neutral = Column(Integer, nullable=False, default=0)
+
+    # 평점 분포
+    rating_1 = Column(Integer, nullable=False, default=0)
+    rating_2 = Column(Integer, nullable=False, default=0)
+    rating_3 = Column(Integer, nullable=False, default=0)
+    rating_4 = Column(Integer, nullable=False, default=0)
+    rating_5 = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+
 class ReviewAnalytics(Base):
     """리뷰 분석 통계"""
     __tablename__ = "review_analytics"
@@ -10,6 +10,7 @@ from sqlalchemy import (
     Enum,
     Boolean,
     Table,
+    Index,
 )
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -38,6 +39,9 @@ post_tags = Table(
 
 class Post(Base):
     __tablename__ = "posts"
+    __table_args__ = (
+        Index("ix_posts_user_id_created_at", "user_id", "created_at"),  # 사용자별 목록/기간 통계
+    )
 
     id = Column(GUID(), primary_key=True, default=uuid_pkg.uuid4)
     user_id = Column(GUID(), ForeignKey("users.id"), nullable=True)  # 익명 사용 허용
@@ -142,7 +146,7 @@ class PostAnalytics(Base):
     __tablename__ = "post_analytics"
 
     id = Column(GUID(), primary_key=True, default=uuid_pkg.uuid4)
-    post_id = Column(GUID(), ForeignKey("posts.id"), nullable=False)
+    post_id = Column(GUID(), ForeignKey("posts.id"), nullable=False, index=True)
 
     # Metrics
     views = Column(Integer, default=0)
@@ -1,5 +1,5 @@
 """ROI 트래커 모델 - 전환 추적 및 ROI 분석"""
-from sqlalchemy import Column, String, DateTime, Integer, Float, Text, ForeignKey, Enum, Date, JSON
+from sqlalchemy import Column, String, DateTime, Integer, Float, Text, ForeignKey, Enum, Date, JSON, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid as uuid_pkg
@@ -20,6 +20,12 @@ class EventType(str, enum.Enum):
 class ConversionEvent(Base):
     """전환 이벤트 - 조회, 상담, 내원 등 추적"""
     __tablename__ = "conversion_events"
+    __table_args__ = (
+        Index(
+            "ix_conversion_events_user_id_event_date_event_type",
+            "user_id", "event_date", "event_type",
+        ),  # 기간/유형별 전환 집계
+    )
 
     id = Column(GUID(), primary_key=True, default=uuid_pkg.uuid4)
     user_id = Column(GUID(), ForeignKey("users.id"), nullable=False, index=True)
@@ -44,6 +50,34 @@ class ConversionEvent(Base):
     post = relationship("Post", backref="conversion_events")
 
 
+class ROIDailyRollup(Base):
+    """ROI 일별 집계 - 전환 이벤트 기록 시 함께 증가 (대시보드는 이벤트 대신 이 테이블을 조회)"""
+    __tablename__ = "roi_daily_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id", "date", "event_type", "channel", "source", "keyword",
+            name="uq_roi_daily_rollups_key",
+        ),
+    )
+
+    id = Column(GUID(), primary_key=True, default=uuid_pkg.uuid4)
+    user_id = Column(GUID(), ForeignKey("users.id"), nullable=False, index=True)
+    date = Column(Date, nullable=False, index=True)
+
+    # 집계 차원 (값이 없으면 빈 문자열)
+    event_type = Column(Enum(EventType), nullable=False)
+    channel = Column(String(50), nullable=False, default="")
+    source = Column(String(50), nullable=False, default="")
+    keyword = Column(String(200), nullable=False, default="")
+
+    # 누적 수치
+    events = Column(Integer, nullable=False, default=0)  # 이벤트 수
+    revenue = Column(Integer, nullable=False, default=0)  # 매출 합계
+    cost = Column(Integer, nullable=False, default=0)  # 비용 합계
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+
 class ROISummary(Base):
     """ROI 요약 - 월별 집계"""
     __tablename__ = "roi_summaries"
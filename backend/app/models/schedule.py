@@ -11,6 +11,7 @@ from sqlalchemy import (
     Boolean,
     Time,
     Date,
+    Index,
 )
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -48,6 +49,10 @@ class ExecutionStatus(str, enum.Enum):
 class PublishSchedule(Base):
     """예약 발행 스케줄"""
     __tablename__ = "publish_schedules"
+    __table_args__ = (
+        Index("ix_publish_schedules_status_next_execution_at", "status", "next_execution_at"),  # 실행 대기 예약
+        Index("ix_publish_schedules_user_id_next_execution_at", "user_id", "next_execution_at"),  # 사용자별 예약 목록
+    )
 
     id = Column(GUID(), primary_key=True, default=uuid_pkg.uuid4)
     user_id = Column(GUID(), ForeignKey("users.id"), nullable=False)
@@ -97,6 +102,9 @@ class PublishSchedule(Base):
 class ScheduleExecution(Base):
     """예약 실행 로그"""
     __tablename__ = "schedule_executions"
+    __table_args__ = (
+        Index("ix_schedule_executions_schedule_id_executed_at", "schedule_id", "executed_at"),
+    )
 
     id = Column(GUID(), primary_key=True, default=uuid_pkg.uuid4)
     schedule_id = Column(GUID(), ForeignKey("publish_schedules.id"), nullable=False)
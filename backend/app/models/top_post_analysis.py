@@ -110,4 +110,22 @@ class AggregatedPattern(Base):
     optimal_image_min = Column(Integer, default=0)
     optimal_image_max = Column(Integer, default=0)
 
+    # 누적 합계 (글 추가 시 증분 갱신, 평균/비율은 여기서 계산 - NULL이면 전체 재집계 필요)
+    sum_title_length = Column(Float, nullable=True)
+    sum_content_length = Column(Float, nullable=True)
+    sum_image_count = Column(Float, nullable=True)
+    sum_video_count = Column(Float, nullable=True)
+    sum_heading_count = Column(Float, nullable=True)
+    sum_paragraph_count = Column(Float, nullable=True)
+    sum_keyword_count = Column(Float, nullable=True)
+    sum_keyword_density = Column(Float, nullable=True)
+
+    # 조건별 글 수 (상위 1~3위 중)
+    title_keyword_posts = Column(Integer, nullable=True)  # 제목에 키워드 포함
+    map_posts = Column(Integer, nullable=True)  # 지도 포함
+    video_posts = Column(Integer, nullable=True)  # 동영상 포함
+    position_front_posts = Column(Integer, nullable=True)  # 키워드 앞부분
+    position_middle_posts = Column(Integer, nullable=True)  # 키워드 중간
+    position_end_posts = Column(Integer, nullable=True)  # 키워드 끝부분
+
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -10,7 +10,7 @@
 import uuid
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, Text, ForeignKey, JSON, Date
+from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, Text, ForeignKey, JSON, Date, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from app.db.database import Base
 
@@ -180,6 +180,9 @@ class ProxyServer(Base):
 class PerformanceEvent(Base):
     """성과 이벤트"""
     __tablename__ = "performance_events"
+    __table_args__ = (
+        Index("ix_performance_events_user_id_event_at", "user_id", "event_at"),  # 당일 성과 집계
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
@@ -216,8 +219,11 @@ class PerformanceEvent(Base):
 
 
 class PerformanceDaily(Base):
-    """일별 성과 통계"""
+    """일별 성과 통계 - 성과 이벤트 기록 시 함께 증가"""
     __tablename__ = "performance_daily"
+    __table_args__ = (
+        UniqueConstraint("user_id", "date", "platform", name="uq_performance_daily_key"),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
@@ -249,6 +255,16 @@ class PerformanceDaily(Base):
     # Relationships
     user = relationship("User", back_populates="performance_daily")
 
+    @property
+    def likes_received(self) -> int:
+        """받은 좋아요 (답변 + 댓글 + 게시글)"""
+        return (self.answer_likes or 0) + (self.comment_likes or 0) + (self.post_likes or 0)
+
+    @property
+    def replies_received(self) -> int:
+        """받은 답글"""
+        return self.comment_replies or 0
+
 
 # ==================== 알림 설정 ====================
 
@@ -296,6 +312,9 @@ class NotificationChannel(Base):
 class NotificationLog(Base):
     """알림 로그"""
     __tablename__ = "notification_logs"
+    __table_args__ = (
+        Index("ix_notification_logs_user_id_created_at", "user_id", "created_at"),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     channel_id = Column(String(36), ForeignKey("notification_channels.id"), nullable=False)
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Union
 from datetime import datetime
 from uuid import UUID
 
@@ -57,6 +57,10 @@ class PostCreate(BaseModel):
     seo_optimization: Optional[SEOOptimization] = None
     # 상위글 분석 기반 규칙
     top_post_rules: Optional[TopPostRules] = None
+    # 제목/추천 제목/소제목/DIA·CRANK 생성 방식: "separate" (항목별 호출) or "combined" (단일 구조화 호출)
+    extras_mode: str = Field(default="separate", pattern="^(separate|combined)$")
+    # 본문 토큰 스트리밍 (WebSocket "delta" 메시지로 실시간 전송)
+    stream: bool = Field(default=False)
 
 
 class RewriteRequest(BaseModel):
@@ -122,11 +126,54 @@ class PostResponse(BaseModel):
         from_attributes = True
 
 
+class PostSummaryResponse(BaseModel):
+    """Schema for post list items without content/analysis columns (summary=true)"""
+
+    id: UUID
+    user_id: Optional[UUID]
+    title: Optional[str]
+    persuasion_score: Optional[float]
+    status: str
+    is_favorited: bool = False
+    published_at: Optional[datetime]
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 class PostListResponse(BaseModel):
     """Schema for paginated post list"""
 
-    posts: List[PostResponse]
+    posts: List[Union[PostResponse, PostSummaryResponse]]
     total: int
     page: int
     page_size: int
     total_pages: int
+    # 커서 페이지네이션 모드에서 다음 페이지 요청에 넘길 값 (마지막 페이지면 None)
+    next_cursor: Optional[str] = None
+    # 검색 highlight=true일 때 포스팅 id -> 검색어 강조 발췌 (HTML 이스케이프, <mark>)
+    snippets: Optional[Dict[str, str]] = None
+
+
+class BatchScoreItem(BaseModel):
+    """Schema for a single text in a batch scoring request"""
+
+    id: Optional[str] = None  # 결과 매칭용 (결과는 끝나는 순서대로 전달됨)
+    text: str
+    title: str = ""
+    keywords: List[str] = Field(default_factory=list)
+    hashtags: List[str] = Field(default_factory=list)
+
+
+class BatchScoreRequest(BaseModel):
+    """Schema for batch compliance/scoring (NDJSON streaming response)"""
+
+    # 직접 전달한 텍스트 또는 저장된 포스팅 (post_ids / all_posts) 중 하나
+    items: List[BatchScoreItem] = Field(default_factory=list, max_length=20000)
+    post_ids: Optional[List[UUID]] = None
+    all_posts: bool = False  # 내 포스팅 전체 (관리자는 전체 사용자)
+    # medical_law, forbidden_words, persuasion, seo, analysis (비우면 전체)
+    checks: List[str] = Field(default_factory=list)
+    save: bool = False  # 포스팅 대상일 때 결과를 포스팅에 반영
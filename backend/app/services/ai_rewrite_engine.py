@@ -2,20 +2,121 @@
 AI Rewrite Engine - OpenAI GPT, Anthropic Claude, Google Gemini API를 사용한 의료 콘텐츠 각색
 """
 
-from openai import OpenAI
-import anthropic
-import httpx
+import json
 import re
-from typing import Dict, Optional, List
+import time
+from typing import Awaitable, Callable, Dict, Optional, List, Tuple
 from app.core.config import settings
+from app.services.llm_client import llm_client, GEMINI_AVAILABLE, DEFAULT_MODELS
+from app.services.length_controller import length_controller
 
-# Gemini SDK 임포트 (설치되어 있는 경우)
-try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
-except ImportError:
-    GEMINI_AVAILABLE = False
-    genai = None
+PROVIDER_LABELS = {"claude": "Claude", "gpt": "GPT", "gemini": "Gemini"}
+
+
+# 스트리밍 시 줄 머리 마크다운(#, -, *, 1., >, ---) 판별에 쓰이는 문자.
+# 줄이 이 문자들로만 이루어져 있으면 아직 기호인지 본문인지 알 수 없음
+LINE_PREFIX_CHARS = frozenset(" \t#-*_>.0123456789")
+INLINE_MARKERS = ("*", "_", "`", "[")
+SENTENCE_ENDINGS = ".!?"
+
+# 목표 대비 이 비율 이내로 벗어나면 전체 재생성 대신 문단 단위로 보정
+SECTION_ADJUST_WINDOW = 0.25
+MAX_SECTION_ADJUSTMENTS = 2
+
+
+class MarkdownStreamStripper:
+    """
+    _remove_markdown_formatting의 스트리밍 버전
+
+    - 줄 머리 기호는 줄에 일반 문자가 처음 들어오는 순간 판별하여 제거
+    - 인라인 기호(**, _, `, [..](..))가 있는 부분은 줄이 끝날 때까지 보류 후 한 번에 정리
+    - 3개 이상 연속된 빈 줄은 2개로 줄이고, 앞뒤 공백은 내보내지 않음
+    보류하는 분량은 최대 한 줄이므로 메모리 사용량이 일정합니다.
+    """
+
+    def __init__(self):
+        self._pending = ""
+        self._line_start = True  # _pending이 줄 머리에서 시작하는지
+        self._newlines = 0  # 아직 내보내지 않은 연속 줄바꿈 수
+        self._started = False  # 첫 일반 문자를 내보냈는지
+
+    @property
+    def at_line_break(self) -> bool:
+        """마지막으로 내보낸 텍스트 뒤에 줄바꿈이 대기 중인지 (문단 경계)"""
+        return self._newlines > 0
+
+    def feed(self, delta: str) -> str:
+        """새 조각을 받아 지금 내보내도 안전한 정리된 텍스트 반환"""
+        self._pending += delta
+        return self._drain(final=False)
+
+    def flush(self) -> str:
+        """스트림 종료 시 보류 중인 텍스트를 모두 정리하여 반환"""
+        return self._drain(final=True)
+
+    def _drain(self, final: bool) -> str:
+        out = []
+        while self._pending:
+            newline = self._pending.find("\n")
+            line = self._pending if newline == -1 else self._pending[:newline]
+            complete = newline != -1 or final
+
+            if not complete:
+                if self._line_start and all(ch in LINE_PREFIX_CHARS for ch in line):
+                    break  # 줄 머리 기호인지 아직 판별 불가
+                if any(marker in line for marker in INLINE_MARKERS):
+                    break  # 인라인 기호가 닫힐 때까지 보류
+
+            if self._line_start:
+                line = self._strip_line_prefix(line, complete)
+            if complete:
+                line = self._strip_inline(line)
+                if not line.strip():
+                    line = ""
+
+            self._emit_text(line, out)
+
+            if newline == -1:
+                self._pending = ""
+                self._line_start = False
+            else:
+                self._pending = self._pending[newline + 1:]
+                self._line_start = True
+                self._newlines += 1
+
+        return "".join(out)
+
+    def _emit_text(self, text: str, out: List[str]):
+        if not text:
+            return
+        if not self._started:
+            text = text.lstrip()
+            if not text:
+                return
+            self._started = True
+        elif self._newlines:
+            out.append("\n" * min(self._newlines, 2))
+        self._newlines = 0
+        out.append(text)
+
+    @staticmethod
+    def _strip_line_prefix(line: str, complete: bool) -> str:
+        line = re.sub(r'^#{1,6}\s+', '', line)
+        line = re.sub(r'^\s*[-*]\s+', '', line)
+        line = re.sub(r'^\s*\d+\.\s+', '', line)
+        line = re.sub(r'^>\s+', '', line)
+        if complete:
+            line = re.sub(r'^[-*_]{3,}\s*$', '', line)
+        return line
+
+    @staticmethod
+    def _strip_inline(line: str) -> str:
+        line = re.sub(r'\*\*(.+?)\*\*', r'\1', line)
+        line = re.sub(r'\*(.+?)\*', r'\1', line)
+        line = re.sub(r'_(.+?)_', r'\1', line)
+        line = re.sub(r'`(.+?)`', r'\1', line)
+        line = re.sub(r'\[(.+?)\]\(.+?\)', r'\1', line)
+        return line
 
 
 # DB에서 API 키 로드하는 함수
@@ -55,15 +156,8 @@ class AIRewriteEngine:
     """
 
     def __init__(self):
-        # 타임아웃 설정: 연결 30초, 읽기 180초 (AI 생성에 충분한 시간)
-        http_client = httpx.Client(timeout=httpx.Timeout(connect=30.0, read=180.0, write=30.0, pool=30.0))
-        self.openai_client = OpenAI(api_key=settings.OPENAI_API_KEY, http_client=http_client, timeout=180.0)
-        self.claude_client = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY, timeout=180.0)
-
-        # Gemini 클라이언트 초기화
+        # 클라이언트는 llm_client가 provider/API 키별로 풀링하여 관리
         self.gemini_available = GEMINI_AVAILABLE and bool(settings.GEMINI_API_KEY)
-        if self.gemini_available:
-            genai.configure(api_key=settings.GEMINI_API_KEY)
 
     def _remove_markdown_formatting(self, text: str) -> str:
         """
@@ -671,15 +765,40 @@ class AIRewriteEngine:
         min_length = int(target_length * 0.95)
         max_length = int(target_length * 1.05)
 
-        # 최대 재시도 횟수
+        # 알 수 없는 provider는 GPT로 처리
+        if ai_provider not in PROVIDER_LABELS:
+            ai_provider = "gpt"
+        model = ai_model or DEFAULT_MODELS[ai_provider]
+
+        # provider/model별로 학습된 보정 배수로 시작 (학습 전에는 2.0배)
+        multiplier = await length_controller.get_multiplier(ai_provider, model)
+
+        # 최대 전체 생성 횟수
         max_retries = 3
         best_result = None
         best_diff = float('inf')
+        best_multiplier = multiplier
+        best_raw_length = 0
+        attempts = 0
+        adjustments = 0
+        usage = {"input_tokens": 0, "output_tokens": 0}
+
+        def save_usage(hit: bool):
+            length_controller.record_result(ai_provider, model, attempts, adjustments, hit)
+            # 토큰 사용량 저장 (클래스 변수에 저장하여 외부에서 접근 가능) - 모든 호출 합산
+            self.last_usage = {
+                "ai_provider": ai_provider,
+                "ai_model": model,
+                "input_tokens": usage["input_tokens"],
+                "output_tokens": usage["output_tokens"],
+                "total_tokens": usage["input_tokens"] + usage["output_tokens"],
+                "target_length": target_length,
+                "length_multiplier": round(best_multiplier, 3),
+                "raw_content_length": best_raw_length,
+                "generation_attempts": attempts,
+            }
 
         for attempt in range(max_retries):
-            # 시도 횟수에 따라 보정 배수 조정
-            # 1차: 2.0배, 2차: 2.3배, 3차: 2.5배
-            multiplier = 2.0 + (attempt * 0.3)
             adjusted_target_length = int(target_length * multiplier)
 
             system_prompt = self._build_system_prompt(
@@ -701,117 +820,44 @@ class AIRewriteEngine:
             # 최소 4000, 최대 16000 토큰으로 제한
             max_tokens = max(4000, min(calculated_max_tokens, 16000))
 
-            # 토큰 사용량 저장 변수
-            input_tokens = 0
-            output_tokens = 0
-
             try:
-                if ai_provider == "claude":
-                    # DB에서 API 키 로드 (없으면 환경변수 사용)
-                    claude_api_key = await get_api_key_from_db("claude")
-                    if not claude_api_key:
-                        raise Exception("Claude API 키가 설정되지 않았습니다.")
-
-                    # 매번 새로운 클라이언트 생성 (DB 키 사용)
-                    claude_client = anthropic.Anthropic(api_key=claude_api_key, timeout=180.0)
-
-                    # Claude API 호출
-                    model = ai_model or "claude-sonnet-4-5-20250929"
-                    response = claude_client.messages.create(
-                        model=model,
-                        max_tokens=max_tokens,
-                        temperature=0.4,
-                        system=system_prompt,
-                        messages=[
-                            {"role": "user", "content": user_prompt}
-                        ],
-                    )
-                    generated_content = response.content[0].text
-                    # Claude 토큰 사용량
-                    input_tokens = response.usage.input_tokens
-                    output_tokens = response.usage.output_tokens
-                elif ai_provider == "gemini":
-                    # DB에서 Gemini API 키 로드
-                    gemini_api_key = await get_api_key_from_db("gemini")
-                    if not gemini_api_key:
-                        raise Exception("Gemini API 키가 설정되지 않았습니다.")
-
-                    if not GEMINI_AVAILABLE:
-                        raise Exception("Gemini SDK가 설치되어 있지 않습니다.")
-
-                    # Gemini 설정 (매번 새로 설정)
-                    genai.configure(api_key=gemini_api_key)
-
-                    model = ai_model or "gemini-2.0-flash-exp"
-
-                    # Gemini 모델 생성 설정
-                    generation_config = genai.GenerationConfig(
-                        temperature=0.4,
-                        max_output_tokens=max_tokens,
-                        top_p=0.95,
-                        top_k=40,
-                    )
+                # DB에서 API 키 로드 (없으면 환경변수 사용)
+                api_key = await get_api_key_from_db(ai_provider)
+                if not api_key:
+                    raise Exception(f"{PROVIDER_LABELS[ai_provider]} API 키가 설정되지 않았습니다.")
+                if ai_provider == "gemini" and not GEMINI_AVAILABLE:
+                    raise Exception("Gemini SDK가 설치되어 있지 않습니다.")
+
+                response = await llm_client.complete(
+                    provider=ai_provider,
+                    api_key=api_key,
+                    prompt=user_prompt,
+                    system_prompt=system_prompt,
+                    model=model,
+                    max_tokens=max_tokens,
+                    temperature=0.4,
+                    # 같은 원고로 다시 각색하면 새 결과를 받아야 하므로 캐시하지 않음
+                    use_cache=False,
+                )
+                attempts += 1
+                usage["input_tokens"] += response["input_tokens"]
+                usage["output_tokens"] += response["output_tokens"]
 
-                    # 안전 설정 (의료 콘텐츠 허용)
-                    safety_settings = [
-                        {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_ONLY_HIGH"},
-                        {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_ONLY_HIGH"},
-                        {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_ONLY_HIGH"},
-                        {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_ONLY_HIGH"},
-                    ]
+                # Markdown 형식 제거
+                generated_content = self._remove_markdown_formatting(response["text"])
 
-                    gemini_model = genai.GenerativeModel(
-                        model_name=model,
-                        generation_config=generation_config,
-                        safety_settings=safety_settings,
-                        system_instruction=system_prompt,
-                    )
+                # 실제 글자수 확인 (공백 포함) 및 보정 배수 학습
+                raw_length = len(generated_content)
+                length_controller.observe(ai_provider, model, adjusted_target_length, raw_length)
 
-                    response = gemini_model.generate_content(user_prompt)
-                    generated_content = response.text
-                    # Gemini 토큰 사용량 (usage_metadata에서 추출)
-                    if hasattr(response, 'usage_metadata'):
-                        input_tokens = getattr(response.usage_metadata, 'prompt_token_count', 0)
-                        output_tokens = getattr(response.usage_metadata, 'candidates_token_count', 0)
-                else:
-                    # DB에서 GPT API 키 로드
-                    gpt_api_key = await get_api_key_from_db("gpt")
-                    if not gpt_api_key:
-                        raise Exception("GPT API 키가 설정되지 않았습니다.")
-
-                    # 매번 새로운 클라이언트 생성 (DB 키 사용)
-                    http_client = httpx.Client(timeout=httpx.Timeout(connect=30.0, read=180.0, write=30.0, pool=30.0))
-                    openai_client = OpenAI(api_key=gpt_api_key, http_client=http_client, timeout=180.0)
-
-                    # GPT API 호출
-                    model = ai_model or "gpt-4o-mini"
-                    response = openai_client.chat.completions.create(
-                        model=model,
-                        max_tokens=max_tokens,
-                        temperature=0.4,
-                        messages=[
-                            {"role": "system", "content": system_prompt},
-                            {"role": "user", "content": user_prompt}
-                        ],
+                # 목표에 근접했으면 전체 재생성 대신 문단 단위로 늘리거나 줄임
+                if not (min_length <= raw_length <= max_length) and \
+                        abs(raw_length - target_length) <= target_length * SECTION_ADJUST_WINDOW:
+                    generated_content, adjusted = await self._converge_by_sections(
+                        generated_content, target_length, ai_provider, api_key, model, usage
                     )
-                    generated_content = response.choices[0].message.content
-                    # GPT 토큰 사용량
-                    input_tokens = response.usage.prompt_tokens
-                    output_tokens = response.usage.completion_tokens
-
-                # 토큰 사용량 저장 (클래스 변수에 저장하여 외부에서 접근 가능)
-                self.last_usage = {
-                    "ai_provider": ai_provider,
-                    "ai_model": model,
-                    "input_tokens": input_tokens,
-                    "output_tokens": output_tokens,
-                    "total_tokens": input_tokens + output_tokens,
-                }
+                    adjustments += adjusted
 
-                # Markdown 형식 제거
-                generated_content = self._remove_markdown_formatting(generated_content)
-
-                # 실제 글자수 확인 (공백 포함)
                 actual_length = len(generated_content)
                 diff = abs(actual_length - target_length)
 
@@ -819,29 +865,266 @@ class AIRewriteEngine:
                 if diff < best_diff:
                     best_diff = diff
                     best_result = generated_content
+                    best_multiplier = multiplier
+                    best_raw_length = raw_length
 
                 # 목표 범위 내에 들어오면 즉시 반환
                 if min_length <= actual_length <= max_length:
-                    print(f"✅ 목표 글자수 달성! (목표: {target_length}자, 실제: {actual_length}자, 시도: {attempt + 1}회)")
+                    save_usage(hit=True)
+                    print(f"✅ 목표 글자수 달성! (목표: {target_length}자, 실제: {actual_length}자, "
+                          f"생성: {attempts}회, 부분 보정: {adjustments}회)")
                     return generated_content
 
-                # 범위를 벗어났지만 마지막 시도가 아니면 재시도
+                # 범위를 벗어났지만 마지막 시도가 아니면 이번 결과로 배수를 보정하여 재시도
                 if attempt < max_retries - 1:
-                    print(f"⚠️ 글자수 미달성 (목표: {target_length}자, 실제: {actual_length}자) - {attempt + 2}차 시도 중...")
+                    multiplier = length_controller.correct(multiplier, target_length, raw_length)
+                    print(f"⚠️ 글자수 미달성 (목표: {target_length}자, 실제: {actual_length}자) - "
+                          f"{attempt + 2}차 시도 중 (보정 배수 {multiplier:.2f})...")
                     continue
 
             except Exception as e:
                 # 에러 발생 시 best_result가 있으면 반환, 없으면 에러 발생
                 if best_result:
+                    save_usage(hit=False)
                     print(f"⚠️ AI 생성 중 에러 발생, 최선의 결과 반환 (목표: {target_length}자, 실제: {len(best_result)}자)")
                     return best_result
                 raise Exception(f"AI 각색 중 오류 발생: {str(e)}")
 
         # 모든 시도 후 최선의 결과 반환
+        save_usage(hit=False)
         actual_length = len(best_result) if best_result else 0
-        print(f"📊 최선의 결과 반환 (목표: {target_length}자, 실제: {actual_length}자, {max_retries}회 시도)")
+        print(f"📊 최선의 결과 반환 (목표: {target_length}자, 실제: {actual_length}자, {attempts}회 시도)")
         return best_result if best_result else ""
 
+    async def _converge_by_sections(
+        self,
+        content: str,
+        target_length: int,
+        ai_provider: str,
+        api_key: str,
+        model: str,
+        usage: Dict[str, int],
+    ) -> Tuple[str, int]:
+        """
+        목표 글자수에 근접한 결과를 문단 하나씩 늘리거나 줄여서 범위 안으로 맞춤
+
+        전체 글 대신 문단 하나만 주고받으므로 재생성 대비 토큰과 시간이 크게 줄어듭니다.
+
+        Returns:
+            (보정된 콘텐츠, 보정 호출 횟수)
+        """
+        min_length = int(target_length * 0.95)
+        max_length = int(target_length * 1.05)
+        adjusted = 0
+
+        for _ in range(MAX_SECTION_ADJUSTMENTS):
+            if min_length <= len(content) <= max_length:
+                break
+
+            paragraphs = content.split("\n\n")
+            # 도입 문단은 유지하고, 가장 긴 본문 문단을 보정 대상으로 선택
+            candidates = range(1, len(paragraphs)) if len(paragraphs) > 2 else range(len(paragraphs))
+            index = max(candidates, key=lambda i: len(paragraphs[i]))
+            section = paragraphs[index]
+
+            diff = target_length - len(content)
+            new_length = max(int(len(section) * 0.4), min(len(section) + diff, len(section) * 3))
+            direction = "늘려서" if diff > 0 else "줄여서"
+
+            prompt = f"""다음은 의료 블로그 글의 한 문단입니다.
+이 문단을 현재 {len(section)}자에서 약 {new_length}자(공백 포함)로 {direction} 다시 써주세요.
+
+[규칙]
+- 말투, 시점, 의미와 흐름은 그대로 유지
+- {"구체적인 설명, 예시, 환자 사례를 보태서 자연스럽게 늘리기" if diff > 0 else "중복 표현과 불필요한 수식어를 덜어내서 간결하게 줄이기"}
+- Markdown 기호 없이 순수한 텍스트로, 고친 문단만 출력
+
+[문단]
+{section}"""
+
+            try:
+                response = await llm_client.complete(
+                    provider=ai_provider,
+                    api_key=api_key,
+                    prompt=prompt,
+                    model=model,
+                    max_tokens=max(800, new_length * 4),
+                    temperature=0.4,
+                    timeout=60.0,
+                )
+            except Exception as e:
+                print(f"⚠️ 문단 보정 실패: {e}")
+                break
+
+            usage["input_tokens"] += response["input_tokens"]
+            usage["output_tokens"] += response["output_tokens"]
+            adjusted += 1
+
+            rewritten = self._remove_markdown_formatting(response["text"])
+            if not rewritten:
+                break
+            paragraphs[index] = rewritten
+            content = "\n\n".join(paragraphs)
+
+        return content, adjusted
+
+    async def generate_streaming(
+        self,
+        original_content: str,
+        doctor_profile: Dict,
+        on_delta: Callable[[str, int], Awaitable[None]],
+        framework: str = "관심유도형",
+        persuasion_level: int = 3,
+        target_length: int = 1500,
+        target_audience: Optional[Dict] = None,
+        writing_perspective: str = "1인칭",
+        custom_writing_style: Optional[Dict] = None,
+        requirements: Optional[Dict] = None,
+        ai_provider: str = "gpt",
+        ai_model: Optional[str] = None,
+        seo_optimization: Optional[Dict] = None,
+        top_post_rules: Optional[Dict] = None,
+    ) -> str:
+        """
+        스트리밍 각색 실행 - 생성되는 텍스트를 on_delta로 즉시 전달
+
+        Markdown 제거와 글자수 조정을 스트림 중에 처리합니다.
+        목표 글자수를 넘긴 뒤 첫 문장/문단 경계에서, 늦어도 최대 허용 글자수에서 스트림을 닫으므로
+        재생성 없이 한 번의 호출로 끝나며 보관하는 텍스트도 최대 허용 글자수로 제한됩니다.
+
+        Args:
+            on_delta: 정리된 텍스트 조각과 현재까지의 글자수를 받는 비동기 콜백
+            (나머지 인자는 generate와 동일)
+
+        Returns:
+            각색된 블로그 포스팅 전체
+        """
+        if ai_provider not in PROVIDER_LABELS:
+            ai_provider = "gpt"
+
+        min_length = int(target_length * 0.95)
+        max_length = int(target_length * 1.05)
+        model = ai_model or DEFAULT_MODELS[ai_provider]
+        # generate와 동일하게 학습된 보정 배수 사용
+        multiplier = await length_controller.get_multiplier(ai_provider, model)
+        adjusted_target_length = int(target_length * multiplier)
+
+        system_prompt = self._build_system_prompt(
+            doctor_profile,
+            writing_perspective,
+            custom_writing_style,
+            requirements,
+            adjusted_target_length,
+            seo_optimization,
+            top_post_rules
+        )
+        user_prompt = self._build_user_prompt(
+            original_content, framework, persuasion_level, adjusted_target_length, target_audience
+        )
+        max_tokens = max(4000, min(int(adjusted_target_length * 4) + 1500, 16000))
+
+        api_key = await get_api_key_from_db(ai_provider)
+        if not api_key:
+            raise Exception(f"{PROVIDER_LABELS[ai_provider]} API 키가 설정되지 않았습니다.")
+        if ai_provider == "gemini" and not GEMINI_AVAILABLE:
+            raise Exception("Gemini SDK가 설치되어 있지 않습니다.")
+
+        stream = llm_client.stream(
+            provider=ai_provider,
+            api_key=api_key,
+            prompt=user_prompt,
+            system_prompt=system_prompt,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=0.4,
+        )
+        stripper = MarkdownStreamStripper()
+        parts: List[str] = []
+        length = 0
+        buffer = ""
+        last_flush = 0.0
+        stopped = False
+
+        async def flush_buffer():
+            nonlocal buffer, last_flush
+            if buffer:
+                await on_delta(buffer, length)
+                buffer = ""
+                last_flush = time.monotonic()
+
+        try:
+            async for delta in stream:
+                cleaned = stripper.feed(delta)
+                if not cleaned:
+                    if length >= target_length and stripper.at_line_break:
+                        stopped = True  # 목표 도달 후 문단 경계
+                        break
+                    continue
+
+                cut = self._find_stream_cut(cleaned, length, target_length, max_length)
+                if cut is not None:
+                    cleaned = cleaned[:cut]
+                    stopped = True
+
+                parts.append(cleaned)
+                length += len(cleaned)
+                buffer += cleaned
+
+                # 첫 조각은 즉시, 이후에는 모아서 전송 (WebSocket 메시지 수 제한)
+                if stopped or last_flush == 0.0 or len(buffer) >= 32 or time.monotonic() - last_flush >= 0.2:
+                    await flush_buffer()
+                if stopped:
+                    break
+        except Exception as e:
+            raise Exception(f"AI 각색 중 오류 발생: {str(e)}")
+        finally:
+            await stream.aclose()
+
+        if not stopped:
+            tail = stripper.flush().rstrip()
+            parts.append(tail)
+            length += len(tail)
+            buffer += tail
+        await flush_buffer()
+
+        generated_content = "".join(parts).strip()
+
+        # 자연 종료한 경우에만 학습 (중간에 끊은 길이는 모델의 실제 생성량이 아님)
+        if not stopped:
+            length_controller.observe(ai_provider, model, adjusted_target_length, len(generated_content))
+        length_controller.record_result(
+            ai_provider, model, 1, 0, min_length <= len(generated_content) <= max_length
+        )
+
+        self.last_usage = {
+            **stream.usage,
+            "total_tokens": stream.input_tokens + stream.output_tokens,
+            "target_length": target_length,
+            "length_multiplier": round(multiplier, 3),
+            "raw_content_length": None if stopped else len(generated_content),
+            "generation_attempts": 1,
+        }
+
+        print(f"📡 스트리밍 각색 완료 (목표: {target_length}자, 실제: {len(generated_content)}자)")
+        return generated_content
+
+    @staticmethod
+    def _find_stream_cut(
+        chunk: str, length: int, target_length: int, max_length: int
+    ) -> Optional[int]:
+        """
+        chunk를 이어붙였을 때 잘라야 할 위치 반환 (없으면 None)
+        목표 글자수 이후 첫 문장 끝, 그 전에 최대 허용 글자수에 닿으면 그 지점
+        """
+        for i in range(max(0, target_length - length), len(chunk)):
+            if length + i >= max_length:
+                return i
+            if chunk[i] in SENTENCE_ENDINGS and (i + 1 == len(chunk) or chunk[i + 1].isspace()):
+                return i + 1
+        if length + len(chunk) >= max_length:
+            return max_length - length
+        return None
+
     async def generate_title_and_meta(
         self, content: str, specialty: str
     ) -> Dict[str, str]:
@@ -877,17 +1160,17 @@ class AIRewriteEngine:
             if not gpt_api_key:
                 raise Exception("GPT API 키가 설정되지 않았습니다.")
 
-            http_client = httpx.Client(timeout=httpx.Timeout(connect=30.0, read=60.0, write=30.0, pool=30.0))
-            openai_client = OpenAI(api_key=gpt_api_key, http_client=http_client, timeout=60.0)
-
-            response = openai_client.chat.completions.create(
+            response = await llm_client.complete(
+                provider="gpt",
+                api_key=gpt_api_key,
+                prompt=prompt,
                 model="gpt-4o-mini",  # 간단한 작업에는 mini 모델 사용
                 max_tokens=500,
                 temperature=0.5,
-                messages=[{"role": "user", "content": prompt}],
+                timeout=60.0,
             )
 
-            result = response.choices[0].message.content
+            result = response["text"]
 
             # 결과 파싱
             lines = result.strip().split("\n")
@@ -953,17 +1236,17 @@ class AIRewriteEngine:
             if not gpt_api_key:
                 raise Exception("GPT API 키가 설정되지 않았습니다.")
 
-            http_client = httpx.Client(timeout=httpx.Timeout(connect=30.0, read=60.0, write=30.0, pool=30.0))
-            openai_client = OpenAI(api_key=gpt_api_key, http_client=http_client, timeout=60.0)
-
-            response = openai_client.chat.completions.create(
+            response = await llm_client.complete(
+                provider="gpt",
+                api_key=gpt_api_key,
+                prompt=prompt,
                 model="gpt-4o-mini",
                 max_tokens=600,
                 temperature=0.7,
-                messages=[{"role": "user", "content": prompt}],
+                timeout=60.0,
             )
 
-            result = response.choices[0].message.content
+            result = response["text"]
 
             # 결과 파싱
             titles = []
@@ -1014,17 +1297,17 @@ class AIRewriteEngine:
             if not gpt_api_key:
                 raise Exception("GPT API 키가 설정되지 않았습니다.")
 
-            http_client = httpx.Client(timeout=httpx.Timeout(connect=30.0, read=60.0, write=30.0, pool=30.0))
-            openai_client = OpenAI(api_key=gpt_api_key, http_client=http_client, timeout=60.0)
-
-            response = openai_client.chat.completions.create(
+            response = await llm_client.complete(
+                provider="gpt",
+                api_key=gpt_api_key,
+                prompt=prompt,
                 model="gpt-4o-mini",
                 max_tokens=400,
                 temperature=0.6,
-                messages=[{"role": "user", "content": prompt}],
+                timeout=60.0,
             )
 
-            result = response.choices[0].message.content
+            result = response["text"]
 
             # "## " 패턴으로 소제목 추출
             subtitles = []
@@ -1040,5 +1323,150 @@ class AIRewriteEngine:
             return ["소제목 생성 실패"] * 4
 
 
+    async def generate_post_extras(
+        self, content: str, specialty: str = "의료"
+    ) -> Dict:
+        """
+        제목/메타/해시태그, 후킹 제목 5개, 소제목 4개, DIA/CRANK 점수를 한 번의 호출로 생성
+
+        본문을 한 번만 전송하므로 개별 호출 대비 입력 토큰과 왕복 횟수가 줄어듭니다.
+        파싱에 실패한 항목은 결과에서 빠지므로 호출 측에서 개별 메서드로 보완해야 합니다.
+
+        Args:
+            content: 생성된 콘텐츠
+            specialty: 진료 과목
+
+        Returns:
+            title, meta_description, hashtags, suggested_titles, suggested_subtitles,
+            dia_crank_analysis 중 유효하게 파싱된 항목만 포함한 딕셔너리
+        """
+        prompt = f"""다음 {specialty} 블로그 글을 분석하여 아래 JSON 형식으로만 응답하세요.
+
+[블로그 내용]
+{content}
+
+[작성 가이드]
+- title: 네이버 검색 최적화된 제목 (50자 이내)
+- meta_description: 메타 설명 (150자 이내)
+- hashtags: 추천 해시태그 10개 (# 없이)
+- suggested_titles: 클릭하고 싶어지는 후킹 제목 5개 (50자 이내, 질문형/비교형/팁 제공형 등 다양하게,
+  의료법 위반 표현(최고, 100%, 완치 등) 금지)
+- suggested_subtitles: 글을 4개 섹션으로 나눴을 때 각 섹션의 소제목 4개 (20자 이내, 마크다운 기호 없이)
+- dia_score: DIA 점수 (experience 경험 정보, information 정보성, originality 독창성, timeliness 적시성),
+  각 항목 0-100점과 analysis, suggestions 포함, total은 평균
+- crank_score: C-RANK 점수 (context 주제 집중도, content 콘텐츠 품질, chain 참여도, creator 작성자 신뢰도),
+  각 항목 0-100점과 analysis, suggestions 포함, total은 평균
+- overall_grade: S(95+), A+(90+), A(85+), B+(80+), B(70+), C(60+), D(60 미만)
+- estimated_ranking: 예상 순위 (예: "상위 10%")
+- summary: 한 줄 총평
+
+[형식]
+{{
+  "title": "...",
+  "meta_description": "...",
+  "hashtags": ["태그1", "태그2"],
+  "suggested_titles": ["제목1", "제목2", "제목3", "제목4", "제목5"],
+  "suggested_subtitles": ["소제목1", "소제목2", "소제목3", "소제목4"],
+  "dia_score": {{
+    "total": 85,
+    "experience": {{"score": 90, "analysis": "...", "suggestions": ["..."]}},
+    "information": {{"score": 85, "analysis": "...", "suggestions": []}},
+    "originality": {{"score": 80, "analysis": "...", "suggestions": []}},
+    "timeliness": {{"score": 85, "analysis": "...", "suggestions": []}}
+  }},
+  "crank_score": {{
+    "total": 88,
+    "context": {{"score": 92, "analysis": "...", "suggestions": []}},
+    "content": {{"score": 87, "analysis": "...", "suggestions": []}},
+    "chain": {{"score": 85, "analysis": "...", "suggestions": []}},
+    "creator": {{"score": 90, "analysis": "...", "suggestions": []}}
+  }},
+  "overall_grade": "A",
+  "estimated_ranking": "상위 10%",
+  "summary": "..."
+}}"""
+
+        try:
+            # DB에서 GPT API 키 로드
+            gpt_api_key = await get_api_key_from_db("gpt")
+            if not gpt_api_key:
+                raise Exception("GPT API 키가 설정되지 않았습니다.")
+
+            response = await llm_client.complete(
+                provider="gpt",
+                api_key=gpt_api_key,
+                prompt=prompt,
+                model="gpt-4o-mini",
+                max_tokens=3000,
+                temperature=0.5,
+                timeout=90.0,
+                json_mode=True,
+            )
+
+            return self._parse_post_extras(response["text"])
+
+        except Exception as e:
+            print(f"Error generating post extras: {e}")
+            return {}
+
+    def _parse_post_extras(self, text: str) -> Dict:
+        """
+        통합 응답 JSON 파싱 - 유효한 항목만 골라서 반환 (부분 성공 허용)
+        """
+        # 코드 블록 또는 앞뒤 설명문 제거
+        if "```" in text:
+            match = re.search(r'```(?:json)?\s*(.*?)```', text, re.DOTALL)
+            if match:
+                text = match.group(1)
+        start, end = text.find("{"), text.rfind("}")
+        if start == -1 or end <= start:
+            return {}
+
+        try:
+            data = json.loads(text[start:end + 1])
+        except ValueError:
+            return {}
+        if not isinstance(data, dict):
+            return {}
+
+        def string_list(value) -> List[str]:
+            if not isinstance(value, list):
+                return []
+            return [str(item).strip() for item in value if str(item).strip()]
+
+        extras = {}
+
+        title = data.get("title")
+        if isinstance(title, str) and title.strip():
+            extras["title"] = title.strip()
+            meta = data.get("meta_description")
+            extras["meta_description"] = meta.strip() if isinstance(meta, str) else ""
+            extras["hashtags"] = [tag.lstrip("#") for tag in string_list(data.get("hashtags"))]
+
+        suggested_titles = string_list(data.get("suggested_titles"))
+        if len(suggested_titles) >= 5:
+            extras["suggested_titles"] = suggested_titles[:5]
+
+        suggested_subtitles = [
+            subtitle.lstrip("#").strip() for subtitle in string_list(data.get("suggested_subtitles"))
+        ]
+        if len(suggested_subtitles) >= 4:
+            extras["suggested_subtitles"] = suggested_subtitles[:4]
+
+        dia_score, crank_score = data.get("dia_score"), data.get("crank_score")
+        if (
+            isinstance(dia_score, dict) and "total" in dia_score
+            and isinstance(crank_score, dict) and "total" in crank_score
+        ):
+            extras["dia_crank_analysis"] = {
+                "dia_score": dia_score,
+                "crank_score": crank_score,
+                "overall_grade": data.get("overall_grade", "N/A"),
+                "estimated_ranking": data.get("estimated_ranking", ""),
+                "summary": data.get("summary", ""),
+            }
+
+        return extras
+
 # Singleton instance
 ai_rewrite_engine = AIRewriteEngine()
@@ -3,9 +3,10 @@ AI Suggestions Service
 포스팅 개선 제안 생성
 """
 
-import anthropic
 from typing import Dict, List, Optional
 
+from app.services.llm_client import llm_client
+
 
 # DB에서 API 키 로드하는 함수
 async def get_api_key_from_db(provider: str) -> Optional[str]:
@@ -81,16 +82,17 @@ JSON 형식으로 답변해주세요."""
             if not claude_api_key:
                 raise Exception("Claude API 키가 설정되지 않았습니다.")
 
-            client = anthropic.Anthropic(api_key=claude_api_key, timeout=60.0)
-
-            message = client.messages.create(
+            message = await llm_client.complete(
+                provider="claude",
+                api_key=claude_api_key,
+                prompt=prompt,
                 model="claude-sonnet-4-5-20250929",
                 max_tokens=2000,
                 temperature=0.7,
-                messages=[{"role": "user", "content": prompt}],
+                timeout=60.0,
             )
 
-            response_text = message.content[0].text
+            response_text = message["text"]
 
             # Parse JSON response
             import json
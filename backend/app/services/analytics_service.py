@@ -0,0 +1,263 @@
+"""
+Analytics Service - 포스팅 통계 집계
+개요/트렌드/기간 비교/리포트 통계를 SQL 집계(COUNT/AVG/GROUP BY)로 계산합니다.
+포스팅 행을 파이썬으로 읽어오지 않으므로 응답 시간과 메모리가 포스팅 수와 무관합니다.
+
+seo_keywords(JSON 배열)는 DB의 JSON 함수로 펼쳐서 집계합니다.
+- SQLite: json_each
+- PostgreSQL: json_array_elements_text WITH ORDINALITY
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import JSON, case, cast, func, literal, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.post import Post, PostStatus
+
+
+def day_of(column):
+    """일 단위 그룹 키 (SQLite는 'YYYY-MM-DD' 문자열, PostgreSQL은 date)"""
+    return func.date(column)
+
+
+def day_key(value) -> str:
+    """day_of() 결과를 'YYYY-MM-DD' 문자열로 통일"""
+    return value.isoformat() if isinstance(value, date) else str(value)
+
+
+def keyword_elements(dialect: str):
+    """
+    포스팅별 seo_keywords 원소 테이블 (value, position: 0부터)
+
+    {"keywords": [...]} 형태로 저장된 예전 데이터도 함께 처리하며,
+    배열이 아닌 값은 빈 배열로 취급합니다.
+    """
+    if dialect == "postgresql":
+        nested = case(
+            (func.json_typeof(Post.seo_keywords) == "object", Post.seo_keywords.op("->")("keywords")),
+            else_=Post.seo_keywords,
+        )
+        keywords = case(
+            (func.json_typeof(nested) == "array", nested),
+            else_=cast(literal("[]"), JSON),
+        )
+        elements = func.json_array_elements_text(keywords).table_valued(
+            "value", with_ordinality="ordinality"
+        ).render_derived(name="keyword")
+        return elements, elements.c.value, elements.c.ordinality - 1
+
+    nested = case(
+        (func.json_type(Post.seo_keywords) == "object", func.json_extract(Post.seo_keywords, "$.keywords")),
+        else_=Post.seo_keywords,
+    )
+    keywords = case((func.json_type(nested) == "array", nested), else_=func.json("[]"))
+    elements = func.json_each(keywords).table_valued("value", "key").alias("keyword")
+    return elements, elements.c.value, elements.c.key
+
+
+async def top_keywords(
+    db: AsyncSession,
+    conditions: List,
+    limit: int = 10,
+    per_post_limit: Optional[int] = None,
+    count_unique: bool = True,
+) -> Dict:
+    """
+    조건에 맞는 포스팅들의 키워드 빈도 상위 목록
+
+    Args:
+        conditions: Post에 대한 WHERE 조건 목록
+        per_post_limit: 포스팅마다 앞에서 N개 키워드만 집계
+        count_unique: 서로 다른 키워드 수도 계산 (키워드를 한 번 더 펼치므로 필요할 때만)
+
+    Returns:
+        {"top_keywords": [{"keyword", "count"}], "total_unique_keywords": int}
+    """
+    elements, value, position = keyword_elements(db.bind.dialect.name)
+    where = [*conditions, Post.seo_keywords.isnot(None), value.isnot(None)]
+    if per_post_limit is not None:
+        where.append(position < per_post_limit)
+
+    base = select(value.label("keyword")).select_from(Post).join(elements, true()).where(*where)
+    counted = base.subquery()
+
+    count = func.count().label("count")
+    rows = await db.execute(
+        select(counted.c.keyword, count)
+        .group_by(counted.c.keyword)
+        .order_by(count.desc(), counted.c.keyword)
+        .limit(limit)
+    )
+    result = {"top_keywords": [{"keyword": row.keyword, "count": row.count} for row in rows]}
+    if count_unique:
+        unique = await db.execute(select(func.count(func.distinct(counted.c.keyword))))
+        result["total_unique_keywords"] = unique.scalar_one()
+    return result
+
+
+class AnalyticsService:
+    """포스팅 통계 집계"""
+
+    async def get_overview(self, db: AsyncSession, user_id: UUID) -> Dict:
+        """전체 개요 (개수/평균 점수/상태별/상위 키워드/최근 30일 추이)"""
+        now = datetime.utcnow()
+        month_start = datetime(now.year, now.month, 1)
+        week_start = now - timedelta(days=7)
+        owned = Post.user_id == user_id
+
+        totals = (await db.execute(
+            select(
+                func.count(Post.id).label("total"),
+                func.avg(Post.persuasion_score).label("avg_score"),
+                func.count(case((Post.created_at >= month_start, 1))).label("this_month"),
+                func.count(case((Post.created_at >= week_start, 1))).label("this_week"),
+                func.count(case((Post.status == PostStatus.DRAFT, 1))).label("draft"),
+                func.count(case((Post.status == PostStatus.PUBLISHED, 1))).label("published"),
+                func.count(case((Post.status == PostStatus.ARCHIVED, 1))).label("archived"),
+            ).where(owned)
+        )).one()
+
+        if not totals.total:
+            return {
+                "total_posts": 0,
+                "average_persuasion_score": 0,
+                "posts_this_month": 0,
+                "posts_this_week": 0,
+                "time_saved_minutes": 0,
+                "status_breakdown": {"draft": 0, "published": 0},
+                "top_keywords": [],
+                "persuasion_trend": [],
+            }
+
+        # 각 포스트의 상위 5개 키워드
+        keywords = await top_keywords(db, [owned], limit=10, per_post_limit=5, count_unique=False)
+
+        # 설득력 트렌드 (최근 30일, 날짜별 평균)
+        day = day_of(Post.created_at).label("day")
+        trend_rows = await db.execute(
+            select(day, func.avg(Post.persuasion_score), func.count())
+            .where(owned, Post.created_at >= now - timedelta(days=30))
+            .group_by(day)
+            .order_by(day)
+        )
+
+        return {
+            "total_posts": totals.total,
+            "average_persuasion_score": round(totals.avg_score or 0, 2),
+            "posts_this_month": totals.this_month,
+            "posts_this_week": totals.this_week,
+            # 시간 절약 계산 (포스트당 60분 가정)
+            "time_saved_minutes": totals.total * 60,
+            "status_breakdown": {
+                "draft": totals.draft,
+                "published": totals.published,
+                "archived": totals.archived,
+            },
+            "top_keywords": keywords["top_keywords"],
+            "persuasion_trend": [
+                {"date": day_key(day_value), "score": score, "count": count}
+                for day_value, score, count in trend_rows
+            ],
+        }
+
+    async def get_trends(self, db: AsyncSession, user_id: UUID, days: int) -> Dict:
+        """기간 내 일별 포스팅 수/점수 추이"""
+        start_date = datetime.utcnow() - timedelta(days=days)
+        day = day_of(Post.created_at).label("day")
+        rows = (await db.execute(
+            select(
+                day,
+                func.count(),
+                func.avg(Post.persuasion_score),
+                func.max(Post.persuasion_score),
+                func.min(Post.persuasion_score),
+            )
+            .where(Post.user_id == user_id, Post.created_at >= start_date)
+            .group_by(day)
+            .order_by(day)
+        )).all()
+
+        total_posts = sum(row[1] for row in rows)
+        if not total_posts:
+            return {
+                "period_days": days,
+                "total_posts": 0,
+                "daily_average": 0,
+                "score_trend": [],
+                "volume_trend": [],
+            }
+
+        return {
+            "period_days": days,
+            "total_posts": total_posts,
+            "daily_average": round(total_posts / days, 2),
+            "score_trend": [
+                {
+                    "date": day_key(day_value),
+                    "average_score": round(avg_score or 0, 2),
+                    "max_score": round(max_score or 0, 2),
+                    "min_score": round(min_score or 0, 2),
+                }
+                for day_value, _, avg_score, max_score, min_score in rows
+            ],
+            "volume_trend": [
+                {"date": day_key(day_value), "count": count}
+                for day_value, count, *_ in rows
+            ],
+        }
+
+    async def get_comparison(self, db: AsyncSession, user_id: UUID) -> Dict:
+        """이번 달과 지난 달 비교 (한 번의 GROUP BY)"""
+        now = datetime.utcnow()
+        this_month_start = datetime(now.year, now.month, 1)
+        if now.month == 1:
+            last_month_start = datetime(now.year - 1, 12, 1)
+        else:
+            last_month_start = datetime(now.year, now.month - 1, 1)
+
+        period = case((Post.created_at >= this_month_start, "this_month"), else_="last_month").label("period")
+        rows = await db.execute(
+            select(
+                period,
+                func.count(),
+                func.avg(Post.persuasion_score),
+                func.count(case((Post.status == PostStatus.PUBLISHED, 1))),
+            )
+            .where(Post.user_id == user_id, Post.created_at >= last_month_start)
+            .group_by(period)
+        )
+
+        stats = {
+            "this_month": {"count": 0, "avg_score": 0, "published": 0},
+            "last_month": {"count": 0, "avg_score": 0, "published": 0},
+        }
+        for name, count, avg_score, published in rows:
+            stats[name] = {
+                "count": count,
+                "avg_score": round(avg_score or 0, 2),
+                "published": published,
+            }
+
+        # 변화율 계산
+        def calc_change(current, previous):
+            if previous == 0:
+                return 100 if current > 0 else 0
+            return round(((current - previous) / previous) * 100, 2)
+
+        this_month, last_month = stats["this_month"], stats["last_month"]
+        return {
+            "this_month": this_month,
+            "last_month": last_month,
+            "changes": {
+                "count_change_percent": calc_change(this_month["count"], last_month["count"]),
+                "score_change_percent": calc_change(this_month["avg_score"], last_month["avg_score"]),
+                "published_change_percent": calc_change(this_month["published"], last_month["published"]),
+            },
+        }
+
+
+# Singleton instance
+analytics_service = AnalyticsService()
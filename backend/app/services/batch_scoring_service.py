@@ -0,0 +1,287 @@
+"""
+Batch Scoring Service - 대량 콘텐츠 일괄 검사/채점
+의료법·금칙어 검사, 설득력/SEO 점수, 콘텐츠 분석을 수천~수십만 건 단위로 실행합니다.
+
+검사기들은 순수 파이썬 정규식 작업이라 GIL에 묶이므로, 텍스트를 묶음(chunk)으로 나눠
+프로세스 풀에 분산하고 끝나는 묶음부터 결과를 흘려보냅니다.
+작업 프로세스는 메인 프로세스의 현재 규칙 세트를 그대로 받아 사용하며,
+규칙이 바뀌면 풀을 새 규칙으로 다시 만듭니다.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Union
+from uuid import UUID
+
+from sqlalchemy import select, update
+
+from app.core.config import settings
+from app.services.compliance_rules import compliance_rule_store
+from app.services.content_analyzer import content_analyzer
+from app.services.forbidden_words_checker import forbidden_words_checker
+from app.services.medical_law_checker import medical_law_checker
+from app.services.persuasion_scorer import persuasion_scorer
+from app.services.seo_optimizer import seo_optimizer
+
+logger = logging.getLogger(__name__)
+
+# 실행 가능한 검사 항목
+CHECKS = ("medical_law", "forbidden_words", "persuasion", "seo", "analysis")
+
+
+def score_item(item: Dict, checks: Sequence[str]) -> Dict:
+    """
+    텍스트 한 건 검사/채점
+
+    Args:
+        item: {"index", "id", "text", "title", "keywords", "hashtags"}
+        checks: CHECKS 중 실행할 항목
+
+    Returns:
+        {"index", "id", "rules_version", <항목별 결과>} (실패 시 "error")
+    """
+    text = item.get("text") or ""
+    result = {
+        "index": item.get("index"),
+        "id": item.get("id"),
+        "rules_version": compliance_rule_store.current.version,
+    }
+    try:
+        if "medical_law" in checks:
+            result["medical_law"] = medical_law_checker.check(text)
+        if "forbidden_words" in checks:
+            result["forbidden_words"] = forbidden_words_checker.check_only(text)
+        if "persuasion" in checks:
+            result["persuasion"] = persuasion_scorer.calculate_score(text)
+        if "seo" in checks:
+            result["seo_score"] = seo_optimizer.get_seo_score(
+                text,
+                item.get("title") or "",
+                item.get("keywords") or [],
+                item.get("hashtags") or [],
+            )
+        if "analysis" in checks:
+            result["analysis"] = content_analyzer.analyze(text)
+    except Exception as e:
+        result["error"] = str(e)
+    return result
+
+
+def _init_worker(rules_snapshot: Dict):
+    """작업 프로세스 시작 시 메인 프로세스의 규칙 세트를 설치 (DB 접근 없음)"""
+    compliance_rule_store.install_snapshot(rules_snapshot)
+
+
+def _score_chunk(items: List[Dict], checks: Sequence[str]) -> List[Dict]:
+    """작업 프로세스에서 실행되는 묶음 단위 검사"""
+    return [score_item(item, checks) for item in items]
+
+
+async def _chunked(
+    items: Union[Iterable[Dict], AsyncIterable[Dict]], size: int
+) -> AsyncIterator[List[Dict]]:
+    """동기/비동기 입력을 size개씩 묶고 입력 순번(index)을 붙임"""
+    chunk: List[Dict] = []
+    index = 0
+
+    def numbered(item: Dict) -> Dict:
+        nonlocal index
+        item = {**item, "index": index}
+        index += 1
+        return item
+
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            chunk.append(numbered(item))
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+    else:
+        for item in items:
+            chunk.append(numbered(item))
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+class BatchScoringService:
+    """프로세스 풀 기반 대량 검사"""
+
+    def __init__(self, workers: int = 0, chunk_size: int = 50):
+        # workers: 0이면 CPU 코어 수, 1이면 풀 없이 스레드 하나에서 실행
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_rules_version: Optional[int] = None
+
+    def _get_executor(self) -> Optional[Executor]:
+        """현재 규칙 버전의 프로세스 풀 (규칙이 바뀌었으면 새로 생성)"""
+        if self.workers <= 1:
+            return None
+
+        version = compliance_rule_store.current.version
+        if self._pool is not None and self._pool_rules_version == version:
+            return self._pool
+
+        if self._pool is not None:
+            # 진행 중인 묶음은 이전 규칙으로 마치고 종료
+            self._pool.shutdown(wait=False)
+        # fork는 이벤트 루프/스레드 상태를 복제하므로 spawn 사용 (Windows와 동작 일치)
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(compliance_rule_store.snapshot(),),
+        )
+        self._pool_rules_version = version
+        logger.info(f"일괄 검사 프로세스 풀 생성 (작업자 {self.workers}, 규칙 v{version})")
+        return self._pool
+
+    async def stream(
+        self,
+        items: Union[Iterable[Dict], AsyncIterable[Dict]],
+        checks: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[Dict]:
+        """
+        입력을 묶음 단위로 프로세스 풀에 분산하고, 끝나는 순서대로 결과를 반환
+
+        입력 순서와 결과 순서는 다를 수 있으므로 각 결과의 index/id로 매칭합니다.
+        동시에 처리 중인 묶음 수를 작업자 수의 2배로 제한해 입력 전체를 메모리에 올리지 않습니다.
+
+        Args:
+            items: {"id", "text", "title", "keywords", "hashtags"} 목록 또는 비동기 이터러블
+            checks: 실행할 검사 항목 (기본: 전체)
+        """
+        checks = tuple(check for check in (checks or CHECKS) if check in CHECKS)
+        await compliance_rule_store.refresh_if_stale()
+
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        max_pending = max(2, self.workers * 2)
+        pending = set()
+
+        try:
+            async for chunk in _chunked(items, self.chunk_size):
+                if len(pending) >= max_pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for future in done:
+                        for result in self._chunk_results(future):
+                            yield result
+                pending.add(loop.run_in_executor(executor, _score_chunk, chunk, checks))
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    for result in self._chunk_results(future):
+                        yield result
+        finally:
+            # 클라이언트 연결이 끊기면 아직 시작하지 않은 묶음은 취소
+            for future in pending:
+                future.cancel()
+
+    def _chunk_results(self, future: asyncio.Future) -> List[Dict]:
+        try:
+            return future.result()
+        except BrokenProcessPool:
+            # 작업 프로세스가 비정상 종료되면 다음 요청에서 풀을 새로 생성
+            self._pool = None
+            self._pool_rules_version = None
+            raise
+
+    async def score_many(
+        self, items: Iterable[Dict], checks: Optional[Sequence[str]] = None
+    ) -> List[Dict]:
+        """stream()의 결과를 입력 순서대로 모아 반환 (수백 건 이하 용도)"""
+        results = [result async for result in self.stream(items, checks)]
+        return sorted(results, key=lambda result: result["index"])
+
+    async def iter_posts(
+        self,
+        user_id: Optional[UUID] = None,
+        post_ids: Optional[List[UUID]] = None,
+        page_size: int = 500,
+    ) -> AsyncIterator[Dict]:
+        """
+        저장된 포스팅을 검사 입력 형태로 페이지 단위 조회 (id 기준 키셋 페이지네이션)
+
+        Args:
+            user_id: 해당 사용자의 포스팅만 (None이면 전체)
+            post_ids: 지정한 포스팅만
+        """
+        from app.db.database import AsyncSessionLocal
+        from app.models import Post
+
+        last_id = None
+        while True:
+            query = select(
+                Post.id, Post.title, Post.generated_content, Post.seo_keywords, Post.hashtags
+            ).where(Post.generated_content.isnot(None))
+            if user_id is not None:
+                query = query.where(Post.user_id == user_id)
+            if post_ids:
+                query = query.where(Post.id.in_(post_ids))
+            if last_id is not None:
+                query = query.where(Post.id > last_id)
+            query = query.order_by(Post.id).limit(page_size)
+
+            # 페이지마다 세션을 닫아 긴 검사 동안 연결을 붙잡지 않음
+            async with AsyncSessionLocal() as db:
+                rows = (await db.execute(query)).all()
+            if not rows:
+                return
+            for row in rows:
+                yield {
+                    "id": str(row.id),
+                    "text": row.generated_content,
+                    "title": row.title or "",
+                    "keywords": row.seo_keywords or [],
+                    "hashtags": row.hashtags or [],
+                }
+            last_id = rows[-1].id
+
+    async def save_results(self, results: List[Dict]) -> int:
+        """검사 결과를 포스팅에 반영 (의료법 검사, 설득력 점수, 콘텐츠 분석)"""
+        from app.db.database import AsyncSessionLocal
+        from app.models import Post
+
+        rows = []
+        for result in results:
+            if result.get("error") or not result.get("id"):
+                continue
+            row = {"id": UUID(result["id"])}
+            if "medical_law" in result:
+                row["medical_law_check"] = result["medical_law"]
+            if "persuasion" in result:
+                row["persuasion_score"] = result["persuasion"]["total"]
+            if "analysis" in result:
+                row["content_analysis"] = result["analysis"]
+            if len(row) > 1:
+                rows.append(row)
+        if not rows:
+            return 0
+
+        async with AsyncSessionLocal() as db:
+            # 기본키 포함 딕셔너리 목록 -> executemany 한 번
+            await db.execute(update(Post), rows)
+            await db.commit()
+        return len(rows)
+
+    def shutdown(self):
+        """프로세스 풀 종료 (애플리케이션 종료 시)"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+            self._pool_rules_version = None
+
+
+# Singleton instance
+batch_scoring_service = BatchScoringService(
+    workers=settings.BATCH_SCORING_WORKERS,
+    chunk_size=settings.BATCH_SCORING_CHUNK_SIZE,
+)
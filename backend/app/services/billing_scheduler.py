@@ -21,7 +21,12 @@ logger = logging.getLogger(__name__)
 
 
 class BillingSchedulerService:
-    """정기결제 스케줄러"""
+    """
+    정기결제 스케줄러
+
+    구독 하나를 처리할 때마다 커밋합니다. 변경분이 남은 채 refresh(autoflush)하면
+    이후 결제/알림 요청 내내 쓰기 커넥션을 점유하므로, 외부 호출 전에는 미반영 변경이 없어야 합니다.
+    """
 
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -98,6 +103,7 @@ class BillingSchedulerService:
                     sub.renewal_notice_sent = True
                     sub.renewal_notice_sent_at = now
                     sent_count += 1
+                    await self.db.commit()
 
             except Exception as e:
                 logger.error(f"알림 발송 실패 (subscription_id={sub.id}): {e}")
@@ -170,6 +176,7 @@ class BillingSchedulerService:
                         paid_at=now
                     )
                     self.db.add(payment)
+                    await self.db.commit()
 
                     # 결제 완료 알림
                     await self.db.refresh(sub, ["user"])
@@ -190,6 +197,7 @@ class BillingSchedulerService:
 
                     if sub.retry_count >= 3:
                         sub.status = SubscriptionStatus.PAST_DUE
+                    await self.db.commit()
 
                     # 결제 실패 알림
                     await self.db.refresh(sub, ["user"])
@@ -274,6 +282,7 @@ class BillingSchedulerService:
                         paid_at=now
                     )
                     self.db.add(payment)
+                    await self.db.commit()
 
                     logger.info(f"결제 재시도 성공: subscription_id={sub.id}")
                 else:
@@ -284,7 +293,9 @@ class BillingSchedulerService:
                     if sub.retry_count >= 3:
                         # 3회 모두 실패 - 구독 만료 처리
                         sub.status = SubscriptionStatus.EXPIRED
+                    await self.db.commit()
 
+                    if sub.status == SubscriptionStatus.EXPIRED:
                         # 최종 실패 알림
                         await self.db.refresh(sub, ["user"])
                         if sub.user and sub.user.email:
@@ -321,6 +332,7 @@ class BillingSchedulerService:
         for sub in subscriptions:
             try:
                 sub.status = SubscriptionStatus.CANCELLED
+                await self.db.commit()
 
                 # 해지 완료 알림
                 await self.db.refresh(sub, ["user", "plan"])
@@ -358,13 +370,14 @@ class BillingSchedulerService:
         for sub in subscriptions:
             try:
                 if sub.billing_key and not sub.cancel_at_period_end:
+                    await self.db.refresh(sub, ["plan"])
+
                     # 빌링키가 있으면 유료 전환
                     sub.status = SubscriptionStatus.ACTIVE
                     sub.current_period_start = now
                     sub.current_period_end = now + timedelta(days=30)
 
                     # 첫 정기결제 실행
-                    await self.db.refresh(sub, ["plan"])
                     if sub.plan:
                         order_id = f"trial_end_{sub.id}_{int(now.timestamp())}"
 
@@ -398,6 +411,7 @@ class BillingSchedulerService:
                 else:
                     # 빌링키가 없거나 해지 예정이면 만료
                     sub.status = SubscriptionStatus.EXPIRED
+                await self.db.commit()
 
                 logger.info(f"트라이얼 종료 처리: subscription_id={sub.id}")
 
@@ -5,11 +5,13 @@ Blog Crawler Service
 
 import re
 import httpx
-from bs4 import BeautifulSoup
 from typing import Optional, Dict, Any, List
 from urllib.parse import urlparse, parse_qs, urljoin
 import json
 
+from app.services.crawler_http import crawler_http
+from app.services.html_parser import make_soup
+
 
 class BlogCrawler:
     """블로그 글 크롤링 서비스"""
@@ -99,11 +101,11 @@ class BlogCrawler:
         # 모바일 URL로 변환 (크롤링 용이)
         mobile_url = self._convert_to_mobile_naver(url)
 
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            response = await client.get(mobile_url, headers=self.HEADERS)
+        async with crawler_http.session(timeout=30.0) as client:
+            response = await client.get(mobile_url, headers=self.HEADERS, cache="post")
             response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "lxml")
+        soup = make_soup(response.text)
 
         # 제목 추출
         title = ""
@@ -170,11 +172,11 @@ class BlogCrawler:
 
     async def _crawl_naver_iframe(self, iframe_url: str) -> Dict[str, Any]:
         """네이버 블로그 iframe 내부 크롤링 (구버전)"""
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            response = await client.get(iframe_url, headers=self.HEADERS)
+        async with crawler_http.session(timeout=30.0) as client:
+            response = await client.get(iframe_url, headers=self.HEADERS, cache="post")
             response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "lxml")
+        soup = make_soup(response.text)
 
         title = ""
         title_elem = soup.select_one(".pcol1, .se-title-text, .__se_title")
@@ -253,11 +255,11 @@ class BlogCrawler:
 
     async def _crawl_tistory(self, url: str) -> Dict[str, Any]:
         """티스토리 블로그 크롤링"""
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            response = await client.get(url, headers=self.HEADERS)
+        async with crawler_http.session(timeout=30.0) as client:
+            response = await client.get(url, headers=self.HEADERS, cache="post")
             response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "lxml")
+        soup = make_soup(response.text)
 
         # 제목 추출
         title = ""
@@ -320,11 +322,11 @@ class BlogCrawler:
 
     async def _crawl_generic(self, url: str) -> Dict[str, Any]:
         """일반 웹페이지 크롤링"""
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            response = await client.get(url, headers=self.HEADERS)
+        async with crawler_http.session(timeout=30.0) as client:
+            response = await client.get(url, headers=self.HEADERS, cache="post")
             response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "lxml")
+        soup = make_soup(response.text)
 
         # 제목 추출
         title = ""
@@ -8,12 +8,44 @@ from docx.shared import RGBColor, Pt, Inches
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
 from docx.oxml.shared import OxmlElement
 from docx.oxml.ns import qn
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import List, Dict, Optional, Union, BinaryIO
+import asyncio
+import binascii
+import os
 import re
 import io
 import base64
+import tempfile
 from PIL import Image
 
+from app.core.config import settings
+from app.services.image_cache import image_transcode_cache
+
+# 이미지 변환 결과: 최적화된 스트림, 이미지 없음(None), 변환 실패(Exception)
+PreparedImage = Union[io.BytesIO, None, Exception]
+
+# 이미지당 목표 크기와 품질 하한 (네이버 블로그 문서 5MB 제한)
+IMAGE_SIZE_BUDGET = 1 * 1024 * 1024
+MIN_JPEG_QUALITY = 40
+
+# base64 디코딩 단위 (4의 배수) - 큰 data URL을 한 번에 디코딩하면 GIL을 오래 잡아 이벤트 루프가 멈춤
+B64_CHUNK_CHARS = 1024 * 1024
+
+
+def _decode_data_url(url: str) -> bytes:
+    """data:image/...;base64,... URL을 청크 단위로 디코딩"""
+    start = url.index(',') + 1
+    try:
+        decoded = bytearray()
+        for offset in range(start, len(url), B64_CHUNK_CHARS):
+            decoded += base64.b64decode(url[offset:offset + B64_CHUNK_CHARS])
+        return bytes(decoded)
+    except binascii.Error:
+        # 줄바꿈 등이 섞여 청크 경계가 어긋난 경우 전체를 한 번에 디코딩
+        return base64.b64decode(url[start:])
+
 
 class BlogExporter:
     """
@@ -29,6 +61,72 @@ class BlogExporter:
             "warning": RGBColor(251, 191, 36),  # 노랑
             "info": RGBColor(168, 85, 247),  # 보라
         }
+        # 문서 생성/이미지 변환 작업 스레드 풀 (PIL, lxml은 GIL을 놓고 실행)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=settings.EXPORT_WORKERS or min(4, os.cpu_count() or 1),
+                thread_name_prefix="blog-export",
+            )
+        return self._executor
+
+    async def _run(self, func, *args, **kwargs):
+        """작업 스레드 풀에서 실행 (이벤트 루프를 막지 않도록)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), partial(func, *args, **kwargs))
+
+    def shutdown(self):
+        """스레드 풀 종료 (애플리케이션 종료 시)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def export_to_docx_async(
+        self,
+        content: str,
+        title: str = "",
+        images: Optional[List[Dict]] = None,
+        keywords: Optional[List[str]] = None,
+        emphasis_phrases: Optional[List[str]] = None,
+    ) -> BinaryIO:
+        """
+        워드 문서 생성 (비동기)
+
+        이미지 디코딩/리사이징/JPEG 인코딩을 스레드 풀에서 동시에 처리한 뒤
+        문서 조립도 스레드 풀에서 실행합니다. 결과는 EXPORT_SPOOL_MAX_MB까지는 메모리,
+        넘으면 디스크 임시 파일에 쓰인 SpooledTemporaryFile (처음 위치로 되감김)이며
+        호출자가 닫아야 합니다.
+        """
+        images_list = images or []
+        prepared = await asyncio.gather(
+            *(self._run(self._prepare_image, img_data) for img_data in images_list)
+        )
+
+        output = tempfile.SpooledTemporaryFile(
+            max_size=settings.EXPORT_SPOOL_MAX_MB * 1024 * 1024, suffix=".docx"
+        )
+        try:
+            return await self._run(
+                self._render_docx,
+                content, images_list, list(prepared), keywords, emphasis_phrases, output,
+            )
+        except BaseException:
+            output.close()
+            raise
+
+    async def export_to_naver_html_async(
+        self,
+        content: str,
+        title: str = "",
+        keywords: Optional[List[str]] = None,
+        emphasis_phrases: Optional[List[str]] = None,
+    ) -> str:
+        """네이버 블로그 전용 HTML 생성 (비동기, 스레드 풀에서 실행)"""
+        return await self._run(
+            self.export_to_naver_html, content, title, keywords, emphasis_phrases
+        )
 
     def export_to_docx(
         self,
@@ -51,6 +149,22 @@ class BlogExporter:
         Returns:
             BytesIO 객체 (워드 파일)
         """
+        images_list = images or []
+        prepared = [self._prepare_image(img_data) for img_data in images_list]
+        return self._render_docx(
+            content, images_list, prepared, keywords, emphasis_phrases, io.BytesIO()
+        )
+
+    def _render_docx(
+        self,
+        content: str,
+        images_list: List[Dict],
+        prepared: List[PreparedImage],
+        keywords: Optional[List[str]],
+        emphasis_phrases: Optional[List[str]],
+        file_stream: BinaryIO,
+    ) -> BinaryIO:
+        """변환된 이미지로 문서를 조립해 file_stream에 저장 (처음 위치로 되감아 반환)"""
         doc = Document()
 
         # 기본 스타일 설정 - 영문 폰트 이름만 사용 (인코딩 문제 해결)
@@ -68,7 +182,6 @@ class BlogExporter:
 
         # 2. 본문 처리
         paragraphs = [p for p in content.split('\n\n') if p.strip()]
-        images_list = images or []
         total_paras = len(paragraphs)
 
         # 이미지 삽입 위치 계산: 문단을 균등하게 나눔
@@ -107,21 +220,20 @@ class BlogExporter:
             # 이미지 삽입 (계산된 위치에서)
             if img_index < len(image_positions) and para_index + 1 == image_positions[img_index]:
                 if img_index < len(images_list):
-                    self._add_image_to_doc(doc, images_list[img_index])
+                    self._add_image_to_doc(doc, images_list[img_index], prepared[img_index])
                 img_index += 1
 
         # 3. 남은 이미지 마지막에 추가
         while img_index < len(images_list):
-            self._add_image_to_doc(doc, images_list[img_index])
+            self._add_image_to_doc(doc, images_list[img_index], prepared[img_index])
             img_index += 1
 
-        # 파일을 메모리에 저장
-        file_stream = io.BytesIO()
+        # 파일 저장
         doc.save(file_stream)
+        file_size = file_stream.tell()
         file_stream.seek(0)
 
         # 파일 크기 검증 (네이버 블로그 5MB 제한)
-        file_size = len(file_stream.getvalue())
         file_size_mb = file_size / (1024 * 1024)
         print(f"📄 DOCX 파일 크기: {file_size_mb:.2f}MB")
 
@@ -236,98 +348,139 @@ class BlogExporter:
             if item_text:
                 doc.add_paragraph(item_text, style='List Bullet')
 
-    def _convert_to_png(self, img_source, max_width: int = 1200, quality: int = 85) -> io.BytesIO:
+    def _convert_to_png(
+        self,
+        img_source,
+        max_width: int = 1200,
+        quality: int = 85,
+        max_bytes: int = IMAGE_SIZE_BUDGET,
+    ) -> io.BytesIO:
         """
-        이미지를 최적화하여 PNG/JPEG 형식으로 변환 (네이버 블로그 5MB 제한 대응)
+        이미지를 최적화하여 JPEG 형식으로 변환 (네이버 블로그 5MB 제한 대응)
 
         네이버 블로그는 EMF, WebP 등 일부 형식을 지원하지 않음
-        이미지 리사이징 + 압축으로 파일 크기를 5MB 이하로 최적화
+        이미지 리사이징 + 압축으로 이미지당 max_bytes 이하로 최적화.
+        같은 원본/파라미터 결과는 디스크 캐시에서 바로 반환 (편집 중 반복 내보내기)
 
         Args:
             img_source: 이미지 소스 (파일 경로 또는 BytesIO)
             max_width: 최대 너비 (기본값: 1200px - 네이버 블로그 최적)
-            quality: JPEG 품질 (1-95, 기본값: 85)
+            quality: JPEG 최대 품질 (1-95, 기본값: 85)
+            max_bytes: 이미지당 목표 크기 (넘으면 품질을 낮춤)
 
         Returns:
             최적화된 이미지 BytesIO
         """
         try:
-            # 이미지 열기
             if isinstance(img_source, str):
                 # 파일 경로
-                img = Image.open(img_source)
+                with open(img_source, 'rb') as f:
+                    source = f.read()
             else:
-                # BytesIO 또는 bytes
-                img = Image.open(img_source)
-
-            # 1. 이미지 리사이징 (큰 이미지는 축소)
-            original_width, original_height = img.size
-            if original_width > max_width:
-                # 비율 유지하며 리사이징
-                ratio = max_width / original_width
-                new_height = int(original_height * ratio)
-                img = img.resize((max_width, new_height), Image.Resampling.LANCZOS)
-                print(f"✅ 이미지 리사이징: {original_width}x{original_height} → {max_width}x{new_height}")
-
-            # 2. RGBA를 RGB로 변환 (투명도 처리)
-            if img.mode in ('RGBA', 'LA', 'P'):
-                # 흰색 배경에 합성
-                background = Image.new('RGB', img.size, (255, 255, 255))
-                if img.mode == 'P':
-                    img = img.convert('RGBA')
-                background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-                img = background
-            elif img.mode != 'RGB':
-                img = img.convert('RGB')
-
-            # 3. JPEG로 저장 (PNG보다 훨씬 작은 파일 크기)
-            output = io.BytesIO()
-            img.save(output, format='JPEG', quality=quality, optimize=True)
-            output.seek(0)
-
-            # 파일 크기 확인
-            file_size = len(output.getvalue())
-            file_size_mb = file_size / (1024 * 1024)
-            print(f"✅ 이미지 최적화 완료: {file_size_mb:.2f}MB (품질: {quality})")
-
-            # 4. 만약 파일이 너무 크면 (1MB 이상) 더 압축
-            if file_size > 1 * 1024 * 1024:  # 1MB
-                print(f"⚠️ 파일이 큼 ({file_size_mb:.2f}MB), 추가 압축 진행...")
-                output = io.BytesIO()
-                # 품질을 낮춰서 다시 저장
-                img.save(output, format='JPEG', quality=70, optimize=True)
-                output.seek(0)
-                file_size = len(output.getvalue())
-                file_size_mb = file_size / (1024 * 1024)
-                print(f"✅ 추가 압축 완료: {file_size_mb:.2f}MB (품질: 70)")
-
-            return output
+                # BytesIO
+                source = img_source.getvalue()
+
+            key = image_transcode_cache.make_key(source, max_width, quality, max_bytes)
+            cached = image_transcode_cache.get(key)
+            if cached is not None:
+                return io.BytesIO(cached)
+
+            data = self._transcode_jpeg(source, max_width, quality, max_bytes)
+            image_transcode_cache.put(key, data)
+            return io.BytesIO(data)
 
         except Exception as e:
             print(f"⚠️ 이미지 변환 실패: {e}")
             raise
 
-    def _add_image_to_doc(self, doc: Document, img_data: Dict):
+    def _transcode_jpeg(self, source: bytes, max_width: int, quality: int, max_bytes: int) -> bytes:
         """
-        이미지 추가 (JPEG 형식으로 최적화하여 네이버 블로그 5MB 제한 대응)
+        디코딩 + 축소 + JPEG 인코딩
 
-        Args:
-            img_data: {"url": "...", "caption": "...", "width": 5}
+        - JPEG 원본은 draft()로 DCT 단계에서 1/2~1/8 축소해 디코딩 (전체 해상도 디코딩 생략)
+        - 남은 축소는 reducing_gap으로 reduce() 후 LANCZOS 마무리
+        - quality로 max_bytes를 넘으면 이진 탐색으로 목표 안에 드는 가장 높은 품질 선택
         """
-        try:
-            img_stream = None
+        img = Image.open(io.BytesIO(source))
+        original_width, original_height = img.size
+
+        # 1. 이미지 리사이징 (큰 이미지는 축소, 비율 유지)
+        if original_width > max_width:
+            target = (max_width, max(1, int(original_height * max_width / original_width)))
+            if img.format == 'JPEG':
+                img.draft('RGB', target)
+            img = img.resize(target, Image.Resampling.LANCZOS, reducing_gap=3.0)
+            print(f"✅ 이미지 리사이징: {original_width}x{original_height} → {target[0]}x{target[1]}")
+
+        # 2. RGBA를 RGB로 변환 (투명도 처리)
+        if img.mode in ('RGBA', 'LA', 'P'):
+            # 흰색 배경에 합성
+            background = Image.new('RGB', img.size, (255, 255, 255))
+            if img.mode == 'P':
+                img = img.convert('RGBA')
+            background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
+            img = background
+        elif img.mode != 'RGB':
+            img = img.convert('RGB')
+
+        # 3. JPEG 인코딩 (PNG보다 훨씬 작은 파일 크기)
+        def encode(q: int) -> bytes:
+            output = io.BytesIO()
+            img.save(output, format='JPEG', quality=q, optimize=True)
+            return output.getvalue()
+
+        data = encode(quality)
+        if len(data) > max_bytes:
+            # 4. 목표 크기 안에 드는 가장 높은 품질 탐색
+            best = None
+            low, high = MIN_JPEG_QUALITY, quality - 1
+            while low <= high:
+                mid = (low + high) // 2
+                candidate = encode(mid)
+                if len(candidate) <= max_bytes:
+                    best, low = (mid, candidate), mid + 1
+                else:
+                    high = mid - 1
+            chosen, data = best or (MIN_JPEG_QUALITY, encode(MIN_JPEG_QUALITY))
+            print(f"⚠️ 목표 크기 초과로 품질 조정: {quality} → {chosen}")
+
+        print(f"✅ 이미지 최적화 완료: {len(data) / (1024 * 1024):.2f}MB")
+        return data
 
+    def _prepare_image(self, img_data: Dict) -> PreparedImage:
+        """
+        이미지 디코딩 + 최적화 (문서와 무관하므로 이미지마다 병렬 실행 가능)
+
+        실패는 예외 객체로 반환해 문서 조립 단계에서 대체 문구로 처리합니다.
+        """
+        try:
             # URL이 base64인 경우
             if img_data.get('url', '').startswith('data:image'):
                 # base64 디코딩
-                img_base64 = img_data['url'].split(',')[1]
-                img_bytes = base64.b64decode(img_base64)
+                img_bytes = _decode_data_url(img_data['url'])
                 # PNG로 변환
-                img_stream = self._convert_to_png(io.BytesIO(img_bytes))
+                return self._convert_to_png(io.BytesIO(img_bytes))
 
-            elif img_data.get('path'):
+            if img_data.get('path'):
                 # 로컬 파일 경로 - PNG로 변환
-                img_stream = self._convert_to_png(img_data['path'])
+                return self._convert_to_png(img_data['path'])
+
+            return None
+
+        except Exception as e:
+            return e
+
+    def _add_image_to_doc(self, doc: Document, img_data: Dict, img_stream: PreparedImage):
+        """
+        이미지 추가 (JPEG 형식으로 최적화하여 네이버 블로그 5MB 제한 대응)
+
+        Args:
+            img_data: {"url": "...", "caption": "...", "width": 5}
+            img_stream: _prepare_image 결과
+        """
+        try:
+            if isinstance(img_stream, Exception):
+                raise img_stream
 
             if img_stream:
                 width = img_data.get('width', 5)
@@ -156,6 +156,8 @@ class BlogOutreachCrawler:
                             status=BlogStatus.NEW
                         )
                         self.db.add(blog)
+                        # 블로그마다 커밋 (다음 중복 체크의 autoflush가 크롤링 내내 쓰기 커넥션을 점유하지 않도록)
+                        await self.db.commit()
                         blogs.append(blog)
                         collected += 1
 
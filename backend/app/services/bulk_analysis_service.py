@@ -6,9 +6,12 @@
 import asyncio
 import uuid
 from datetime import datetime
-from typing import Dict, List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import update, func
+
+from app.core.config import settings
 
 from app.models.analysis_job import AnalysisJob, CollectedKeyword
 from app.models.top_post_analysis import TopPostAnalysis, AggregatedPattern
@@ -16,19 +19,32 @@ from app.services.keyword_collector import (
     collect_keywords_for_category,
     save_keywords_to_db,
     get_keywords_for_analysis,
-    mark_keyword_analyzed,
+    mark_keywords_analyzed,
     CATEGORY_SEEDS
 )
 from app.services.top_post_analyzer import (
     analyze_top_posts,
-    update_aggregated_patterns,
+    save_post_analyses,
+    rebuild_aggregated_patterns,
     CATEGORIES
 )
+from app.services.crawler_http import naver_rate_budget
 
 
 # 메모리 기반 작업 상태 저장소 (프로덕션에서는 Redis 사용 권장)
 _running_jobs: Dict[str, AnalysisJob] = {}
 _job_callbacks: Dict[str, Callable] = {}
+# 실행 중인 작업의 취소 플래그 (작업 ID -> 이벤트)
+_cancel_flags: Dict[str, asyncio.Event] = {}
+
+
+def request_cancel(job_id: str) -> bool:
+    """실행 중인 작업에 취소 신호 전달 (이 프로세스에서 실행 중이 아니면 False)"""
+    flag = _cancel_flags.get(job_id)
+    if flag is None:
+        return False
+    flag.set()
+    return True
 
 
 class BulkAnalysisService:
@@ -137,6 +153,7 @@ class BulkAnalysisService:
             job.status = 'cancelled'
             job.completed_at = datetime.utcnow()
             self.db.commit()
+            request_cancel(job_id)
             return True
 
         return False
@@ -167,7 +184,7 @@ def get_analyzed_keywords(db: Session, category: str) -> set:
 
 
 async def run_bulk_analysis(
-    db: Session,
+    db: AsyncSession,
     job_id: str,
     category: str,
     target_count: int,
@@ -176,35 +193,47 @@ async def run_bulk_analysis(
     """
     대량 분석 실행 (백그라운드)
 
+    키워드 수집/상위글 분석 사이의 DB 작업은 동기 헬퍼를 그대로 쓰되
+    db.run_sync로 비동기 드라이버 위에서 실행해 이벤트 루프를 막지 않는다.
+
     Args:
-        db: DB 세션
+        db: 비동기 DB 세션
         job_id: 작업 ID
         category: 카테고리
         target_count: 목표 분석 수
         progress_callback: 진행 상황 콜백
     """
-    service = BulkAnalysisService(db)
+    async def update_status(status: str, **kwargs):
+        await db.run_sync(
+            lambda s: BulkAnalysisService(s).update_job_status(job_id, status, **kwargs)
+        )
+
+    async def finish_job(**fields):
+        job = await db.get(AnalysisJob, job_id)
+        if job:
+            for key, value in fields.items():
+                setattr(job, key, value)
+            await db.commit()
+
+    cancelled = _cancel_flags[job_id] = asyncio.Event()
 
     try:
         # 1. 작업 시작
-        service.update_job_status(job_id, 'running', progress=0)
+        await update_status('running', progress=0)
 
         # 2. 이미 분석된 키워드 조회
-        already_analyzed = get_analyzed_keywords(db, category)
+        already_analyzed = await db.run_sync(lambda s: get_analyzed_keywords(s, category))
         print(f"[대량분석] 이미 분석된 키워드: {len(already_analyzed)}개")
 
         # 3. 키워드 수집 (이미 분석된 것 고려하여 더 많이 수집)
         keywords_needed = (target_count // 3) + 10 + len(already_analyzed)
         print(f"[대량분석] 키워드 수집 시작: {keywords_needed}개 필요 (중복 제외 위해 추가 수집)")
 
-        keyword_result = await collect_keywords_for_category(category, min(keywords_needed, 500))
+        keyword_result = await collect_keywords_for_category(category, min(keywords_needed, 500), db=db)
         all_keywords = keyword_result.get('keywords', [])
 
         if not all_keywords:
-            service.update_job_status(
-                job_id, 'failed',
-                error_message="키워드 수집 실패"
-            )
+            await update_status('failed', error_message="키워드 수집 실패")
             return
 
         # 4. 이미 분석된 키워드 제외
@@ -214,8 +243,8 @@ async def run_bulk_analysis(
         print(f"[대량분석] 수집된 키워드: {len(all_keywords)}개, 신규: {len(new_keywords)}개, 스킵: {skipped_count}개")
 
         if not new_keywords:
-            service.update_job_status(
-                job_id, 'completed',
+            await update_status(
+                'completed',
                 progress=100,
                 posts_analyzed=0,
                 error_message=f"모든 키워드가 이미 분석되었습니다 ({skipped_count}개 스킵)"
@@ -225,106 +254,168 @@ async def run_bulk_analysis(
         keywords = new_keywords
 
         # 키워드 DB 저장
-        save_keywords_to_db(db, category, keywords, source='bulk_analysis')
-
-        service.update_job_status(
-            job_id, 'running',
-            progress=10,
-            keywords_collected=len(keywords)
+        await db.run_sync(
+            lambda s: save_keywords_to_db(s, category, keywords, source='bulk_analysis')
         )
 
+        await update_status('running', progress=10, keywords_collected=len(keywords))
+
         # 작업 객체에 키워드 저장
-        job = service.get_job(job_id)
-        if job:
-            job.keywords = keywords
-            job.keywords_collected = len(keywords)
-            job.result_summary = {
+        await finish_job(
+            keywords=keywords,
+            keywords_collected=len(keywords),
+            result_summary={
                 "skipped_keywords": skipped_count,
                 "new_keywords": len(keywords)
             }
-            db.commit()
+        )
 
         print(f"[대량분석] 신규 키워드 {len(keywords)}개 분석 시작")
 
-        # 5. 상위글 분석
-        posts_analyzed = 0
-        posts_failed = 0
-
-        for i, keyword in enumerate(keywords):
-            # 작업 취소 확인
-            job = service.get_job(job_id)
-            if job and job.status == 'cancelled':
-                print(f"[대량분석] 작업 취소됨: {job_id}")
-                return
-
-            # 목표 달성 확인
-            if posts_analyzed >= target_count:
-                break
+        # 5. 상위글 분석 (키워드 큐 -> 동시 워커)
+        posts_analyzed, posts_failed, categories = await _analyze_keywords(
+            db, job_id, category, keywords, target_count, cancelled
+        )
 
+        # 4. 패턴 집계 (작업 중에는 건너뛰고 저장된 결과로 한 번만 재집계 - 취소된 작업도 저장분은 반영)
+        # 분석 결과는 키워드로 판별한 카테고리로 저장됨
+        if categories:
             try:
-                # 상위 3개 글 분석
-                result = await analyze_top_posts(
-                    keyword=keyword,
-                    top_n=3,
-                    db=None  # 비동기 환경에서는 별도 처리
-                )
-
-                analyzed_count = result.get('analyzed_count', 0)
-                posts_analyzed += analyzed_count
-
-                # 키워드 분석 완료 표시
-                mark_keyword_analyzed(db, category, keyword, analyzed_count)
-
+                await db.run_sync(lambda s: rebuild_aggregated_patterns(s, sorted(categories)))
             except Exception as e:
-                print(f"[대량분석] 키워드 분석 실패 ({keyword}): {e}")
-                posts_failed += 1
-
-            # 진행률 계산 (키워드 수집 10% + 분석 90%)
-            analysis_progress = min(90, (posts_analyzed / target_count) * 90)
-            total_progress = 10 + int(analysis_progress)
-
-            service.update_job_status(
-                job_id, 'running',
-                progress=total_progress,
-                posts_analyzed=posts_analyzed
-            )
+                await db.rollback()
+                print(f"[대량분석] 패턴 집계 오류: {e}")
 
-            # Rate limiting (네이버 차단 방지)
-            await asyncio.sleep(1.0)
-
-        # 4. 패턴 집계 업데이트
-        try:
-            update_aggregated_patterns(db, category)
-        except Exception as e:
-            print(f"[대량분석] 패턴 집계 오류: {e}")
+        if cancelled.is_set():
+            print(f"[대량분석] 작업 취소됨: {job_id}")
+            return
 
         # 5. 작업 완료
-        job = service.get_job(job_id)
-        if job:
-            job.posts_analyzed = posts_analyzed
-            job.posts_failed = posts_failed
-            job.result_summary = {
+        await finish_job(
+            posts_analyzed=posts_analyzed,
+            posts_failed=posts_failed,
+            result_summary={
                 "total_keywords": len(keywords),
                 "posts_analyzed": posts_analyzed,
                 "posts_failed": posts_failed,
                 "category": category
             }
-            db.commit()
-
-        service.update_job_status(
-            job_id, 'completed',
-            progress=100,
-            posts_analyzed=posts_analyzed
         )
 
+        await update_status('completed', progress=100, posts_analyzed=posts_analyzed)
+
         print(f"[대량분석] 완료: {posts_analyzed}개 글 분석")
 
     except Exception as e:
         print(f"[대량분석] 오류: {e}")
-        service.update_job_status(
-            job_id, 'failed',
-            error_message=str(e)
+        await db.rollback()
+        await update_status('failed', error_message=str(e))
+    finally:
+        _cancel_flags.pop(job_id, None)
+
+
+async def _analyze_keywords(
+    db: AsyncSession,
+    job_id: str,
+    category: str,
+    keywords: List[str],
+    target_count: int,
+    cancelled: asyncio.Event
+) -> Tuple[int, int, set]:
+    """
+    키워드 큐를 N개 워커가 나눠 분석
+
+    - 네이버 요청 속도는 워커 수와 무관하게 naver_rate_budget이 제한
+    - 분석 결과 저장/키워드 완료 표시/진행률은 BULK_ANALYSIS_FLUSH_SECONDS마다 한 번에 기록
+    - 취소는 메모리 플래그로 확인하고, 다른 프로세스에서 취소한 경우는 진행률 기록 시 감지
+
+    Returns:
+        (분석한 글 수, 실패한 키워드 수, 분석 결과의 카테고리 집합)
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    for keyword in keywords:
+        queue.put_nowait(keyword)
+
+    target_reached = asyncio.Event()
+    totals = {"posts_analyzed": 0, "posts_failed": 0}
+    categories = {category}
+    pending_posts: List[Dict] = []
+    pending_keywords: Dict[str, int] = {}
+
+    async def worker():
+        while not (cancelled.is_set() or target_reached.is_set()):
+            try:
+                keyword = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            try:
+                # 상위 3개 글 분석
+                result = await analyze_top_posts(
+                    keyword=keyword,
+                    top_n=3,
+                    throttle=naver_rate_budget.acquire
+                )
+            except Exception as e:
+                print(f"[대량분석] 키워드 분석 실패 ({keyword}): {e}")
+                totals["posts_failed"] += 1
+                continue
+
+            analyzed_count = result.get('analyzed_count', 0)
+            totals["posts_analyzed"] += analyzed_count
+            pending_posts.extend(result.get('results', []))
+            pending_keywords[keyword] = pending_keywords.get(keyword, 0) + analyzed_count
+            categories.add(result.get('category', category))
+
+            # 목표 달성 확인 (진행 중인 키워드는 마저 끝냄)
+            if totals["posts_analyzed"] >= target_count:
+                target_reached.set()
+
+    async def flush():
+        posts = pending_posts[:]
+        marks = dict(pending_keywords)
+        pending_posts.clear()
+        pending_keywords.clear()
+
+        if posts:
+            await db.run_sync(lambda s: save_post_analyses(s, posts, update_patterns=False))
+        if marks:
+            await db.run_sync(lambda s: mark_keywords_analyzed(s, category, marks))
+
+        # 진행률 계산 (키워드 수집 10% + 분석 90%)
+        analysis_progress = min(90, (totals["posts_analyzed"] / target_count) * 90)
+        # 실행 중일 때만 갱신 - 0건이면 다른 요청이 취소한 것
+        result = await db.execute(
+            update(AnalysisJob)
+            .where(AnalysisJob.id == job_id, AnalysisJob.status == 'running')
+            .values(progress=10 + int(analysis_progress), posts_analyzed=totals["posts_analyzed"])
         )
+        await db.commit()
+        if result.rowcount == 0:
+            cancelled.set()
+
+    worker_count = max(1, min(settings.BULK_ANALYSIS_WORKERS, len(keywords)))
+    workers = asyncio.gather(*(worker() for _ in range(worker_count)))
+    cancel_wait = asyncio.ensure_future(cancelled.wait())
+    try:
+        while not workers.done():
+            await asyncio.wait(
+                {workers, cancel_wait},
+                timeout=settings.BULK_ANALYSIS_FLUSH_SECONDS,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            if cancelled.is_set() and not workers.done():
+                # 요청 예산 대기 중인 워커도 바로 중단 (완료된 키워드 결과는 아래에서 기록)
+                workers.cancel()
+                await asyncio.gather(workers, return_exceptions=True)
+            await flush()
+    finally:
+        cancel_wait.cancel()
+        if not workers.done():
+            workers.cancel()
+            await asyncio.gather(workers, return_exceptions=True)
+
+    return totals["posts_analyzed"], totals["posts_failed"], categories
 
 
 def get_analysis_dashboard(db: Session) -> Dict:
@@ -0,0 +1,335 @@
+"""
+Compliance Rule Store - 의료법/금칙어 규칙 저장소
+DB(medical_law_rules)의 규칙을 한 번 컴파일한 불변 규칙 세트로 보관하고,
+관리자가 규칙을 수정하면 새 세트를 컴파일해 통째로 교체합니다.
+검사기는 요청마다 현재 세트를 참조만 하므로 요청 단위 재컴파일이 없습니다.
+"""
+
+import asyncio
+import logging
+import re
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func, select
+
+from app.services.compliance_scanner import ComplianceScanner
+
+logger = logging.getLogger(__name__)
+
+RULE_SET_MEDICAL_LAW = "medical_law"
+RULE_SET_FORBIDDEN_WORDS = "forbidden_words"
+
+# 번호 역참조 (\1 ~ \9, 앞의 역슬래시가 짝수 개일 때만)
+BACKREFERENCE = re.compile(r"(?<!\\)(?:\\\\)*\\[1-9]")
+
+
+class ComplianceRuleSet:
+    """
+    컴파일이 끝난 불변 규칙 세트
+
+    - medical_scanner: 의료법 위반 검사용 (모든 규칙)
+    - medical_fix_scanner: 의료법 자동 수정용 (대체 표현이 있는 규칙만)
+    - forbidden_scanner: 금칙어 검사/대체용
+    """
+
+    __slots__ = (
+        "version",
+        "source",
+        "signature",
+        "loaded_at",
+        "medical_rules",
+        "forbidden_rules",
+        "medical_scanner",
+        "medical_fix_scanner",
+        "forbidden_scanner",
+    )
+
+    def __init__(
+        self,
+        version: int,
+        medical_rules: List[Dict],
+        forbidden_rules: List[Dict],
+        source: str = "defaults",
+        signature: Optional[Tuple] = None,
+    ):
+        values = {
+            "version": version,
+            "source": source,
+            "signature": signature,
+            "loaded_at": datetime.utcnow(),
+            "medical_rules": tuple(medical_rules),
+            "forbidden_rules": tuple(forbidden_rules),
+            "medical_scanner": ComplianceScanner(medical_rules, re.IGNORECASE),
+            "medical_fix_scanner": ComplianceScanner(
+                [rule for rule in medical_rules if rule["replacement"]], re.IGNORECASE
+            ),
+            "forbidden_scanner": ComplianceScanner(forbidden_rules),
+        }
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ComplianceRuleSet은 변경할 수 없습니다. 새 세트를 만들어 교체하세요.")
+
+    def summary(self) -> Dict:
+        return {
+            "version": self.version,
+            "source": self.source,
+            "loaded_at": self.loaded_at.isoformat(),
+            "medical_law_rules": len(self.medical_rules),
+            "forbidden_word_rules": len(self.forbidden_rules),
+        }
+
+
+def default_rules() -> Tuple[List[Dict], List[Dict]]:
+    """코드에 내장된 기본 규칙 (DB에 규칙이 없을 때 사용)"""
+    from app.services.forbidden_words_checker import ForbiddenWordsChecker
+    from app.services.medical_law_checker import MedicalLawChecker
+
+    medical = [
+        {
+            "pattern": pattern,
+            "replacement": alternative,
+            "category": category,
+            "severity": MedicalLawChecker.CATEGORY_SEVERITY.get(category, "medium"),
+        }
+        for category, patterns in MedicalLawChecker.VIOLATION_PATTERNS.items()
+        for pattern, alternative in patterns
+    ]
+    forbidden = [
+        {"pattern": word, "literal": True, "replacement": replacement, "type": "exact_match"}
+        for word, replacement in ForbiddenWordsChecker.FORBIDDEN_WORDS.items()
+    ] + [
+        {"pattern": pattern, "replacement": replacement, "type": "pattern_match"}
+        for pattern, replacement in ForbiddenWordsChecker.FORBIDDEN_PATTERNS
+    ]
+    return medical, forbidden
+
+
+def validate_pattern(pattern: str, is_literal: bool = False) -> Optional[str]:
+    """
+    정규식 오류 메시지 (정상이면 None)
+
+    검사기는 여러 규칙을 하나의 결합 정규식으로 묶으므로, 다른 규칙과 이름이 겹칠 수 있는
+    이름 있는 그룹과 그룹 번호가 바뀌는 역참조는 허용하지 않습니다.
+    (규칙 세트 전체로 컴파일되는지는 ComplianceRuleStore.validate_rules에서 확인)
+    """
+    if is_literal:
+        return None if pattern else "빈 단어는 등록할 수 없습니다"
+    try:
+        compiled = re.compile(pattern)
+    except re.error as e:
+        return f"잘못된 정규식입니다: {e}"
+    if compiled.match(""):
+        return "빈 문자열과 일치하는 패턴은 등록할 수 없습니다"
+    if compiled.groupindex:
+        return "이름 있는 그룹((?P<이름>...))은 사용할 수 없습니다. 일반 그룹 (...)을 사용하세요"
+    if BACKREFERENCE.search(pattern):
+        return "패턴에 역참조(\\1 등)는 사용할 수 없습니다"
+    return None
+
+
+class ComplianceRuleStore:
+    """현재 규칙 세트 보관 및 DB 재적재"""
+
+    # 다른 워커에서 규칙이 바뀌었는지 확인하는 최소 간격(초)
+    STALE_CHECK_INTERVAL = 30.0
+
+    def __init__(self):
+        self._current: Optional[ComplianceRuleSet] = None
+        self._version = 0
+        self._last_checked = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def current(self) -> ComplianceRuleSet:
+        """현재 규칙 세트 (참조 한 번으로 읽으므로 교체 중에도 일관됨)"""
+        if self._current is None:
+            medical, forbidden = default_rules()
+            self._current = self._next_rule_set(medical, forbidden, "defaults")
+        return self._current
+
+    def _next_rule_set(self, medical, forbidden, source, signature=None) -> ComplianceRuleSet:
+        rule_set = ComplianceRuleSet(self._version + 1, medical, forbidden, source, signature)
+        self._version = rule_set.version
+        return rule_set
+
+    @staticmethod
+    async def _active_rules(db) -> List:
+        """활성 규칙 (등록 순서 = 우선순위)"""
+        from app.models import MedicalLawRule
+
+        result = await db.execute(
+            select(MedicalLawRule)
+            .where(MedicalLawRule.is_active == True)
+            .order_by(MedicalLawRule.created_at, MedicalLawRule.id)
+        )
+        return result.scalars().all()
+
+    @staticmethod
+    def _rules_from_rows(rows) -> Tuple[List[Dict], List[Dict]]:
+        """DB 행 -> (의료법 규칙, 금칙어 규칙), 규칙이 없는 쪽은 내장 기본 규칙"""
+        default_medical, default_forbidden = default_rules()
+        medical, forbidden = [], []
+        for row in rows:
+            error = validate_pattern(row.pattern, bool(row.is_literal))
+            if error:
+                logger.warning(f"규칙 건너뜀 ({row.id}): {error}")
+                continue
+            if row.rule_set == RULE_SET_FORBIDDEN_WORDS:
+                forbidden.append({
+                    "pattern": row.pattern,
+                    "literal": bool(row.is_literal),
+                    "replacement": row.alternative_suggestion or "",
+                    "type": "exact_match" if row.is_literal else "pattern_match",
+                })
+            else:
+                medical.append({
+                    "pattern": re.escape(row.pattern) if row.is_literal else row.pattern,
+                    "replacement": row.alternative_suggestion or "",
+                    "category": row.category,
+                    "severity": row.severity.value if row.severity else "medium",
+                })
+        return medical or default_medical, forbidden or default_forbidden
+
+    async def validate_rules(self, db) -> Optional[str]:
+        """
+        db 세션에서 보이는 규칙(커밋 전 변경 포함)으로 규칙 세트를 컴파일할 수 있는지 확인
+
+        관리자 변경을 커밋하기 전에 호출합니다. 개별 패턴은 정상이어도 결합 정규식에서 실패할 수 있습니다.
+
+        Returns:
+            오류 메시지 (정상이면 None)
+        """
+        medical, forbidden = self._rules_from_rows(await self._active_rules(db))
+        try:
+            ComplianceRuleSet(0, medical, forbidden)
+        except Exception as e:
+            return f"다른 규칙과 함께 컴파일할 수 없는 패턴입니다: {e}"
+        return None
+
+    async def _signature(self, db) -> Tuple:
+        """규칙 테이블 변경 감지용 (행 수, 최종 수정 시각)"""
+        from app.models import MedicalLawRule
+
+        result = await db.execute(
+            select(func.count(MedicalLawRule.id), func.max(MedicalLawRule.updated_at))
+        )
+        count, updated_at = result.one()
+        return count, updated_at
+
+    async def reload(self, force: bool = True) -> ComplianceRuleSet:
+        """
+        DB에서 규칙을 읽어 새 세트로 교체
+
+        Args:
+            force: False면 테이블이 바뀌지 않았을 때 기존 세트 유지
+        """
+        from app.db.database import AsyncSessionLocal
+
+        async with self._lock:
+            self._last_checked = time.monotonic()
+            try:
+                async with AsyncSessionLocal() as db:
+                    signature = await self._signature(db)
+                    if not force and self._current is not None and signature == self._current.signature:
+                        return self._current
+                    rows = await self._active_rules(db)
+            except Exception as e:
+                logger.warning(f"규칙 DB 조회 실패, 기존 규칙 유지: {e}")
+                return self.current
+
+            # 규칙이 하나도 없는 세트는 내장 기본 규칙 사용
+            medical, forbidden = self._rules_from_rows(rows)
+            source = "database" if rows else "defaults"
+            try:
+                rule_set = self._next_rule_set(medical, forbidden, source, signature)
+            except Exception as e:
+                # 다른 경로로 저장된 규칙이 결합 정규식을 깨뜨려도 검사는 이전 세트로 계속
+                logger.error(f"규칙 세트 컴파일 실패, 기존 규칙 유지: {e}")
+                return self.current
+            # 참조 교체 한 번으로 적용 (진행 중인 검사는 이전 세트로 끝까지 수행)
+            self._current = rule_set
+            logger.info(f"규칙 세트 v{rule_set.version} 적재 ({rule_set.summary()})")
+            return rule_set
+
+    async def refresh_if_stale(self) -> ComplianceRuleSet:
+        """다른 워커의 수정 사항 반영 (STALE_CHECK_INTERVAL마다 변경 여부만 확인)"""
+        if time.monotonic() - self._last_checked < self.STALE_CHECK_INTERVAL:
+            return self.current
+        return await self.reload(force=False)
+
+    def snapshot(self) -> Dict:
+        """다른 프로세스로 넘길 수 있는 현재 규칙 (컴파일 전 원본)"""
+        rule_set = self.current
+        return {
+            "version": rule_set.version,
+            "source": rule_set.source,
+            "medical_rules": list(rule_set.medical_rules),
+            "forbidden_rules": list(rule_set.forbidden_rules),
+        }
+
+    def install_snapshot(self, snapshot: Dict) -> ComplianceRuleSet:
+        """snapshot()으로 받은 규칙을 현재 세트로 사용 (DB 없이 규칙만 필요한 작업 프로세스용)"""
+        self._version = snapshot["version"]
+        self._current = ComplianceRuleSet(
+            snapshot["version"],
+            snapshot["medical_rules"],
+            snapshot["forbidden_rules"],
+            snapshot["source"],
+        )
+        # 작업 프로세스에서는 DB 재확인을 하지 않음
+        self._last_checked = float("inf")
+        return self._current
+
+    async def seed_defaults(self) -> int:
+        """규칙 테이블이 비어 있으면 내장 기본 규칙을 DB에 등록 (관리자가 수정할 수 있도록)"""
+        from app.db.database import AsyncSessionLocal
+        from app.models import MedicalLawRule
+        from app.models.medical_law import ViolationSeverity
+
+        async with AsyncSessionLocal() as db:
+            count = (await db.execute(select(func.count(MedicalLawRule.id)))).scalar()
+            if count:
+                return 0
+
+            medical, forbidden = default_rules()
+            # created_at 순서 = 규칙 우선순위이므로 등록 순서대로 1마이크로초씩 차이를 둠
+            started_at = datetime.utcnow()
+            for index, rule in enumerate(medical + forbidden):
+                rule["created_at"] = started_at + timedelta(microseconds=index)
+            for rule in medical:
+                db.add(MedicalLawRule(
+                    id=uuid.uuid4(),
+                    rule_set=RULE_SET_MEDICAL_LAW,
+                    category=rule["category"],
+                    pattern=rule["pattern"],
+                    is_literal=False,
+                    severity=ViolationSeverity(rule["severity"]),
+                    alternative_suggestion=rule["replacement"] or None,
+                    is_active=True,
+                    created_at=rule["created_at"],
+                    updated_at=started_at,
+                ))
+            for rule in forbidden:
+                db.add(MedicalLawRule(
+                    id=uuid.uuid4(),
+                    rule_set=RULE_SET_FORBIDDEN_WORDS,
+                    category="금칙어",
+                    pattern=rule["pattern"],
+                    is_literal=bool(rule.get("literal")),
+                    severity=ViolationSeverity.MEDIUM,
+                    alternative_suggestion=rule["replacement"] or None,
+                    is_active=True,
+                    created_at=rule["created_at"],
+                    updated_at=started_at,
+                ))
+            await db.commit()
+            return len(medical) + len(forbidden)
+
+
+# Singleton instance
+compliance_rule_store = ComplianceRuleStore()
@@ -0,0 +1,492 @@
+"""
+Compliance Scanner - 금칙어/의료법 규칙 단일 패스 검사 엔진
+고정 단어와 정규식 규칙의 고정 접두어는 하나의 다중 문자열 검색기(Aho-Corasick 또는 트라이 정규식)로,
+고정 접두어가 없는 정규식 규칙은 하나의 결합 정규식으로 컴파일하여 텍스트를 한 번만 훑고,
+모든 대체를 한 번의 선형 재구성으로 적용합니다.
+"""
+
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+try:
+    from re import _constants as sre_constants, _parser as sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover
+    import sre_constants
+    import sre_parse
+
+# C 구현 Aho-Corasick (설치되어 있는 경우)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
+# 정규식 메타문자가 없는 순수 단어 (또는 (?:a|b|c) 형태의 단어 묶음)
+_LITERAL_CHARS = r"[^\\.^$*+?{}\[\]()|]+"
+_LITERAL_ALTERNATION = re.compile(
+    rf"(?:\(\?:)?({_LITERAL_CHARS}(?:\|{_LITERAL_CHARS})*)\)?"
+)
+_REGEX_META = set("\\.^$*+?{}[]()|")
+_QUANTIFIERS = set("*+?{")
+
+
+def literal_alternatives(pattern: str) -> Optional[List[str]]:
+    """
+    정규식이 단어 나열(`abc`, `(?:a|b|c)`)에 불과하면 단어 목록을, 아니면 None 반환
+    """
+    match = _LITERAL_ALTERNATION.fullmatch(pattern)
+    if not match:
+        return None
+    # 괄호 짝이 맞는 경우만 ("(?:a|b" / "a|b)" 제외)
+    if pattern.startswith("(?:") != pattern.endswith(")"):
+        return None
+    return match.group(1).split("|")
+
+
+def _has_top_level_alternation(pattern: str) -> bool:
+    """괄호/문자 클래스 밖의 | 포함 여부"""
+    depth = 0
+    in_class = False
+    escaped = False
+    for ch in pattern:
+        if escaped:
+            escaped = False
+        elif ch == "\\":
+            escaped = True
+        elif in_class:
+            in_class = ch != "]"
+        elif ch == "[":
+            in_class = True
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "|" and depth == 0:
+            return True
+    return False
+
+
+def split_literal_prefix(pattern: str) -> Tuple[str, str]:
+    r"""
+    정규식을 (고정 접두어, 나머지)로 분리
+    예: r"국내\s*(?:최고|1위)" -> ("국내", r"\s*(?:최고|1위)")
+    """
+    if _has_top_level_alternation(pattern):
+        return "", pattern
+    index = 0
+    while index < len(pattern) and pattern[index] not in _REGEX_META:
+        index += 1
+    # 수량자가 붙은 마지막 글자는 접두어에서 제외 (예: "완벽한?")
+    if 0 < index < len(pattern) and pattern[index] in _QUANTIFIERS:
+        index -= 1
+    return pattern[:index], pattern[index:]
+
+
+def literal_prefixes(pattern: str) -> List[str]:
+    r"""
+    정규식과 일치하는 모든 문자열이 반드시 시작하는 고정 접두어 목록
+    맨 앞의 단어 묶음 그룹은 단어별로 펼칩니다.
+    예: r"(?:반드시|무조건)\s*효과" -> ["반드시", "무조건"]
+
+    접두어를 특정할 수 없으면 빈 목록
+    """
+    if pattern.startswith("(?:") and not _has_top_level_alternation(pattern):
+        close = pattern.find(")")
+        words = literal_alternatives(pattern[:close + 1]) if close > 0 else None
+        rest = pattern[close + 1:]
+        if words and all(words) and not (rest and rest[0] in _QUANTIFIERS):
+            prefix, _ = split_literal_prefix(rest)
+            return [word + prefix for word in words]
+        return []
+    prefix, _ = split_literal_prefix(pattern)
+    return [prefix] if prefix else []
+
+
+def _first_chars(items, flags: int) -> Optional[Tuple[Set[str], bool]]:
+    """
+    파싱된 정규식이 시작할 수 있는 글자 집합과 빈 문자열 허용 여부
+    분석할 수 없는 구성(., 앵커, 전후방 탐색 등)이 있으면 None
+    """
+    chars: Set[str] = set()
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            chars.add(chr(av))
+            return chars, False
+        if op is sre_constants.IN:
+            for item_op, item_av in av:
+                if item_op is sre_constants.LITERAL:
+                    chars.add(chr(item_av))
+                elif item_op is sre_constants.CATEGORY and item_av is sre_constants.CATEGORY_DIGIT:
+                    chars.add("\\d")
+                elif item_op is sre_constants.CATEGORY and item_av is sre_constants.CATEGORY_SPACE:
+                    chars.add("\\s")
+                else:
+                    return None
+            return chars, False
+        if op is sre_constants.SUBPATTERN:
+            result = _first_chars(av[-1], flags)
+        elif op is sre_constants.BRANCH:
+            result = (set(), False)
+            for alternative in av[1]:
+                branch = _first_chars(alternative, flags)
+                if branch is None:
+                    return None
+                result = (result[0] | branch[0], result[1] or branch[1])
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+            result = _first_chars(av[2], flags)
+            if result is not None and av[0] == 0:
+                result = (result[0], True)
+        else:
+            return None
+
+        if result is None:
+            return None
+        chars |= result[0]
+        if not result[1]:
+            return chars, False
+    return chars, True
+
+
+def first_char_members(pattern: str, flags: int = 0) -> Optional[Set[str]]:
+    """
+    정규식의 첫 글자 후보를 문자 클래스 구성요소 집합으로 반환 (결합 정규식 앞의 사전 필터용)
+    첫 글자를 특정할 수 없으면 None
+    """
+    try:
+        result = _first_chars(sre_parse.parse(pattern, flags), flags)
+    except Exception:
+        return None
+    if result is None or result[1] or not result[0]:
+        return None
+
+    members = set()
+    for ch in result[0]:
+        if ch.startswith("\\"):
+            members.add(ch)
+        else:
+            members.add(re.escape(ch))
+            if flags & re.IGNORECASE:
+                members.update(re.escape(c) for c in (ch.lower(), ch.upper()) if len(c) == 1)
+    return members
+
+
+def fold_case(text: str) -> str:
+    """대소문자 무시 검색용 변환 (글자 수가 바뀌는 문자는 그대로 둠)"""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(ch.lower() if len(ch.lower()) == 1 else ch for ch in text)
+
+
+class AhoCorasick:
+    """
+    다중 고정 문자열 검색 (겹치는 일치 포함)
+    pyahocorasick(C 구현)이 설치되어 있으면 Aho-Corasick 오토마톤을 사용합니다.
+    없으면 트라이 모양 정규식으로 단어가 시작하는 위치만 C 정규식 엔진으로 찾고,
+    그 위치에서만 트라이를 따라가 단어를 모읍니다 (글자마다 파이썬 루프를 돌지 않음).
+    """
+
+    def __init__(self, words: Iterable[str], ignore_case: bool = False):
+        self.ignore_case = ignore_case
+        self.words: List[str] = []
+        # 상태별 전이, 그 상태에서 끝나는 단어 인덱스
+        self._goto: List[Dict[str, int]] = [{}]
+        self._ends: Dict[int, List[int]] = {}
+
+        for word in words:
+            self._add(word)
+
+        self._native = None
+        if AHOCORASICK_AVAILABLE and any(self.words):
+            # 대소문자 변환 후 같아지는 단어는 하나의 키에 모든 인덱스를 담음
+            grouped: Dict[str, List[int]] = {}
+            for index, word in enumerate(self.words):
+                if word:
+                    grouped.setdefault(fold_case(word) if ignore_case else word, []).append(index)
+            self._native = ahocorasick.Automaton()
+            for key, indices in grouped.items():
+                self._native.add_word(key, (tuple(indices), len(key)))
+            self._native.make_automaton()
+
+        # 어떤 단어든 시작하는 위치 (가장 짧은 단어에서 끝나므로 일치 구간은 버리고 시작 위치만 사용)
+        self._starts = re.compile(self._trie_pattern(0) if self._goto[0] else r"(?!)")
+
+    def _add(self, word: str):
+        index = len(self.words)
+        self.words.append(word)
+        if not word:
+            return
+
+        state = 0
+        for ch in fold_case(word) if self.ignore_case else word:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._goto[state][ch] = next_state
+            state = next_state
+        self._ends.setdefault(state, []).append(index)
+
+    def _trie_pattern(self, state: int) -> str:
+        """state 아래 트라이를 정규식으로 (분기점에서만 그룹, 단어가 끝나는 곳에서 멈춤)"""
+        goto, ends = self._goto, self._ends
+        branches = []
+        for ch, next_state in sorted(goto[state].items()):
+            branch = re.escape(ch)
+            while next_state not in ends and len(goto[next_state]) == 1:
+                (ch, next_state), = goto[next_state].items()
+                branch += re.escape(ch)
+            if next_state not in ends:
+                branch += self._trie_pattern(next_state)
+            branches.append(branch)
+        return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """
+        모든 (겹치는 것 포함) 일치 위치
+
+        Yields:
+            (시작, 끝, 단어 인덱스)
+        """
+        if self.ignore_case:
+            text = fold_case(text)
+
+        if self._native is not None:
+            for end, (indices, length) in self._native.iter(text):
+                for index in indices:
+                    yield end + 1 - length, end + 1, index
+            return
+
+        goto, ends = self._goto, self._ends
+        length = len(text)
+        search = self._starts.search
+        found = search(text)
+        while found:
+            start = found.start()
+            state = 0
+            position = start
+            while position < length:
+                state = goto[state].get(text[position])
+                if state is None:
+                    break
+                position += 1
+                for index in ends.get(state, ()):
+                    yield start, position, index
+            found = search(text, start + 1)
+
+
+class ComplianceScanner:
+    """
+    규칙 목록을 한 번 컴파일해 두고 재사용하는 단일 패스 검사기
+
+    규칙은 {"pattern": str, "literal": bool, "replacement": str, ...} 딕셔너리이며,
+    나머지 키(category 등)는 검사 결과에 그대로 전달됩니다.
+
+    - 고정 단어(literal=True 또는 단어 나열뿐인 정규식): 오토마톤 일치가 곧 결과
+    - 고정 접두어가 있는 정규식: 오토마톤이 접두어를 찾은 위치에서만 해당 규칙을 확인
+    - 나머지 정규식: 첫 글자 전방 탐색을 붙인 하나의 결합 정규식으로 검색
+
+    겹치는 일치 처리:
+    - 같은 위치에서 시작하면 가장 긴 것 (길이가 같으면 먼저 등록된 규칙)
+    - 그 외에는 먼저 끝나는 것을 채택 (넓은 범위 규칙 `.*?`이 안쪽 위반을 삼키지 않도록)
+    """
+
+    def __init__(self, rules: Iterable[Dict], flags: int = 0):
+        self.rules: List[Dict] = list(rules)
+        self.flags = flags
+
+        # 오토마톤 단어 -> [(규칙 인덱스, 접두어 여부)]
+        word_entries: Dict[str, List[Tuple[int, bool]]] = {}
+        fallback_parts: List[str] = []
+        self._compiled: Dict[int, re.Pattern] = {}
+        self._markers: Dict[str, int] = {}
+        # 결합 정규식 규칙의 첫 글자 후보 (하나라도 특정할 수 없으면 None)
+        first_chars: Optional[Set[str]] = set()
+
+        for index, rule in enumerate(self.rules):
+            pattern = rule["pattern"]
+            words = [pattern] if rule.get("literal") else literal_alternatives(pattern)
+            if words is not None and not self._shadows_later_word(words, flags):
+                for word in words:
+                    word_entries.setdefault(word, []).append((index, False))
+                continue
+
+            # 역참조 대체(\1)와 접두어 위치 확인을 위해 개별 컴파일본 보관
+            self._compiled[index] = re.compile(pattern, flags)
+            prefixes = literal_prefixes(pattern)
+            if prefixes:
+                for prefix in prefixes:
+                    word_entries.setdefault(prefix, []).append((index, True))
+                continue
+
+            # 규칙 끝의 빈 표식 그룹으로 어떤 규칙이 일치했는지 구분 (lastgroup)
+            marker = f"_m{len(self._markers)}"
+            self._markers[marker] = index
+            fallback_parts.append(f"(?:{pattern})(?P<{marker}>)")
+            if first_chars is not None:
+                members = first_char_members(pattern, flags)
+                first_chars = first_chars | members if members else None
+
+        self._word_entries = list(word_entries.values())
+        self._automaton = AhoCorasick(word_entries, ignore_case=bool(flags & re.IGNORECASE))
+
+        self._combined = None
+        if fallback_parts:
+            combined = "|".join(fallback_parts)
+            # 첫 글자 전방 탐색: 정규식 엔진이 위치마다 모든 분기를 시도하지 않도록
+            if first_chars:
+                combined = f"(?=[{''.join(sorted(first_chars))}])(?:{combined})"
+            self._combined = re.compile(combined, flags)
+
+    @staticmethod
+    def _shadows_later_word(words: List[str], flags: int) -> bool:
+        """
+        앞 단어가 뒤 단어의 접두어인지 (예: `(?:b|ba)`)
+        정규식은 먼저 일치한 분기("b")를 택하므로 가장 긴 단어를 택하는 오토마톤과 결과가 달라짐
+        """
+        if flags & re.IGNORECASE:
+            words = [fold_case(word) for word in words]
+        return any(
+            later.startswith(word) for i, word in enumerate(words) for later in words[i + 1:]
+        )
+
+    def scan(self, text: str) -> List[Tuple[int, int, int, Optional[re.Match]]]:
+        """
+        겹치지 않는 일치 목록 (위치 순)
+
+        Returns:
+            [(시작, 끝, 규칙 인덱스, 정규식 Match 또는 None)]
+        """
+        # 시작 위치별 최선의 후보 (가장 긴 것, 동률이면 먼저 등록된 규칙)
+        best: Dict[int, Tuple[int, int, int, Optional[re.Match]]] = {}
+
+        def offer(candidate):
+            current = best.get(candidate[0])
+            if current is None or (candidate[1], -candidate[2]) > (current[1], -current[2]):
+                best[candidate[0]] = candidate
+
+        compiled = self._compiled
+        for start, end, word_index in self._automaton.finditer(text):
+            for rule_index, anchored in self._word_entries[word_index]:
+                if not anchored:
+                    offer((start, end, rule_index, None))
+                    continue
+                match = compiled[rule_index].match(text, start)
+                if match and match.end() > start:
+                    offer((start, match.end(), rule_index, match))
+
+        if self._combined is not None:
+            # finditer는 일치 구간을 건너뛰므로, 구간 안쪽에서 시작하는 일치도 찾도록 한 칸씩 재검색
+            search = self._combined.search
+            match = search(text)
+            while match:
+                if match.end() > match.start():
+                    offer((match.start(), match.end(), self._markers[match.lastgroup], match))
+                match = search(text, match.start() + 1)
+
+        selected = []
+        last_end = 0
+        for candidate in sorted(best.values(), key=lambda c: (c[1], c[0])):
+            if candidate[0] >= last_end:
+                selected.append(candidate)
+                last_end = candidate[1]
+        return selected
+
+    def all_matches(self, text: str) -> List[Tuple[int, int, int, Optional[re.Match]]]:
+        """
+        규칙별 모든 일치 (규칙마다 re.finditer와 같은 결과)
+
+        scan()과 달리 서로 다른 규칙의 겹치는 일치를 정리하지 않으므로 위반 건수 집계에 사용합니다.
+
+        Returns:
+            [(시작, 끝, 규칙 인덱스, 정규식 Match 또는 None)] - 규칙 순, 같은 규칙 안에서는 위치 순
+        """
+        # 규칙별 시작 위치 -> 후보 (같은 위치는 가장 긴 것: 단어 묶음 정규식이 긴 단어를 먼저 택하는 경우와 같음)
+        candidates: Dict[int, Dict[int, Tuple[int, int, int, Optional[re.Match]]]] = {}
+
+        def offer(candidate):
+            by_start = candidates.setdefault(candidate[2], {})
+            current = by_start.get(candidate[0])
+            if current is None or candidate[1] > current[1]:
+                by_start[candidate[0]] = candidate
+
+        compiled = self._compiled
+        for start, end, word_index in self._automaton.finditer(text):
+            for rule_index, anchored in self._word_entries[word_index]:
+                if not anchored:
+                    offer((start, end, rule_index, None))
+                    continue
+                match = compiled[rule_index].match(text, start)
+                if match and match.end() > start:
+                    offer((start, match.end(), rule_index, match))
+
+        if self._combined is not None:
+            # 결합 정규식은 위치마다 한 규칙만 알려주므로, 일치한 위치에서 나머지 규칙도 확인
+            search = self._combined.search
+            fallback_rules = list(self._markers.values())
+            found = search(text)
+            while found:
+                start = found.start()
+                for rule_index in fallback_rules:
+                    match = compiled[rule_index].match(text, start)
+                    if match and match.end() > start:
+                        offer((start, match.end(), rule_index, match))
+                found = search(text, start + 1)
+
+        # 규칙마다 finditer처럼 앞에서부터 겹치지 않게 선택
+        results = []
+        for rule_index in sorted(candidates):
+            by_start = candidates[rule_index]
+            last_end = 0
+            for start in sorted(by_start):
+                if start >= last_end:
+                    results.append(by_start[start])
+                    last_end = by_start[start][1]
+        return results
+
+    def replacement_for(self, rule_index: int, text: str, match: Optional[re.Match]) -> str:
+        """일치 구간을 대체할 문자열 (정규식 규칙은 \\1 등 역참조 확장)"""
+        replacement = self.rules[rule_index].get("replacement") or ""
+        if match is None or "\\" not in replacement:
+            return replacement
+        single = self._compiled[rule_index]
+        if match.re is not single:
+            match = single.match(text, match.start())
+        return match.expand(replacement) if match else replacement
+
+    def replace(
+        self, text: str, matches: Optional[List[Tuple[int, int, int, Optional[re.Match]]]] = None
+    ) -> Tuple[str, List[Dict]]:
+        """
+        대체 표현이 있는 모든 일치를 한 번에 교체
+
+        Args:
+            text: 원본 텍스트
+            matches: 이미 구한 scan(text) 결과 (없으면 새로 검사)
+
+        Returns:
+            (교체된 텍스트, [{"rule", "original", "replaced", "position"}])
+            position은 원본 텍스트 기준
+        """
+        pieces = []
+        changes = []
+        cursor = 0
+        if matches is None:
+            matches = self.scan(text)
+        for start, end, rule_index, match in matches:
+            if not self.rules[rule_index].get("replacement"):
+                continue
+            original = text[start:end]
+            replaced = self.replacement_for(rule_index, text, match)
+            pieces.append(text[cursor:start])
+            pieces.append(replaced)
+            cursor = end
+            changes.append({
+                "rule": self.rules[rule_index],
+                "original": original,
+                "replaced": replaced,
+                "position": (start, end),
+            })
+        pieces.append(text[cursor:])
+        return "".join(pieces), changes
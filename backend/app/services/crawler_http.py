@@ -0,0 +1,274 @@
+"""
+Crawler HTTP Client - 크롤러 공용 HTTP 클라이언트
+블로그/지식인/상위글/키워드 크롤러가 하나의 커넥션 풀을 공유합니다.
+
+- keep-alive 커넥션 재사용 (요청마다 TCP/TLS 핸드셰이크를 하지 않음)
+- HTTP/2 (h2 패키지가 설치된 경우)
+- 호스트별 동시 요청 수 제한
+- 호스트별 최소 요청 간격 (대상 서버에 부담을 주지 않도록)
+- 출처를 지정한 GET 요청은 디스크 응답 캐시(http_cache) 사용
+"""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Dict, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from app.core.config import settings
+from app.services.http_cache import http_response_cache, CacheMissError
+
+# HTTP/2 지원 (h2 패키지가 설치되어 있는 경우)
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlerHTTPClient:
+    """프로세스 전역 크롤러 HTTP 클라이언트"""
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 40,
+        per_host_concurrency: int = 6,
+        per_host_interval: float = 0.1,
+        timeout: float = 30.0,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=60.0,
+        )
+        self.per_host_concurrency = max(1, per_host_concurrency)
+        self.per_host_interval = max(0.0, per_host_interval)
+        self.timeout = timeout
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        # 호스트별 다음 요청을 보낼 수 있는 시각 (monotonic)
+        self._host_next_slot: Dict[str, float] = {}
+        self._stats = defaultdict(int)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """공유 httpx 클라이언트 (없으면 생성)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=self.limits,
+                timeout=self.timeout,
+                follow_redirects=True,
+            )
+        return self._client
+
+    async def start(self):
+        """애플리케이션 시작 시 클라이언트 준비"""
+        _ = self.client
+
+    async def aclose(self):
+        """애플리케이션 종료 시 커넥션 정리"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._host_semaphores.clear()
+        self._host_next_slot.clear()
+
+    @asynccontextmanager
+    async def _host_slot(self, host: str) -> AsyncIterator[None]:
+        """호스트별 동시 요청 수 제한 + 요청 시작 간격 유지"""
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._host_semaphores[host] = asyncio.Semaphore(self.per_host_concurrency)
+
+        async with semaphore:
+            if self.per_host_interval:
+                # 대기 전에 다음 시각을 예약하므로 동시에 들어온 요청도 간격을 두고 출발
+                now = time.monotonic()
+                slot = max(now, self._host_next_slot.get(host, 0.0))
+                self._host_next_slot[host] = slot + self.per_host_interval
+                if slot > now:
+                    self._stats["throttled"] += 1
+                    await asyncio.sleep(slot - now)
+            yield
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        timeout: Optional[float] = None,
+        follow_redirects: bool = True,
+        cache: Optional[str] = None,
+        throttle: Optional[Callable[[str], Awaitable[None]]] = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        공유 커넥션 풀로 요청
+
+        Args:
+            timeout: 요청별 타임아웃 (없으면 기본값)
+            cache: 응답 캐시 출처 (search/post/kin, GET만 - 없으면 캐시하지 않음)
+            throttle: 네트워크로 보내기 직전에 URL을 받아 대기하는 훅 (캐시 적중 시 호출하지 않음)
+        """
+        options = dict(headers=headers, timeout=timeout, follow_redirects=follow_redirects, throttle=throttle, **kwargs)
+        if cache and method == "GET" and http_response_cache.enabled:
+            if params:
+                url = str(httpx.URL(url, params=params))
+            return await self._cached_get(url, cache, **options)
+        return await self._send(method, url, params=params, **options)
+
+    async def _cached_get(self, url: str, source: str, headers: Optional[Dict] = None, **options) -> httpx.Response:
+        """
+        캐시를 거치는 GET
+
+        유효 기간 내 응답은 그대로, 지난 응답은 조건부 요청으로 재검증(304면 저장본 사용),
+        replay 모드에서는 네트워크를 쓰지 않습니다.
+        """
+        entry = await asyncio.to_thread(http_response_cache.load, url)
+        if entry and (http_response_cache.replay or entry.is_fresh(http_response_cache.ttl(source))):
+            http_response_cache.record("fresh")
+            return entry.to_response()
+        if http_response_cache.replay:
+            http_response_cache.record("replay_misses")
+            raise CacheMissError(f"캐시에 없는 요청입니다 (replay 모드): {url}")
+
+        if entry:
+            headers = {**(headers or {}), **entry.validators()}
+        response = await self._send("GET", url, headers=headers, **options)
+
+        if entry and response.status_code == 304:
+            http_response_cache.record("revalidated")
+            await asyncio.to_thread(http_response_cache.refresh, url, entry)
+            return entry.to_response()
+        if response.status_code == 200:
+            http_response_cache.record("refetched" if entry else "stored")
+            await asyncio.to_thread(http_response_cache.store, url, response)
+        return response
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        *,
+        timeout: Optional[float],
+        throttle: Optional[Callable[[str], Awaitable[None]]],
+        **kwargs,
+    ) -> httpx.Response:
+        if throttle:
+            await throttle(url)
+
+        host = urlparse(url).netloc.lower()
+        async with self._host_slot(host):
+            self._stats["requests"] += 1
+            response = await self.client.request(
+                method,
+                url,
+                timeout=timeout if timeout is not None else self.timeout,
+                **kwargs,
+            )
+        if response.http_version == "HTTP/2":
+            self._stats["http2_responses"] += 1
+        return response
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    @asynccontextmanager
+    async def session(
+        self, timeout: Optional[float] = None, follow_redirects: bool = True
+    ) -> AsyncIterator["CrawlerSession"]:
+        """
+        기존 `async with httpx.AsyncClient(...) as client:` 자리에 쓰는 공유 풀 세션
+        블록을 벗어나도 커넥션은 닫히지 않고 풀에 남습니다.
+        """
+        yield CrawlerSession(self, timeout, follow_redirects)
+
+    def get_stats(self) -> Dict:
+        """요청 수/대기 횟수 및 풀 설정"""
+        return {
+            **self._stats,
+            "http2_enabled": HTTP2_AVAILABLE,
+            "hosts": len(self._host_semaphores),
+            "per_host_concurrency": self.per_host_concurrency,
+            "per_host_interval": self.per_host_interval,
+            "max_connections": self.limits.max_connections,
+        }
+
+
+class CrawlerSession:
+    """세션 단위 기본값(타임아웃, 리다이렉트)을 적용하는 공유 클라이언트 래퍼"""
+
+    def __init__(self, http: CrawlerHTTPClient, timeout: Optional[float], follow_redirects: bool):
+        self._http = http
+        self._defaults = {"timeout": timeout, "follow_redirects": follow_redirects}
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        return await self._http.request(method, url, **{**self._defaults, **kwargs})
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+
+class HostRateBudget:
+    """
+    호스트별 초당 요청 수 예산 (여러 작업/워커가 공유)
+
+    크롤러 클라이언트의 기본 간격보다 엄격한 상한이 필요한 대량 작업에서
+    요청 직전에 acquire(url)로 차례를 받습니다. 예산이 없는 호스트는 바로 통과합니다.
+    """
+
+    def __init__(self, rates: Dict[str, float]):
+        # host -> 요청 간 최소 간격(초)
+        self._intervals = {host: 1.0 / rate for host, rate in rates.items() if rate > 0}
+        self._next_slot: Dict[str, float] = {}
+        self._stats = defaultdict(int)
+
+    async def acquire(self, url: str):
+        """해당 호스트의 다음 요청 시각까지 대기"""
+        host = urlparse(url).netloc.lower()
+        interval = self._intervals.get(host)
+        if interval is None:
+            return
+
+        # 대기 전에 시각을 예약해 동시에 들어온 워커들도 간격을 두고 출발
+        now = time.monotonic()
+        slot = max(now, self._next_slot.get(host, 0.0))
+        self._next_slot[host] = slot + interval
+        self._stats[host] += 1
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def get_stats(self) -> Dict:
+        """호스트별 허용 요청 수와 초당 예산"""
+        return {
+            host: {"requests": self._stats[host], "rate_per_second": round(1.0 / interval, 3)}
+            for host, interval in self._intervals.items()
+        }
+
+
+# Singleton instance
+crawler_http = CrawlerHTTPClient(
+    max_connections=settings.CRAWLER_MAX_CONNECTIONS,
+    per_host_concurrency=settings.CRAWLER_PER_HOST_CONCURRENCY,
+    per_host_interval=settings.CRAWLER_PER_HOST_INTERVAL,
+)
+
+# 대량 작업(상위글 분석, 키워드 확장)이 공유하는 네이버 요청 예산
+naver_rate_budget = HostRateBudget({
+    "search.naver.com": settings.BULK_ANALYSIS_SEARCH_RPS,
+    "m.blog.naver.com": settings.BULK_ANALYSIS_POST_RPS,
+    "ac.search.naver.com": settings.KEYWORD_AUTOCOMPLETE_RPS,
+})
@@ -10,9 +10,10 @@ from datetime import datetime, date, timedelta
 from typing import Optional, List, Dict, Any
 from sqlalchemy import select, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.models.viral_common import DailyReport, PerformanceDaily, NotificationType
+from app.models.viral_common import DailyReport, NotificationType
 from app.models.knowledge import KnowledgeAnswer, KnowledgeStats
 from app.models.cafe import CafeContent, CafeStats
+from app.services.rollup_service import rollup_service
 
 
 class DailyReportService:
@@ -95,31 +96,36 @@ class DailyReportService:
             "place_clicks": 0
         }
 
-        # PerformanceDaily에서 데이터 조회
+        # 일별 집계 조회 (당일이면 원본 이벤트 기준)
+        facts = rollup_service.performance_facts(user_id, target_date, target_date)
         result = await db.execute(
-            select(PerformanceDaily).where(
-                and_(
-                    PerformanceDaily.user_id == user_id,
-                    PerformanceDaily.date == target_date
-                )
-            )
+            select(
+                facts.c.platform,
+                func.sum(facts.c.answers_posted),
+                func.sum(facts.c.answers_adopted),
+                func.sum(facts.c.comments_posted),
+                func.sum(facts.c.posts_created),
+                func.sum(facts.c.answer_likes + facts.c.comment_likes + facts.c.post_likes),
+                func.sum(facts.c.comment_replies),
+                func.sum(facts.c.blog_clicks),
+                func.sum(facts.c.place_clicks),
+            ).group_by(facts.c.platform)
         )
-        daily_stats = list(result.scalars().all())
-
-        for stat in daily_stats:
-            if stat.platform == "knowledge":
-                data["knowledge_answers"] += stat.answers_posted
-                data["knowledge_adoptions"] += stat.answers_adopted
-                data["knowledge_likes"] += stat.likes_received
-                data["blog_clicks"] += stat.blog_clicks
-                data["place_clicks"] += stat.place_clicks
-            elif stat.platform == "cafe":
-                data["cafe_comments"] += stat.comments_posted
-                data["cafe_posts"] += stat.posts_created
-                data["cafe_likes"] += stat.likes_received
-                data["cafe_replies"] += stat.replies_received
-                data["blog_clicks"] += stat.blog_clicks
-                data["place_clicks"] += stat.place_clicks
+
+        for platform, answers, adoptions, comments, posts, likes, replies, blog_clicks, place_clicks in result:
+            if platform == "knowledge":
+                data["knowledge_answers"] += answers
+                data["knowledge_adoptions"] += adoptions
+                data["knowledge_likes"] += likes
+                data["blog_clicks"] += blog_clicks
+                data["place_clicks"] += place_clicks
+            elif platform == "cafe":
+                data["cafe_comments"] += comments
+                data["cafe_posts"] += posts
+                data["cafe_likes"] += likes
+                data["cafe_replies"] += replies
+                data["blog_clicks"] += blog_clicks
+                data["place_clicks"] += place_clicks
 
         return data
 
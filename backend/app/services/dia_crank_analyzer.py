@@ -4,8 +4,8 @@ DIA/CRANK SEO Score Analyzer
 """
 
 from typing import Dict, Optional
-import anthropic
 from app.core.config import settings
+from app.services.llm_client import llm_client
 
 
 # DB에서 API 키 로드하는 함수
@@ -200,17 +200,19 @@ class DIACRANKAnalyzer:
             if not claude_api_key:
                 raise Exception("Claude API 키가 설정되지 않았습니다.")
 
-            claude_client = anthropic.Anthropic(api_key=claude_api_key, timeout=60.0)
-
-            response = claude_client.messages.create(
+            response = await llm_client.complete(
+                provider="claude",
+                api_key=claude_api_key,
+                prompt=prompt,
                 model="claude-sonnet-4-5-20250929",
                 max_tokens=4000,
                 temperature=0.3,
-                messages=[{"role": "user", "content": prompt}]
+                timeout=60.0,
+                use_cache=True,  # 같은 글은 같은 점수로 평가
             )
 
             import json
-            result_text = response.content[0].text
+            result_text = response["text"]
             # JSON 추출
             if "```json" in result_text:
                 result_text = result_text.split("```json")[1].split("```")[0].strip()
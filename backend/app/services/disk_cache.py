@@ -0,0 +1,158 @@
+"""
+Disk Cache - 용량 제한 LRU 디스크 캐시 (공용 기반 클래스)
+이미지 변환 캐시(image_cache)와 크롤링 응답 캐시(http_cache)가 함께 사용합니다.
+
+- 저장: cache_dir/<키><SUFFIX>, 임시 파일에 쓴 뒤 교체 (읽는 쪽이 쓰다 만 파일을 보지 않음)
+- 용량: max_bytes를 넘으면 가장 오래 사용하지 않은 파일부터 삭제 (LRU, 재시작 후에는 파일 수정 시각 기준)
+- 여러 작업 스레드에서 동시에 사용 가능
+"""
+
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DiskLRUCache:
+    """용량 제한 LRU 디스크 캐시"""
+
+    SUFFIX = ".bin"
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        # key -> 파일 크기 (앞쪽일수록 오래 사용하지 않음)
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "errors": 0}
+
+    @property
+    def enabled(self) -> bool:
+        """하위 클래스에서 설정값으로 재정의"""
+        return True
+
+    def get(self, key: str) -> Optional[bytes]:
+        """캐시된 데이터 (없으면 None)"""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            self._load_index()
+            if key not in self._index:
+                self._stats["misses"] += 1
+                return None
+            self._index.move_to_end(key)
+
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            # 재시작 후에도 LRU 순서를 유지하도록 사용 시각 갱신
+            os.utime(path)
+        except OSError:
+            # 다른 프로세스가 지운 경우
+            with self._lock:
+                self._forget(key)
+                self._stats["misses"] += 1
+            return None
+
+        with self._lock:
+            self._stats["hits"] += 1
+        return data
+
+    def put(self, key: str, data: bytes):
+        """저장 후 용량 초과분 정리"""
+        if not self.enabled or len(data) > self.max_bytes:
+            return
+
+        path = self._path(key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"디스크 캐시 저장 실패 ({self.cache_dir}): {e}")
+            with self._lock:
+                self._stats["errors"] += 1
+            return
+
+        with self._lock:
+            self._load_index()
+            self._forget(key)
+            self._index[key] = len(data)
+            self._total_bytes += len(data)
+            self._evict()
+
+    def get_stats(self) -> Dict:
+        """적중/미적중 카운터와 사용량"""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else 0.0,
+                "entries": len(self._index),
+                "size_mb": round(self._total_bytes / (1024 * 1024), 2),
+                "max_size_mb": round(self.max_bytes / (1024 * 1024), 2),
+                "cache_dir": str(self.cache_dir),
+            }
+
+    def clear(self):
+        """캐시 파일 모두 삭제"""
+        with self._lock:
+            self._load_index()
+            for key in list(self._index):
+                self._remove_file(key)
+            self._index.clear()
+            self._total_bytes = 0
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self.SUFFIX}"
+
+    def _load_index(self):
+        """처음 사용할 때 기존 캐시 파일을 사용 시각 순으로 읽어 들임 (lock 보유 상태)"""
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.cache_dir.is_dir():
+            return
+
+        entries = []
+        for path in self.cache_dir.glob(f"*{self.SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path.stem, stat.st_size))
+
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._total_bytes += size
+        self._evict()
+
+    def _forget(self, key: str):
+        size = self._index.pop(key, None)
+        if size is not None:
+            self._total_bytes -= size
+
+    def _evict(self):
+        while self._total_bytes > self.max_bytes and self._index:
+            key, size = self._index.popitem(last=False)
+            self._total_bytes -= size
+            self._remove_file(key)
+            self._stats["evictions"] += 1
+
+    def _remove_file(self, key: str):
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"디스크 캐시 삭제 실패 ({self.cache_dir}): {e}")
@@ -11,7 +11,8 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
 from cryptography.fernet import Fernet
 import os
 import base64
@@ -28,7 +29,7 @@ logger = logging.getLogger(__name__)
 class EmailSenderService:
     """이메일 발송 서비스"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         # 암호화 키 (환경 변수에서 가져오거나 생성)
         self._encryption_key = os.getenv("ENCRYPTION_KEY", Fernet.generate_key().decode())
@@ -55,24 +56,32 @@ class EmailSenderService:
         f = self._get_fernet()
         return f.decrypt(encrypted.encode()).decode()
 
-    def _get_outreach_settings(self, user_id: str) -> Optional[OutreachSetting]:
+    async def _get_outreach_settings(self, user_id: str) -> Optional[OutreachSetting]:
         """사용자 발송 설정 조회"""
-        return self.db.query(OutreachSetting).filter(
-            OutreachSetting.user_id == user_id
-        ).first()
+        result = await self.db.execute(
+            select(OutreachSetting).where(OutreachSetting.user_id == user_id)
+        )
+        return result.scalars().first()
+
+    async def _count_sent_since(self, user_id: str, since: datetime) -> int:
+        """since 이후 발송 완료 건수"""
+        result = await self.db.execute(
+            select(func.count(EmailLog.id)).where(
+                EmailLog.user_id == user_id,
+                EmailLog.sent_at >= since,
+                EmailLog.status == EmailStatus.SENT
+            )
+        )
+        return result.scalar() or 0
 
-    def _check_daily_limit(self, user_id: str) -> Dict[str, Any]:
+    async def _check_daily_limit(self, user_id: str) -> Dict[str, Any]:
         """일일 발송 한도 확인"""
-        settings = self._get_outreach_settings(user_id)
+        settings = await self._get_outreach_settings(user_id)
         daily_limit = settings.daily_limit if settings else 50
 
         # 오늘 발송량 조회
         today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-        today_sent = self.db.query(EmailLog).filter(
-            EmailLog.user_id == user_id,
-            EmailLog.sent_at >= today_start,
-            EmailLog.status == EmailStatus.SENT
-        ).count()
+        today_sent = await self._count_sent_since(user_id, today_start)
 
         remaining = max(0, daily_limit - today_sent)
 
@@ -83,18 +92,14 @@ class EmailSenderService:
             "can_send": remaining > 0
         }
 
-    def _check_hourly_limit(self, user_id: str) -> Dict[str, Any]:
+    async def _check_hourly_limit(self, user_id: str) -> Dict[str, Any]:
         """시간당 발송 한도 확인"""
-        settings = self._get_outreach_settings(user_id)
+        settings = await self._get_outreach_settings(user_id)
         hourly_limit = settings.hourly_limit if settings else 10
 
         # 최근 1시간 발송량 조회
         hour_ago = datetime.utcnow() - timedelta(hours=1)
-        hour_sent = self.db.query(EmailLog).filter(
-            EmailLog.user_id == user_id,
-            EmailLog.sent_at >= hour_ago,
-            EmailLog.status == EmailStatus.SENT
-        ).count()
+        hour_sent = await self._count_sent_since(user_id, hour_ago)
 
         remaining = max(0, hourly_limit - hour_sent)
 
@@ -194,6 +199,20 @@ class EmailSenderService:
 
         return html
 
+    def _deliver(self, settings: OutreachSetting, to_email: str, msg: MIMEMultipart):
+        """SMTP 연결 및 발송 (동기 - asyncio.to_thread로 실행)"""
+        smtp_password = self.decrypt_password(settings.smtp_password_encrypted) if settings.smtp_password_encrypted else ""
+
+        if settings.smtp_use_tls:
+            server = smtplib.SMTP(settings.smtp_host, settings.smtp_port)
+            server.starttls()
+        else:
+            server = smtplib.SMTP_SSL(settings.smtp_host, settings.smtp_port)
+
+        server.login(settings.smtp_username, smtp_password)
+        server.sendmail(settings.sender_email, to_email, msg.as_string())
+        server.quit()
+
     async def send_email(
         self,
         user_id: str,
@@ -210,14 +229,14 @@ class EmailSenderService:
         """이메일 발송"""
         try:
             # 한도 확인
-            daily_check = self._check_daily_limit(user_id)
+            daily_check = await self._check_daily_limit(user_id)
             if not daily_check["can_send"]:
                 return {
                     "success": False,
                     "error": f"일일 발송 한도 초과 ({daily_check['daily_limit']}건)"
                 }
 
-            hourly_check = self._check_hourly_limit(user_id)
+            hourly_check = await self._check_hourly_limit(user_id)
             if not hourly_check["can_send"]:
                 return {
                     "success": False,
@@ -225,7 +244,7 @@ class EmailSenderService:
                 }
 
             # 설정 조회
-            settings = self._get_outreach_settings(user_id)
+            settings = await self._get_outreach_settings(user_id)
             if not settings or not settings.smtp_host:
                 return {
                     "success": False,
@@ -255,8 +274,8 @@ class EmailSenderService:
                 status=EmailStatus.PENDING,
                 sequence_number=sequence_number
             )
+            # 발송 결과와 함께 커밋 (SMTP 발송 전에 flush하면 발송 내내 쓰기 커넥션을 점유)
             self.db.add(email_log)
-            self.db.flush()
 
             # SMTP 발송
             try:
@@ -271,18 +290,8 @@ class EmailSenderService:
                 msg.attach(MIMEText(text_body, 'plain', 'utf-8'))
                 msg.attach(MIMEText(html_body, 'html', 'utf-8'))
 
-                # SMTP 연결 및 발송
-                smtp_password = self.decrypt_password(settings.smtp_password_encrypted) if settings.smtp_password_encrypted else ""
-
-                if settings.smtp_use_tls:
-                    server = smtplib.SMTP(settings.smtp_host, settings.smtp_port)
-                    server.starttls()
-                else:
-                    server = smtplib.SMTP_SSL(settings.smtp_host, settings.smtp_port)
-
-                server.login(settings.smtp_username, smtp_password)
-                server.sendmail(settings.sender_email, to_email, msg.as_string())
-                server.quit()
+                # SMTP 연결 및 발송 (블로킹 소켓 I/O는 스레드에서)
+                await asyncio.to_thread(self._deliver, settings, to_email, msg)
 
                 # 발송 성공 업데이트
                 email_log.status = EmailStatus.SENT
@@ -290,14 +299,12 @@ class EmailSenderService:
 
                 # 블로그 상태 업데이트
                 if blog_id:
-                    blog = self.db.query(NaverBlog).filter(
-                        NaverBlog.id == blog_id
-                    ).first()
+                    blog = await self.db.get(NaverBlog, blog_id)
                     if blog:
                         blog.status = BlogStatus.CONTACTED
                         blog.updated_at = datetime.utcnow()
 
-                self.db.commit()
+                await self.db.commit()
 
                 return {
                     "success": True,
@@ -309,7 +316,7 @@ class EmailSenderService:
                 email_log.status = EmailStatus.BOUNCED
                 email_log.error_message = str(e)
                 email_log.bounced_at = datetime.utcnow()
-                self.db.commit()
+                await self.db.commit()
 
                 return {
                     "success": False,
@@ -318,7 +325,7 @@ class EmailSenderService:
 
         except Exception as e:
             logger.error(f"이메일 발송 오류: {e}")
-            self.db.rollback()
+            await self.db.rollback()
             return {"success": False, "error": str(e)}
 
     async def send_with_template(
@@ -332,40 +339,52 @@ class EmailSenderService:
         """템플릿으로 이메일 발송"""
         try:
             # 블로그 및 연락처 조회
-            blog = self.db.query(NaverBlog).filter(
-                NaverBlog.id == blog_id,
-                NaverBlog.user_id == user_id
-            ).first()
+            result = await self.db.execute(
+                select(NaverBlog).where(
+                    NaverBlog.id == blog_id,
+                    NaverBlog.user_id == user_id
+                )
+            )
+            blog = result.scalars().first()
 
             if not blog:
                 return {"success": False, "error": "블로그를 찾을 수 없습니다"}
 
             # 기본 연락처 조회
-            contact = self.db.query(BlogContact).filter(
-                BlogContact.blog_id == blog_id,
-                BlogContact.is_primary == True
-            ).first()
+            result = await self.db.execute(
+                select(BlogContact).where(
+                    BlogContact.blog_id == blog_id,
+                    BlogContact.is_primary == True
+                )
+            )
+            contact = result.scalars().first()
 
             if not contact:
-                contact = self.db.query(BlogContact).filter(
-                    BlogContact.blog_id == blog_id,
-                    BlogContact.email.isnot(None)
-                ).first()
+                result = await self.db.execute(
+                    select(BlogContact).where(
+                        BlogContact.blog_id == blog_id,
+                        BlogContact.email.isnot(None)
+                    )
+                )
+                contact = result.scalars().first()
 
             if not contact or not contact.email:
                 return {"success": False, "error": "이메일 연락처가 없습니다"}
 
             # 템플릿 조회
-            template = self.db.query(EmailTemplate).filter(
-                EmailTemplate.id == template_id,
-                EmailTemplate.user_id == user_id
-            ).first()
+            result = await self.db.execute(
+                select(EmailTemplate).where(
+                    EmailTemplate.id == template_id,
+                    EmailTemplate.user_id == user_id
+                )
+            )
+            template = result.scalars().first()
 
             if not template:
                 return {"success": False, "error": "템플릿을 찾을 수 없습니다"}
 
             # 설정 조회
-            settings = self._get_outreach_settings(user_id)
+            settings = await self._get_outreach_settings(user_id)
 
             # 변수 준비
             variables = {
@@ -402,13 +421,13 @@ class EmailSenderService:
             # 템플릿 사용 횟수 증가
             if result["success"]:
                 template.usage_count = (template.usage_count or 0) + 1
-                self.db.commit()
+                await self.db.commit()
 
             return result
 
         except Exception as e:
             logger.error(f"템플릿 이메일 발송 오류: {e}")
-            self.db.rollback()
+            await self.db.rollback()
             return {"success": False, "error": str(e)}
 
     async def send_campaign_batch(
@@ -420,10 +439,13 @@ class EmailSenderService:
         """캠페인 배치 발송"""
         try:
             # 캠페인 조회
-            campaign = self.db.query(EmailCampaign).filter(
-                EmailCampaign.id == campaign_id,
-                EmailCampaign.user_id == user_id
-            ).first()
+            result = await self.db.execute(
+                select(EmailCampaign).where(
+                    EmailCampaign.id == campaign_id,
+                    EmailCampaign.user_id == user_id
+                )
+            )
+            campaign = result.scalars().first()
 
             if not campaign:
                 return {"success": False, "error": "캠페인을 찾을 수 없습니다"}
@@ -432,7 +454,7 @@ class EmailSenderService:
                 return {"success": False, "error": "활성 상태의 캠페인이 아닙니다"}
 
             # 한도 확인
-            daily_check = self._check_daily_limit(user_id)
+            daily_check = await self._check_daily_limit(user_id)
             batch_size = min(batch_size, daily_check["remaining"])
 
             if batch_size <= 0:
@@ -442,11 +464,11 @@ class EmailSenderService:
                 }
 
             # 타겟 블로그 조회 (아직 이메일 안 보낸 블로그)
-            sent_blog_ids = self.db.query(EmailLog.blog_id).filter(
+            sent_blog_ids = select(EmailLog.blog_id).where(
                 EmailLog.campaign_id == campaign_id
-            ).subquery()
+            )
 
-            query = self.db.query(NaverBlog).filter(
+            query = select(NaverBlog).where(
                 NaverBlog.user_id == user_id,
                 NaverBlog.has_contact == True,
                 NaverBlog.status.notin_([BlogStatus.CONTACTED, BlogStatus.NOT_INTERESTED, BlogStatus.INVALID]),
@@ -456,16 +478,17 @@ class EmailSenderService:
             # 등급 필터
             if campaign.target_grades:
                 target_grades = [LeadGrade(g) for g in campaign.target_grades]
-                query = query.filter(NaverBlog.lead_grade.in_(target_grades))
+                query = query.where(NaverBlog.lead_grade.in_(target_grades))
 
             # 최소 점수 필터
             if campaign.min_score:
-                query = query.filter(NaverBlog.lead_score >= campaign.min_score)
+                query = query.where(NaverBlog.lead_score >= campaign.min_score)
 
             # 정렬 및 제한
-            blogs = query.order_by(
-                NaverBlog.lead_score.desc()
-            ).limit(batch_size).all()
+            result = await self.db.execute(
+                query.order_by(NaverBlog.lead_score.desc()).limit(batch_size)
+            )
+            blogs = result.scalars().all()
 
             if not blogs:
                 return {
@@ -490,7 +513,7 @@ class EmailSenderService:
                 "errors": []
             }
 
-            settings = self._get_outreach_settings(user_id)
+            settings = await self._get_outreach_settings(user_id)
             min_interval = settings.min_interval_seconds if settings else 300
 
             for blog in blogs:
@@ -515,7 +538,7 @@ class EmailSenderService:
                 if min_interval > 0 and results["sent"] < len(blogs):
                     await asyncio.sleep(min_interval)
 
-            self.db.commit()
+            await self.db.commit()
 
             return {
                 "success": True,
@@ -524,15 +547,16 @@ class EmailSenderService:
 
         except Exception as e:
             logger.error(f"캠페인 배치 발송 오류: {e}")
-            self.db.rollback()
+            await self.db.rollback()
             return {"success": False, "error": str(e)}
 
     async def track_open(self, tracking_id: str) -> bool:
         """오픈 추적"""
         try:
-            email_log = self.db.query(EmailLog).filter(
-                EmailLog.tracking_id == tracking_id
-            ).first()
+            result = await self.db.execute(
+                select(EmailLog).where(EmailLog.tracking_id == tracking_id)
+            )
+            email_log = result.scalars().first()
 
             if email_log and email_log.status == EmailStatus.SENT:
                 email_log.status = EmailStatus.OPENED
@@ -540,13 +564,11 @@ class EmailSenderService:
 
                 # 캠페인 통계 업데이트
                 if email_log.campaign_id:
-                    campaign = self.db.query(EmailCampaign).filter(
-                        EmailCampaign.id == email_log.campaign_id
-                    ).first()
+                    campaign = await self.db.get(EmailCampaign, email_log.campaign_id)
                     if campaign:
                         campaign.total_opened = (campaign.total_opened or 0) + 1
 
-                self.db.commit()
+                await self.db.commit()
                 return True
 
             return False
@@ -558,9 +580,10 @@ class EmailSenderService:
     async def track_click(self, tracking_id: str, url: str) -> bool:
         """클릭 추적"""
         try:
-            email_log = self.db.query(EmailLog).filter(
-                EmailLog.tracking_id == tracking_id
-            ).first()
+            result = await self.db.execute(
+                select(EmailLog).where(EmailLog.tracking_id == tracking_id)
+            )
+            email_log = result.scalars().first()
 
             if email_log:
                 if email_log.status in [EmailStatus.SENT, EmailStatus.OPENED]:
@@ -569,13 +592,11 @@ class EmailSenderService:
 
                 # 캠페인 통계 업데이트
                 if email_log.campaign_id:
-                    campaign = self.db.query(EmailCampaign).filter(
-                        EmailCampaign.id == email_log.campaign_id
-                    ).first()
+                    campaign = await self.db.get(EmailCampaign, email_log.campaign_id)
                     if campaign:
                         campaign.total_clicked = (campaign.total_clicked or 0) + 1
 
-                self.db.commit()
+                await self.db.commit()
                 return True
 
             return False
@@ -587,9 +608,7 @@ class EmailSenderService:
     async def mark_replied(self, email_log_id: str) -> bool:
         """회신 마킹"""
         try:
-            email_log = self.db.query(EmailLog).filter(
-                EmailLog.id == email_log_id
-            ).first()
+            email_log = await self.db.get(EmailLog, email_log_id)
 
             if email_log:
                 email_log.status = EmailStatus.REPLIED
@@ -597,22 +616,18 @@ class EmailSenderService:
 
                 # 블로그 상태 업데이트
                 if email_log.blog_id:
-                    blog = self.db.query(NaverBlog).filter(
-                        NaverBlog.id == email_log.blog_id
-                    ).first()
+                    blog = await self.db.get(NaverBlog, email_log.blog_id)
                     if blog:
                         blog.status = BlogStatus.RESPONDED
                         blog.updated_at = datetime.utcnow()
 
                 # 캠페인 통계 업데이트
                 if email_log.campaign_id:
-                    campaign = self.db.query(EmailCampaign).filter(
-                        EmailCampaign.id == email_log.campaign_id
-                    ).first()
+                    campaign = await self.db.get(EmailCampaign, email_log.campaign_id)
                     if campaign:
                         campaign.total_replied = (campaign.total_replied or 0) + 1
 
-                self.db.commit()
+                await self.db.commit()
                 return True
 
             return False
@@ -623,14 +638,13 @@ class EmailSenderService:
 
     async def get_sending_stats(self, user_id: str) -> Dict[str, Any]:
         """발송 통계"""
-        settings = self._get_outreach_settings(user_id)
-
         # 오늘 통계
         today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-        today_logs = self.db.query(EmailLog).filter(
-            EmailLog.user_id == user_id,
-            EmailLog.created_at >= today_start
-        ).all()
+        result = await self.db.execute(
+            select(EmailLog.status, EmailLog.created_at).where(EmailLog.user_id == user_id)
+        )
+        all_logs = result.all()
+        today_logs = [log for log in all_logs if log.created_at and log.created_at >= today_start]
 
         today_stats = {
             "sent": 0,
@@ -658,10 +672,6 @@ class EmailSenderService:
                 today_stats["bounced"] += 1
 
         # 전체 통계
-        all_logs = self.db.query(EmailLog).filter(
-            EmailLog.user_id == user_id
-        ).all()
-
         total_stats = {
             "total": len(all_logs),
             "sent": sum(1 for l in all_logs if l.status not in [EmailStatus.PENDING, EmailStatus.BOUNCED]),
@@ -685,7 +695,7 @@ class EmailSenderService:
             "today": today_stats,
             "total": total_stats,
             "limits": {
-                "daily": self._check_daily_limit(user_id),
-                "hourly": self._check_hourly_limit(user_id)
+                "daily": await self._check_daily_limit(user_id),
+                "hourly": await self._check_hourly_limit(user_id)
             }
         }
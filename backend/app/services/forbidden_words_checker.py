@@ -2,14 +2,21 @@
 네이버 블로그 금칙어 검사 및 자동 대체 서비스
 """
 
-import re
 from typing import Dict, List, Tuple
 
+from app.services.compliance_rules import compliance_rule_store
+from app.services.compliance_scanner import ComplianceScanner
+
 
 class ForbiddenWordsChecker:
-    """네이버 블로그 금칙어 검사기"""
+    """
+    네이버 블로그 금칙어 검사기
+
+    실제 검사는 compliance_rule_store의 현재 규칙 세트(DB 규칙)로 수행하며,
+    아래 목록은 DB에 규칙이 없을 때의 기본값입니다.
+    """
 
-    # 네이버 블로그 금칙어 목록 (의료 관련)
+    # 네이버 블로그 금칙어 목록 (의료 관련, 기본값)
     FORBIDDEN_WORDS = {
         # 효과 과장 금지어
         "100% 치료": "개선 가능",
@@ -72,6 +79,34 @@ class ForbiddenWordsChecker:
         (r'\d+회\s*무료', r'상담 시 안내'),
     ]
 
+    def _summarize(self, scanner: ComplianceScanner, text: str, matches: List) -> List[Dict]:
+        """
+        검사 결과를 변경 내역 형식으로 정리
+        고정 단어는 단어별로 개수를 합치고(사전 순), 패턴은 일치마다 하나씩(위치 순)
+        """
+        exact: Dict[int, Dict] = {}
+        patterns = []
+        for start, end, rule_index, match in matches:
+            rule = scanner.rules[rule_index]
+            if rule["type"] == "exact_match":
+                if rule_index in exact:
+                    exact[rule_index]["count"] += 1
+                else:
+                    exact[rule_index] = {
+                        "original": rule["pattern"],
+                        "replaced": rule["replacement"],
+                        "count": 1,
+                        "type": "exact_match",
+                    }
+            else:
+                patterns.append({
+                    "original": text[start:end],
+                    "replaced": scanner.replacement_for(rule_index, text, match),
+                    "count": 1,
+                    "type": "pattern_match",
+                })
+        return [exact[index] for index in sorted(exact)] + patterns
+
     def check_and_replace(self, text: str) -> Tuple[str, List[Dict]]:
         """
         텍스트에서 금칙어를 찾아서 대체
@@ -82,36 +117,10 @@ class ForbiddenWordsChecker:
         Returns:
             (대체된 텍스트, 변경 내역 리스트)
         """
-        replacements = []
-        modified_text = text
-
-        # 1. 고정 단어 대체
-        for forbidden, replacement in self.FORBIDDEN_WORDS.items():
-            if forbidden in modified_text:
-                count = modified_text.count(forbidden)
-                modified_text = modified_text.replace(forbidden, replacement)
-                replacements.append({
-                    "original": forbidden,
-                    "replaced": replacement,
-                    "count": count,
-                    "type": "exact_match"
-                })
-
-        # 2. 패턴 기반 대체
-        for pattern, replacement in self.FORBIDDEN_PATTERNS:
-            matches = re.finditer(pattern, modified_text)
-            for match in matches:
-                original = match.group(0)
-                new_text = re.sub(pattern, replacement, original)
-                modified_text = modified_text.replace(original, new_text)
-                replacements.append({
-                    "original": original,
-                    "replaced": new_text,
-                    "count": 1,
-                    "type": "pattern_match"
-                })
-
-        return modified_text, replacements
+        scanner = compliance_rule_store.current.forbidden_scanner
+        matches = scanner.scan(text)
+        modified_text, _ = scanner.replace(text, matches)
+        return modified_text, self._summarize(scanner, text, matches)
 
     def check_only(self, text: str) -> List[Dict]:
         """
@@ -123,35 +132,24 @@ class ForbiddenWordsChecker:
         Returns:
             발견된 금칙어 리스트
         """
-        found_words = []
-
-        # 1. 고정 단어 검사
-        for forbidden, replacement in self.FORBIDDEN_WORDS.items():
-            if forbidden in text:
-                count = text.count(forbidden)
-                found_words.append({
-                    "word": forbidden,
-                    "suggestion": replacement,
-                    "count": count,
-                    "type": "exact_match"
-                })
-
-        # 2. 패턴 기반 검사
-        for pattern, replacement in self.FORBIDDEN_PATTERNS:
-            matches = re.finditer(pattern, text)
-            for match in matches:
-                found_words.append({
-                    "word": match.group(0),
-                    "suggestion": re.sub(pattern, replacement, match.group(0)),
-                    "count": 1,
-                    "type": "pattern_match"
-                })
-
-        return found_words
+        scanner = compliance_rule_store.current.forbidden_scanner
+        return [
+            {
+                "word": item["original"],
+                "suggestion": item["replaced"],
+                "count": item["count"],
+                "type": item["type"],
+            }
+            for item in self._summarize(scanner, text, scanner.all_matches(text))
+        ]
 
     def get_forbidden_words_list(self) -> List[str]:
         """금칙어 목록 반환"""
-        return list(self.FORBIDDEN_WORDS.keys())
+        return [
+            rule["pattern"]
+            for rule in compliance_rule_store.current.forbidden_rules
+            if rule.get("literal")
+        ]
 
 
 # Singleton instance
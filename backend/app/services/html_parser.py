@@ -0,0 +1,348 @@
+"""
+HTML Parser - 크롤러 공용 HTML 파서 백엔드
+설치된 파서 중 가장 빠른 것을 사용하고, 셀렉터 여러 개를 트리 한 번 순회로 평가합니다.
+
+- 백엔드: selectolax > lxml > BeautifulSoup(html.parser) (HTML_PARSER로 고정 가능)
+- make_soup: BeautifulSoup이 필요한 코드용 (lxml 트리 빌더 우선)
+- scan_page: 셀렉터 그룹별 일치 요소를 한 번의 순회로 수집 (그룹마다 select를 반복하지 않음)
+
+scan_page가 지원하는 셀렉터는 단순 셀렉터 하나입니다:
+    tag, .class, #id, [attr], [attr='v'], [attr*='v'], [attr^='v'], [attr$='v'] 및 그 조합
+    (자손/자식 결합자는 지원하지 않음 - 필요하면 make_soup + select 사용)
+"""
+
+import logging
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+from app.core.config import settings
+
+# lxml (bs4 트리 빌더 겸 직접 순회용)
+try:
+    import lxml.html
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# selectolax (설치된 경우)
+try:
+    from selectolax.parser import HTMLParser as SelectolaxHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# 텍스트 추출에서 제외하는 태그 (BeautifulSoup get_text와 동일)
+NON_TEXT_TAGS = ("script", "style")
+
+_SIMPLE_SELECTOR = re.compile(
+    r"""
+    (?P<tag>[a-zA-Z][\w-]*|\*)?
+    (?P<rest>(?:[.#][\w-]+|\[[^\]]+\])*)
+    """,
+    re.VERBOSE,
+)
+_SELECTOR_PART = re.compile(r"([.#])([\w-]+)|\[\s*([\w-]+)\s*(?:([*^$]?=)\s*['\"]?([^'\"\]]*)['\"]?)?\s*\]")
+
+
+class SimpleSelector:
+    """단순 셀렉터 하나 (태그/id/클래스/속성 조건)"""
+
+    def __init__(self, selector: str):
+        selector = selector.strip()
+        match = _SIMPLE_SELECTOR.fullmatch(selector)
+        if not match or not selector:
+            raise ValueError(f"지원하지 않는 셀렉터입니다: {selector}")
+
+        tag = match.group("tag")
+        self.selector = selector
+        self.tag = tag.lower() if tag and tag != "*" else None
+        self.id: Optional[str] = None
+        self.classes: List[str] = []
+        self.attrs: List[Tuple[str, Optional[str], Optional[str]]] = []
+
+        for part in _SELECTOR_PART.finditer(match.group("rest")):
+            prefix, name, attr, op, value = part.groups()
+            if prefix == ".":
+                self.classes.append(name)
+            elif prefix == "#":
+                self.id = name
+            else:
+                self.attrs.append((attr.lower(), op, value))
+
+    def matches(self, tag: str, classes: List[str], element: Any, backend: "ParserBackend") -> bool:
+        if self.tag and tag != self.tag:
+            return False
+        if self.id and backend.attr(element, "id") != self.id:
+            return False
+        if self.classes and any(name not in classes for name in self.classes):
+            return False
+        for name, op, value in self.attrs:
+            actual = backend.attr(element, name)
+            if actual is None:
+                return False
+            if op == "=" and actual != value:
+                return False
+            if op == "*=" and (not value or value not in actual):
+                return False
+            if op == "^=" and (not value or not actual.startswith(value)):
+                return False
+            if op == "$=" and (not value or not actual.endswith(value)):
+                return False
+        return True
+
+
+class ParserBackend:
+    """파서 백엔드 공통 인터페이스"""
+
+    name = ""
+
+    def parse(self, html: str) -> Any:
+        raise NotImplementedError
+
+    def iter_elements(self, root: Any) -> Iterator[Any]:
+        """문서 순서대로 요소 노드만"""
+        raise NotImplementedError
+
+    def tag(self, element: Any) -> str:
+        raise NotImplementedError
+
+    def attr(self, element: Any, name: str) -> Optional[str]:
+        raise NotImplementedError
+
+    def strings(self, element: Any) -> Iterator[str]:
+        """요소 아래 텍스트 조각 (주석, script/style 제외)"""
+        raise NotImplementedError
+
+    def text(self, element: Any, separator: str = "", strip: bool = False) -> str:
+        """BeautifulSoup get_text(separator, strip)와 같은 결과"""
+        strings = self.strings(element)
+        if strip:
+            strings = (s.strip() for s in strings)
+            strings = (s for s in strings if s)
+        return separator.join(strings)
+
+
+class LxmlBackend(ParserBackend):
+    name = "lxml"
+
+    def parse(self, html: str) -> Any:
+        if not html or not html.strip():
+            return None
+        try:
+            return lxml.html.document_fromstring(html)
+        except ValueError:
+            # <?xml encoding=...?> 선언이 있는 문자열은 바이트로 파싱
+            return lxml.html.document_fromstring(html.encode("utf-8"))
+        except etree.ParserError:
+            return None
+
+    def iter_elements(self, root: Any) -> Iterator[Any]:
+        if root is None:
+            return iter(())
+        return root.iter(etree.Element)
+
+    def tag(self, element: Any) -> str:
+        return element.tag
+
+    def attr(self, element: Any, name: str) -> Optional[str]:
+        return element.get(name)
+
+    def strings(self, element: Any) -> Iterator[str]:
+        if element.text and element.tag not in NON_TEXT_TAGS:
+            yield element.text
+        for node in element.iterdescendants():
+            if isinstance(node.tag, str) and node.text and node.tag not in NON_TEXT_TAGS:
+                yield node.text
+            if node.tail:
+                yield node.tail
+
+
+class SelectolaxBackend(ParserBackend):
+    name = "selectolax"
+
+    def parse(self, html: str) -> Any:
+        if not html or not html.strip():
+            return None
+        return SelectolaxHTMLParser(html).root
+
+    def iter_elements(self, root: Any) -> Iterator[Any]:
+        if root is None:
+            return iter(())
+        return (node for node in root.traverse(include_text=False) if not node.tag.startswith(("-", "_")))
+
+    def tag(self, element: Any) -> str:
+        return element.tag
+
+    def attr(self, element: Any, name: str) -> Optional[str]:
+        attributes = element.attributes
+        if name not in attributes:
+            return None
+        # 값 없는 속성은 None으로 오므로 빈 문자열로
+        return attributes[name] or ""
+
+    def strings(self, element: Any) -> Iterator[str]:
+        for node in element.traverse(include_text=True):
+            if node.tag == "-text" and (node.parent is None or node.parent.tag not in NON_TEXT_TAGS):
+                yield node.text_content
+
+
+class SoupBackend(ParserBackend):
+    name = "html.parser"
+
+    def parse(self, html: str) -> Any:
+        return BeautifulSoup(html or "", "html.parser")
+
+    def iter_elements(self, root: Any) -> Iterator[Any]:
+        return root.find_all(True)
+
+    def tag(self, element: Any) -> str:
+        return element.name
+
+    def attr(self, element: Any, name: str) -> Optional[str]:
+        value = element.get(name)
+        # class 등 다중 값 속성은 리스트로 옴
+        return " ".join(value) if isinstance(value, list) else value
+
+    def strings(self, element: Any) -> Iterator[str]:
+        return element._all_strings()
+
+    def text(self, element: Any, separator: str = "", strip: bool = False) -> str:
+        return element.get_text(separator=separator, strip=strip)
+
+
+_BACKENDS: Dict[str, Callable[[], ParserBackend]] = {"html.parser": SoupBackend}
+if LXML_AVAILABLE:
+    _BACKENDS["lxml"] = LxmlBackend
+if SELECTOLAX_AVAILABLE:
+    _BACKENDS["selectolax"] = SelectolaxBackend
+
+
+def available_backends() -> List[str]:
+    """설치된 백엔드 (빠른 순)"""
+    return [name for name in ("selectolax", "lxml", "html.parser") if name in _BACKENDS]
+
+
+def get_backend(name: Optional[str] = None) -> ParserBackend:
+    """
+    파서 백엔드 선택
+
+    Args:
+        name: selectolax / lxml / html.parser (없으면 HTML_PARSER 설정, "auto"면 가장 빠른 것)
+    """
+    name = name or settings.HTML_PARSER
+    if name == "auto":
+        name = available_backends()[0]
+    if name not in _BACKENDS:
+        logger.warning(f"HTML 파서 '{name}'을(를) 사용할 수 없어 {available_backends()[0]}로 대체합니다")
+        name = available_backends()[0]
+    return _BACKENDS[name]()
+
+
+def make_soup(html: str) -> BeautifulSoup:
+    """BeautifulSoup 객체 생성 (lxml 트리 빌더가 있으면 사용 - html.parser보다 수 배 빠름)"""
+    return BeautifulSoup(html or "", "lxml" if LXML_AVAILABLE else "html.parser")
+
+
+class PageScan:
+    """scan_page 결과 - 그룹/셀렉터별 일치 요소"""
+
+    def __init__(self, backend: ParserBackend, matches: Dict[str, List[List[Any]]]):
+        self.backend = backend
+        self._matches = matches
+
+    def count(self, group: str) -> int:
+        """셀렉터별 일치 수의 합 (soup.select를 셀렉터마다 실행해 더한 값과 같음)"""
+        return sum(len(elements) for elements in self._matches.get(group, []))
+
+    def any(self, group: str) -> bool:
+        return any(self._matches.get(group, []))
+
+    def first(self, group: str) -> Optional[Any]:
+        """셀렉터 우선순위대로 첫 일치 요소 (select_one을 순서대로 시도한 결과)"""
+        for elements in self._matches.get(group, []):
+            if elements:
+                return elements[0]
+        return None
+
+    def elements(self, group: str) -> List[Any]:
+        """그룹의 모든 일치 요소 (셀렉터 순서, 중복 포함)"""
+        return [element for elements in self._matches.get(group, []) for element in elements]
+
+    def attrs(self, group: str, name: str) -> List[str]:
+        """일치 요소들의 속성 값 (비어 있는 값 제외)"""
+        values = (self.backend.attr(element, name) for element in self.elements(group))
+        return [value for value in values if value]
+
+    def tag(self, element: Any) -> str:
+        return self.backend.tag(element)
+
+    def attr(self, element: Any, name: str) -> Optional[str]:
+        return self.backend.attr(element, name)
+
+    def text(self, element: Any, separator: str = "", strip: bool = True) -> str:
+        return self.backend.text(element, separator=separator, strip=strip)
+
+
+@lru_cache(maxsize=64)
+def _compile_groups(groups: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> Tuple[Tuple[str, Tuple[SimpleSelector, ...]], ...]:
+    """셀렉터 그룹 컴파일 (같은 그룹 구성은 한 번만)"""
+    return tuple((name, tuple(SimpleSelector(s) for s in selectors)) for name, selectors in groups)
+
+
+def scan_page(
+    html: str,
+    groups: Dict[str, List[str]],
+    backend: Optional[ParserBackend] = None
+) -> PageScan:
+    """
+    문서를 한 번 순회하며 모든 셀렉터 그룹의 일치 요소 수집
+
+    Args:
+        groups: 그룹 이름 -> 단순 셀렉터 목록 (예: top_post_analyzer.SELECTORS)
+        backend: 파서 백엔드 (없으면 get_backend())
+    """
+    backend = backend or get_backend()
+    compiled = _compile_groups(tuple((name, tuple(selectors)) for name, selectors in groups.items()))
+    matches = {name: [[] for _ in selectors] for name, selectors in compiled}
+
+    # 요소마다 전체 셀렉터를 검사하지 않도록 태그/첫 클래스/id로 후보를 나눠 둠
+    by_tag: Dict[str, List[Tuple[SimpleSelector, List[Any]]]] = {}
+    by_class: Dict[str, List[Tuple[SimpleSelector, List[Any]]]] = {}
+    by_id: Dict[str, List[Tuple[SimpleSelector, List[Any]]]] = {}
+    generic: List[Tuple[SimpleSelector, List[Any]]] = []
+    for name, selectors in compiled:
+        for selector, bucket in zip(selectors, matches[name]):
+            if selector.tag:
+                by_tag.setdefault(selector.tag, []).append((selector, bucket))
+            elif selector.classes:
+                by_class.setdefault(selector.classes[0], []).append((selector, bucket))
+            elif selector.id:
+                by_id.setdefault(selector.id, []).append((selector, bucket))
+            else:
+                generic.append((selector, bucket))
+
+    attr = backend.attr
+    for element in backend.iter_elements(backend.parse(html)):
+        tag = backend.tag(element)
+        class_attr = attr(element, "class")
+        classes = class_attr.split() if class_attr else []
+
+        candidates = list(by_tag.get(tag, ()))
+        for name in classes:
+            candidates.extend(by_class.get(name, ()))
+        if by_id:
+            candidates.extend(by_id.get(attr(element, "id"), ()))
+        candidates.extend(generic)
+
+        for selector, bucket in candidates:
+            # 같은 클래스가 두 번 적힌 경우 중복 추가 방지
+            if selector.matches(tag, classes, element, backend) and (not bucket or bucket[-1] is not element):
+                bucket.append(element)
+
+    return PageScan(backend, matches)
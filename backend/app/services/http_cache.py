@@ -0,0 +1,160 @@
+"""
+HTTP Response Cache - 크롤링 응답 디스크 캐시
+여러 사용자/작업이 같은 블로그 글과 검색 결과를 반복해서 받지 않도록 응답을 저장하고,
+유효 기간이 지나면 ETag/Last-Modified 조건부 요청으로 재검증합니다 (304면 본문을 다시 받지 않음).
+
+- 키: 요청 URL(쿼리 포함) SHA-256 / 파일: HTTP_CACHE_DIR/<키>.gz (메타데이터 + 본문 gzip 압축)
+- 용량: HTTP_CACHE_MAX_MB를 넘으면 가장 오래 사용하지 않은 응답부터 삭제 (LRU)
+- 출처별 유효 기간: search(검색 결과), post(블로그 본문), kin(지식인 질문) - HTTP_CACHE_TTL_*
+- HTTP_CACHE_MODE=replay: 네트워크 없이 저장된 응답만 사용 (없으면 CacheMissError) - 테스트 재현용
+
+crawler_http.request(..., cache="post")처럼 출처를 지정한 GET 요청만 캐시합니다.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections import defaultdict
+from typing import Dict, Optional
+
+import httpx
+
+from app.core.config import settings
+from app.services.disk_cache import DiskLRUCache
+
+# 캐시에 함께 저장하는 응답 헤더 (본문은 압축 해제된 상태로 저장하므로 content-encoding 등은 제외)
+STORED_HEADERS = ("content-type", "etag", "last-modified")
+
+
+class CacheMissError(httpx.RequestError):
+    """replay 모드에서 저장되지 않은 요청"""
+
+
+class CachedResponse:
+    """디스크에 저장된 응답 하나"""
+
+    def __init__(self, meta: Dict, body: bytes):
+        self.meta = meta
+        self.body = body
+
+    def is_fresh(self, ttl: int) -> bool:
+        return time.time() - self.meta.get("validated_at", 0) < ttl
+
+    def validators(self) -> Dict[str, str]:
+        """조건부 요청 헤더"""
+        headers = self.meta.get("headers", {})
+        validators = {}
+        if headers.get("etag"):
+            validators["If-None-Match"] = headers["etag"]
+        if headers.get("last-modified"):
+            validators["If-Modified-Since"] = headers["last-modified"]
+        return validators
+
+    def to_response(self) -> httpx.Response:
+        """호출자가 네트워크 응답과 똑같이 쓸 수 있는 httpx.Response"""
+        response = httpx.Response(
+            self.meta.get("status_code", 200),
+            headers=self.meta.get("headers", {}),
+            content=self.body,
+            request=httpx.Request("GET", self.meta["url"]),
+        )
+        if self.meta.get("encoding"):
+            response.encoding = self.meta["encoding"]
+        return response
+
+    def dumps(self) -> bytes:
+        # JSON은 줄바꿈을 이스케이프하므로 첫 줄바꿈이 메타데이터와 본문의 경계
+        return gzip.compress(
+            json.dumps(self.meta, ensure_ascii=False).encode("utf-8") + b"\n" + self.body,
+            compresslevel=6,
+        )
+
+    @classmethod
+    def loads(cls, data: bytes) -> "CachedResponse":
+        meta, body = gzip.decompress(data).split(b"\n", 1)
+        return cls(json.loads(meta), body)
+
+
+class HTTPResponseCache(DiskLRUCache):
+    """크롤링 응답 캐시"""
+
+    SUFFIX = ".gz"
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        super().__init__(cache_dir, max_bytes)
+        # fresh: 유효 기간 내 적중, revalidated: 304로 재사용, refetched: 변경되어 다시 받음
+        self._http_stats = defaultdict(int)
+
+    @property
+    def enabled(self) -> bool:
+        return settings.HTTP_CACHE_ENABLED
+
+    @property
+    def replay(self) -> bool:
+        return settings.HTTP_CACHE_MODE == "replay"
+
+    @staticmethod
+    def make_key(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def ttl(source: str) -> int:
+        """출처별 유효 기간(초)"""
+        return {
+            "search": settings.HTTP_CACHE_TTL_SEARCH,
+            "post": settings.HTTP_CACHE_TTL_POST,
+            "kin": settings.HTTP_CACHE_TTL_KIN,
+        }.get(source, settings.HTTP_CACHE_TTL_SEARCH)
+
+    def load(self, url: str) -> Optional[CachedResponse]:
+        """저장된 응답 (없거나 손상되었으면 None, 동기 - asyncio.to_thread로 실행)"""
+        data = self.get(self.make_key(url))
+        if data is None:
+            return None
+        try:
+            return CachedResponse.loads(data)
+        except (OSError, ValueError, EOFError):
+            self._http_stats["corrupted"] += 1
+            return None
+
+    def store(self, url: str, response: httpx.Response):
+        """200 응답 저장 (동기)"""
+        headers = {name: response.headers[name] for name in STORED_HEADERS if name in response.headers}
+        entry = CachedResponse(
+            {
+                "url": str(response.url),
+                "status_code": response.status_code,
+                "headers": headers,
+                "encoding": response.encoding,
+                "validated_at": time.time(),
+            },
+            response.content,
+        )
+        self.put(self.make_key(url), entry.dumps())
+
+    def refresh(self, url: str, entry: CachedResponse):
+        """304 응답 후 재검증 시각 갱신 (동기)"""
+        entry.meta["validated_at"] = time.time()
+        self.put(self.make_key(url), entry.dumps())
+
+    def record(self, event: str):
+        self._http_stats[event] += 1
+
+    def get_stats(self) -> Dict:
+        """디스크 사용량 + 적중 유형별 횟수"""
+        return {
+            **super().get_stats(),
+            **self._http_stats,
+            "mode": settings.HTTP_CACHE_MODE,
+            "ttl_seconds": {source: self.ttl(source) for source in ("search", "post", "kin")},
+        }
+
+
+# Singleton instance
+http_response_cache = HTTPResponseCache(
+    cache_dir=settings.HTTP_CACHE_DIR or os.path.join(tempfile.gettempdir(), "doctorvoice-http-cache"),
+    max_bytes=settings.HTTP_CACHE_MAX_MB * 1024 * 1024,
+)
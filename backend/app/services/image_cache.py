@@ -0,0 +1,40 @@
+"""
+Image Transcode Cache - 내용 해시 기반 이미지 변환 결과 디스크 캐시
+(원본 바이트 SHA-256, 최대 너비, 품질, 용량 목표) 해시를 키로
+같은 이미지를 내보낼 때마다 디코딩/리사이징/JPEG 인코딩을 반복하지 않도록 합니다.
+
+- 저장: IMAGE_CACHE_DIR/<키>.jpg (비우면 시스템 임시 폴더)
+- 용량: IMAGE_CACHE_MAX_MB를 넘으면 가장 오래 사용하지 않은 파일부터 삭제 (LRU)
+- 여러 작업 스레드에서 동시에 사용 가능
+"""
+
+import hashlib
+import os
+import tempfile
+
+from app.core.config import settings
+from app.services.disk_cache import DiskLRUCache
+
+
+class ImageTranscodeCache(DiskLRUCache):
+    """이미지 변환 결과 캐시"""
+
+    SUFFIX = ".jpg"
+
+    @property
+    def enabled(self) -> bool:
+        return settings.IMAGE_CACHE_ENABLED
+
+    @staticmethod
+    def make_key(source: bytes, max_width: int, quality: int, max_bytes: int) -> str:
+        """원본 내용 + 변환 파라미터 해시"""
+        digest = hashlib.sha256(source).hexdigest()
+        params = f"{digest}:{max_width}:{quality}:{max_bytes}"
+        return hashlib.sha256(params.encode("ascii")).hexdigest()
+
+
+# Singleton instance
+image_transcode_cache = ImageTranscodeCache(
+    cache_dir=settings.IMAGE_CACHE_DIR or os.path.join(tempfile.gettempdir(), "doctorvoice-image-cache"),
+    max_bytes=settings.IMAGE_CACHE_MAX_MB * 1024 * 1024,
+)
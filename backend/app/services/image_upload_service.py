@@ -0,0 +1,198 @@
+"""
+Image Upload Service - imgBB 이미지 업로드
+업로드 API가 공유하는 커넥션 풀과 동시 업로드 제한을 관리합니다.
+
+- 파일은 base64로 변환하지 않고 multipart로 청크 단위 전송 (메모리에 전체를 올리지 않음)
+- 크기 제한은 읽기 전에 확인
+- 선택적으로 업로드 전 서버에서 축소 (max_width)
+- 프로세스 전체 동시 업로드 수 제한 (IMAGE_UPLOAD_CONCURRENCY)
+"""
+
+import asyncio
+import base64
+import binascii
+import logging
+import os
+import tempfile
+from typing import BinaryIO, Dict, Optional
+
+import httpx
+from PIL import Image
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+IMGBB_UPLOAD_URL = "https://api.imgbb.com/1/upload"
+# 축소 결과가 이 크기를 넘으면 디스크 임시 파일로
+SPOOL_MAX_BYTES = 4 * 1024 * 1024
+RESIZABLE_FORMATS = ("JPEG", "PNG", "WEBP")
+
+
+class ImageUploadError(Exception):
+    """imgBB 업로드 실패"""
+
+
+class ImageTooLargeError(ImageUploadError):
+    """업로드 크기 제한 초과"""
+
+
+class InvalidImageError(ImageUploadError):
+    """이미지로 읽을 수 없는 파일 또는 잘못된 base64"""
+
+
+def _file_size(file: BinaryIO) -> int:
+    """현재 위치를 바꾸지 않고 파일 크기 확인"""
+    position = file.tell()
+    size = file.seek(0, os.SEEK_END)
+    file.seek(position)
+    return size
+
+
+def _downscale(file: BinaryIO, max_width: int) -> BinaryIO:
+    """
+    너비가 max_width를 넘으면 비율을 유지해 축소 (형식 유지, 동기 - asyncio.to_thread로 실행)
+
+    애니메이션 GIF 등 축소하면 손실되는 이미지는 원본을 그대로 반환합니다.
+    이미지가 아니거나 손상된 파일은 InvalidImageError를 발생시킵니다.
+    """
+    file.seek(0)
+    try:
+        img = Image.open(file)
+        if img.width <= max_width or img.format not in RESIZABLE_FORMATS or getattr(img, "is_animated", False):
+            file.seek(0)
+            return file
+
+        image_format = img.format
+        target = (max_width, max(1, round(img.height * max_width / img.width)))
+        if image_format == "JPEG":
+            # DCT 단계에서 1/2~1/8 축소 디코딩
+            img.draft(img.mode, target)
+        resized = img.resize(target, Image.Resampling.LANCZOS, reducing_gap=3.0)
+    except (Image.UnidentifiedImageError, Image.DecompressionBombError) as e:
+        raise InvalidImageError("이미지 파일을 읽을 수 없습니다") from e
+    except (OSError, ValueError, SyntaxError) as e:
+        # 헤더는 정상이지만 데이터가 잘린/손상된 경우 (PIL은 일부 형식 오류를 SyntaxError로 알림)
+        raise InvalidImageError(f"손상된 이미지 파일입니다: {e}") from e
+
+    output = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    save_kwargs = {"quality": 90} if image_format in ("JPEG", "WEBP") else {"optimize": True}
+    resized.save(output, format=image_format, **save_kwargs)
+    output.seek(0)
+    return output
+
+
+class ImgBBUploader:
+    """프로세스 전역 imgBB 업로드 클라이언트"""
+
+    def __init__(self, api_key: str, max_bytes: int, concurrency: int = 4, timeout: float = 60.0):
+        self.api_key = api_key
+        self.max_bytes = max_bytes
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.api_key)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """공유 httpx 클라이언트 (없으면 생성)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.concurrency,
+                    max_keepalive_connections=self.concurrency,
+                    keepalive_expiry=60.0,
+                ),
+                timeout=self.timeout,
+            )
+        return self._client
+
+    async def aclose(self):
+        """애플리케이션 종료 시 커넥션 정리"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+    def check_size(self, size: int):
+        if size > self.max_bytes:
+            raise ImageTooLargeError(
+                f"이미지 크기가 제한({self.max_bytes // (1024 * 1024)}MB)을 초과했습니다"
+            )
+
+    async def upload_file(self, file: BinaryIO, name: str, max_width: Optional[int] = None) -> Dict:
+        """
+        파일 객체 업로드 (UploadFile.file 등)
+
+        Returns:
+            imgBB 응답의 data ({"url", "delete_url", "thumb", ...})
+        """
+        self.check_size(_file_size(file))
+
+        upload = file
+        if max_width:
+            upload = await asyncio.to_thread(_downscale, file, max_width)
+        upload.seek(0)
+
+        try:
+            return await self._post(files={"image": (name, upload)}, name=name)
+        finally:
+            # 축소본 임시 파일만 닫음 (원본은 호출자 소유)
+            if upload is not file:
+                upload.close()
+
+    async def upload_base64(self, image: str, name: str, max_width: Optional[int] = None) -> Dict:
+        """
+        base64 문자열 업로드 (data:image/xxx;base64, 접두사 허용)
+
+        축소가 필요하면 디코딩해 파일로 업로드하고, 아니면 문자열을 그대로 전달합니다.
+        """
+        # data:image/xxx;base64, 접두사 제거
+        image_data = image.split(",", 1)[1] if "," in image else image
+        # 디코딩 전에 크기 확인 (base64는 원본의 4/3)
+        self.check_size(len(image_data) * 3 // 4)
+
+        if max_width:
+            decoded = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+            try:
+                try:
+                    await asyncio.to_thread(lambda: decoded.write(base64.b64decode(image_data)))
+                except binascii.Error as e:
+                    raise InvalidImageError(f"잘못된 base64 데이터입니다: {e}") from e
+                return await self.upload_file(decoded, name, max_width)
+            finally:
+                decoded.close()
+
+        return await self._post(data={"image": image_data}, name=name)
+
+    async def _post(self, name: str, data: Optional[Dict] = None, files: Optional[Dict] = None) -> Dict:
+        if not self.configured:
+            raise ImageUploadError("imgBB API 키가 설정되지 않았습니다")
+
+        form = {"key": self.api_key, "name": name, **(data or {})}
+        async with self._semaphore:
+            try:
+                response = await self.client.post(IMGBB_UPLOAD_URL, data=form, files=files)
+            except httpx.HTTPError as e:
+                raise ImageUploadError(f"imgBB 업로드 실패: {e}") from e
+
+        if response.status_code != 200:
+            raise ImageUploadError(f"imgBB 업로드 실패: {response.text}")
+
+        result = response.json()
+        if not result.get("success"):
+            raise ImageUploadError(
+                f"imgBB 업로드 실패: {result.get('error', {}).get('message', 'Unknown error')}"
+            )
+        return result["data"]
+
+
+# Singleton instance
+image_uploader = ImgBBUploader(
+    api_key=settings.IMGBB_API_KEY,
+    max_bytes=settings.IMAGE_UPLOAD_MAX_MB * 1024 * 1024,
+    concurrency=settings.IMAGE_UPLOAD_CONCURRENCY,
+)
@@ -5,14 +5,21 @@
 
 import re
 import json
-import httpx
+import asyncio
 from bs4 import BeautifulSoup
-from datetime import datetime
-from typing import List, Dict, Set, Optional
+from datetime import datetime, timedelta
+from typing import List, Dict, Set, Optional, Tuple, Callable, Awaitable
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy import select
 
-from app.models.analysis_job import CollectedKeyword
+from app.core.config import settings
+from app.models.analysis_job import CollectedKeyword, KeywordExpansion
+from app.services.crawler_http import crawler_http, naver_rate_budget
+
+# 네이버 요청 직전에 URL을 받아 차례를 기다리는 훅
+Throttle = Callable[[str], Awaitable[None]]
 
 
 # 카테고리별 시드 키워드
@@ -94,7 +101,7 @@ HEADERS = {
 }
 
 
-async def get_naver_related_keywords(keyword: str) -> List[str]:
+async def get_naver_related_keywords(keyword: str, throttle: Optional[Throttle] = None) -> List[str]:
     """
     네이버 연관검색어 수집
     """
@@ -102,8 +109,8 @@ async def get_naver_related_keywords(keyword: str) -> List[str]:
     search_url = f"https://search.naver.com/search.naver?where=nexearch&query={keyword}"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-            response = await client.get(search_url, headers=HEADERS)
+        async with crawler_http.session(timeout=10.0) as client:
+            response = await client.get(search_url, headers=HEADERS, cache="search", throttle=throttle)
 
             if response.status_code == 200:
                 soup = BeautifulSoup(response.text, 'html.parser')
@@ -128,7 +135,7 @@ async def get_naver_related_keywords(keyword: str) -> List[str]:
     return related[:10]  # 최대 10개
 
 
-async def get_naver_autocomplete(keyword: str) -> List[str]:
+async def get_naver_autocomplete(keyword: str, throttle: Optional[Throttle] = None) -> List[str]:
     """
     네이버 자동완성 키워드 수집
     """
@@ -136,8 +143,8 @@ async def get_naver_autocomplete(keyword: str) -> List[str]:
     autocomplete_url = f"https://ac.search.naver.com/nx/ac?q={keyword}&con=1&frm=nv&ans=2&r_format=json&r_enc=UTF-8&r_unicode=0&t_koreng=1&run=2&rev=4&q_enc=UTF-8"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(autocomplete_url, headers=HEADERS)
+        async with crawler_http.session(timeout=10.0, follow_redirects=False) as client:
+            response = await client.get(autocomplete_url, headers=HEADERS, throttle=throttle)
 
             if response.status_code == 200:
                 data = response.json()
@@ -155,16 +162,37 @@ async def get_naver_autocomplete(keyword: str) -> List[str]:
     return suggestions[:10]
 
 
+def normalize_keyword(keyword: str) -> str:
+    """중복 판별용 키워드 정규화 (공백 정리 + 대소문자 통일)"""
+    return " ".join(keyword.split()).casefold()
+
+
+async def expand_keyword(keyword: str, throttle: Optional[Throttle] = None) -> Tuple[List[str], List[str]]:
+    """키워드 하나의 연관검색어와 자동완성을 동시에 수집"""
+    related, autocomplete = await asyncio.gather(
+        get_naver_related_keywords(keyword, throttle),
+        get_naver_autocomplete(keyword, throttle)
+    )
+    return related, autocomplete
+
+
 async def collect_keywords_for_category(
     category: str,
-    max_keywords: int = 100
+    max_keywords: int = 100,
+    db: Optional[AsyncSession] = None
 ) -> Dict:
     """
-    카테고리별 키워드 대량 수집
+    카테고리별 키워드 대량 수집 (시드에서 시작하는 단계별 너비 우선 확장)
+
+    - 단계마다 KEYWORD_EXPANSION_WORKERS개 워커가 키워드를 나눠 확장 (요청 속도는 naver_rate_budget)
+    - 공백/대소문자만 다른 키워드는 하나로 취급
+    - 키워드별 확장 결과는 DB(KeywordExpansion)에 저장해 KEYWORD_EXPANSION_TTL_HOURS 동안 다른 작업과 공유
+    - max_keywords에 도달하면 남은 확장을 중단
 
     Args:
         category: 카테고리 ID
         max_keywords: 최대 수집 키워드 수
+        db: 확장 결과 조회/저장에 쓸 세션 (없으면 새로 열기)
 
     Returns:
         {
@@ -176,46 +204,135 @@ async def collect_keywords_for_category(
     if category not in CATEGORY_SEEDS:
         return {"category": category, "keywords": [], "count": 0, "error": "Invalid category"}
 
-    seeds = CATEGORY_SEEDS[category]["seeds"]
-    collected: Set[str] = set(seeds)  # 시드 키워드로 시작
+    # 정규화 키워드 -> 처음 발견한 표기 (삽입 순서 = 발견 순서)
+    collected: Dict[str, str] = {}
+
+    def add(keyword: str) -> Optional[str]:
+        """새 키워드면 추가하고 표기를 반환"""
+        norm = normalize_keyword(keyword)
+        if not norm or norm in collected or len(collected) >= max_keywords:
+            return None
+        collected[norm] = " ".join(keyword.split())
+        return collected[norm]
+
+    frontier = [kw for kw in map(add, CATEGORY_SEEDS[category]["seeds"]) if kw]
+    stats = {"expanded": 0, "reused": 0}
+    depth = 0
+
+    while frontier and depth < settings.KEYWORD_EXPANSION_MAX_DEPTH and len(collected) < max_keywords:
+        known = await _run_db(db, lambda s: load_keyword_expansions(s, frontier))
+        queue: asyncio.Queue = asyncio.Queue()
+        for keyword in frontier:
+            queue.put_nowait(keyword)
+
+        next_frontier: List[str] = []
+        fetched: Dict[str, Tuple[List[str], List[str]]] = {}
+
+        async def worker():
+            while len(collected) < max_keywords:
+                try:
+                    keyword = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                norm = normalize_keyword(keyword)
+                if norm in known:
+                    related, autocomplete = known[norm]
+                    stats["reused"] += 1
+                else:
+                    related, autocomplete = await expand_keyword(keyword, naver_rate_budget.acquire)
+                    fetched[norm] = (related, autocomplete)
+                    stats["expanded"] += 1
+
+                for kw in related + autocomplete:
+                    added = add(kw)
+                    if added:
+                        next_frontier.append(added)
+
+        workers = max(1, min(settings.KEYWORD_EXPANSION_WORKERS, len(frontier)))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+
+        if fetched:
+            await _run_db(db, lambda s: save_keyword_expansions(s, fetched))
+
+        frontier = next_frontier
+        depth += 1
+
+    keywords_list = list(collected.values())
+    print(
+        f"[키워드 수집] {category}: {len(keywords_list)}개 "
+        f"(확장 요청 {stats['expanded']}회, 저장된 확장 재사용 {stats['reused']}회)"
+    )
 
-    # 1단계: 시드 키워드에서 연관검색어 수집
-    for seed in seeds:
-        if len(collected) >= max_keywords:
-            break
+    return {
+        "category": category,
+        "category_name": CATEGORY_SEEDS[category]["name"],
+        "keywords": keywords_list,
+        "count": len(keywords_list)
+    }
 
-        related = await get_naver_related_keywords(seed)
-        for kw in related:
-            if len(collected) < max_keywords:
-                collected.add(kw)
 
-        autocomplete = await get_naver_autocomplete(seed)
-        for kw in autocomplete:
-            if len(collected) < max_keywords:
-                collected.add(kw)
+async def _run_db(db: Optional[AsyncSession], fn):
+    """동기 DB 헬퍼를 주어진 세션(없으면 새 세션)에서 실행"""
+    if db is not None:
+        return await db.run_sync(fn)
 
-    # 2단계: 수집된 키워드에서 추가 확장 (아직 목표에 미달인 경우)
-    if len(collected) < max_keywords:
-        expansion_candidates = list(collected - set(seeds))[:20]  # 상위 20개만
+    from app.db.database import AsyncSessionLocal
+    async with AsyncSessionLocal() as session:
+        return await session.run_sync(fn)
 
-        for candidate in expansion_candidates:
-            if len(collected) >= max_keywords:
-                break
 
-            related = await get_naver_related_keywords(candidate)
-            for kw in related:
-                if len(collected) < max_keywords:
-                    collected.add(kw)
+def load_keyword_expansions(db: Session, keywords: List[str]) -> Dict[str, Tuple[List[str], List[str]]]:
+    """
+    저장된 확장 결과 중 유효 기간 내인 것 조회
 
-    keywords_list = list(collected)[:max_keywords]
+    Returns:
+        정규화 키워드 -> (연관검색어, 자동완성)
+    """
+    norms = list({normalize_keyword(kw) for kw in keywords})
+    if not norms:
+        return {}
 
-    return {
-        "category": category,
-        "category_name": CATEGORY_SEEDS[category]["name"],
-        "keywords": keywords_list,
-        "count": len(keywords_list)
+    cutoff = datetime.utcnow() - timedelta(hours=settings.KEYWORD_EXPANSION_TTL_HOURS)
+    rows = db.query(KeywordExpansion).filter(
+        KeywordExpansion.keyword.in_(norms),
+        KeywordExpansion.fetched_at >= cutoff
+    ).all()
+
+    return {row.keyword: (row.related or [], row.autocomplete or []) for row in rows}
+
+
+def save_keyword_expansions(db: Session, expansions: Dict[str, Tuple[List[str], List[str]]]):
+    """
+    확장 결과 저장 (정규화 키워드 기준, 기존 행은 갱신)
+
+    둘 다 비어 있는 결과는 요청 실패일 수 있어 저장하지 않습니다.
+    """
+    expansions = {kw: value for kw, value in expansions.items() if value[0] or value[1]}
+    if not expansions:
+        return
+
+    now = datetime.utcnow()
+    existing = {
+        row.keyword: row
+        for row in db.query(KeywordExpansion).filter(KeywordExpansion.keyword.in_(list(expansions))).all()
     }
 
+    for keyword, (related, autocomplete) in expansions.items():
+        row = existing.get(keyword)
+        if row is None:
+            row = KeywordExpansion(keyword=keyword)
+            db.add(row)
+        row.related = related
+        row.autocomplete = autocomplete
+        row.fetched_at = now
+
+    try:
+        db.commit()
+    except IntegrityError:
+        # 다른 작업이 같은 키워드를 먼저 저장한 경우 - 다음 조회 때 그 결과를 사용
+        db.rollback()
+
 
 def save_keywords_to_db(
     db: Session,
@@ -302,6 +419,29 @@ def mark_keyword_analyzed(
         db.commit()
 
 
+def mark_keywords_analyzed(db: Session, category: str, analyzed_counts: Dict[str, int]):
+    """
+    여러 키워드를 한 번에 분석 완료로 표시 (대량 분석용)
+
+    Args:
+        analyzed_counts: 키워드 -> 분석된 글 수
+    """
+    if not analyzed_counts:
+        return
+
+    now = datetime.utcnow()
+    rows = db.query(CollectedKeyword).filter(
+        CollectedKeyword.category == category,
+        CollectedKeyword.keyword.in_(list(analyzed_counts))
+    ).all()
+
+    for row in rows:
+        row.is_analyzed = 1
+        row.analysis_count = (row.analysis_count or 0) + analyzed_counts[row.keyword]
+        row.last_analyzed_at = now
+    db.commit()
+
+
 def get_category_keyword_stats(db: Session, category: str) -> Dict:
     """
     카테고리별 키워드 통계 조회
@@ -11,9 +11,11 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 from urllib.parse import urlencode, urlparse, parse_qs
 
-import httpx
 from bs4 import BeautifulSoup
 
+from app.services.crawler_http import crawler_http
+from app.services.html_parser import make_soup
+
 logger = logging.getLogger(__name__)
 
 
@@ -82,7 +84,7 @@ class KinCrawlerService:
         per_page = 10  # 네이버 지식인 기본 페이지당 개수
 
         try:
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+            async with crawler_http.session(timeout=30.0) as client:
                 while len(questions) < limit:
                     # 검색 파라미터 구성
                     params = {
@@ -113,7 +115,7 @@ class KinCrawlerService:
                         break
 
                     # HTML 파싱
-                    soup = BeautifulSoup(response.text, "html.parser")
+                    soup = make_soup(response.text)
                     items = self._parse_search_results(soup)
 
                     if not items:
@@ -303,14 +305,14 @@ class KinCrawlerService:
             url = f"https://m.kin.naver.com/mobile/qna/detail.naver?docId={question_id}"
 
         try:
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                response = await client.get(url, headers=self._get_headers())
+            async with crawler_http.session(timeout=30.0) as client:
+                response = await client.get(url, headers=self._get_headers(), cache="kin")
 
                 if response.status_code != 200:
                     logger.warning(f"상세 조회 실패: HTTP {response.status_code}")
                     return None
 
-                soup = BeautifulSoup(response.text, "html.parser")
+                soup = make_soup(response.text)
                 return self._parse_detail_page(soup, question_id)
 
         except Exception as e:
@@ -5,7 +5,8 @@
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.blog_outreach import (
     NaverBlog, BlogContact, LeadGrade, BlogCategory,
@@ -78,14 +79,15 @@ class LeadScoringService:
         BlogCategory.OTHER: 30          # 기타
     }
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def _get_user_weights(self, user_id: str) -> Dict[str, float]:
+    async def _get_user_weights(self, user_id: str) -> Dict[str, float]:
         """사용자 설정 가중치 가져오기"""
-        settings = self.db.query(OutreachSetting).filter(
-            OutreachSetting.user_id == user_id
-        ).first()
+        result = await self.db.execute(
+            select(OutreachSetting).where(OutreachSetting.user_id == user_id)
+        )
+        settings = result.scalars().first()
 
         if settings:
             return {
@@ -175,14 +177,11 @@ class LeadScoringService:
     def calculate_lead_score(
         self,
         blog: NaverBlog,
-        user_id: str,
+        weights: Dict[str, float],
         target_categories: Optional[List[BlogCategory]] = None,
         target_keywords: Optional[List[str]] = None
     ) -> Dict[str, Any]:
-        """리드 점수 종합 계산"""
-        # 가중치 가져오기
-        weights = self._get_user_weights(user_id)
-
+        """리드 점수 종합 계산 (weights: _get_user_weights 결과)"""
         # 개별 점수 계산
         influence_score = self._calculate_influence_score(blog)
         activity_score = self._calculate_activity_score(blog)
@@ -222,17 +221,21 @@ class LeadScoringService:
     ) -> Dict[str, Any]:
         """블로그 스코어링 및 저장"""
         try:
-            blog = self.db.query(NaverBlog).filter(
-                NaverBlog.id == blog_id,
-                NaverBlog.user_id == user_id
-            ).first()
+            result = await self.db.execute(
+                select(NaverBlog).where(
+                    NaverBlog.id == blog_id,
+                    NaverBlog.user_id == user_id
+                )
+            )
+            blog = result.scalars().first()
 
             if not blog:
                 return {"success": False, "error": "블로그를 찾을 수 없습니다"}
 
             # 점수 계산
+            weights = await self._get_user_weights(user_id)
             scores = self.calculate_lead_score(
-                blog, user_id, target_categories, target_keywords
+                blog, weights, target_categories, target_keywords
             )
 
             # DB 업데이트
@@ -243,7 +246,7 @@ class LeadScoringService:
             blog.relevance_score = scores["relevance_score"]
             blog.updated_at = datetime.utcnow()
 
-            self.db.commit()
+            await self.db.commit()
 
             return {
                 "success": True,
@@ -253,7 +256,7 @@ class LeadScoringService:
 
         except Exception as e:
             logger.error(f"블로그 스코어링 오류: {e}")
-            self.db.rollback()
+            await self.db.rollback()
             return {"success": False, "error": str(e)}
 
     async def score_blogs_batch(
@@ -266,10 +269,14 @@ class LeadScoringService:
         """배치 스코어링"""
         try:
             # 스코어링 필요한 블로그 조회
-            blogs = self.db.query(NaverBlog).filter(
-                NaverBlog.user_id == user_id,
-                NaverBlog.lead_score == 0  # 아직 스코어링 안된 블로그
-            ).limit(limit).all()
+            result = await self.db.execute(
+                select(NaverBlog).where(
+                    NaverBlog.user_id == user_id,
+                    NaverBlog.lead_score == 0  # 아직 스코어링 안된 블로그
+                ).limit(limit)
+            )
+            blogs = result.scalars().all()
+            weights = await self._get_user_weights(user_id)
 
             results = {
                 "total": len(blogs),
@@ -281,7 +288,7 @@ class LeadScoringService:
             for blog in blogs:
                 try:
                     scores = self.calculate_lead_score(
-                        blog, user_id, target_categories, target_keywords
+                        blog, weights, target_categories, target_keywords
                     )
 
                     blog.lead_score = scores["lead_score"]
@@ -300,7 +307,7 @@ class LeadScoringService:
                         "error": str(e)
                     })
 
-            self.db.commit()
+            await self.db.commit()
 
             return {
                 "success": True,
@@ -309,7 +316,7 @@ class LeadScoringService:
 
         except Exception as e:
             logger.error(f"배치 스코어링 오류: {e}")
-            self.db.rollback()
+            await self.db.rollback()
             return {"success": False, "error": str(e)}
 
     async def rescore_all(
@@ -320,9 +327,11 @@ class LeadScoringService:
     ) -> Dict[str, Any]:
         """전체 재스코어링"""
         try:
-            blogs = self.db.query(NaverBlog).filter(
-                NaverBlog.user_id == user_id
-            ).all()
+            result = await self.db.execute(
+                select(NaverBlog).where(NaverBlog.user_id == user_id)
+            )
+            blogs = result.scalars().all()
+            weights = await self._get_user_weights(user_id)
 
             results = {
                 "total": len(blogs),
@@ -332,7 +341,7 @@ class LeadScoringService:
 
             for blog in blogs:
                 scores = self.calculate_lead_score(
-                    blog, user_id, target_categories, target_keywords
+                    blog, weights, target_categories, target_keywords
                 )
 
                 blog.lead_score = scores["lead_score"]
@@ -345,7 +354,7 @@ class LeadScoringService:
                 results["scored"] += 1
                 results["grades"][scores["lead_grade"].value] += 1
 
-            self.db.commit()
+            await self.db.commit()
 
             return {
                 "success": True,
@@ -354,7 +363,7 @@ class LeadScoringService:
 
         except Exception as e:
             logger.error(f"재스코어링 오류: {e}")
-            self.db.rollback()
+            await self.db.rollback()
             return {"success": False, "error": str(e)}
 
     async def get_top_leads(
@@ -366,30 +375,37 @@ class LeadScoringService:
         limit: int = 50
     ) -> List[Dict[str, Any]]:
         """상위 리드 조회"""
-        query = self.db.query(NaverBlog).filter(
+        query = select(NaverBlog).where(
             NaverBlog.user_id == user_id,
             NaverBlog.status.notin_([BlogStatus.INVALID, BlogStatus.NOT_INTERESTED])
         )
 
         if grade:
-            query = query.filter(NaverBlog.lead_grade == grade)
+            query = query.where(NaverBlog.lead_grade == grade)
 
         if category:
-            query = query.filter(NaverBlog.category == category)
+            query = query.where(NaverBlog.category == category)
 
         if has_contact is not None:
-            query = query.filter(NaverBlog.has_contact == has_contact)
+            query = query.where(NaverBlog.has_contact == has_contact)
 
-        blogs = query.order_by(
-            NaverBlog.lead_score.desc()
-        ).limit(limit).all()
+        result = await self.db.execute(
+            query.order_by(NaverBlog.lead_score.desc()).limit(limit)
+        )
+        blogs = result.scalars().all()
+
+        # 연락처 정보 한 번에 조회
+        contacts_by_blog: Dict[str, List[BlogContact]] = {}
+        if blogs:
+            contact_result = await self.db.execute(
+                select(BlogContact).where(BlogContact.blog_id.in_([blog.id for blog in blogs]))
+            )
+            for contact in contact_result.scalars():
+                contacts_by_blog.setdefault(contact.blog_id, []).append(contact)
 
         results = []
         for blog in blogs:
-            # 연락처 정보 조회
-            contacts = self.db.query(BlogContact).filter(
-                BlogContact.blog_id == blog.id
-            ).all()
+            contacts = contacts_by_blog.get(blog.id, [])
 
             results.append({
                 "id": blog.id,
@@ -422,9 +438,10 @@ class LeadScoringService:
 
     async def get_scoring_stats(self, user_id: str) -> Dict[str, Any]:
         """스코어링 통계"""
-        blogs = self.db.query(NaverBlog).filter(
-            NaverBlog.user_id == user_id
-        ).all()
+        result = await self.db.execute(
+            select(NaverBlog).where(NaverBlog.user_id == user_id)
+        )
+        blogs = result.scalars().all()
 
         stats = {
             "total_blogs": len(blogs),
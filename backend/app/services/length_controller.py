@@ -0,0 +1,137 @@
+"""
+Length Controller - AI 각색 글자수 수렴 제어
+provider/model별로 "요청 글자수 대비 실제 생성 글자수" 비율을 학습하여
+첫 시도부터 목표 글자수에 맞는 보정 배수를 고르고, 적중률/시도 횟수 지표를 집계합니다.
+"""
+
+import logging
+from typing import Dict, List, Tuple
+
+from sqlalchemy import select
+
+logger = logging.getLogger(__name__)
+
+
+class LengthController:
+    """provider/model별 글자수 보정 배수 학습기"""
+
+    # 학습 데이터가 없을 때의 기본 보정 배수 (기존 1차 시도 값)
+    DEFAULT_MULTIPLIER = 2.0
+    MIN_MULTIPLIER = 1.0
+    MAX_MULTIPLIER = 3.5
+    # 최근 관측값 가중치 (지수 이동 평균)
+    EWMA_ALPHA = 0.3
+    # 초기 학습에 사용할 AIUsage 기록 수
+    HISTORY_LIMIT = 50
+
+    def __init__(self):
+        # (provider, model) -> 실제 글자수 / 요청 글자수
+        self._ratios: Dict[Tuple[str, str], float] = {}
+        self._loaded: set = set()
+        self._stats: Dict[Tuple[str, str], Dict[str, int]] = {}
+
+    async def get_multiplier(self, provider: str, model: str) -> float:
+        """목표 글자수에 곱해 프롬프트에 넣을 보정 배수"""
+        key = (provider, model)
+        if key not in self._loaded:
+            await self._load_history(provider, model)
+
+        ratio = self._ratios.get(key)
+        if not ratio:
+            return self.DEFAULT_MULTIPLIER
+        return self._clamp(1.0 / ratio)
+
+    def observe(self, provider: str, model: str, requested_length: int, actual_length: int):
+        """생성 1회의 (요청 글자수, 실제 글자수) 관측값 반영"""
+        if requested_length <= 0 or actual_length <= 0:
+            return
+        key = (provider, model)
+        ratio = actual_length / requested_length
+        previous = self._ratios.get(key)
+        self._ratios[key] = ratio if previous is None else (
+            self.EWMA_ALPHA * ratio + (1 - self.EWMA_ALPHA) * previous
+        )
+
+    def correct(self, multiplier: float, target_length: int, actual_length: int) -> float:
+        """직전 시도 결과로 다음 시도 배수를 바로 보정 (같은 요청 내 재시도용)"""
+        if actual_length <= 0:
+            return self._clamp(multiplier * 1.25)
+        return self._clamp(multiplier * target_length / actual_length)
+
+    def record_result(self, provider: str, model: str, attempts: int, adjustments: int, hit: bool):
+        """요청 1건의 최종 결과 집계"""
+        stats = self._stats.setdefault((provider, model), {
+            "requests": 0,
+            "hits": 0,
+            "first_attempt_hits": 0,
+            "attempts": 0,
+            "adjustments": 0,
+        })
+        stats["requests"] += 1
+        stats["attempts"] += attempts
+        stats["adjustments"] += adjustments
+        if hit:
+            stats["hits"] += 1
+            if attempts == 1 and adjustments == 0:
+                stats["first_attempt_hits"] += 1
+
+    def get_metrics(self) -> List[Dict]:
+        """모델별 적중률 및 평균 시도 횟수"""
+        metrics = []
+        for (provider, model), stats in self._stats.items():
+            requests = stats["requests"] or 1
+            ratio = self._ratios.get((provider, model))
+            metrics.append({
+                "ai_provider": provider,
+                "ai_model": model,
+                "requests": stats["requests"],
+                "hit_rate": round(stats["hits"] / requests, 3),
+                "first_attempt_hit_rate": round(stats["first_attempt_hits"] / requests, 3),
+                "avg_attempts": round(stats["attempts"] / requests, 2),
+                "avg_adjustments": round(stats["adjustments"] / requests, 2),
+                "length_ratio": round(ratio, 3) if ratio else None,
+                "multiplier": round(self._clamp(1.0 / ratio), 2) if ratio else self.DEFAULT_MULTIPLIER,
+            })
+        metrics.sort(key=lambda m: m["requests"], reverse=True)
+        return metrics
+
+    async def _load_history(self, provider: str, model: str):
+        """AIUsage 기록에서 초기 비율 학습 (오래된 것부터 반영)"""
+        key = (provider, model)
+        self._loaded.add(key)
+        try:
+            from app.db.database import AsyncSessionLocal
+            from app.models import AIUsage
+
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(
+                    select(
+                        AIUsage.target_length,
+                        AIUsage.length_multiplier,
+                        AIUsage.raw_content_length,
+                    )
+                    .where(
+                        AIUsage.ai_provider == provider,
+                        AIUsage.ai_model == model,
+                        AIUsage.request_type == "content_generation",
+                        AIUsage.target_length.isnot(None),
+                        AIUsage.length_multiplier.isnot(None),
+                        AIUsage.raw_content_length > 0,
+                    )
+                    .order_by(AIUsage.created_at.desc())
+                    .limit(self.HISTORY_LIMIT)
+                )
+                rows = result.all()
+        except Exception as e:
+            logger.warning(f"글자수 학습 기록 조회 실패 ({provider}/{model}): {e}")
+            return
+
+        for target_length, multiplier, raw_length in reversed(rows):
+            self.observe(provider, model, int(target_length * multiplier), raw_length)
+
+    def _clamp(self, multiplier: float) -> float:
+        return max(self.MIN_MULTIPLIER, min(multiplier, self.MAX_MULTIPLIER))
+
+
+# Singleton instance
+length_controller = LengthController()
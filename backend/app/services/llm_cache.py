@@ -0,0 +1,180 @@
+"""
+LLM Response Cache - 내용 주소 기반 AI 응답 캐시
+(provider, model, 시스템 프롬프트, 사용자 프롬프트, temperature 등) 해시를 키로
+같은 입력의 completion을 다시 호출하지 않도록 합니다.
+호출자가 use_cache=True로 지정한 요청(키워드 추출, 채점 등 결과가 정해진 호출)만 캐시합니다.
+
+- 1차: 프로세스 내 LRU (TTL 적용)
+- 2차(선택): 기존 CacheService(Redis) — LLM_CACHE_REDIS=True이고 Redis가 연결된 경우
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCache:
+    """LRU + TTL 기반 LLM 응답 캐시"""
+
+    KEY_PREFIX = "llm:"
+
+    def __init__(self, max_entries: int = 512, ttl: int = 86400):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # key -> (만료 시각, 응답)
+        self._entries: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        # 동일 요청이 동시에 들어오면 첫 호출 결과를 함께 사용
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._stats = {
+            "memory_hits": 0,
+            "persistent_hits": 0,
+            "shared_in_flight": 0,
+            "misses": 0,
+            "bypassed": 0,
+            "evictions": 0,
+        }
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        system_prompt: Optional[str],
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool = False,
+    ) -> str:
+        """요청 내용의 SHA-256 해시"""
+        payload = json.dumps(
+            [provider, model, system_prompt or "", prompt, round(temperature, 3), max_tokens, json_mode],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get_or_call(
+        self,
+        key: str,
+        call: Callable[[], Awaitable[Dict]],
+        use_cache: bool = False,
+    ) -> Dict:
+        """
+        캐시에 있으면 저장된 응답을, 없으면 call() 결과를 저장 후 반환
+
+        캐시에서 나온 응답은 실제 토큰을 쓰지 않았으므로 토큰 수를 0으로, cached=True로 표시합니다.
+        """
+        if not use_cache or not settings.LLM_CACHE_ENABLED:
+            self._stats["bypassed"] += 1
+            return await call()
+
+        cached = self._get_local(key)
+        if cached is not None:
+            self._stats["memory_hits"] += 1
+            return self._as_hit(cached)
+
+        cached = await self._get_persistent(key)
+        if cached is not None:
+            self._stats["persistent_hits"] += 1
+            self._set_local(key, cached)
+            return self._as_hit(cached)
+
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            self._stats["shared_in_flight"] += 1
+            return self._as_hit(await asyncio.shield(pending))
+
+        self._stats["misses"] += 1
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            response = await call()
+        except BaseException as e:
+            future.set_exception(e)
+            # 대기자가 없으면 "exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        finally:
+            self._in_flight.pop(key, None)
+
+        future.set_result(response)
+        # 빈 응답은 저장하지 않음 (일시적 오류일 가능성)
+        if response.get("text"):
+            self._set_local(key, response)
+            await self._set_persistent(key, response)
+        return response
+
+    def get_stats(self) -> Dict:
+        """적중/미적중 카운터"""
+        hits = (
+            self._stats["memory_hits"]
+            + self._stats["persistent_hits"]
+            + self._stats["shared_in_flight"]
+        )
+        lookups = hits + self._stats["misses"]
+        return {
+            **self._stats,
+            "hits": hits,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "persistent_tier": self._persistent_available(),
+        }
+
+    def clear(self):
+        """프로세스 내 캐시 비우기 (Redis 항목은 TTL로 만료)"""
+        self._entries.clear()
+
+    def _get_local(self, key: str) -> Optional[Dict]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    def _set_local(self, key: str, response: Dict):
+        self._entries[key] = (time.monotonic() + self.ttl, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def _persistent_available(self) -> bool:
+        if not settings.LLM_CACHE_REDIS:
+            return False
+        from app.services.cache_service import cache_service
+        return cache_service.redis is not None
+
+    async def _get_persistent(self, key: str) -> Optional[Dict]:
+        if not self._persistent_available():
+            return None
+        from app.services.cache_service import cache_service
+        return await cache_service.get(self.KEY_PREFIX + key)
+
+    async def _set_persistent(self, key: str, response: Dict):
+        if not self._persistent_available():
+            return
+        from app.services.cache_service import cache_service
+        await cache_service.set(self.KEY_PREFIX + key, response, self.ttl)
+
+    @staticmethod
+    def _as_hit(response: Dict) -> Dict:
+        return {**response, "input_tokens": 0, "output_tokens": 0, "cached": True}
+
+
+# Singleton instance
+llm_cache = LLMResponseCache(
+    max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+    ttl=settings.LLM_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,426 @@
+"""
+LLM Client - Claude, GPT, Gemini 비동기 호출 계층
+provider + API 키별로 장기 유지되는 클라이언트(커넥션 풀)를 공유하여
+이벤트 루프를 막지 않고 AI API를 호출합니다.
+"""
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+import anthropic
+import httpx
+from openai import AsyncOpenAI
+
+from app.services.llm_cache import llm_cache
+
+# Gemini SDK 임포트 (설치되어 있는 경우)
+try:
+    import google.generativeai as genai
+    GEMINI_AVAILABLE = True
+except ImportError:
+    GEMINI_AVAILABLE = False
+    genai = None
+
+logger = logging.getLogger(__name__)
+
+
+# 타임아웃 설정: 연결 30초, 읽기 180초 (AI 생성에 충분한 시간)
+DEFAULT_TIMEOUT = httpx.Timeout(connect=30.0, read=180.0, write=30.0, pool=30.0)
+
+# provider별 공유 커넥션 풀 크기
+POOL_LIMITS = httpx.Limits(
+    max_connections=50,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0,
+)
+
+# 비동기 API가 없는 Gemini SDK 폴백 시 동시에 점유할 수 있는 스레드 수
+GEMINI_THREAD_LIMIT = 8
+
+DEFAULT_MODELS = {
+    "claude": "claude-sonnet-4-5-20250929",
+    "gpt": "gpt-4o-mini",
+    "gemini": "gemini-2.0-flash-exp",
+}
+
+# 안전 설정 (의료 콘텐츠 허용)
+GEMINI_SAFETY_SETTINGS = [
+    {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_ONLY_HIGH"},
+    {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_ONLY_HIGH"},
+    {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_ONLY_HIGH"},
+    {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_ONLY_HIGH"},
+]
+
+
+class LLMStream:
+    """
+    스트리밍 응답
+    async for로 텍스트 조각(delta)을 받고, 종료 후 input/output 토큰 수를 확인합니다.
+    도중에 aclose()하면 provider 스트림(HTTP 연결)도 함께 닫혀 이후 토큰 생성이 중단됩니다.
+    """
+
+    def __init__(self, provider: str, model: str):
+        self.provider = provider
+        self.model = model
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self._iterator: Optional[AsyncIterator[str]] = None
+
+    def __aiter__(self) -> AsyncIterator[str]:
+        return self._iterator
+
+    async def aclose(self):
+        await self._iterator.aclose()
+
+    @property
+    def usage(self) -> Dict:
+        return {
+            "ai_provider": self.provider,
+            "ai_model": self.model,
+            "input_tokens": self.input_tokens or 0,
+            "output_tokens": self.output_tokens or 0,
+        }
+
+
+class LLMClient:
+    """
+    AI 제공자별 비동기 클라이언트 풀
+
+    - Claude: AsyncAnthropic (API 키별 1개 인스턴스 재사용)
+    - GPT: AsyncOpenAI + 공유 httpx.AsyncClient 커넥션 풀
+    - Gemini: generate_content_async, 없으면 제한된 스레드 풀로 폴백
+    """
+
+    def __init__(self):
+        self._clients: Dict[Tuple[str, str], Any] = {}
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._gemini_semaphore = asyncio.Semaphore(GEMINI_THREAD_LIMIT)
+        self._gemini_api_key: Optional[str] = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """OpenAI 호출에 공유되는 httpx 커넥션 풀"""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(timeout=DEFAULT_TIMEOUT, limits=POOL_LIMITS)
+        return self._http_client
+
+    def get_claude_client(self, api_key: str) -> anthropic.AsyncAnthropic:
+        """API 키별 AsyncAnthropic 클라이언트 (내부 커넥션 풀 재사용)"""
+        key = ("claude", api_key)
+        client = self._clients.get(key)
+        if client is None:
+            client = anthropic.AsyncAnthropic(api_key=api_key, timeout=180.0)
+            self._clients[key] = client
+        return client
+
+    def get_openai_client(self, api_key: str) -> AsyncOpenAI:
+        """API 키별 AsyncOpenAI 클라이언트 (공유 httpx 풀 사용)"""
+        key = ("gpt", api_key)
+        client = self._clients.get(key)
+        if client is None:
+            client = AsyncOpenAI(
+                api_key=api_key,
+                http_client=self._get_http_client(),
+                timeout=180.0,
+            )
+            self._clients[key] = client
+        return client
+
+    def _configure_gemini(self, api_key: str):
+        """Gemini SDK는 전역 설정이므로 키가 바뀔 때만 재설정"""
+        if self._gemini_api_key != api_key:
+            genai.configure(api_key=api_key)
+            self._gemini_api_key = api_key
+
+    async def complete(
+        self,
+        provider: str,
+        api_key: str,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        model: Optional[str] = None,
+        max_tokens: int = 2000,
+        temperature: float = 0.7,
+        timeout: Optional[float] = None,
+        json_mode: bool = False,
+        use_cache: bool = False,
+    ) -> Dict:
+        """
+        단일 completion 호출
+
+        Args:
+            provider: AI 제공자 ("claude", "gpt", "gemini")
+            api_key: 사용할 API 키
+            prompt: 사용자 프롬프트
+            system_prompt: 시스템 프롬프트 (선택)
+            model: 모델명 (없으면 provider 기본 모델)
+            max_tokens: 최대 출력 토큰 수
+            temperature: 창의성 정도 (0.0 ~ 1.0)
+            timeout: 요청 타임아웃(초), 없으면 클라이언트 기본값
+            json_mode: JSON 객체 응답 강제 (GPT response_format, Gemini response_mime_type).
+                Claude는 프롬프트 지시에 의존
+            use_cache: 같은 입력의 이전 응답 재사용 여부 (기본 False).
+                키워드 추출/채점처럼 같은 입력에 같은 결과를 기대하는 호출만 True로 지정
+                (다시 생성하면 새 결과가 나와야 하는 글/제목/답변 생성은 캐시하지 않음)
+
+        Returns:
+            {"text", "ai_provider", "ai_model", "input_tokens", "output_tokens"}
+            캐시 적중 시 "cached": True와 토큰 수 0
+        """
+        if not api_key:
+            raise ValueError(f"{provider} API 키가 설정되지 않았습니다.")
+
+        model = model or DEFAULT_MODELS.get(provider, DEFAULT_MODELS["gpt"])
+        key = llm_cache.make_key(
+            provider, model, system_prompt, prompt, temperature, max_tokens, json_mode
+        )
+        return await llm_cache.get_or_call(
+            key,
+            lambda: self._complete(
+                provider, api_key, prompt, system_prompt, model,
+                max_tokens, temperature, timeout, json_mode,
+            ),
+            use_cache=use_cache,
+        )
+
+    async def _complete(
+        self, provider, api_key, prompt, system_prompt, model,
+        max_tokens, temperature, timeout, json_mode,
+    ) -> Dict:
+        """provider별 실제 API 호출 (캐시 미적중 시)"""
+        if provider == "claude":
+            text, input_tokens, output_tokens = await self._complete_claude(
+                api_key, prompt, system_prompt, model, max_tokens, temperature, timeout
+            )
+        elif provider == "gemini":
+            text, input_tokens, output_tokens = await self._complete_gemini(
+                api_key, prompt, system_prompt, model, max_tokens, temperature, json_mode
+            )
+        else:
+            text, input_tokens, output_tokens = await self._complete_gpt(
+                api_key, prompt, system_prompt, model, max_tokens, temperature, timeout, json_mode
+            )
+
+        return {
+            "text": text or "",
+            "ai_provider": provider,
+            "ai_model": model,
+            "input_tokens": input_tokens or 0,
+            "output_tokens": output_tokens or 0,
+        }
+
+    async def _complete_claude(
+        self, api_key, prompt, system_prompt, model, max_tokens, temperature, timeout
+    ) -> Tuple[str, int, int]:
+        kwargs = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+        if system_prompt:
+            kwargs["system"] = system_prompt
+        if timeout:
+            kwargs["timeout"] = timeout
+
+        response = await self.get_claude_client(api_key).messages.create(**kwargs)
+        return (
+            response.content[0].text,
+            response.usage.input_tokens,
+            response.usage.output_tokens,
+        )
+
+    async def _complete_gpt(
+        self, api_key, prompt, system_prompt, model, max_tokens, temperature, timeout,
+        json_mode=False,
+    ) -> Tuple[str, int, int]:
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+
+        kwargs = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "messages": messages,
+        }
+        if timeout:
+            kwargs["timeout"] = timeout
+        if json_mode:
+            kwargs["response_format"] = {"type": "json_object"}
+
+        response = await self.get_openai_client(api_key).chat.completions.create(**kwargs)
+        usage = response.usage
+        return (
+            response.choices[0].message.content,
+            usage.prompt_tokens if usage else 0,
+            usage.completion_tokens if usage else 0,
+        )
+
+    def _build_gemini_model(
+        self, api_key, system_prompt, model, max_tokens, temperature, json_mode=False
+    ):
+        if not GEMINI_AVAILABLE:
+            raise RuntimeError("Gemini SDK가 설치되어 있지 않습니다.")
+
+        self._configure_gemini(api_key)
+        generation_config = genai.GenerationConfig(
+            temperature=temperature,
+            max_output_tokens=max_tokens,
+            top_p=0.95,
+            top_k=40,
+            response_mime_type="application/json" if json_mode else None,
+        )
+        return genai.GenerativeModel(
+            model_name=model,
+            generation_config=generation_config,
+            safety_settings=GEMINI_SAFETY_SETTINGS,
+            system_instruction=system_prompt or None,
+        )
+
+    async def _complete_gemini(
+        self, api_key, prompt, system_prompt, model, max_tokens, temperature, json_mode=False
+    ) -> Tuple[str, int, int]:
+        gemini_model = self._build_gemini_model(
+            api_key, system_prompt, model, max_tokens, temperature, json_mode
+        )
+
+        if hasattr(gemini_model, "generate_content_async"):
+            response = await gemini_model.generate_content_async(prompt)
+        else:
+            # 구버전 SDK: 동기 호출을 제한된 스레드에서 실행
+            async with self._gemini_semaphore:
+                response = await asyncio.to_thread(gemini_model.generate_content, prompt)
+
+        input_tokens = output_tokens = 0
+        if hasattr(response, "usage_metadata"):
+            input_tokens = getattr(response.usage_metadata, "prompt_token_count", 0)
+            output_tokens = getattr(response.usage_metadata, "candidates_token_count", 0)
+        return response.text, input_tokens, output_tokens
+
+    def stream(
+        self,
+        provider: str,
+        api_key: str,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        model: Optional[str] = None,
+        max_tokens: int = 2000,
+        temperature: float = 0.7,
+    ) -> LLMStream:
+        """
+        스트리밍 completion 호출 (인자는 complete와 동일)
+
+        Returns:
+            텍스트 조각을 순서대로 내보내는 LLMStream
+        """
+        if not api_key:
+            raise ValueError(f"{provider} API 키가 설정되지 않았습니다.")
+
+        model = model or DEFAULT_MODELS.get(provider, DEFAULT_MODELS["gpt"])
+        stream = LLMStream(provider, model)
+
+        if provider == "claude":
+            stream._iterator = self._stream_claude(
+                stream, api_key, prompt, system_prompt, model, max_tokens, temperature
+            )
+        elif provider == "gemini":
+            stream._iterator = self._stream_gemini(
+                stream, api_key, prompt, system_prompt, model, max_tokens, temperature
+            )
+        else:
+            stream._iterator = self._stream_gpt(
+                stream, api_key, prompt, system_prompt, model, max_tokens, temperature
+            )
+        return stream
+
+    async def _stream_claude(
+        self, stream, api_key, prompt, system_prompt, model, max_tokens, temperature
+    ) -> AsyncIterator[str]:
+        kwargs = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+        if system_prompt:
+            kwargs["system"] = system_prompt
+
+        async with self.get_claude_client(api_key).messages.stream(**kwargs) as response:
+            async for event in response:
+                if event.type == "text":
+                    yield event.text
+                elif event.type == "message_start":
+                    stream.input_tokens = event.message.usage.input_tokens
+                elif event.type == "message_delta":
+                    stream.output_tokens = event.usage.output_tokens
+
+    async def _stream_gpt(
+        self, stream, api_key, prompt, system_prompt, model, max_tokens, temperature
+    ) -> AsyncIterator[str]:
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+
+        response = await self.get_openai_client(api_key).chat.completions.create(
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            messages=messages,
+            stream=True,
+            # 마지막 청크에 토큰 사용량 포함 (SDK 버전과 무관하게 body로 전달)
+            extra_body={"stream_options": {"include_usage": True}},
+        )
+        try:
+            async for chunk in response:
+                usage = getattr(chunk, "usage", None)
+                if usage:
+                    if isinstance(usage, dict):
+                        stream.input_tokens = usage.get("prompt_tokens", 0)
+                        stream.output_tokens = usage.get("completion_tokens", 0)
+                    else:
+                        stream.input_tokens = usage.prompt_tokens
+                        stream.output_tokens = usage.completion_tokens
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            await response.close()
+
+    async def _stream_gemini(
+        self, stream, api_key, prompt, system_prompt, model, max_tokens, temperature
+    ) -> AsyncIterator[str]:
+        gemini_model = self._build_gemini_model(
+            api_key, system_prompt, model, max_tokens, temperature
+        )
+        response = await gemini_model.generate_content_async(prompt, stream=True)
+        async for chunk in response:
+            metadata = getattr(chunk, "usage_metadata", None)
+            if metadata:
+                stream.input_tokens = getattr(metadata, "prompt_token_count", 0)
+                stream.output_tokens = getattr(metadata, "candidates_token_count", 0)
+            try:
+                text = chunk.text
+            except ValueError:
+                # 텍스트 파트가 없는 청크 (종료 사유만 포함 등)
+                text = ""
+            if text:
+                yield text
+
+    async def aclose(self):
+        """애플리케이션 종료 시 모든 커넥션 풀 정리"""
+        for (provider, _), client in list(self._clients.items()):
+            try:
+                await client.close()
+            except Exception as e:
+                logger.warning(f"{provider} 클라이언트 종료 실패: {e}")
+        self._clients.clear()
+
+        if self._http_client is not None and not self._http_client.is_closed:
+            await self._http_client.aclose()
+        self._http_client = None
+
+
+# Singleton instance
+llm_client = LLMClient()
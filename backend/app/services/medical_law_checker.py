@@ -3,16 +3,20 @@ Medical Law Compliance Checker
 의료법 준수 검증 모듈
 """
 
-import re
 from typing import List, Dict, Tuple
 
+from app.services.compliance_rules import compliance_rule_store
+
 
 class MedicalLawChecker:
     """
     의료법 위반 표현 검증 및 대체 표현 제안
+
+    실제 검사는 compliance_rule_store의 현재 규칙 세트(DB 규칙)로 수행하며,
+    아래 패턴은 DB에 규칙이 없을 때의 기본값입니다.
     """
 
-    # 의료법 위반 패턴 정의
+    # 의료법 위반 패턴 정의 (기본값)
     VIOLATION_PATTERNS = {
         "절대적_표현": [
             (r"100%\s*(?:완치|치료|효과)", "높은 치료 성공률"),
@@ -44,25 +48,22 @@ class MedicalLawChecker:
         ],
     }
 
-    def __init__(self):
-        self.compiled_patterns = self._compile_patterns()
-
-    def _compile_patterns(self) -> Dict[str, List[Tuple[re.Pattern, str]]]:
-        """
-        정규식 패턴 사전 컴파일
-        """
-        compiled = {}
-        for category, patterns in self.VIOLATION_PATTERNS.items():
-            compiled[category] = [
-                (re.compile(pattern, re.IGNORECASE), alternative)
-                for pattern, alternative in patterns
-            ]
-        return compiled
+    # 카테고리별 위반 심각도 (DB 규칙은 규칙별 severity 사용)
+    CATEGORY_SEVERITY = {
+        "절대적_표현": "high",
+        "비교_우위": "high",
+        "과장_광고": "high",
+        "가격_할인": "critical",
+        "보장_표현": "high",
+    }
 
     def check(self, text: str) -> Dict:
         """
         텍스트에서 의료법 위반 표현 검사
 
+        규칙마다 모든 일치를 보고합니다 (서로 다른 규칙의 일치가 겹쳐도 각각 집계).
+        겹치는 일치 정리는 auto_fix에서만 적용합니다.
+
         Args:
             text: 검사할 텍스트
 
@@ -75,25 +76,25 @@ class MedicalLawChecker:
         """
         violations = []
         warnings = []
+        scanner = compliance_rule_store.current.medical_scanner
+
+        for start, end, rule_index, _ in scanner.all_matches(text):
+            rule = scanner.rules[rule_index]
+            category = rule["category"]
+            severity = rule.get("severity") or self._get_severity(category)
+            violation_data = {
+                "category": category,
+                "text": text[start:end],
+                "position": (start, end),
+                "severity": severity,
+                "suggestion": rule["replacement"],
+                "context": self._get_context(text, (start, end)),
+            }
 
-        for category, patterns in self.compiled_patterns.items():
-            for pattern, alternative in patterns:
-                matches = list(pattern.finditer(text))
-
-                for match in matches:
-                    violation_data = {
-                        "category": category,
-                        "text": match.group(),
-                        "position": match.span(),
-                        "severity": self._get_severity(category),
-                        "suggestion": alternative,
-                        "context": self._get_context(text, match.span()),
-                    }
-
-                    if self._get_severity(category) in ["high", "critical"]:
-                        violations.append(violation_data)
-                    else:
-                        warnings.append(violation_data)
+            if severity in ["high", "critical"]:
+                violations.append(violation_data)
+            else:
+                warnings.append(violation_data)
 
         return {
             "is_compliant": len(violations) == 0,
@@ -106,14 +107,7 @@ class MedicalLawChecker:
         """
         카테고리별 위반 심각도 반환
         """
-        severity_map = {
-            "절대적_표현": "high",
-            "비교_우위": "high",
-            "과장_광고": "high",
-            "가격_할인": "critical",
-            "보장_표현": "high",
-        }
-        return severity_map.get(category, "medium")
+        return self.CATEGORY_SEVERITY.get(category, "medium")
 
     def _get_context(self, text: str, position: Tuple[int, int], window: int = 50) -> str:
         """
@@ -136,31 +130,16 @@ class MedicalLawChecker:
         Returns:
             (수정된 텍스트, 수정 내역 리스트)
         """
-        fixed_text = text
-        changes = []
-
-        for category, patterns in self.compiled_patterns.items():
-            for pattern, alternative in patterns:
-                matches = list(pattern.finditer(fixed_text))
-
-                # 뒤에서부터 교체 (인덱스 유지)
-                for match in reversed(matches):
-                    if alternative:  # 대체 표현이 있는 경우만
-                        original = match.group()
-                        start, end = match.span()
-
-                        # 교체
-                        fixed_text = fixed_text[:start] + alternative + fixed_text[end:]
-
-                        changes.append(
-                            {
-                                "category": category,
-                                "original": original,
-                                "replaced": alternative,
-                                "position": (start, end),
-                            }
-                        )
-
+        fixed_text, replaced = compliance_rule_store.current.medical_fix_scanner.replace(text)
+        changes = [
+            {
+                "category": change["rule"]["category"],
+                "original": change["original"],
+                "replaced": change["replaced"],
+                "position": change["position"],
+            }
+            for change in replaced
+        ]
         return fixed_text, changes
 
     def get_compliance_score(self, text: str) -> float:
@@ -8,8 +8,10 @@ import logging
 from datetime import datetime, date, timedelta
 from typing import Optional, Dict, Any, List
 
-from sqlalchemy import select, and_, func
-from sqlalchemy.orm import Session
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import AsyncSessionLocal
 
 from app.models.blog_outreach import (
     NaverBlog, BlogContact, BlogSearchKeyword, EmailCampaign, EmailLog,
@@ -24,9 +26,14 @@ logger = logging.getLogger(__name__)
 
 
 class OutreachSchedulerService:
-    """블로그 영업 자동화 스케줄러"""
+    """
+    블로그 영업 자동화 스케줄러
+
+    self.db는 요청 세션으로 start() 설정 조회에만 사용하고,
+    백그라운드 루프는 요청이 끝난 뒤에도 돌기 때문에 실행마다 AsyncSessionLocal 세션을 새로 연다.
+    """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self._is_running = False
         self._collection_task: Optional[asyncio.Task] = None
@@ -70,7 +77,7 @@ class OutreachSchedulerService:
         self._emails_sent = 0
 
         # 설정 로드
-        settings = self._get_settings(user_id)
+        settings = await self._get_settings(self.db, user_id)
 
         # 자동 수집 루프
         if settings and settings.auto_collect:
@@ -146,11 +153,12 @@ class OutreachSchedulerService:
             "last_campaign_run": self._last_campaign_run.isoformat() if self._last_campaign_run else None
         }
 
-    def _get_settings(self, user_id: str) -> Optional[OutreachSetting]:
+    async def _get_settings(self, db: AsyncSession, user_id: str) -> Optional[OutreachSetting]:
         """사용자 설정 조회"""
-        return self.db.query(OutreachSetting).filter(
-            OutreachSetting.user_id == user_id
-        ).first()
+        result = await db.execute(
+            select(OutreachSetting).where(OutreachSetting.user_id == user_id)
+        )
+        return result.scalars().first()
 
     def _is_working_hours(self, settings: Optional[OutreachSetting]) -> bool:
         """영업 시간 확인"""
@@ -174,45 +182,52 @@ class OutreachSchedulerService:
     async def _run_collection(self, user_id: str):
         """블로그 수집 실행"""
         try:
-            # 활성 키워드 조회
-            keywords = self.db.query(BlogSearchKeyword).filter(
+            async with AsyncSessionLocal() as db:
+                await self._collect_keywords(db, user_id)
+        except Exception as e:
+            logger.error(f"수집 실행 오류: {e}")
+
+    async def _collect_keywords(self, db: AsyncSession, user_id: str):
+        """활성 키워드별 블로그 수집"""
+        # 활성 키워드 조회
+        result = await db.execute(
+            select(BlogSearchKeyword).where(
                 BlogSearchKeyword.user_id == user_id,
                 BlogSearchKeyword.is_active == True
-            ).order_by(BlogSearchKeyword.priority.desc()).limit(5).all()
-
-            if not keywords:
-                logger.info("수집할 키워드가 없습니다")
-                return
+            ).order_by(BlogSearchKeyword.priority.desc()).limit(5)
+        )
+        keywords = result.scalars().all()
 
-            crawler = BlogOutreachCrawler(self.db)
-            total_collected = 0
+        if not keywords:
+            logger.info("수집할 키워드가 없습니다")
+            return
 
-            for keyword in keywords:
-                try:
-                    result = await crawler.search_blogs(
-                        keyword=keyword.keyword,
-                        user_id=user_id,
-                        category=keyword.category,
-                        max_results=20
-                    )
-                    collected = result.get('collected', 0)
-                    total_collected += collected
-                    logger.info(f"키워드 '{keyword.keyword}' 수집 완료: {collected}개")
+        crawler = BlogOutreachCrawler(db)
+        total_collected = 0
 
-                    # 키워드 간 딜레이
-                    await asyncio.sleep(60)
+        for keyword in keywords:
+            try:
+                result = await crawler.search_blogs(
+                    keyword=keyword.keyword,
+                    user_id=user_id,
+                    category=keyword.category,
+                    max_results=20
+                )
+                collected = result.get('collected', 0)
+                total_collected += collected
+                logger.info(f"키워드 '{keyword.keyword}' 수집 완료: {collected}개")
 
-                except Exception as e:
-                    logger.error(f"키워드 '{keyword.keyword}' 수집 오류: {e}")
+                # 키워드 간 딜레이
+                await asyncio.sleep(60)
 
-            await crawler.close()
+            except Exception as e:
+                logger.error(f"키워드 '{keyword.keyword}' 수집 오류: {e}")
 
-            # 통계 업데이트
-            self._blogs_collected += total_collected
-            self._last_collection = datetime.utcnow()
+        await crawler.close()
 
-        except Exception as e:
-            logger.error(f"수집 실행 오류: {e}")
+        # 통계 업데이트
+        self._blogs_collected += total_collected
+        self._last_collection = datetime.utcnow()
 
     async def _extraction_loop(self, user_id: str, settings: Optional[OutreachSetting]):
         """연락처 추출 루프"""
@@ -228,15 +243,16 @@ class OutreachSchedulerService:
     async def _run_extraction(self, user_id: str):
         """연락처 추출 실행"""
         try:
-            extractor = ContactExtractorService(self.db)
-            result = await extractor.extract_contacts_batch(
-                user_id=user_id,
-                limit=10
-            )
-            contacts_found = result.get('contacts_found', 0)
-            self._contacts_extracted += contacts_found
-            logger.info(f"연락처 추출 완료: {contacts_found}개 발견")
-            await extractor.close()
+            async with AsyncSessionLocal() as db:
+                extractor = ContactExtractorService(db)
+                result = await extractor.extract_contacts_batch(
+                    user_id=user_id,
+                    limit=10
+                )
+                contacts_found = result.get('contacts_found', 0)
+                self._contacts_extracted += contacts_found
+                logger.info(f"연락처 추출 완료: {contacts_found}개 발견")
+                await extractor.close()
 
         except Exception as e:
             logger.error(f"추출 실행 오류: {e}")
@@ -254,11 +270,12 @@ class OutreachSchedulerService:
     async def _run_scoring(self, user_id: str):
         """스코어링 실행"""
         try:
-            scorer = LeadScoringService(self.db)
-            result = await scorer.score_blogs_batch(
-                user_id=user_id,
-                limit=50
-            )
+            async with AsyncSessionLocal() as db:
+                scorer = LeadScoringService(db)
+                result = await scorer.score_blogs_batch(
+                    user_id=user_id,
+                    limit=50
+                )
             logger.info(f"스코어링 완료: {result.get('results', {}).get('scored', 0)}개")
 
         except Exception as e:
@@ -278,68 +295,77 @@ class OutreachSchedulerService:
     async def _run_campaigns(self, user_id: str):
         """활성 캠페인 발송 실행"""
         try:
-            # 활성 캠페인 조회
-            active_campaigns = self.db.query(EmailCampaign).filter(
+            async with AsyncSessionLocal() as db:
+                await self._send_campaigns(db, user_id)
+        except Exception as e:
+            logger.error(f"캠페인 실행 오류: {e}")
+
+    async def _send_campaigns(self, db: AsyncSession, user_id: str):
+        """활성 캠페인 배치 발송 및 팔로업"""
+        # 활성 캠페인 조회
+        result = await db.execute(
+            select(EmailCampaign).where(
                 EmailCampaign.user_id == user_id,
                 EmailCampaign.status == CampaignStatus.ACTIVE
-            ).all()
-
-            if not active_campaigns:
-                return
+            )
+        )
+        active_campaigns = result.scalars().all()
 
-            settings = self._get_settings(user_id)
-            sender = EmailSenderService(self.db)
-            total_sent = 0
+        if not active_campaigns:
+            return
 
-            for campaign in active_campaigns:
-                try:
-                    # 발송 시간 확인
-                    now = datetime.now()
-                    if campaign.sending_hours_start and campaign.sending_hours_end:
-                        if not (campaign.sending_hours_start <= now.hour < campaign.sending_hours_end):
-                            continue
+        sender = EmailSenderService(db)
+        total_sent = 0
 
-                    # 발송 요일 확인
-                    if campaign.sending_days:
-                        if now.isoweekday() not in campaign.sending_days:
-                            continue
+        for campaign in active_campaigns:
+            try:
+                # 발송 시간 확인
+                now = datetime.now()
+                if campaign.sending_hours_start and campaign.sending_hours_end:
+                    if not (campaign.sending_hours_start <= now.hour < campaign.sending_hours_end):
+                        continue
 
-                    # 배치 발송
-                    result = await sender.send_campaign_batch(
-                        user_id=user_id,
-                        campaign_id=campaign.id,
-                        batch_size=5
-                    )
+                # 발송 요일 확인
+                if campaign.sending_days:
+                    if now.isoweekday() not in campaign.sending_days:
+                        continue
 
-                    if result.get("success"):
-                        sent = result.get("results", {}).get("sent", 0)
-                        total_sent += sent
-                        if sent > 0:
-                            logger.info(f"캠페인 '{campaign.name}' 발송: {sent}건")
+                # 배치 발송
+                result = await sender.send_campaign_batch(
+                    user_id=user_id,
+                    campaign_id=campaign.id,
+                    batch_size=5
+                )
 
-                except Exception as e:
-                    logger.error(f"캠페인 '{campaign.name}' 발송 오류: {e}")
+                if result.get("success"):
+                    sent = result.get("results", {}).get("sent", 0)
+                    total_sent += sent
+                    if sent > 0:
+                        logger.info(f"캠페인 '{campaign.name}' 발송: {sent}건")
 
-            # 팔로업 이메일 발송
-            followup_sent = await self._run_followups(user_id, sender)
-            total_sent += followup_sent
+            except Exception as e:
+                logger.error(f"캠페인 '{campaign.name}' 발송 오류: {e}")
 
-            # 통계 업데이트
-            self._emails_sent += total_sent
-            self._last_campaign_run = datetime.utcnow()
+        # 팔로업 이메일 발송
+        followup_sent = await self._run_followups(db, user_id, sender)
+        total_sent += followup_sent
 
-        except Exception as e:
-            logger.error(f"캠페인 실행 오류: {e}")
+        # 통계 업데이트
+        self._emails_sent += total_sent
+        self._last_campaign_run = datetime.utcnow()
 
-    async def _run_followups(self, user_id: str, sender: EmailSenderService) -> int:
+    async def _run_followups(self, db: AsyncSession, user_id: str, sender: EmailSenderService) -> int:
         """팔로업 이메일 발송"""
         sent_count = 0
         try:
             # 활성 캠페인에서 팔로업 필요한 이메일 조회
-            campaigns = self.db.query(EmailCampaign).filter(
-                EmailCampaign.user_id == user_id,
-                EmailCampaign.status == CampaignStatus.ACTIVE
-            ).all()
+            result = await db.execute(
+                select(EmailCampaign).where(
+                    EmailCampaign.user_id == user_id,
+                    EmailCampaign.status == CampaignStatus.ACTIVE
+                )
+            )
+            campaigns = result.scalars().all()
 
             for campaign in campaigns:
                 templates = campaign.templates or []
@@ -358,22 +384,27 @@ class OutreachSchedulerService:
                     cutoff_date = datetime.utcnow() - timedelta(days=delay_days)
 
                     # 이전 시퀀스 이메일이 발송되었고 회신 없는 블로그
-                    prev_logs = self.db.query(EmailLog).filter(
-                        EmailLog.campaign_id == campaign.id,
-                        EmailLog.sequence_number == i - 1,
-                        EmailLog.status.in_([EmailStatus.SENT, EmailStatus.OPENED, EmailStatus.CLICKED]),
-                        EmailLog.sent_at <= cutoff_date
-                    ).all()
+                    result = await db.execute(
+                        select(EmailLog).where(
+                            EmailLog.campaign_id == campaign.id,
+                            EmailLog.sequence_number == i - 1,
+                            EmailLog.status.in_([EmailStatus.SENT, EmailStatus.OPENED, EmailStatus.CLICKED]),
+                            EmailLog.sent_at <= cutoff_date
+                        )
+                    )
+                    prev_logs = result.scalars().all()
 
-                    for prev_log in prev_logs:
-                        # 이미 이 시퀀스 발송했는지 확인
-                        existing = self.db.query(EmailLog).filter(
+                    # 이미 이 시퀀스를 발송한 블로그
+                    result = await db.execute(
+                        select(EmailLog.blog_id).where(
                             EmailLog.campaign_id == campaign.id,
-                            EmailLog.blog_id == prev_log.blog_id,
                             EmailLog.sequence_number == i
-                        ).first()
+                        )
+                    )
+                    already_sent = set(result.scalars().all())
 
-                        if existing:
+                    for prev_log in prev_logs:
+                        if prev_log.blog_id in already_sent:
                             continue
 
                         # 팔로업 발송
@@ -388,12 +419,10 @@ class OutreachSchedulerService:
                             if result.get("success"):
                                 sent_count += 1
                                 # 시퀀스 번호 업데이트
-                                log = self.db.query(EmailLog).filter(
-                                    EmailLog.id == result.get("email_log_id")
-                                ).first()
+                                log = await db.get(EmailLog, result.get("email_log_id"))
                                 if log:
                                     log.sequence_number = i
-                                    self.db.commit()
+                                    await db.commit()
 
                                 logger.info(f"팔로업 발송 완료: blog_id={prev_log.blog_id}, sequence={i}")
 
@@ -417,77 +446,88 @@ class OutreachSchedulerService:
 
     async def _run_stats(self, user_id: str):
         """일일 통계 집계"""
-        try:
-            today = date.today()
-            today_start = datetime.combine(today, datetime.min.time())
+        async with AsyncSessionLocal() as db:
+            try:
+                await self._aggregate_stats(db, user_id)
+                await db.commit()
+                logger.debug("일일 통계 집계 완료")
 
-            # 기존 통계 확인
-            existing = self.db.query(OutreachStats).filter(
+            except Exception as e:
+                logger.error(f"통계 집계 오류: {e}")
+                await db.rollback()
+
+    async def _aggregate_stats(self, db: AsyncSession, user_id: str):
+        """오늘자 OutreachStats 행 갱신"""
+        today = date.today()
+        today_start = datetime.combine(today, datetime.min.time())
+
+        # 기존 통계 확인
+        result = await db.execute(
+            select(OutreachStats).where(
                 OutreachStats.user_id == user_id,
                 OutreachStats.stat_date >= today_start,
                 OutreachStats.stat_date < today_start + timedelta(days=1)
-            ).first()
+            )
+        )
+        stats = result.scalars().first()
 
-            if existing:
-                stats = existing
-            else:
-                stats = OutreachStats(
-                    user_id=user_id,
-                    stat_date=today_start
-                )
-                self.db.add(stats)
+        if not stats:
+            stats = OutreachStats(
+                user_id=user_id,
+                stat_date=today_start
+            )
+            db.add(stats)
 
-            # 수집 통계
-            stats.blogs_collected = self.db.query(NaverBlog).filter(
+        # 수집 통계
+        stats.blogs_collected = await db.scalar(
+            select(func.count(NaverBlog.id)).where(
                 NaverBlog.user_id == user_id,
                 NaverBlog.collected_at >= today_start
-            ).count()
+            )
+        )
 
-            stats.contacts_extracted = self.db.query(BlogContact).filter(
+        stats.contacts_extracted = await db.scalar(
+            select(func.count(BlogContact.id)).where(
                 BlogContact.extracted_at >= today_start
-            ).count()
+            )
+        )
 
-            # 이메일 통계
-            today_logs = self.db.query(EmailLog).filter(
+        # 이메일 통계
+        result = await db.execute(
+            select(EmailLog.status).where(
                 EmailLog.user_id == user_id,
                 EmailLog.created_at >= today_start
-            ).all()
-
-            stats.emails_sent = sum(1 for l in today_logs if l.status not in [EmailStatus.PENDING, EmailStatus.BOUNCED])
-            stats.emails_opened = sum(1 for l in today_logs if l.status in [EmailStatus.OPENED, EmailStatus.CLICKED, EmailStatus.REPLIED])
-            stats.emails_clicked = sum(1 for l in today_logs if l.status in [EmailStatus.CLICKED, EmailStatus.REPLIED])
-            stats.emails_replied = sum(1 for l in today_logs if l.status == EmailStatus.REPLIED)
-            stats.emails_bounced = sum(1 for l in today_logs if l.status == EmailStatus.BOUNCED)
-
-            # 비율 계산
-            if stats.emails_sent > 0:
-                stats.open_rate = round(stats.emails_opened / stats.emails_sent * 100, 1)
-                stats.click_rate = round(stats.emails_clicked / stats.emails_sent * 100, 1)
-                stats.reply_rate = round(stats.emails_replied / stats.emails_sent * 100, 1)
-
-            # 등급별 분포
-            grade_breakdown = {}
-            for grade in LeadGrade:
-                count = self.db.query(NaverBlog).filter(
-                    NaverBlog.user_id == user_id,
-                    NaverBlog.lead_grade == grade
-                ).count()
-                grade_breakdown[grade.value] = count
-            stats.grade_breakdown = grade_breakdown
-
-            self.db.commit()
-            logger.debug("일일 통계 집계 완료")
-
-        except Exception as e:
-            logger.error(f"통계 집계 오류: {e}")
-            self.db.rollback()
+            )
+        )
+        today_statuses = result.scalars().all()
+
+        stats.emails_sent = sum(1 for s in today_statuses if s not in [EmailStatus.PENDING, EmailStatus.BOUNCED])
+        stats.emails_opened = sum(1 for s in today_statuses if s in [EmailStatus.OPENED, EmailStatus.CLICKED, EmailStatus.REPLIED])
+        stats.emails_clicked = sum(1 for s in today_statuses if s in [EmailStatus.CLICKED, EmailStatus.REPLIED])
+        stats.emails_replied = sum(1 for s in today_statuses if s == EmailStatus.REPLIED)
+        stats.emails_bounced = sum(1 for s in today_statuses if s == EmailStatus.BOUNCED)
+
+        # 비율 계산
+        if stats.emails_sent > 0:
+            stats.open_rate = round(stats.emails_opened / stats.emails_sent * 100, 1)
+            stats.click_rate = round(stats.emails_clicked / stats.emails_sent * 100, 1)
+            stats.reply_rate = round(stats.emails_replied / stats.emails_sent * 100, 1)
+
+        # 등급별 분포
+        result = await db.execute(
+            select(NaverBlog.lead_grade, func.count(NaverBlog.id)).where(
+                NaverBlog.user_id == user_id
+            ).group_by(NaverBlog.lead_grade)
+        )
+        counts = {grade: count for grade, count in result.all()}
+        stats.grade_breakdown = {grade.value: counts.get(grade, 0) for grade in LeadGrade}
 
 
 # 싱글톤 인스턴스 관리
 _scheduler_instances: Dict[str, OutreachSchedulerService] = {}
 
 
-def get_outreach_scheduler(db: Session, user_id: str) -> OutreachSchedulerService:
+def get_outreach_scheduler(db: AsyncSession, user_id: str) -> OutreachSchedulerService:
     """사용자별 스케줄러 인스턴스 반환"""
     if user_id not in _scheduler_instances:
         _scheduler_instances[user_id] = OutreachSchedulerService(db)
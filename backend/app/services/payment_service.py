@@ -6,7 +6,8 @@ import httpx
 import base64
 from datetime import datetime
 from typing import Optional, Dict
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 import uuid
 import os
 
@@ -25,7 +26,7 @@ TOSS_CLIENT_KEY = os.getenv("TOSS_CLIENT_KEY", "")
 class PaymentService:
     """토스페이먼츠 결제 서비스"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.subscription_service = SubscriptionService(db)
         self._auth_header = self._get_auth_header()
@@ -74,7 +75,7 @@ class PaymentService:
 
     # ==================== 결제 생성 ====================
 
-    def create_payment_intent(
+    async def create_payment_intent(
         self,
         user_id: str,
         amount: int,
@@ -97,8 +98,8 @@ class PaymentService:
         )
 
         self.db.add(payment)
-        self.db.commit()
-        self.db.refresh(payment)
+        await self.db.commit()
+        await self.db.refresh(payment)
 
         return payment
 
@@ -119,9 +120,7 @@ class PaymentService:
         result = await self._request("POST", "/payments/confirm", data)
 
         # DB에서 결제 조회
-        payment = self.db.query(Payment).filter(
-            Payment.pg_order_id == order_id
-        ).first()
+        payment = await self.get_payment_by_order_id(order_id)
 
         if not payment:
             raise PaymentError("PAYMENT_NOT_FOUND", "결제 정보를 찾을 수 없습니다")
@@ -146,18 +145,16 @@ class PaymentService:
 
         # 구독 처리
         if payment.subscription_id:
-            self._activate_subscription(payment)
+            await self._activate_subscription(payment)
 
-        self.db.commit()
-        self.db.refresh(payment)
+        await self.db.commit()
+        await self.db.refresh(payment)
 
         return payment
 
-    def _activate_subscription(self, payment: Payment):
+    async def _activate_subscription(self, payment: Payment):
         """결제 완료 후 구독 활성화"""
-        subscription = self.db.query(Subscription).filter(
-            Subscription.id == payment.subscription_id
-        ).first()
+        subscription = await self.db.get(Subscription, payment.subscription_id)
 
         if subscription:
             subscription.status = SubscriptionStatus.ACTIVE
@@ -174,7 +171,7 @@ class PaymentService:
         refund_amount: int = None
     ) -> Payment:
         """결제 취소"""
-        payment = self.db.query(Payment).filter(Payment.id == payment_id).first()
+        payment = await self.get_payment(payment_id)
 
         if not payment:
             raise PaymentError("PAYMENT_NOT_FOUND", "결제 정보를 찾을 수 없습니다")
@@ -206,8 +203,8 @@ class PaymentService:
         if payment.refunded_amount >= payment.amount:
             payment.status = PaymentStatus.REFUNDED
 
-        self.db.commit()
-        self.db.refresh(payment)
+        await self.db.commit()
+        await self.db.refresh(payment)
 
         return payment
 
@@ -255,7 +252,7 @@ class PaymentService:
             payment_method="card"
         )
         self.db.add(payment)
-        self.db.commit()
+        await self.db.commit()
 
         try:
             data = {
@@ -286,22 +283,25 @@ class PaymentService:
             payment.status = PaymentStatus.FAILED
             payment.metadata = {"error": {"code": e.code, "message": e.message}}
 
-        self.db.commit()
-        self.db.refresh(payment)
+        await self.db.commit()
+        await self.db.refresh(payment)
 
         return payment
 
     # ==================== 결제 조회 ====================
 
-    def get_payment(self, payment_id: str) -> Optional[Payment]:
+    async def get_payment(self, payment_id: str) -> Optional[Payment]:
         """결제 조회"""
-        return self.db.query(Payment).filter(Payment.id == payment_id).first()
+        return await self.db.get(Payment, payment_id)
 
-    def get_payment_by_order_id(self, order_id: str) -> Optional[Payment]:
+    async def get_payment_by_order_id(self, order_id: str) -> Optional[Payment]:
         """주문 ID로 결제 조회"""
-        return self.db.query(Payment).filter(Payment.pg_order_id == order_id).first()
+        result = await self.db.execute(
+            select(Payment).where(Payment.pg_order_id == order_id)
+        )
+        return result.scalars().first()
 
-    def get_user_payments(
+    async def get_user_payments(
         self,
         user_id: str,
         status: PaymentStatus = None,
@@ -309,12 +309,15 @@ class PaymentService:
         offset: int = 0
     ) -> list:
         """사용자 결제 내역 조회"""
-        query = self.db.query(Payment).filter(Payment.user_id == user_id)
+        query = select(Payment).where(Payment.user_id == user_id)
 
         if status:
-            query = query.filter(Payment.status == status)
+            query = query.where(Payment.status == status)
 
-        return query.order_by(Payment.created_at.desc()).offset(offset).limit(limit).all()
+        result = await self.db.execute(
+            query.order_by(Payment.created_at.desc()).offset(offset).limit(limit)
+        )
+        return list(result.scalars().all())
 
     async def get_payment_from_toss(self, payment_key: str) -> Dict:
         """토스에서 결제 정보 조회"""
@@ -329,6 +332,6 @@ class PaymentError(Exception):
         super().__init__(message)
 
 
-def get_payment_service(db: Session) -> PaymentService:
+def get_payment_service(db: AsyncSession) -> PaymentService:
     """서비스 인스턴스 생성"""
     return PaymentService(db)
@@ -14,6 +14,7 @@ from app.models.viral_common import (
     PerformanceEvent, PerformanceDaily,
     PerformanceEventType
 )
+from app.services.rollup_service import rollup_service
 
 
 class PerformanceTrackerService:
@@ -39,69 +40,17 @@ class PerformanceTrackerService:
             platform=platform,
             target_id=target_id,
             target_url=target_url,
-            metadata=metadata,
+            event_data=metadata,
             event_at=datetime.utcnow()
         )
         db.add(event)
+        # 일별 통계를 같은 트랜잭션에서 증가
+        await rollup_service.record_performance_events(db, [event])
         await db.commit()
         await db.refresh(event)
 
-        # 일별 통계 업데이트
-        await self._update_daily_stats(db, user_id, platform, event_type)
-
         return event
 
-    async def _update_daily_stats(
-        self,
-        db: AsyncSession,
-        user_id: str,
-        platform: str,
-        event_type: PerformanceEventType
-    ):
-        """일별 통계 업데이트"""
-        today = date.today()
-
-        # 기존 레코드 조회
-        result = await db.execute(
-            select(PerformanceDaily).where(
-                and_(
-                    PerformanceDaily.user_id == user_id,
-                    PerformanceDaily.platform == platform,
-                    PerformanceDaily.date == today
-                )
-            )
-        )
-        daily = result.scalar_one_or_none()
-
-        if not daily:
-            daily = PerformanceDaily(
-                id=str(uuid.uuid4()),
-                user_id=user_id,
-                platform=platform,
-                date=today
-            )
-            db.add(daily)
-
-        # 이벤트 유형별 카운터 증가
-        if event_type == PerformanceEventType.ANSWER_POSTED:
-            daily.answers_posted += 1
-        elif event_type == PerformanceEventType.ANSWER_ADOPTED:
-            daily.answers_adopted += 1
-        elif event_type == PerformanceEventType.COMMENT_POSTED:
-            daily.comments_posted += 1
-        elif event_type == PerformanceEventType.POST_CREATED:
-            daily.posts_created += 1
-        elif event_type == PerformanceEventType.LIKE_RECEIVED:
-            daily.likes_received += 1
-        elif event_type == PerformanceEventType.REPLY_RECEIVED:
-            daily.replies_received += 1
-        elif event_type == PerformanceEventType.CLICK_BLOG:
-            daily.blog_clicks += 1
-        elif event_type == PerformanceEventType.CLICK_PLACE:
-            daily.place_clicks += 1
-
-        await db.commit()
-
     async def get_daily_stats(
         self,
         db: AsyncSession,
@@ -169,46 +118,45 @@ class PerformanceTrackerService:
     ) -> Dict[str, Any]:
         """성과 요약"""
         start_date = date.today() - timedelta(days=days)
+        facts = rollup_service.performance_facts(user_id, start_date)
+        likes = facts.c.answer_likes + facts.c.comment_likes + facts.c.post_likes
 
-        # 일별 통계 조회
-        daily_stats = await self.get_daily_stats(
-            db, user_id, start_date=start_date
+        # 플랫폼별 집계
+        result = await db.execute(
+            select(
+                facts.c.platform,
+                func.sum(facts.c.answers_posted).label("answers_posted"),
+                func.sum(facts.c.answers_adopted).label("answers_adopted"),
+                func.sum(facts.c.comments_posted).label("comments_posted"),
+                func.sum(facts.c.posts_created).label("posts_created"),
+                func.sum(likes).label("likes_received"),
+                func.sum(facts.c.comment_replies).label("replies_received"),
+                func.sum(facts.c.blog_clicks).label("blog_clicks"),
+                func.sum(facts.c.place_clicks).label("place_clicks"),
+            ).group_by(facts.c.platform)
         )
+        totals = {row.platform: row for row in result}
 
-        # 플랫폼별 집계
+        knowledge = totals.get("knowledge")
         knowledge_stats = {
-            "answers_posted": 0,
-            "answers_adopted": 0,
+            "answers_posted": knowledge.answers_posted if knowledge else 0,
+            "answers_adopted": knowledge.answers_adopted if knowledge else 0,
             "adoption_rate": 0,
-            "likes_received": 0,
-            "blog_clicks": 0,
-            "place_clicks": 0
+            "likes_received": knowledge.likes_received if knowledge else 0,
+            "blog_clicks": knowledge.blog_clicks if knowledge else 0,
+            "place_clicks": knowledge.place_clicks if knowledge else 0
         }
 
+        cafe = totals.get("cafe")
         cafe_stats = {
-            "comments_posted": 0,
-            "posts_created": 0,
-            "likes_received": 0,
-            "replies_received": 0,
-            "blog_clicks": 0,
-            "place_clicks": 0
+            "comments_posted": cafe.comments_posted if cafe else 0,
+            "posts_created": cafe.posts_created if cafe else 0,
+            "likes_received": cafe.likes_received if cafe else 0,
+            "replies_received": cafe.replies_received if cafe else 0,
+            "blog_clicks": cafe.blog_clicks if cafe else 0,
+            "place_clicks": cafe.place_clicks if cafe else 0
         }
 
-        for stat in daily_stats:
-            if stat.platform == "knowledge":
-                knowledge_stats["answers_posted"] += stat.answers_posted
-                knowledge_stats["answers_adopted"] += stat.answers_adopted
-                knowledge_stats["likes_received"] += stat.likes_received
-                knowledge_stats["blog_clicks"] += stat.blog_clicks
-                knowledge_stats["place_clicks"] += stat.place_clicks
-            elif stat.platform == "cafe":
-                cafe_stats["comments_posted"] += stat.comments_posted
-                cafe_stats["posts_created"] += stat.posts_created
-                cafe_stats["likes_received"] += stat.likes_received
-                cafe_stats["replies_received"] += stat.replies_received
-                cafe_stats["blog_clicks"] += stat.blog_clicks
-                cafe_stats["place_clicks"] += stat.place_clicks
-
         # 채택률 계산
         if knowledge_stats["answers_posted"] > 0:
             knowledge_stats["adoption_rate"] = (
@@ -216,18 +164,25 @@ class PerformanceTrackerService:
             )
 
         # 일별 트렌드
-        daily_trend = []
-        for stat in sorted(daily_stats, key=lambda x: x.date):
-            daily_trend.append({
-                "date": stat.date.isoformat(),
-                "platform": stat.platform,
-                "activity": (
-                    stat.answers_posted + stat.comments_posted +
-                    stat.posts_created
-                ),
-                "engagement": stat.likes_received + stat.replies_received,
-                "clicks": stat.blog_clicks + stat.place_clicks
-            })
+        trend_result = await db.execute(
+            select(
+                facts.c.date,
+                facts.c.platform,
+                func.sum(facts.c.answers_posted + facts.c.comments_posted + facts.c.posts_created),
+                func.sum(likes + facts.c.comment_replies),
+                func.sum(facts.c.blog_clicks + facts.c.place_clicks),
+            ).group_by(facts.c.date, facts.c.platform).order_by(facts.c.date)
+        )
+        daily_trend = [
+            {
+                "date": stat_date.isoformat(),
+                "platform": platform,
+                "activity": activity,
+                "engagement": engagement,
+                "clicks": clicks
+            }
+            for stat_date, platform, activity, engagement, clicks in trend_result
+        ]
 
         return {
             "period_days": days,
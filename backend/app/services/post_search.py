@@ -0,0 +1,207 @@
+"""
+Post Search Index - 포스팅 전문 검색 인덱스
+제목/본문/원문 검색을 테이블 전체 스캔(ilike '%q%') 대신 인덱스로 처리합니다.
+
+- SQLite: FTS5 trigram 토크나이저 가상 테이블 (posts_fts)
+  띄어쓰기 없는 한국어도 부분 문자열로 검색되며, posts 테이블 트리거로 생성/수정/삭제가 자동 반영됩니다.
+- PostgreSQL: pg_trgm GIN 인덱스 (ilike 조건이 인덱스를 사용)
+- 인덱스를 만들 수 없거나 검색어가 3자 미만이면 기존 ilike 검색으로 동작
+
+posts_fts는 posts.id(post_id 컬럼)로 포스팅을 찾습니다. posts의 기본 키가 GUID라 rowid는
+VACUUM 등으로 번호가 바뀔 수 있으므로 rowid를 키로 쓰는 외부 콘텐츠 테이블로 만들지 않습니다.
+"""
+
+import html
+import logging
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import column, func, literal_column, or_, select, table, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.models import Post
+
+logger = logging.getLogger(__name__)
+
+# trigram 토크나이저는 3자 이상 검색어만 인덱스로 찾을 수 있음
+MIN_INDEXED_QUERY_LENGTH = 3
+
+SQLITE_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(
+        post_id UNINDEXED, title, generated_content, original_content,
+        tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_fts_ai AFTER INSERT ON posts BEGIN
+        INSERT INTO posts_fts(post_id, title, generated_content, original_content)
+        VALUES (new.id, new.title, new.generated_content, new.original_content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_fts_ad AFTER DELETE ON posts BEGIN
+        DELETE FROM posts_fts WHERE post_id = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_fts_au
+    AFTER UPDATE OF id, title, generated_content, original_content ON posts BEGIN
+        DELETE FROM posts_fts WHERE post_id = old.id;
+        INSERT INTO posts_fts(post_id, title, generated_content, original_content)
+        VALUES (new.id, new.title, new.generated_content, new.original_content);
+    END
+    """,
+]
+
+# 이전 버전(posts.rowid 키 외부 콘텐츠 테이블) 인덱스 제거
+SQLITE_FTS_DROP_DDL = [
+    "DROP TRIGGER IF EXISTS posts_fts_ai",
+    "DROP TRIGGER IF EXISTS posts_fts_ad",
+    "DROP TRIGGER IF EXISTS posts_fts_au",
+    "DROP TABLE IF EXISTS posts_fts",
+]
+
+SQLITE_FTS_FILL = """
+    INSERT INTO posts_fts(post_id, title, generated_content, original_content)
+    SELECT id, title, generated_content, original_content FROM posts
+"""
+
+POSTGRES_TRGM_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_posts_title_trgm ON posts USING gin (title gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_posts_generated_content_trgm "
+    "ON posts USING gin (generated_content gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_posts_original_content_trgm "
+    "ON posts USING gin (original_content gin_trgm_ops)",
+]
+
+posts_fts = table("posts_fts", column("post_id"))
+
+
+class PostSearchIndex:
+    """포스팅 검색 인덱스 관리 및 검색 조건 생성"""
+
+    def __init__(self):
+        # 사용 중인 인덱스 종류: "fts5", "pg_trgm", None(ilike 폴백)
+        self.backend: Optional[str] = None
+
+    async def ensure(self, engine: AsyncEngine) -> Optional[str]:
+        """
+        인덱스 생성 (이미 있으면 그대로 사용)
+
+        SQLite에서 가상 테이블을 새로 만든 경우(이전 형식 인덱스 교체 포함) 기존 포스팅으로 한 번 채웁니다.
+        """
+        dialect = engine.dialect.name
+        try:
+            async with engine.begin() as conn:
+                if dialect == "sqlite":
+                    existing = await conn.execute(
+                        text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'posts_fts'")
+                    )
+                    current = existing.scalar()
+                    if current is not None and "post_id" not in current:
+                        for statement in SQLITE_FTS_DROP_DDL:
+                            await conn.execute(text(statement))
+                        current = None
+                    for statement in SQLITE_FTS_DDL:
+                        await conn.execute(text(statement))
+                    if current is None:
+                        await conn.execute(text(SQLITE_FTS_FILL))
+                    self.backend = "fts5"
+                elif dialect == "postgresql":
+                    for statement in POSTGRES_TRGM_DDL:
+                        await conn.execute(text(statement))
+                    self.backend = "pg_trgm"
+                else:
+                    self.backend = None
+        except Exception as e:
+            # FTS5/trigram 미지원 SQLite(3.34 미만) 또는 확장 생성 권한 없음
+            logger.warning(f"검색 인덱스를 사용할 수 없어 기본 검색으로 동작합니다: {e}")
+            self.backend = None
+        return self.backend
+
+    def apply(self, query, q: str) -> Tuple[object, Optional[object]]:
+        """
+        검색 조건 적용
+
+        Returns:
+            (검색 조건이 적용된 쿼리, 관련도 정렬식 또는 None)
+            정렬식은 오름차순이 관련도 높은 순입니다.
+        """
+        q = q.strip()
+        if self.backend == "fts5" and len(q) >= MIN_INDEXED_QUERY_LENGTH:
+            # 검색어 전체를 하나의 문구로 (ilike '%q%'와 같은 부분 문자열 일치)
+            phrase = '"' + q.replace('"', '""') + '"'
+            matches = (
+                select(
+                    posts_fts.c.post_id.label("post_id"),
+                    # 제목 일치에 가중치 (post_id는 검색 대상 아님)
+                    func.bm25(literal_column("posts_fts"), 0.0, 10.0, 2.0, 1.0).label("rank"),
+                )
+                .where(literal_column("posts_fts").op("MATCH")(phrase))
+                .subquery("fts_matches")
+            )
+            query = query.join(matches, matches.c.post_id == Post.id)
+            return query, matches.c.rank
+
+        search_term = f"%{q}%"
+        query = query.where(
+            or_(
+                Post.title.ilike(search_term),
+                Post.generated_content.ilike(search_term),
+                Post.original_content.ilike(search_term),
+            )
+        )
+        if self.backend == "pg_trgm":
+            rank = -(
+                func.word_similarity(q, func.coalesce(Post.title, "")) * 2
+                + func.word_similarity(q, func.coalesce(Post.generated_content, ""))
+            )
+            return query, rank
+        return query, None
+
+    async def snippets(
+        self, db: AsyncSession, post_ids: List[UUID], q: str, width: int = 60
+    ) -> Dict[str, str]:
+        """현재 페이지 포스팅의 검색어 주변 본문 (HTML 이스케이프 후 <mark> 강조)"""
+        if not post_ids or not q.strip():
+            return {}
+        rows = await db.execute(
+            select(Post.id, Post.title, Post.generated_content, Post.original_content)
+            .where(Post.id.in_(post_ids))
+        )
+        needle = q.strip().lower()
+        snippets = {}
+        for row in rows:
+            fields = [row.generated_content, row.original_content, row.title]
+            # 검색어가 들어 있는 첫 필드에서 발췌 (없으면 본문 앞부분)
+            content = next(
+                (field for field in fields if field and needle in field.lower()),
+                next((field for field in fields if field), ""),
+            )
+            snippets[str(row.id)] = make_snippet(content, q, width)
+        return snippets
+
+
+def make_snippet(content: str, q: str, width: int = 60) -> str:
+    """검색어 첫 등장 위치 주변 발췌 (없으면 앞부분)"""
+    q = q.strip()
+    position = content.lower().find(q.lower()) if q else -1
+    if position < 0:
+        excerpt = content[: width * 2]
+        return html.escape(excerpt) + ("…" if len(content) > len(excerpt) else "")
+
+    start = max(0, position - width)
+    end = min(len(content), position + len(q) + width)
+    return (
+        ("…" if start > 0 else "")
+        + html.escape(content[start:position])
+        + "<mark>" + html.escape(content[position:position + len(q)]) + "</mark>"
+        + html.escape(content[position + len(q):end])
+        + ("…" if end < len(content) else "")
+    )
+
+
+# Singleton instance
+post_search_index = PostSearchIndex()
@@ -13,11 +13,13 @@ from app.models import User, DoctorProfile, Post, PostVersion, AIUsage, calculat
 from app.models.top_post_analysis import AggregatedPattern
 from app.services.ai_rewrite_engine import ai_rewrite_engine
 from app.services.medical_law_checker import medical_law_checker
+from app.services.compliance_rules import compliance_rule_store
 from app.services.persuasion_scorer import persuasion_scorer
 from app.services.seo_optimizer import seo_optimizer
 from app.services.forbidden_words_checker import forbidden_words_checker
 from app.services.content_analyzer import content_analyzer
 from app.services.dia_crank_analyzer import dia_crank_analyzer
+from app.services.stage_executor import StageExecutor
 from app.services.top_post_analyzer import detect_category, CATEGORIES
 
 
@@ -40,6 +42,8 @@ class PostService:
         ai_model: Optional[str] = None,
         seo_optimization: Optional[Dict] = None,
         top_post_rules: Optional[Dict] = None,
+        extras_mode: str = "separate",
+        stream: bool = False,
         websocket_manager=None,
         task_id: str = None,
     ) -> Post:
@@ -58,6 +62,9 @@ class PostService:
             ai_provider: AI 제공자 ("claude" 또는 "gpt")
             ai_model: 사용할 모델
             seo_optimization: SEO 최적화 설정 (DIA/CRANK)
+            extras_mode: 제목/추천 제목/소제목/DIA·CRANK 생성 방식
+                ("separate": 항목별 개별 호출, "combined": 한 번의 구조화 호출 후 누락 항목만 개별 호출)
+            stream: True면 각색 본문을 토큰 스트리밍으로 생성하여 WebSocket delta 메시지로 전송
             websocket_manager: WebSocket 관리자 (선택)
             task_id: 작업 ID (WebSocket 사용 시 필수)
 
@@ -119,7 +126,7 @@ class PostService:
         else:
             target_audience = None
 
-        generated_content = await ai_rewrite_engine.generate(
+        generation_options = dict(
             original_content=original_content,
             doctor_profile=profile_dict,
             framework=framework,
@@ -134,8 +141,22 @@ class PostService:
             top_post_rules=top_post_rules,
         )
 
+        if stream and websocket_manager:
+            async def send_delta(delta: str, length: int):
+                try:
+                    await websocket_manager.send_delta(str(user_id), task_id, delta, length)
+                except Exception as e:
+                    print(f"WebSocket error: {e}")
+
+            generated_content = await ai_rewrite_engine.generate_streaming(
+                on_delta=send_delta, **generation_options
+            )
+        else:
+            generated_content = await ai_rewrite_engine.generate(**generation_options)
+
         # AI 사용량 기록
         usage_info = None
+        ai_usage = None
         if hasattr(ai_rewrite_engine, 'last_usage') and ai_rewrite_engine.last_usage:
             usage = ai_rewrite_engine.last_usage
             cost = calculate_cost(
@@ -149,7 +170,7 @@ class PostService:
                 **cost,
             }
 
-            # DB에 사용량 저장
+            # 사용량 레코드는 포스팅과 함께 저장 (flush하면 이후 AI 호출 내내 쓰기 커넥션을 점유)
             try:
                 ai_usage = AIUsage(
                     user_id=user_id,
@@ -162,14 +183,18 @@ class PostService:
                     cost_krw=cost.get("total_cost_krw", 0),
                     request_type="content_generation",
                     content_length=len(generated_content),
+                    target_length=usage.get("target_length"),
+                    length_multiplier=usage.get("length_multiplier"),
+                    raw_content_length=usage.get("raw_content_length"),
+                    generation_attempts=usage.get("generation_attempts"),
                 )
-                db.add(ai_usage)
-                await db.flush()  # 즉시 저장
             except Exception as e:
                 print(f"AI 사용량 기록 실패: {e}")
 
-        # 3. 의료법 검증
+        # 3. 의료법 검증 (본문을 수정하므로 후처리 단계보다 먼저 실행)
         await send_progress("law_check", 50, "의료법 준수 여부를 검증하고 있습니다...", {})
+        # 다른 워커에서 관리자가 수정한 규칙 반영 (일정 간격으로 변경 여부만 확인)
+        await compliance_rule_store.refresh_if_stale()
         law_check = medical_law_checker.check(generated_content)
 
         # 위반 사항이 있으면 자동 수정
@@ -183,65 +208,41 @@ class PostService:
             law_check["auto_fixed"] = True
             law_check["changes"] = changes
 
-        # 4. 설득력 점수 계산
-        await send_progress("scoring", 70, "설득력 점수를 계산하고 있습니다...", {})
-        persuasion_scores = persuasion_scorer.calculate_score(generated_content)
-
-        # 5. SEO 최적화
-        await send_progress("seo", 80, "SEO 최적화를 진행하고 있습니다...", {})
-        medical_terms = seo_optimizer._extract_medical_terms(generated_content)
+        # 4. 금칙어 검사 및 자동 대체 (이후 단계는 확정된 본문을 사용)
+        await send_progress("forbidden", 58, "금칙어를 검사하고 있습니다...", {})
+        generated_content, forbidden_replacements = forbidden_words_checker.check_and_replace(generated_content)
 
         # user가 None이어도 작동하도록
         hospital_name = user.hospital_name if user else ""
         specialty = user.specialty if user else "의료"
         location = self._extract_location(hospital_name)
 
-        seo_keywords = seo_optimizer.extract_keywords(
-            generated_content, specialty, location
+        # 5. 후처리 단계 동시 실행
+        # AI 단계(제목/추천 제목/소제목)와 CPU 단계(점수/SEO/분석)는 모두 본문에만 의존하고,
+        # DIA/CRANK 분석만 제목 생성 결과를 기다림
+        await send_progress("post_processing", 60, "제목, 점수, SEO 분석을 동시에 진행하고 있습니다...", {})
+        stage_results = await self._run_post_processing(
+            generated_content, specialty, location, send_progress, extras_mode
         )
 
-        hashtags = seo_optimizer.generate_hashtags(
-            generated_content, medical_terms, specialty, location
-        )
+        persuasion_scores = stage_results["scoring"]
+        seo_keywords = stage_results["seo"]["keywords"]
+        hashtags = stage_results["seo"]["hashtags"]
+        content_analysis = stage_results["analyzing"]
+        suggested_titles = stage_results["titles"]
+        suggested_subtitles = stage_results["subtitles"]
+        dia_crank_analysis = stage_results["dia_crank"]
 
-        # 6. 제목 및 메타 설명 생성
-        await send_progress("title", 80, "제목과 메타 설명을 생성하고 있습니다...", {})
-        title_meta = await ai_rewrite_engine.generate_title_and_meta(
-            generated_content, specialty
-        )
-
-        title = title_meta.get("title", "")
+        title_meta = stage_results["title"]
+        title = title_meta["title"]
         meta_description = title_meta.get("meta_description", "")
         ai_hashtags = title_meta.get("hashtags", [])
 
-        # 7. 금칙어 검사 및 자동 대체
-        await send_progress("forbidden", 85, "금칙어를 검사하고 있습니다...", {})
-        generated_content, forbidden_replacements = forbidden_words_checker.check_and_replace(generated_content)
-
-        # 제목도 금칙어 검사
-        title, title_replacements = forbidden_words_checker.check_and_replace(title)
-
         forbidden_check_result = {
             "content_replacements": forbidden_replacements,
-            "title_replacements": title_replacements,
+            "title_replacements": title_meta["title_replacements"],
         }
 
-        # 8. 콘텐츠 분석 (글자수, 키워드)
-        await send_progress("analyzing", 88, "콘텐츠를 분석하고 있습니다...", {})
-        content_analysis = content_analyzer.analyze(generated_content)
-
-        # 9. 후킹성 제목 5개 생성
-        await send_progress("titles", 91, "추천 제목을 생성하고 있습니다...", {})
-        suggested_titles = await ai_rewrite_engine.generate_hooking_titles(generated_content, specialty)
-
-        # 10. 소제목 4개 생성
-        await send_progress("subtitles", 94, "추천 소제목을 생성하고 있습니다...", {})
-        suggested_subtitles = await ai_rewrite_engine.generate_subtitles(generated_content)
-
-        # 11. DIA/CRANK 분석
-        await send_progress("dia_crank", 96, "DIA/CRANK 점수를 분석하고 있습니다...", {})
-        dia_crank_analysis = await dia_crank_analyzer.analyze(generated_content, title)
-
         # 제목에서 메인 키워드 추출 (띄어쓰기 제거)
         main_keyword = seo_optimizer.extract_keyword_from_title(title)
 
@@ -252,7 +253,7 @@ class PostService:
         # 해시태그 병합 (중복 제거)
         all_hashtags = list(set(hashtags + [f"#{tag}" for tag in ai_hashtags]))[:15]
 
-        # 12. DB에 저장
+        # 6. DB에 저장
         await send_progress("saving", 98, "포스팅을 저장하고 있습니다...", {})
         post = Post(
             user_id=user_id,
@@ -273,11 +274,13 @@ class PostService:
             dia_crank_analysis=dia_crank_analysis,
         )
 
+        if ai_usage is not None:
+            db.add(ai_usage)
         db.add(post)
         await db.commit()
         await db.refresh(post)
 
-        # 8. 첫 번째 버전 저장
+        # 7. 첫 번째 버전 저장
         version = PostVersion(
             post_id=post.id,
             version_number=1,
@@ -314,6 +317,107 @@ class PostService:
 
         return post
 
+    async def _run_post_processing(
+        self,
+        content: str,
+        specialty: str,
+        location: str,
+        send_progress,
+        extras_mode: str = "separate",
+    ) -> Dict:
+        """
+        본문 확정 이후의 후처리 단계를 의존 관계에 따라 동시 실행
+
+        extras_mode가 "combined"이면 AI 단계들이 한 번의 통합 호출(extras) 결과를 사용하고,
+        파싱되지 않은 항목만 기존 개별 메서드로 생성합니다.
+
+        Returns:
+            {단계 이름: 결과} - scoring, seo, analyzing, title, titles, subtitles, dia_crank
+            (combined 모드에서는 extras 포함)
+        """
+
+        def extract_seo(_results: Dict) -> Dict:
+            medical_terms = seo_optimizer._extract_medical_terms(content)
+            return {
+                "keywords": seo_optimizer.extract_keywords(content, specialty, location),
+                "hashtags": seo_optimizer.generate_hashtags(
+                    content, medical_terms, specialty, location
+                ),
+            }
+
+        combined = extras_mode == "combined"
+        ai_deps = ("extras",) if combined else ()
+
+        def extra(results: Dict, key: str):
+            return results.get("extras", {}).get(key)
+
+        async def generate_title(results: Dict) -> Dict:
+            if extra(results, "title"):
+                title_meta = {
+                    key: results["extras"][key]
+                    for key in ("title", "meta_description", "hashtags")
+                }
+            else:
+                title_meta = await ai_rewrite_engine.generate_title_and_meta(content, specialty)
+            # 제목도 금칙어 검사
+            title, title_replacements = forbidden_words_checker.check_and_replace(
+                title_meta.get("title", "")
+            )
+            return {**title_meta, "title": title, "title_replacements": title_replacements}
+
+        async def on_stage_complete(stage, completed: int, total: int):
+            progress = 60 + int(36 * completed / total)
+            await send_progress(stage.name, progress, stage.message, {
+                "completed": completed,
+                "total": total,
+            })
+
+        executor = StageExecutor(on_stage_complete=on_stage_complete)
+        executor.add(
+            "scoring", lambda _: persuasion_scorer.calculate_score(content),
+            message="설득력 점수 계산이 완료되었습니다.", blocking=True,
+        )
+        executor.add(
+            "seo", extract_seo,
+            message="SEO 키워드 분석이 완료되었습니다.", blocking=True,
+        )
+        executor.add(
+            "analyzing", lambda _: content_analyzer.analyze(content),
+            message="콘텐츠 분석이 완료되었습니다.", blocking=True,
+        )
+        if combined:
+            executor.add(
+                "extras", lambda _: ai_rewrite_engine.generate_post_extras(content, specialty),
+                message="제목, 소제목, DIA/CRANK 분석을 한 번에 생성했습니다.",
+            )
+        executor.add(
+            "title", generate_title, depends_on=ai_deps,
+            message="제목과 메타 설명이 생성되었습니다.",
+        )
+        executor.add(
+            "titles",
+            lambda results: extra(results, "suggested_titles")
+            or ai_rewrite_engine.generate_hooking_titles(content, specialty),
+            depends_on=ai_deps,
+            message="추천 제목이 생성되었습니다.",
+        )
+        executor.add(
+            "subtitles",
+            lambda results: extra(results, "suggested_subtitles")
+            or ai_rewrite_engine.generate_subtitles(content),
+            depends_on=ai_deps,
+            message="추천 소제목이 생성되었습니다.",
+        )
+        executor.add(
+            "dia_crank",
+            lambda results: extra(results, "dia_crank_analysis")
+            or dia_crank_analyzer.analyze(content, results["title"]["title"]),
+            depends_on=ai_deps + ("title",),
+            message="DIA/CRANK 점수 분석이 완료되었습니다.",
+        )
+
+        return await executor.run()
+
     async def rewrite_post(
         self,
         db: AsyncSession,
@@ -367,6 +471,7 @@ class PostService:
         )
 
         # 검증 및 점수 계산
+        await compliance_rule_store.refresh_if_stale()
         law_check = medical_law_checker.check(generated_content)
         if not law_check["is_compliant"]:
             generated_content, _ = medical_law_checker.auto_fix(generated_content)
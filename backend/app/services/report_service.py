@@ -7,8 +7,7 @@ from typing import Optional, Dict, List, Any
 from datetime import datetime, date, timedelta
 from calendar import monthrange
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, and_, case, func
 import json
 import io
 
@@ -18,6 +17,7 @@ from app.models.report import (
 )
 from app.models.post import Post, PostStatus, PostAnalytics
 from app.models.subscription import UsageLog
+from app.services.analytics_service import day_of, day_key, top_keywords
 
 logger = logging.getLogger(__name__)
 
@@ -109,98 +109,91 @@ class ReportService:
         start_dt = datetime.combine(period_start, datetime.min.time())
         end_dt = datetime.combine(period_end, datetime.max.time())
 
-        # 1. 포스트 통계 수집
-        posts_query = select(Post).where(
-            and_(
-                Post.user_id == user_id,
-                Post.created_at >= start_dt,
-                Post.created_at <= end_dt,
+        in_period = [
+            Post.user_id == user_id,
+            Post.created_at >= start_dt,
+            Post.created_at <= end_dt,
+        ]
+        # 0점/미채점 포스팅은 점수 통계에서 제외
+        scored = and_(Post.persuasion_score.isnot(None), Post.persuasion_score != 0)
+
+        # 1. 포스트 통계 집계
+        totals = (await db.execute(
+            select(
+                func.count(Post.id).label("total"),
+                func.count(case((Post.status == PostStatus.PUBLISHED, 1))).label("published"),
+                func.count(case((Post.status == PostStatus.DRAFT, 1))).label("draft"),
+                func.avg(case((scored, Post.persuasion_score))).label("avg_score"),
+            ).where(*in_period)
+        )).one()
+
+        engagement = (await db.execute(
+            select(
+                func.coalesce(func.sum(PostAnalytics.views), 0),
+                func.coalesce(func.sum(PostAnalytics.inquiries), 0),
             )
-        ).options(selectinload(Post.analytics))
-
-        posts_result = await db.execute(posts_query)
-        posts = posts_result.scalars().all()
+            .join(Post, Post.id == PostAnalytics.post_id)
+            .where(*in_period)
+        )).one()
 
         # 2. 요약 통계 계산
-        total_posts = len(posts)
-        published_posts = len([p for p in posts if p.status == PostStatus.PUBLISHED])
-        draft_posts = len([p for p in posts if p.status == PostStatus.DRAFT])
-
-        persuasion_scores = [p.persuasion_score for p in posts if p.persuasion_score]
-        avg_persuasion_score = sum(persuasion_scores) / len(persuasion_scores) if persuasion_scores else 0
-
-        total_views = sum(p.analytics.views if p.analytics else 0 for p in posts)
-        total_inquiries = sum(p.analytics.inquiries if p.analytics else 0 for p in posts)
+        total_posts = totals.total
+        published_posts = totals.published
+        total_views, total_inquiries = engagement
 
         summary = {
             "total_posts": total_posts,
             "published_posts": published_posts,
-            "draft_posts": draft_posts,
+            "draft_posts": totals.draft,
             "publish_rate": round(published_posts / total_posts * 100, 1) if total_posts > 0 else 0,
-            "avg_persuasion_score": round(avg_persuasion_score, 1),
+            "avg_persuasion_score": round(totals.avg_score or 0, 1),
             "total_views": total_views,
             "total_inquiries": total_inquiries,
             "avg_views_per_post": round(total_views / published_posts, 1) if published_posts > 0 else 0,
         }
 
         # 3. 설득력 점수 트렌드
-        persuasion_trend = []
-        current_date = period_start
-        while current_date <= period_end:
-            day_posts = [
-                p for p in posts
-                if p.created_at.date() == current_date and p.persuasion_score
-            ]
-            if day_posts:
-                day_avg = sum(p.persuasion_score for p in day_posts) / len(day_posts)
-                persuasion_trend.append({
-                    "date": current_date.isoformat(),
-                    "score": round(day_avg, 1),
-                    "count": len(day_posts),
-                })
-            current_date += timedelta(days=1)
+        day = day_of(Post.created_at).label("day")
+        trend_rows = await db.execute(
+            select(day, func.avg(Post.persuasion_score), func.count())
+            .where(*in_period, scored)
+            .group_by(day)
+            .order_by(day)
+        )
+        persuasion_trend = [
+            {"date": day_key(day_value), "score": round(score, 1), "count": count}
+            for day_value, score, count in trend_rows
+        ]
 
         # 4. 키워드 분석
-        all_keywords = []
-        for post in posts:
-            if post.seo_keywords:
-                if isinstance(post.seo_keywords, list):
-                    all_keywords.extend(post.seo_keywords)
-                elif isinstance(post.seo_keywords, dict) and 'keywords' in post.seo_keywords:
-                    all_keywords.extend(post.seo_keywords['keywords'])
-
-        keyword_counts = {}
-        for kw in all_keywords:
-            keyword_counts[kw] = keyword_counts.get(kw, 0) + 1
-
-        top_keywords = sorted(
-            keyword_counts.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:10]
-
-        keyword_analysis = {
-            "total_unique_keywords": len(keyword_counts),
-            "top_keywords": [{"keyword": kw, "count": count} for kw, count in top_keywords],
-        }
+        keyword_analysis = await top_keywords(db, in_period, limit=10)
 
         # 5. 상위 포스트
-        sorted_posts = sorted(
-            [p for p in posts if p.persuasion_score],
-            key=lambda x: x.persuasion_score,
-            reverse=True
-        )[:5]
+        views = (
+            select(func.max(PostAnalytics.views))
+            .where(PostAnalytics.post_id == Post.id)
+            .scalar_subquery()
+        )
+        top_rows = await db.execute(
+            select(
+                Post.id, Post.title, Post.persuasion_score, Post.status, Post.created_at,
+                func.coalesce(views, 0).label("views"),
+            )
+            .where(*in_period, scored)
+            .order_by(Post.persuasion_score.desc())
+            .limit(5)
+        )
 
         top_posts = [
             {
-                "id": str(p.id),
-                "title": p.title,
-                "persuasion_score": p.persuasion_score,
-                "status": p.status.value,
-                "views": p.analytics.views if p.analytics else 0,
-                "created_at": p.created_at.isoformat(),
+                "id": str(row.id),
+                "title": row.title,
+                "persuasion_score": row.persuasion_score,
+                "status": row.status.value,
+                "views": row.views,
+                "created_at": row.created_at.isoformat(),
             }
-            for p in sorted_posts
+            for row in top_rows
         ]
 
         # 6. 개선 제안 생성
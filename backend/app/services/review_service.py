@@ -16,6 +16,7 @@ from app.models.place_review import (
 )
 from app.models.naver_place import NaverPlace
 from app.services.ai_service import AIService
+from app.services.rollup_service import rollup_service
 
 logger = logging.getLogger(__name__)
 
@@ -96,9 +97,11 @@ class ReviewService:
 
         if existing:
             # 업데이트
+            before = rollup_service.review_row(existing)
             for key, value in kwargs.items():
                 if hasattr(existing, key):
                     setattr(existing, key, value)
+            await rollup_service.record_review_change(db, before, existing)
             await db.commit()
             await db.refresh(existing)
             return existing
@@ -121,6 +124,7 @@ class ReviewService:
                 review.needs_attention = True
 
         db.add(review)
+        await rollup_service.record_review_change(db, None, review)
         await db.commit()
         await db.refresh(review)
 
@@ -159,12 +163,14 @@ class ReviewService:
         if not review:
             raise ValueError("Review not found")
 
+        before = rollup_service.review_row(review)
         review.is_replied = True
         review.reply_content = reply_content
         review.replied_at = datetime.utcnow()
         review.reply_by = reply_by
         review.needs_attention = False
 
+        await rollup_service.record_review_change(db, before, review)
         await db.commit()
         await db.refresh(review)
 
@@ -253,82 +259,44 @@ class ReviewService:
         if not end_date:
             end_date = date.today()
 
+        facts = rollup_service.review_facts(place_db_id, start_date, end_date)
+
         # 기본 통계
         query = select(
-            func.count(PlaceReview.id).label("total"),
-            func.avg(PlaceReview.rating).label("avg_rating"),
-            func.sum(func.cast(PlaceReview.is_replied, Integer)).label("replied"),
-        ).where(
-            and_(
-                PlaceReview.place_id == place_db_id,
-                PlaceReview.written_at >= datetime.combine(start_date, datetime.min.time()),
-                PlaceReview.written_at <= datetime.combine(end_date, datetime.max.time()),
-            )
+            func.sum(facts.c.reviews).label("total"),
+            func.sum(facts.c.rated).label("rated"),
+            func.sum(facts.c.rating_sum).label("rating_sum"),
+            func.sum(facts.c.replied).label("replied"),
+            func.sum(facts.c.positive).label("positive"),
+            func.sum(facts.c.negative).label("negative"),
+            func.sum(facts.c.neutral).label("neutral"),
+            *[func.sum(facts.c[f"rating_{i}"]).label(f"rating_{i}") for i in range(1, 6)],
         )
 
         result = await db.execute(query)
         row = result.one()
 
         total = row.total or 0
-        avg_rating = round(row.avg_rating or 0, 1)
+        avg_rating = round(row.rating_sum / row.rated, 1) if row.rated else 0
         replied = row.replied or 0
 
         # 감성별 통계
-        sentiment_query = select(
-            PlaceReview.sentiment,
-            func.count(PlaceReview.id).label("count"),
-        ).where(
-            and_(
-                PlaceReview.place_id == place_db_id,
-                PlaceReview.written_at >= datetime.combine(start_date, datetime.min.time()),
-                PlaceReview.written_at <= datetime.combine(end_date, datetime.max.time()),
-            )
-        ).group_by(PlaceReview.sentiment)
-
-        sentiment_result = await db.execute(sentiment_query)
-        sentiment_rows = sentiment_result.all()
-
         sentiment_breakdown = {
-            "positive": 0,
-            "negative": 0,
-            "neutral": 0,
+            "positive": row.positive or 0,
+            "negative": row.negative or 0,
+            "neutral": row.neutral or 0,
         }
-        for s_row in sentiment_rows:
-            if s_row.sentiment:
-                sentiment_breakdown[s_row.sentiment.value] = s_row.count
 
         # 평점별 통계
-        rating_query = select(
-            PlaceReview.rating,
-            func.count(PlaceReview.id).label("count"),
-        ).where(
-            and_(
-                PlaceReview.place_id == place_db_id,
-                PlaceReview.written_at >= datetime.combine(start_date, datetime.min.time()),
-                PlaceReview.written_at <= datetime.combine(end_date, datetime.max.time()),
-            )
-        ).group_by(PlaceReview.rating)
-
-        rating_result = await db.execute(rating_query)
-        rating_rows = rating_result.all()
-
-        rating_breakdown = {i: 0 for i in range(1, 6)}
-        for r_row in rating_rows:
-            if r_row.rating:
-                rating_breakdown[r_row.rating] = r_row.count
+        rating_breakdown = {i: getattr(row, f"rating_{i}") or 0 for i in range(1, 6)}
 
         # 일별 트렌드
         daily_query = select(
-            func.date(PlaceReview.written_at).label("date"),
-            func.count(PlaceReview.id).label("count"),
-            func.avg(PlaceReview.rating).label("avg_rating"),
-        ).where(
-            and_(
-                PlaceReview.place_id == place_db_id,
-                PlaceReview.written_at >= datetime.combine(start_date, datetime.min.time()),
-                PlaceReview.written_at <= datetime.combine(end_date, datetime.max.time()),
-            )
-        ).group_by(func.date(PlaceReview.written_at)).order_by("date")
+            facts.c.date,
+            func.sum(facts.c.reviews).label("count"),
+            func.sum(facts.c.rated).label("rated"),
+            func.sum(facts.c.rating_sum).label("rating_sum"),
+        ).group_by(facts.c.date).order_by(facts.c.date)
 
         daily_result = await db.execute(daily_query)
         daily_rows = daily_result.all()
@@ -337,7 +305,7 @@ class ReviewService:
             {
                 "date": str(d_row.date),
                 "count": d_row.count,
-                "avg_rating": round(d_row.avg_rating or 0, 1),
+                "avg_rating": round(d_row.rating_sum / d_row.rated, 1) if d_row.rated else 0,
             }
             for d_row in daily_rows
         ]
@@ -463,7 +431,3 @@ class ReviewService:
         await db.refresh(template)
 
         return template
-
-
-# Integer 임포트
-from sqlalchemy import Integer
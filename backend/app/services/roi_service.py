@@ -7,7 +7,7 @@ from typing import Optional, Dict, List, Any
 from datetime import datetime, date, timedelta
 from calendar import monthrange
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func, desc
+from sqlalchemy import select, and_, case, func, desc
 from sqlalchemy.orm import selectinload
 import uuid
 
@@ -15,6 +15,7 @@ from app.models.roi_tracker import (
     ConversionEvent, ROISummary, KeywordROI, FunnelStage, MarketingCost,
     EventType
 )
+from app.services.rollup_service import rollup_service
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +54,7 @@ class ROIService:
         )
 
         db.add(event)
+        await rollup_service.record_roi_events(db, [event])
         await db.commit()
         await db.refresh(event)
 
@@ -75,6 +77,7 @@ class ROIService:
             db.add(event)
             created_events.append(event)
 
+        await rollup_service.record_roi_events(db, created_events)
         await db.commit()
         for event in created_events:
             await db.refresh(event)
@@ -175,17 +178,12 @@ class ROIService:
     ) -> Dict[str, Any]:
         """기본 이벤트 통계"""
         # 이벤트 타입별 카운트
+        facts = rollup_service.roi_facts(user_id, start_date, end_date)
         query = select(
-            ConversionEvent.event_type,
-            func.count(ConversionEvent.id).label("count"),
-            func.sum(ConversionEvent.revenue).label("revenue"),
-        ).where(
-            and_(
-                ConversionEvent.user_id == user_id,
-                ConversionEvent.event_date >= start_date,
-                ConversionEvent.event_date <= end_date,
-            )
-        ).group_by(ConversionEvent.event_type)
+            facts.c.event_type,
+            func.sum(facts.c.events).label("count"),
+            func.sum(facts.c.revenue).label("revenue"),
+        ).group_by(facts.c.event_type)
 
         result = await db.execute(query)
         rows = result.all()
@@ -234,19 +232,15 @@ class ROIService:
         end_date: date,
     ) -> List[Dict[str, Any]]:
         """채널별 분석"""
+        facts = rollup_service.roi_facts(user_id, start_date, end_date)
         query = select(
-            ConversionEvent.channel,
-            ConversionEvent.event_type,
-            func.count(ConversionEvent.id).label("count"),
-            func.sum(ConversionEvent.revenue).label("revenue"),
+            facts.c.channel,
+            facts.c.event_type,
+            func.sum(facts.c.events).label("count"),
+            func.sum(facts.c.revenue).label("revenue"),
         ).where(
-            and_(
-                ConversionEvent.user_id == user_id,
-                ConversionEvent.event_date >= start_date,
-                ConversionEvent.event_date <= end_date,
-                ConversionEvent.channel.isnot(None),
-            )
-        ).group_by(ConversionEvent.channel, ConversionEvent.event_type)
+            facts.c.channel != "",
+        ).group_by(facts.c.channel, facts.c.event_type)
 
         result = await db.execute(query)
         rows = result.all()
@@ -281,18 +275,14 @@ class ROIService:
         end_date: date,
     ) -> List[Dict[str, Any]]:
         """소스별 분석"""
+        facts = rollup_service.roi_facts(user_id, start_date, end_date)
         query = select(
-            ConversionEvent.source,
-            func.count(ConversionEvent.id).label("count"),
-            func.sum(ConversionEvent.revenue).label("revenue"),
+            facts.c.source,
+            func.sum(facts.c.events).label("count"),
+            func.sum(facts.c.revenue).label("revenue"),
         ).where(
-            and_(
-                ConversionEvent.user_id == user_id,
-                ConversionEvent.event_date >= start_date,
-                ConversionEvent.event_date <= end_date,
-                ConversionEvent.source.isnot(None),
-            )
-        ).group_by(ConversionEvent.source)
+            facts.c.source != "",
+        ).group_by(facts.c.source)
 
         result = await db.execute(query)
         rows = result.all()
@@ -310,17 +300,12 @@ class ROIService:
         end_date: date,
     ) -> List[Dict[str, Any]]:
         """일별 트렌드"""
+        facts = rollup_service.roi_facts(user_id, start_date, end_date)
         query = select(
-            ConversionEvent.event_date,
-            ConversionEvent.event_type,
-            func.count(ConversionEvent.id).label("count"),
-        ).where(
-            and_(
-                ConversionEvent.user_id == user_id,
-                ConversionEvent.event_date >= start_date,
-                ConversionEvent.event_date <= end_date,
-            )
-        ).group_by(ConversionEvent.event_date, ConversionEvent.event_type).order_by(ConversionEvent.event_date)
+            facts.c.date,
+            facts.c.event_type,
+            func.sum(facts.c.events).label("count"),
+        ).group_by(facts.c.date, facts.c.event_type).order_by(facts.c.date)
 
         result = await db.execute(query)
         rows = result.all()
@@ -384,19 +369,15 @@ class ROIService:
         limit: int = 10,
     ) -> List[Dict[str, Any]]:
         """상위 키워드 분석"""
+        facts = rollup_service.roi_facts(user_id, start_date, end_date)
         query = select(
-            ConversionEvent.keyword,
-            func.count(ConversionEvent.id).label("total_count"),
-            func.sum(func.cast(ConversionEvent.event_type == EventType.RESERVATION, Integer)).label("conversions"),
-            func.sum(ConversionEvent.revenue).label("revenue"),
+            facts.c.keyword,
+            func.sum(facts.c.events).label("total_count"),
+            func.sum(case((facts.c.event_type == EventType.RESERVATION, facts.c.events), else_=0)).label("conversions"),
+            func.sum(facts.c.revenue).label("revenue"),
         ).where(
-            and_(
-                ConversionEvent.user_id == user_id,
-                ConversionEvent.event_date >= start_date,
-                ConversionEvent.event_date <= end_date,
-                ConversionEvent.keyword.isnot(None),
-            )
-        ).group_by(ConversionEvent.keyword).order_by(desc("conversions")).limit(limit)
+            facts.c.keyword != "",
+        ).group_by(facts.c.keyword).order_by(desc("conversions")).limit(limit)
 
         result = await db.execute(query)
         rows = result.all()
@@ -432,20 +413,16 @@ class ROIService:
             end_date = date.today()
 
         # 키워드별 이벤트 집계
+        facts = rollup_service.roi_facts(user_id, start_date, end_date)
         query = select(
-            ConversionEvent.keyword,
-            ConversionEvent.event_type,
-            func.count(ConversionEvent.id).label("count"),
-            func.sum(ConversionEvent.revenue).label("revenue"),
-            func.sum(ConversionEvent.cost).label("cost"),
+            facts.c.keyword,
+            facts.c.event_type,
+            func.sum(facts.c.events).label("count"),
+            func.sum(facts.c.revenue).label("revenue"),
+            func.sum(facts.c.cost).label("cost"),
         ).where(
-            and_(
-                ConversionEvent.user_id == user_id,
-                ConversionEvent.event_date >= start_date,
-                ConversionEvent.event_date <= end_date,
-                ConversionEvent.keyword.isnot(None),
-            )
-        ).group_by(ConversionEvent.keyword, ConversionEvent.event_type)
+            facts.c.keyword != "",
+        ).group_by(facts.c.keyword, facts.c.event_type)
 
         result = await db.execute(query)
         rows = result.all()
@@ -626,6 +603,3 @@ class ROIService:
             for s in reversed(summaries)
         ]
 
-
-# Integer 임포트 추가
-from sqlalchemy import Integer
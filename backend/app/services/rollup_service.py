@@ -0,0 +1,556 @@
+"""
+Rollup Service - 일별 집계 테이블 관리
+대시보드가 원본 이벤트를 요청마다 다시 집계하지 않도록 사용자/장소별 일 단위 카운터를 유지합니다.
+
+- 원본 행을 기록하는 같은 트랜잭션에서 카운터를 증감 (INSERT ... ON CONFLICT DO UPDATE)
+- 조회는 어제까지는 집계 테이블, 오늘은 원본 행 (오늘 수치는 항상 원본과 일치)
+- rebuild_*(): 원본에서 다시 계산 (백필/복구)
+
+대상:
+- ROI: conversion_events -> roi_daily_rollups
+- 리뷰: place_reviews -> review_daily_rollups (작성일 기준)
+- 성과: performance_events -> performance_daily
+"""
+
+import logging
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import and_, case, delete, func, literal, select, text, union_all, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.models.place_review import PlaceReview, ReviewDailyRollup, Sentiment
+from app.models.roi_tracker import ConversionEvent, ROIDailyRollup
+from app.models.viral_common import PerformanceDaily, PerformanceEvent, PerformanceEventType
+
+logger = logging.getLogger(__name__)
+
+ROI_KEYS = ("user_id", "date", "event_type", "channel", "source", "keyword")
+ROI_COUNTERS = ("events", "revenue", "cost")
+
+REVIEW_KEYS = ("place_id", "date")
+REVIEW_COUNTERS = (
+    "reviews", "rated", "rating_sum", "replied",
+    "positive", "negative", "neutral",
+    "rating_1", "rating_2", "rating_3", "rating_4", "rating_5",
+)
+
+PERFORMANCE_KEYS = ("user_id", "date", "platform")
+# 성과 이벤트 유형 -> performance_daily 카운터 (링크 클릭은 링크 종류로 구분)
+PERFORMANCE_COLUMNS = {
+    PerformanceEventType.ANSWER_POSTED.value: "answers_posted",
+    PerformanceEventType.ANSWER_ADOPTED.value: "answers_adopted",
+    PerformanceEventType.ANSWER_LIKED.value: "answer_likes",
+    PerformanceEventType.COMMENT_POSTED.value: "comments_posted",
+    PerformanceEventType.COMMENT_LIKED.value: "comment_likes",
+    PerformanceEventType.COMMENT_REPLIED.value: "comment_replies",
+    PerformanceEventType.POST_CREATED.value: "posts_created",
+    PerformanceEventType.POST_LIKED.value: "post_likes",
+}
+PERFORMANCE_COUNTERS = tuple(PERFORMANCE_COLUMNS.values()) + ("blog_clicks", "place_clicks")
+
+# 백필 시 한 번에 넣는 행 수
+REBUILD_BATCH_SIZE = 1000
+
+
+class RollupService:
+    """일별 집계 테이블 갱신/조회/재계산"""
+
+    # ==================== 공통 ====================
+
+    async def _increment(
+        self,
+        db: AsyncSession,
+        model,
+        keys: Sequence[str],
+        counters: Sequence[str],
+        rows: Iterable[Optional[Dict]],
+    ) -> int:
+        """
+        키별 카운터 증감 (행이 없으면 생성)
+
+        같은 키의 행은 먼저 합쳐서 키마다 한 번만 갱신합니다. 커밋은 호출한 쪽에서 합니다.
+        """
+        merged: Dict[tuple, Dict] = {}
+        for row in rows:
+            if row is None:
+                continue
+            key = tuple(str(row[name]) for name in keys)
+            if key in merged:
+                for name in counters:
+                    merged[key][name] += row[name]
+            else:
+                merged[key] = dict(row)
+        values = [row for row in merged.values() if any(row[name] for name in counters)]
+        if not values:
+            return 0
+
+        table = model.__table__
+        now = datetime.utcnow()
+        dialect = db.bind.dialect.name
+        if dialect in ("sqlite", "postgresql"):
+            insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+            stmt = insert(table)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(keys),
+                set_={
+                    **{name: table.c[name] + stmt.excluded[name] for name in counters},
+                    "updated_at": now,
+                },
+            )
+            await db.execute(stmt, values)
+            return len(values)
+
+        # ON CONFLICT 미지원 DB: 갱신 후 대상 행이 없으면 생성
+        for row in values:
+            result = await db.execute(
+                update(table)
+                .where(*[table.c[name] == row[name] for name in keys])
+                .values({name: table.c[name] + row[name] for name in counters}, updated_at=now)
+            )
+            if result.rowcount == 0:
+                await db.execute(table.insert().values(row))
+        return len(values)
+
+    async def _replace(
+        self,
+        db: AsyncSession,
+        model,
+        conditions: List,
+        rows: List[Dict],
+    ) -> int:
+        """조건에 맞는 집계 행을 지우고 다시 계산한 행으로 교체"""
+        await db.execute(delete(model).where(*conditions))
+        table = model.__table__
+        for start in range(0, len(rows), REBUILD_BATCH_SIZE):
+            await db.execute(table.insert(), rows[start:start + REBUILD_BATCH_SIZE])
+        await db.commit()
+        return len(rows)
+
+    # ==================== ROI ====================
+
+    def roi_row(self, event: ConversionEvent) -> Dict:
+        """전환 이벤트 한 건의 집계 증가분"""
+        return {
+            "user_id": event.user_id,
+            "date": event.event_date,
+            "event_type": event.event_type,
+            "channel": event.channel or "",
+            "source": event.source or "",
+            "keyword": event.keyword or "",
+            "events": 1,
+            "revenue": event.revenue or 0,
+            "cost": event.cost or 0,
+        }
+
+    async def record_roi_events(self, db: AsyncSession, events: Iterable[ConversionEvent]) -> int:
+        """전환 이벤트 기록분을 집계에 반영"""
+        return await self._increment(
+            db, ROIDailyRollup, ROI_KEYS, ROI_COUNTERS, (self.roi_row(event) for event in events)
+        )
+
+    def roi_facts(self, user_id, start_date: date, end_date: date):
+        """
+        기간 내 ROI 일별 수치 (어제까지 집계 테이블 + 오늘 이후 원본 이벤트)
+
+        컬럼: date, event_type, channel, source, keyword, events, revenue, cost
+        """
+        today = date.today()
+        queries = [
+            select(
+                ROIDailyRollup.date,
+                ROIDailyRollup.event_type,
+                ROIDailyRollup.channel,
+                ROIDailyRollup.source,
+                ROIDailyRollup.keyword,
+                ROIDailyRollup.events,
+                ROIDailyRollup.revenue,
+                ROIDailyRollup.cost,
+            ).where(
+                ROIDailyRollup.user_id == user_id,
+                ROIDailyRollup.date >= start_date,
+                ROIDailyRollup.date <= end_date,
+                ROIDailyRollup.date < today,
+            )
+        ]
+        if end_date >= today:
+            channel = func.coalesce(ConversionEvent.channel, "")
+            source = func.coalesce(ConversionEvent.source, "")
+            keyword = func.coalesce(ConversionEvent.keyword, "")
+            queries.append(
+                select(
+                    ConversionEvent.event_date,
+                    ConversionEvent.event_type,
+                    channel,
+                    source,
+                    keyword,
+                    func.count(ConversionEvent.id),
+                    func.coalesce(func.sum(ConversionEvent.revenue), 0),
+                    func.coalesce(func.sum(ConversionEvent.cost), 0),
+                )
+                .where(
+                    ConversionEvent.user_id == user_id,
+                    ConversionEvent.event_date >= max(start_date, today),
+                    ConversionEvent.event_date <= end_date,
+                )
+                .group_by(ConversionEvent.event_date, ConversionEvent.event_type, channel, source, keyword)
+            )
+        return union_all(*queries).subquery("roi_facts")
+
+    async def rebuild_roi(
+        self,
+        db: AsyncSession,
+        user_id=None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> int:
+        """원본 전환 이벤트로 ROI 집계 재계산"""
+        rollup_conditions, event_conditions = [], []
+        if user_id is not None:
+            rollup_conditions.append(ROIDailyRollup.user_id == user_id)
+            event_conditions.append(ConversionEvent.user_id == user_id)
+        if start_date:
+            rollup_conditions.append(ROIDailyRollup.date >= start_date)
+            event_conditions.append(ConversionEvent.event_date >= start_date)
+        if end_date:
+            rollup_conditions.append(ROIDailyRollup.date <= end_date)
+            event_conditions.append(ConversionEvent.event_date <= end_date)
+
+        channel = func.coalesce(ConversionEvent.channel, "")
+        source = func.coalesce(ConversionEvent.source, "")
+        keyword = func.coalesce(ConversionEvent.keyword, "")
+        result = await db.execute(
+            select(
+                ConversionEvent.user_id,
+                ConversionEvent.event_date,
+                ConversionEvent.event_type,
+                channel,
+                source,
+                keyword,
+                func.count(ConversionEvent.id),
+                func.coalesce(func.sum(ConversionEvent.revenue), 0),
+                func.coalesce(func.sum(ConversionEvent.cost), 0),
+            )
+            .where(*event_conditions)
+            .group_by(
+                ConversionEvent.user_id, ConversionEvent.event_date, ConversionEvent.event_type,
+                channel, source, keyword,
+            )
+        )
+        rows = [dict(zip(ROI_KEYS + ROI_COUNTERS, row)) for row in result]
+        return await self._replace(db, ROIDailyRollup, rollup_conditions, rows)
+
+    # ==================== 리뷰 ====================
+
+    def review_row(self, review: PlaceReview, sign: int = 1) -> Optional[Dict]:
+        """리뷰 한 건의 집계 기여분 (작성일이 없으면 집계 대상 아님)"""
+        if review.written_at is None:
+            return None
+        rating = review.rating
+        sentiment = Sentiment(review.sentiment).value if review.sentiment else None
+        row = {
+            "place_id": review.place_id,
+            "date": review.written_at.date(),
+            "reviews": sign,
+            "rated": sign if rating is not None else 0,
+            "rating_sum": sign * (rating or 0),
+            "replied": sign if review.is_replied else 0,
+        }
+        for name in ("positive", "negative", "neutral"):
+            row[name] = sign if sentiment == name else 0
+        for value in range(1, 6):
+            row[f"rating_{value}"] = sign if rating == value else 0
+        return row
+
+    async def record_review_change(
+        self,
+        db: AsyncSession,
+        before: Optional[Dict],
+        review: PlaceReview,
+    ) -> int:
+        """
+        리뷰 생성/수정을 집계에 반영
+
+        Args:
+            before: 수정 전 review_row(review) (새 리뷰면 None)
+        """
+        rows = [self.review_row(review)]
+        if before is not None:
+            rows.append({
+                name: -value if name in REVIEW_COUNTERS else value
+                for name, value in before.items()
+            })
+        return await self._increment(db, ReviewDailyRollup, REVIEW_KEYS, REVIEW_COUNTERS, rows)
+
+    def review_facts(self, place_id, start_date: date, end_date: date):
+        """
+        기간 내 리뷰 일별 수치 (어제까지 집계 테이블 + 오늘 이후 원본 리뷰)
+
+        컬럼: date, REVIEW_COUNTERS
+        """
+        today = date.today()
+        queries = [
+            select(
+                ReviewDailyRollup.date,
+                *[ReviewDailyRollup.__table__.c[name] for name in REVIEW_COUNTERS],
+            ).where(
+                ReviewDailyRollup.place_id == place_id,
+                ReviewDailyRollup.date >= start_date,
+                ReviewDailyRollup.date <= end_date,
+                ReviewDailyRollup.date < today,
+            )
+        ]
+        if end_date >= today:
+            day = func.date(PlaceReview.written_at)
+            queries.append(
+                select(day, *self._review_counter_columns())
+                .where(
+                    PlaceReview.place_id == place_id,
+                    PlaceReview.written_at >= datetime.combine(max(start_date, today), datetime.min.time()),
+                    PlaceReview.written_at <= datetime.combine(end_date, datetime.max.time()),
+                )
+                .group_by(day)
+            )
+        return union_all(*queries).subquery("review_facts")
+
+    def _review_counter_columns(self) -> List:
+        """원본 리뷰에서 REVIEW_COUNTERS 순서로 집계하는 컬럼"""
+        def count_if(condition):
+            return func.count(case((condition, 1)))
+
+        return [
+            func.count(PlaceReview.id),
+            func.count(PlaceReview.rating),
+            func.coalesce(func.sum(PlaceReview.rating), 0),
+            count_if(PlaceReview.is_replied == True),
+            count_if(PlaceReview.sentiment == Sentiment.POSITIVE),
+            count_if(PlaceReview.sentiment == Sentiment.NEGATIVE),
+            count_if(PlaceReview.sentiment == Sentiment.NEUTRAL),
+            *[count_if(PlaceReview.rating == value) for value in range(1, 6)],
+        ]
+
+    async def rebuild_reviews(
+        self,
+        db: AsyncSession,
+        place_id=None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> int:
+        """원본 리뷰로 리뷰 집계 재계산"""
+        rollup_conditions, review_conditions = [], [PlaceReview.written_at.isnot(None)]
+        if place_id is not None:
+            rollup_conditions.append(ReviewDailyRollup.place_id == place_id)
+            review_conditions.append(PlaceReview.place_id == place_id)
+        if start_date:
+            rollup_conditions.append(ReviewDailyRollup.date >= start_date)
+            review_conditions.append(
+                PlaceReview.written_at >= datetime.combine(start_date, datetime.min.time())
+            )
+        if end_date:
+            rollup_conditions.append(ReviewDailyRollup.date <= end_date)
+            review_conditions.append(
+                PlaceReview.written_at <= datetime.combine(end_date, datetime.max.time())
+            )
+
+        day = func.date(PlaceReview.written_at)
+        result = await db.execute(
+            select(PlaceReview.place_id, day, *self._review_counter_columns())
+            .where(*review_conditions)
+            .group_by(PlaceReview.place_id, day)
+        )
+        rows = []
+        for row in result:
+            values = dict(zip(REVIEW_KEYS + REVIEW_COUNTERS, row))
+            if isinstance(values["date"], str):
+                values["date"] = date.fromisoformat(values["date"])
+            rows.append(values)
+        return await self._replace(db, ReviewDailyRollup, rollup_conditions, rows)
+
+    # ==================== 성과 ====================
+
+    def performance_row(self, event: PerformanceEvent) -> Optional[Dict]:
+        """성과 이벤트 한 건의 집계 증가분 (집계 항목이 없는 유형이면 None)"""
+        column = PERFORMANCE_COLUMNS.get(event.event_type)
+        if event.event_type == PerformanceEventType.LINK_CLICKED.value:
+            column = "place_clicks" if event.place_link and not event.blog_link else "blog_clicks"
+        if column is None:
+            return None
+        row = {
+            "user_id": event.user_id,
+            "date": (event.event_at or datetime.utcnow()).date(),
+            "platform": event.platform,
+            **{name: 0 for name in PERFORMANCE_COUNTERS},
+        }
+        row[column] = 1
+        return row
+
+    async def record_performance_events(self, db: AsyncSession, events: Iterable[PerformanceEvent]) -> int:
+        """성과 이벤트 기록분을 performance_daily에 반영"""
+        return await self._increment(
+            db, PerformanceDaily, PERFORMANCE_KEYS, PERFORMANCE_COUNTERS,
+            (self.performance_row(event) for event in events),
+        )
+
+    def _performance_counter_columns(self) -> List:
+        """원본 성과 이벤트에서 PERFORMANCE_COUNTERS 순서로 집계하는 컬럼"""
+        def count_if(condition):
+            return func.count(case((condition, 1)))
+
+        place_click = and_(
+            PerformanceEvent.event_type == PerformanceEventType.LINK_CLICKED.value,
+            PerformanceEvent.place_link.isnot(None),
+            PerformanceEvent.place_link != "",
+            func.coalesce(PerformanceEvent.blog_link, "") == "",
+        )
+        return [
+            *[count_if(PerformanceEvent.event_type == event_type) for event_type in PERFORMANCE_COLUMNS],
+            count_if(and_(
+                PerformanceEvent.event_type == PerformanceEventType.LINK_CLICKED.value,
+                ~place_click,
+            )),
+            count_if(place_click),
+        ]
+
+    def performance_facts(
+        self,
+        user_id: str,
+        start_date: date,
+        end_date: Optional[date] = None,
+        platform: Optional[str] = None,
+    ):
+        """
+        기간 내 성과 일별 수치 (어제까지 performance_daily + 오늘 이후 원본 이벤트)
+
+        컬럼: date, platform, PERFORMANCE_COUNTERS
+        """
+        today = date.today()
+        end_date = end_date or today
+        rollup_query = select(
+            PerformanceDaily.date,
+            PerformanceDaily.platform,
+            *[func.coalesce(PerformanceDaily.__table__.c[name], 0).label(name) for name in PERFORMANCE_COUNTERS],
+        ).where(
+            PerformanceDaily.user_id == user_id,
+            PerformanceDaily.date >= start_date,
+            PerformanceDaily.date <= end_date,
+            PerformanceDaily.date < today,
+        )
+        if platform:
+            rollup_query = rollup_query.where(PerformanceDaily.platform == platform)
+        queries = [rollup_query]
+
+        if end_date >= today:
+            day = func.date(PerformanceEvent.event_at)
+            raw_query = (
+                select(day, PerformanceEvent.platform, *self._performance_counter_columns())
+                .where(
+                    PerformanceEvent.user_id == user_id,
+                    PerformanceEvent.event_at >= datetime.combine(max(start_date, today), datetime.min.time()),
+                    PerformanceEvent.event_at <= datetime.combine(end_date, datetime.max.time()),
+                )
+                .group_by(day, PerformanceEvent.platform)
+            )
+            if platform:
+                raw_query = raw_query.where(PerformanceEvent.platform == platform)
+            queries.append(raw_query)
+
+        return union_all(*queries).subquery("performance_facts")
+
+    async def rebuild_performance(
+        self,
+        db: AsyncSession,
+        user_id: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> int:
+        """원본 성과 이벤트로 performance_daily 재계산"""
+        rollup_conditions, event_conditions = [], [PerformanceEvent.event_at.isnot(None)]
+        if user_id is not None:
+            rollup_conditions.append(PerformanceDaily.user_id == user_id)
+            event_conditions.append(PerformanceEvent.user_id == user_id)
+        if start_date:
+            rollup_conditions.append(PerformanceDaily.date >= start_date)
+            event_conditions.append(
+                PerformanceEvent.event_at >= datetime.combine(start_date, datetime.min.time())
+            )
+        if end_date:
+            rollup_conditions.append(PerformanceDaily.date <= end_date)
+            event_conditions.append(
+                PerformanceEvent.event_at <= datetime.combine(end_date, datetime.max.time())
+            )
+
+        day = func.date(PerformanceEvent.event_at)
+        result = await db.execute(
+            select(PerformanceEvent.user_id, day, PerformanceEvent.platform, *self._performance_counter_columns())
+            .where(*event_conditions)
+            .group_by(PerformanceEvent.user_id, day, PerformanceEvent.platform)
+        )
+        rows = []
+        for row in result:
+            values = dict(zip(PERFORMANCE_KEYS + PERFORMANCE_COUNTERS, row))
+            if isinstance(values["date"], str):
+                values["date"] = date.fromisoformat(values["date"])
+            if any(values[name] for name in PERFORMANCE_COUNTERS):
+                rows.append(values)
+        return await self._replace(db, PerformanceDaily, rollup_conditions, rows)
+
+    # ==================== 관리 ====================
+
+    async def rebuild_all(
+        self,
+        db: AsyncSession,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Dict[str, int]:
+        """모든 집계 테이블 재계산 (백필/복구)"""
+        return {
+            "roi_daily_rollups": await self.rebuild_roi(db, start_date=start_date, end_date=end_date),
+            "review_daily_rollups": await self.rebuild_reviews(db, start_date=start_date, end_date=end_date),
+            "performance_daily": await self.rebuild_performance(db, start_date=start_date, end_date=end_date),
+        }
+
+    async def ensure(self, engine: AsyncEngine) -> Dict[str, int]:
+        """
+        애플리케이션 시작 시 집계 테이블 준비
+
+        - create_all로 만들어지지 않는 기존 performance_daily의 고유 인덱스 생성
+        - 집계 테이블이 비어 있고 원본이 있으면 백필
+
+        인덱스 생성과 백필 모두 전달받은 engine의 DB에서 실행합니다 (테스트용 임시 DB 등).
+        """
+        session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+        rebuilt = {}
+        async with session_factory() as db:
+            try:
+                async with engine.begin() as conn:
+                    await conn.execute(text(
+                        "CREATE UNIQUE INDEX IF NOT EXISTS uq_performance_daily_key "
+                        "ON performance_daily (user_id, date, platform)"
+                    ))
+            except Exception as e:
+                # 이전 방식으로 중복 저장된 행이 있으면 원본 이벤트로 다시 만든 뒤 재시도
+                logger.warning(f"performance_daily 중복 행 정리 후 인덱스 재생성: {e}")
+                rebuilt["performance_daily"] = await self.rebuild_performance(db)
+                async with engine.begin() as conn:
+                    await conn.execute(text(
+                        "CREATE UNIQUE INDEX IF NOT EXISTS uq_performance_daily_key "
+                        "ON performance_daily (user_id, date, platform)"
+                    ))
+
+            for name, rollup, source, rebuild in (
+                ("roi_daily_rollups", ROIDailyRollup, ConversionEvent, self.rebuild_roi),
+                ("review_daily_rollups", ReviewDailyRollup, PlaceReview, self.rebuild_reviews),
+            ):
+                has_rollup = (await db.execute(select(literal(1)).select_from(rollup).limit(1))).first()
+                has_source = (await db.execute(select(literal(1)).select_from(source).limit(1))).first()
+                if has_source and not has_rollup:
+                    rebuilt[name] = await rebuild(db)
+        if rebuilt:
+            logger.info(f"일별 집계 백필 완료: {rebuilt}")
+        return rebuilt
+
+
+# Singleton instance
+rollup_service = RollupService()
@@ -346,13 +346,14 @@ class ScheduleService:
         if not schedule:
             raise ValueError(f"Schedule {schedule_id} not found")
 
-        # 실행 로그 생성
+        # 실행 로그 생성 (발행 결과와 함께 추가 - 미리 추가하면 포스트 조회 시 autoflush로
+        # 네이버 발행 요청 내내 쓰기 커넥션을 점유)
         execution = ScheduleExecution(
             schedule_id=schedule_id,
             post_id=schedule.post_id,
             status=ExecutionStatus.PENDING,
+            executed_at=datetime.utcnow(),
         )
-        db.add(execution)
 
         try:
             # 포스트 조회
@@ -395,6 +396,7 @@ class ScheduleService:
             execution.error_message = str(e)
 
         execution.completed_at = datetime.utcnow()
+        db.add(execution)
 
         # 스케줄 업데이트
         schedule.last_executed_at = datetime.utcnow()
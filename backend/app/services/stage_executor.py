@@ -0,0 +1,117 @@
+"""
+Stage Executor
+의존 관계(DAG)에 따라 파이프라인 단계를 동시에 실행하는 실행기
+"""
+
+import asyncio
+import inspect
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+
+class Stage:
+    """파이프라인 단계 정의"""
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[Dict[str, Any]], Any],
+        depends_on: Iterable[str] = (),
+        message: str = "",
+        blocking: bool = False,
+    ):
+        """
+        Args:
+            name: 단계 이름 (결과 딕셔너리의 키, 진행상황 stage 값)
+            func: 선행 단계 결과 딕셔너리를 받아 결과를 반환하는 함수 (동기/비동기)
+            depends_on: 선행 단계 이름 목록
+            message: 단계 완료 시 전송할 메시지
+            blocking: True면 동기 함수를 스레드에서 실행 (CPU 작업이 이벤트 루프를 막지 않도록)
+        """
+        self.name = name
+        self.func = func
+        self.depends_on = tuple(depends_on)
+        self.message = message
+        self.blocking = blocking
+
+
+class StageExecutor:
+    """
+    선행 단계가 끝나는 즉시 다음 단계를 시작하는 DAG 실행기
+
+    단계는 선행 단계가 먼저 등록된 경우에만 추가할 수 있으므로 순환이 생기지 않습니다.
+    """
+
+    def __init__(
+        self,
+        on_stage_complete: Optional[Callable[[Stage, int, int], Awaitable[None]]] = None,
+    ):
+        """
+        Args:
+            on_stage_complete: 단계 완료 콜백 (stage, 완료 단계 수, 전체 단계 수)
+        """
+        self.stages: Dict[str, Stage] = {}
+        self.on_stage_complete = on_stage_complete
+
+    def add(
+        self,
+        name: str,
+        func: Callable[[Dict[str, Any]], Any],
+        depends_on: Iterable[str] = (),
+        message: str = "",
+        blocking: bool = False,
+    ) -> "StageExecutor":
+        """단계 등록"""
+        if name in self.stages:
+            raise ValueError(f"이미 등록된 단계입니다: {name}")
+
+        stage = Stage(name, func, depends_on, message, blocking)
+        missing = [dep for dep in stage.depends_on if dep not in self.stages]
+        if missing:
+            raise ValueError(f"'{name}' 단계의 선행 단계가 등록되지 않았습니다: {missing}")
+
+        self.stages[name] = stage
+        return self
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        모든 단계 실행
+
+        Returns:
+            {단계 이름: 결과}
+        """
+        results: Dict[str, Any] = {}
+        tasks: Dict[str, asyncio.Task] = {}
+        total = len(self.stages)
+        completed: List[str] = []
+
+        async def run_stage(stage: Stage):
+            if stage.depends_on:
+                await asyncio.gather(*(tasks[dep] for dep in stage.depends_on))
+
+            if stage.blocking:
+                result = await asyncio.to_thread(stage.func, results)
+            else:
+                result = stage.func(results)
+                if inspect.isawaitable(result):
+                    result = await result
+
+            results[stage.name] = result
+            completed.append(stage.name)
+
+            if self.on_stage_complete:
+                await self.on_stage_complete(stage, len(completed), total)
+            return result
+
+        # 등록 순서 = 위상 정렬 순서이므로 선행 태스크가 항상 먼저 생성됨
+        for name, stage in self.stages.items():
+            tasks[name] = asyncio.create_task(run_stage(stage))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        return results
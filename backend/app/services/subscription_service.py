@@ -4,8 +4,8 @@
 
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, func
+from sqlalchemy import select, and_
+from sqlalchemy.ext.asyncio import AsyncSession
 import uuid
 
 from app.models.subscription import (
@@ -92,16 +92,16 @@ DEFAULT_PLANS = [
 class SubscriptionService:
     """구독 관리 서비스"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
     # ==================== 플랜 관리 ====================
 
-    def init_plans(self) -> List[Plan]:
+    async def init_plans(self) -> List[Plan]:
         """기본 플랜 초기화"""
         plans = []
         for plan_data in DEFAULT_PLANS:
-            existing = self.db.query(Plan).filter(Plan.id == plan_data["id"]).first()
+            existing = await self.db.get(Plan, plan_data["id"])
             if not existing:
                 plan = Plan(**plan_data)
                 self.db.add(plan)
@@ -112,32 +112,36 @@ class SubscriptionService:
                     setattr(existing, key, value)
                 plans.append(existing)
 
-        self.db.commit()
+        await self.db.commit()
         return plans
 
-    def get_plans(self, include_inactive: bool = False) -> List[Plan]:
+    async def get_plans(self, include_inactive: bool = False) -> List[Plan]:
         """모든 플랜 조회"""
-        query = self.db.query(Plan)
+        query = select(Plan)
         if not include_inactive:
-            query = query.filter(Plan.is_active == True)
-        return query.order_by(Plan.sort_order).all()
+            query = query.where(Plan.is_active == True)
+        result = await self.db.execute(query.order_by(Plan.sort_order))
+        return list(result.scalars().all())
 
-    def get_plan(self, plan_id: str) -> Optional[Plan]:
+    async def get_plan(self, plan_id: str) -> Optional[Plan]:
         """플랜 조회"""
-        return self.db.query(Plan).filter(Plan.id == plan_id).first()
+        return await self.db.get(Plan, plan_id)
 
     # ==================== 구독 관리 ====================
 
-    def get_user_subscription(self, user_id: str) -> Optional[Subscription]:
+    async def get_user_subscription(self, user_id: str) -> Optional[Subscription]:
         """사용자의 현재 활성 구독 조회"""
-        return self.db.query(Subscription).filter(
-            and_(
-                Subscription.user_id == user_id,
-                Subscription.status.in_([SubscriptionStatus.ACTIVE, SubscriptionStatus.TRIALING])
+        result = await self.db.execute(
+            select(Subscription).where(
+                and_(
+                    Subscription.user_id == user_id,
+                    Subscription.status.in_([SubscriptionStatus.ACTIVE, SubscriptionStatus.TRIALING])
+                )
             )
-        ).first()
+        )
+        return result.scalars().first()
 
-    def create_subscription(
+    async def create_subscription(
         self,
         user_id: str,
         plan_id: str,
@@ -145,12 +149,12 @@ class SubscriptionService:
         trial_days: int = 0
     ) -> Subscription:
         """새 구독 생성"""
-        plan = self.get_plan(plan_id)
+        plan = await self.get_plan(plan_id)
         if not plan:
             raise ValueError(f"Invalid plan: {plan_id}")
 
         # 기존 활성 구독 확인
-        existing = self.get_user_subscription(user_id)
+        existing = await self.get_user_subscription(user_id)
         if existing:
             raise ValueError("User already has an active subscription")
 
@@ -188,25 +192,23 @@ class SubscriptionService:
         self.db.add(subscription)
 
         # 사용량 요약 초기화
-        self._init_usage_summary(user_id, subscription.id, plan)
+        await self._init_usage_summary(user_id, subscription.id, plan)
 
         # 크레딧 초기화
-        self._init_user_credits(user_id)
+        await self._init_user_credits(user_id)
 
-        self.db.commit()
-        self.db.refresh(subscription)
+        await self.db.commit()
+        await self.db.refresh(subscription)
 
         return subscription
 
-    def cancel_subscription(
+    async def cancel_subscription(
         self,
         subscription_id: str,
         immediate: bool = False
     ) -> Subscription:
         """구독 취소"""
-        subscription = self.db.query(Subscription).filter(
-            Subscription.id == subscription_id
-        ).first()
+        subscription = await self.db.get(Subscription, subscription_id)
 
         if not subscription:
             raise ValueError("Subscription not found")
@@ -218,49 +220,45 @@ class SubscriptionService:
         else:
             subscription.cancel_at_period_end = True
 
-        self.db.commit()
-        self.db.refresh(subscription)
+        await self.db.commit()
+        await self.db.refresh(subscription)
 
         return subscription
 
-    def change_plan(
+    async def change_plan(
         self,
         subscription_id: str,
         new_plan_id: str,
         immediate: bool = True
     ) -> Subscription:
         """플랜 변경"""
-        subscription = self.db.query(Subscription).filter(
-            Subscription.id == subscription_id
-        ).first()
+        subscription = await self.db.get(Subscription, subscription_id)
 
         if not subscription:
             raise ValueError("Subscription not found")
 
-        new_plan = self.get_plan(new_plan_id)
+        new_plan = await self.get_plan(new_plan_id)
         if not new_plan:
             raise ValueError(f"Invalid plan: {new_plan_id}")
 
         if immediate:
             subscription.plan_id = new_plan_id
             # 사용량 제한 업데이트
-            self._update_usage_limits(subscription.user_id, new_plan)
+            await self._update_usage_limits(subscription.user_id, new_plan)
         else:
             # 다음 결제 주기에 변경
             if not subscription.metadata:
                 subscription.metadata = {}
             subscription.metadata["pending_plan_change"] = new_plan_id
 
-        self.db.commit()
-        self.db.refresh(subscription)
+        await self.db.commit()
+        await self.db.refresh(subscription)
 
         return subscription
 
-    def renew_subscription(self, subscription_id: str) -> Subscription:
+    async def renew_subscription(self, subscription_id: str) -> Subscription:
         """구독 갱신"""
-        subscription = self.db.query(Subscription).filter(
-            Subscription.id == subscription_id
-        ).first()
+        subscription = await self.db.get(Subscription, subscription_id)
 
         if not subscription:
             raise ValueError("Subscription not found")
@@ -277,32 +275,35 @@ class SubscriptionService:
         subscription.status = SubscriptionStatus.ACTIVE
 
         # 사용량 초기화
-        plan = self.get_plan(subscription.plan_id)
-        self._init_usage_summary(subscription.user_id, subscription.id, plan)
+        plan = await self.get_plan(subscription.plan_id)
+        await self._init_usage_summary(subscription.user_id, subscription.id, plan)
 
-        self.db.commit()
-        self.db.refresh(subscription)
+        await self.db.commit()
+        await self.db.refresh(subscription)
 
         return subscription
 
     # ==================== 사용량 관리 ====================
 
-    def get_usage_summary(self, user_id: str, year: int = None, month: int = None) -> Optional[UsageSummary]:
+    async def get_usage_summary(self, user_id: str, year: int = None, month: int = None) -> Optional[UsageSummary]:
         """사용량 요약 조회"""
         if not year or not month:
             now = datetime.utcnow()
             year = now.year
             month = now.month
 
-        return self.db.query(UsageSummary).filter(
-            and_(
-                UsageSummary.user_id == user_id,
-                UsageSummary.year == year,
-                UsageSummary.month == month
+        result = await self.db.execute(
+            select(UsageSummary).where(
+                and_(
+                    UsageSummary.user_id == user_id,
+                    UsageSummary.year == year,
+                    UsageSummary.month == month
+                )
             )
-        ).first()
+        )
+        return result.scalars().first()
 
-    def record_usage(
+    async def record_usage(
         self,
         user_id: str,
         usage_type: UsageType,
@@ -311,14 +312,14 @@ class SubscriptionService:
         resource_type: str = None
     ) -> Dict:
         """사용량 기록"""
-        subscription = self.get_user_subscription(user_id)
-        plan = self.get_plan(subscription.plan_id) if subscription else self.get_plan("free")
+        subscription = await self.get_user_subscription(user_id)
+        plan = await self.get_plan(subscription.plan_id) if subscription else await self.get_plan("free")
 
         now = datetime.utcnow()
-        summary = self.get_usage_summary(user_id, now.year, now.month)
+        summary = await self.get_usage_summary(user_id, now.year, now.month)
 
         if not summary:
-            summary = self._init_usage_summary(
+            summary = await self._init_usage_summary(
                 user_id,
                 subscription.id if subscription else None,
                 plan
@@ -366,7 +367,7 @@ class SubscriptionService:
             period_end=datetime(now.year, now.month + 1, 1) if now.month < 12 else datetime(now.year + 1, 1, 1)
         )
         self.db.add(usage_log)
-        self.db.commit()
+        await self.db.commit()
 
         return {
             "success": True,
@@ -379,16 +380,16 @@ class SubscriptionService:
             }
         }
 
-    def check_usage_limit(self, user_id: str, usage_type: UsageType) -> Dict:
+    async def check_usage_limit(self, user_id: str, usage_type: UsageType) -> Dict:
         """사용량 한도 확인"""
-        subscription = self.get_user_subscription(user_id)
-        plan = self.get_plan(subscription.plan_id) if subscription else self.get_plan("free")
+        subscription = await self.get_user_subscription(user_id)
+        plan = await self.get_plan(subscription.plan_id) if subscription else await self.get_plan("free")
 
         now = datetime.utcnow()
-        summary = self.get_usage_summary(user_id, now.year, now.month)
+        summary = await self.get_usage_summary(user_id, now.year, now.month)
 
         if not summary:
-            summary = self._init_usage_summary(
+            summary = await self._init_usage_summary(
                 user_id,
                 subscription.id if subscription else None,
                 plan
@@ -424,14 +425,14 @@ class SubscriptionService:
 
     # ==================== 크레딧 관리 ====================
 
-    def get_user_credits(self, user_id: str) -> UserCredit:
+    async def get_user_credits(self, user_id: str) -> UserCredit:
         """사용자 크레딧 조회"""
-        credits = self.db.query(UserCredit).filter(UserCredit.user_id == user_id).first()
+        credits = await self._find_user_credits(user_id)
         if not credits:
-            credits = self._init_user_credits(user_id)
+            credits = await self._init_user_credits(user_id)
         return credits
 
-    def add_credits(
+    async def add_credits(
         self,
         user_id: str,
         credit_type: str,  # post, analysis
@@ -441,7 +442,7 @@ class SubscriptionService:
         expires_days: int = 365
     ) -> CreditTransaction:
         """크레딧 충전"""
-        credits = self.get_user_credits(user_id)
+        credits = await self.get_user_credits(user_id)
 
         if credit_type == "post":
             credits.post_credits += amount
@@ -464,11 +465,11 @@ class SubscriptionService:
         )
 
         self.db.add(transaction)
-        self.db.commit()
+        await self.db.commit()
 
         return transaction
 
-    def use_credits(
+    async def use_credits(
         self,
         user_id: str,
         credit_type: str,
@@ -476,7 +477,7 @@ class SubscriptionService:
         description: str = None
     ) -> Optional[CreditTransaction]:
         """크레딧 사용"""
-        credits = self.get_user_credits(user_id)
+        credits = await self.get_user_credits(user_id)
 
         if credit_type == "post":
             if credits.post_credits < amount:
@@ -501,18 +502,18 @@ class SubscriptionService:
         )
 
         self.db.add(transaction)
-        self.db.commit()
+        await self.db.commit()
 
         return transaction
 
     # ==================== 헬퍼 메서드 ====================
 
-    def _init_usage_summary(self, user_id: str, subscription_id: str, plan: Plan) -> UsageSummary:
+    async def _init_usage_summary(self, user_id: str, subscription_id: str, plan: Plan) -> UsageSummary:
         """사용량 요약 초기화"""
         now = datetime.utcnow()
 
         # 기존 요약 확인
-        existing = self.get_usage_summary(user_id, now.year, now.month)
+        existing = await self.get_usage_summary(user_id, now.year, now.month)
         if existing:
             return existing
 
@@ -527,36 +528,43 @@ class SubscriptionService:
         )
 
         self.db.add(summary)
-        self.db.commit()
-        self.db.refresh(summary)
+        await self.db.commit()
+        await self.db.refresh(summary)
 
         return summary
 
-    def _init_user_credits(self, user_id: str) -> UserCredit:
+    async def _find_user_credits(self, user_id: str) -> Optional[UserCredit]:
+        """사용자 크레딧 행 조회"""
+        result = await self.db.execute(
+            select(UserCredit).where(UserCredit.user_id == user_id)
+        )
+        return result.scalars().first()
+
+    async def _init_user_credits(self, user_id: str) -> UserCredit:
         """사용자 크레딧 초기화"""
-        existing = self.db.query(UserCredit).filter(UserCredit.user_id == user_id).first()
+        existing = await self._find_user_credits(user_id)
         if existing:
             return existing
 
         credits = UserCredit(user_id=user_id)
         self.db.add(credits)
-        self.db.commit()
-        self.db.refresh(credits)
+        await self.db.commit()
+        await self.db.refresh(credits)
 
         return credits
 
-    def _update_usage_limits(self, user_id: str, plan: Plan):
+    async def _update_usage_limits(self, user_id: str, plan: Plan):
         """사용량 제한 업데이트"""
         now = datetime.utcnow()
-        summary = self.get_usage_summary(user_id, now.year, now.month)
+        summary = await self.get_usage_summary(user_id, now.year, now.month)
 
         if summary:
             summary.posts_limit = plan.posts_per_month
             summary.analysis_limit = plan.analysis_per_month
             summary.keywords_limit = plan.keywords_per_month
-            self.db.commit()
+            await self.db.commit()
 
 
-def get_subscription_service(db: Session) -> SubscriptionService:
+def get_subscription_service(db: AsyncSession) -> SubscriptionService:
     """서비스 인스턴스 생성"""
     return SubscriptionService(db)
@@ -3,17 +3,23 @@
 네이버 블로그 검색 결과 상위 1~3위 글들을 크롤링하고 분석
 """
 
+import asyncio
 import re
 import random
 import urllib.parse
-import httpx
-from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from collections import defaultdict
+from typing import List, Dict, Optional, Tuple, Callable, Awaitable
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, case, update
 
 from app.models.top_post_analysis import TopPostAnalysis, AggregatedPattern
+from app.services.crawler_http import crawler_http
+from app.services.html_parser import make_soup, scan_page
+
+# 네트워크 요청 직전에 URL을 받아 차례를 기다리는 훅 (대량 분석의 요청 속도 예산 등, 캐시 적중 시 호출되지 않음)
+Throttle = Callable[[str], Awaitable[None]]
 
 
 # 카테고리 정의
@@ -101,6 +107,9 @@ SELECTORS = {
     ]
 }
 
+# 본문 분석 시 한 번에 평가할 셀렉터 (SELECTORS + 외부 링크 후보)
+PAGE_SELECTORS = {**SELECTORS, "links": ["a[href*='http']"]}
+
 
 def detect_category(keyword: str) -> str:
     """키워드에서 카테고리 자동 감지"""
@@ -181,7 +190,7 @@ def assess_data_quality(analysis: dict) -> str:
     return "low"
 
 
-async def search_naver_blog(keyword: str, top_n: int = 3) -> List[Dict]:
+async def search_naver_blog(keyword: str, top_n: int = 3, throttle: Optional[Throttle] = None) -> List[Dict]:
     """
     네이버 블로그 검색하여 상위 글 URL 수집
     """
@@ -211,13 +220,13 @@ async def search_naver_blog(keyword: str, top_n: int = 3) -> List[Dict]:
     }
 
     try:
-        async with httpx.AsyncClient(timeout=20.0, follow_redirects=True) as client:
-            response = await client.get(search_url, headers=headers)
+        async with crawler_http.session(timeout=20.0) as client:
+            response = await client.get(search_url, headers=headers, cache="search", throttle=throttle)
             
             print(f"[상위글 분석] 검색 응답 상태: {response.status_code}, 키워드: {keyword}")
 
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = make_soup(response.text)
 
                 # 블로그 검색 결과 파싱
                 blog_items = soup.select('.api_txt_lines.total_tit') or soup.select('.title_link')
@@ -246,7 +255,7 @@ async def search_naver_blog(keyword: str, top_n: int = 3) -> List[Dict]:
     return results
 
 
-async def analyze_post(post_url: str, keyword: str) -> Dict:
+async def analyze_post(post_url: str, keyword: str, throttle: Optional[Throttle] = None) -> Dict:
     """
     블로그 포스트 분석
     """
@@ -293,91 +302,11 @@ async def analyze_post(post_url: str, keyword: str) -> Dict:
     }
 
     try:
-        async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-            response = await client.get(mobile_url, headers=headers)
+        async with crawler_http.session(timeout=15.0) as client:
+            response = await client.get(mobile_url, headers=headers, cache="post", throttle=throttle)
 
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-
-                # 제목 추출
-                title = None
-                for selector in SELECTORS["title"]:
-                    if selector.startswith("meta"):
-                        meta = soup.select_one(selector)
-                        if meta:
-                            title = meta.get('content', '')
-                            break
-                    else:
-                        el = soup.select_one(selector)
-                        if el:
-                            title = el.get_text(strip=True)
-                            break
-
-                if title:
-                    result["title"] = title
-                    result["title_length"] = len(title)
-                    result["title_has_keyword"] = keyword.lower() in title.lower()
-                    result["title_keyword_position"] = get_keyword_position(title, keyword)
-
-                # 본문 추출
-                content = ""
-                for selector in SELECTORS["content"]:
-                    el = soup.select_one(selector)
-                    if el:
-                        content = el.get_text(separator="\n", strip=True)
-                        break
-
-                if content:
-                    result["content_length"] = len(content)
-                    kw_count, kw_density = calculate_keyword_density(content, keyword)
-                    result["keyword_count"] = kw_count
-                    result["keyword_density"] = kw_density
-                    result["data_fetched"] = True
-
-                    # 문단 개수 (줄바꿈 기준)
-                    paragraphs = [p for p in content.split('\n') if p.strip() and len(p.strip()) > 20]
-                    result["paragraph_count"] = len(paragraphs)
-
-                # 이미지 개수
-                images = []
-                for selector in SELECTORS["images"]:
-                    images.extend(soup.select(selector))
-                result["image_count"] = len(set([img.get('src', '') for img in images if img.get('src')]))
-
-                # 동영상 개수
-                videos = []
-                for selector in SELECTORS["videos"]:
-                    videos.extend(soup.select(selector))
-                result["video_count"] = len(videos)
-
-                # 소제목 개수
-                headings = []
-                for selector in SELECTORS["headings"]:
-                    headings.extend(soup.select(selector))
-                result["heading_count"] = len(headings)
-
-                # 지도 여부
-                maps = []
-                for selector in SELECTORS["maps"]:
-                    maps.extend(soup.select(selector))
-                result["has_map"] = len(maps) > 0
-
-                # 외부 링크 여부
-                links = soup.select('a[href*="http"]')
-                external_links = [l for l in links if 'naver.com' not in l.get('href', '')]
-                result["has_link"] = len(external_links) > 0
-
-                # 인용구 여부
-                quotes = []
-                for selector in SELECTORS["quotes"]:
-                    quotes.extend(soup.select(selector))
-                result["has_quote"] = len(quotes) > 0
-
-                # 목록 여부
-                lists = []
-                for selector in SELECTORS["lists"]:
-                    lists.extend(soup.select(selector))
-                result["has_list"] = len(lists) > 0
+                result.update(extract_post_features(response.text, keyword))
 
     except Exception as e:
         print(f"[상위글 분석] 포스트 분석 오류 ({post_url}): {e}")
@@ -385,14 +314,82 @@ async def analyze_post(post_url: str, keyword: str) -> Dict:
     return result
 
 
-async def analyze_top_posts(keyword: str, top_n: int = 3, db: Session = None) -> Dict:
+def extract_post_features(html: str, keyword: str) -> Dict:
+    """
+    블로그 본문 HTML에서 분석 항목 추출
+
+    SELECTORS의 모든 셀렉터를 문서 한 번 순회로 평가합니다 (html_parser.scan_page).
+    제목/본문은 셀렉터 우선순위대로 첫 일치 요소를 사용합니다.
+    """
+    features = {}
+    page = scan_page(html, PAGE_SELECTORS)
+
+    # 제목
+    title = None
+    title_el = page.first("title")
+    if title_el is not None:
+        if page.tag(title_el) == "meta":
+            title = page.attr(title_el, "content") or ""
+        else:
+            title = page.text(title_el)
+
+    if title:
+        features["title"] = title
+        features["title_length"] = len(title)
+        features["title_has_keyword"] = keyword.lower() in title.lower()
+        features["title_keyword_position"] = get_keyword_position(title, keyword)
+
+    # 본문
+    content_el = page.first("content")
+    content = page.text(content_el, separator="\n") if content_el is not None else ""
+
+    if content:
+        features["content_length"] = len(content)
+        kw_count, kw_density = calculate_keyword_density(content, keyword)
+        features["keyword_count"] = kw_count
+        features["keyword_density"] = kw_density
+        features["data_fetched"] = True
+
+        # 문단 개수 (줄바꿈 기준)
+        paragraphs = [p for p in content.split('\n') if p.strip() and len(p.strip()) > 20]
+        features["paragraph_count"] = len(paragraphs)
+
+    # 이미지 개수 (같은 이미지는 한 번만)
+    features["image_count"] = len(set(page.attrs("images", "src")))
+
+    # 동영상/소제목 개수
+    features["video_count"] = page.count("videos")
+    features["heading_count"] = page.count("headings")
+
+    # 지도/인용구/목록 여부
+    features["has_map"] = page.any("maps")
+    features["has_quote"] = page.any("quotes")
+    features["has_list"] = page.any("lists")
+
+    # 외부 링크 여부
+    external_links = [href for href in page.attrs("links", "href") if 'naver.com' not in href]
+    features["has_link"] = len(external_links) > 0
+
+    return features
+
+
+async def analyze_top_posts(
+    keyword: str,
+    top_n: int = 3,
+    db: Optional[AsyncSession] = None,
+    throttle: Optional[Throttle] = None
+) -> Dict:
     """
     키워드에 대한 상위 글 전체 분석
+
+    Args:
+        db: 지정하면 분석 결과를 저장하고 카테고리 패턴을 증분 갱신
+        throttle: 네이버 요청 직전에 호출할 속도 제한 훅 (대량 분석용)
     """
     category = detect_category(keyword)
 
     # 1. 검색하여 상위 글 URL 수집
-    search_results = await search_naver_blog(keyword, top_n)
+    search_results = await search_naver_blog(keyword, top_n, throttle)
 
     if not search_results:
         return {
@@ -405,32 +402,29 @@ async def analyze_top_posts(keyword: str, top_n: int = 3, db: Session = None) ->
             "error": "검색 결과를 찾을 수 없습니다"
         }
 
-    # 2. 각 글 분석
+    # 2. 각 글 분석 (상위 글들을 동시에 수집)
+    analyses = await asyncio.gather(
+        *(analyze_post(result["post_url"], keyword, throttle) for result in search_results)
+    )
+
     analysis_results = []
-    for result in search_results:
-        analysis = await analyze_post(result["post_url"], keyword)
+    for result, analysis in zip(search_results, analyses):
         analysis["rank"] = result["rank"]
         analysis["blog_id"] = result["blog_id"]
         analysis["category"] = category
         analysis["data_quality"] = assess_data_quality(analysis)
         analysis_results.append(analysis)
 
-        # DB 저장
-        if db:
-            try:
-                save_post_analysis(db, analysis)
-            except Exception as e:
-                print(f"[상위글 분석] DB 저장 오류: {e}")
-
-    # 3. 요약 통계 계산
-    summary = calculate_summary(analysis_results)
-
-    # 4. 패턴 집계 업데이트
+    # 3. DB 저장 + 패턴 집계 증분 갱신
     if db:
         try:
-            update_aggregated_patterns(db, category)
+            await db.run_sync(lambda s: save_post_analyses(s, analysis_results))
         except Exception as e:
-            print(f"[상위글 분석] 패턴 집계 오류: {e}")
+            await db.rollback()
+            print(f"[상위글 분석] DB 저장 오류: {e}")
+
+    # 4. 요약 통계 계산
+    summary = calculate_summary(analysis_results)
 
     return {
         "keyword": keyword,
@@ -515,17 +509,45 @@ def calculate_summary(results: List[Dict]) -> Dict:
 
 def save_post_analysis(db: Session, analysis: Dict):
     """분석 결과 DB 저장"""
+    save_post_analyses(db, [analysis])
+
+
+def save_post_analyses(db: Session, analyses: List[Dict], update_patterns: bool = True):
+    """
+    분석 결과 여러 건을 한 트랜잭션으로 저장
+
+    Args:
+        update_patterns: 카테고리 패턴 집계도 증분 갱신 (대량 분석은 False로 두고 작업 끝에 한 번 재집계)
+    """
+    # 같은 글(키워드+URL)이 여러 번 오면 마지막 결과만 저장
+    # (autoflush=False 세션에서는 아직 추가 대기 중인 행을 조회로 찾지 못해 중복 INSERT가 됨)
+    latest = {(analysis["keyword"], analysis["post_url"]): analysis for analysis in analyses}
+    changes = [_upsert_post_analysis(db, analysis) for analysis in latest.values()]
+    if update_patterns:
+        apply_pattern_changes(db, changes)
+    db.commit()
+
+
+def _upsert_post_analysis(db: Session, analysis: Dict) -> Tuple[Optional[Dict], Optional[Dict]]:
+    """
+    키워드+URL 기준으로 기존 결과는 갱신, 없으면 추가 (커밋하지 않음)
+
+    Returns:
+        (변경 전, 변경 후) 패턴 기여분 - apply_pattern_changes에 전달
+    """
     existing = db.query(TopPostAnalysis).filter(
         TopPostAnalysis.keyword == analysis["keyword"],
         TopPostAnalysis.post_url == analysis["post_url"]
     ).first()
 
     if existing:
+        before = _pattern_contribution(existing)
         # 업데이트
         for key, value in analysis.items():
             if hasattr(existing, key) and key not in ["id", "analyzed_at"]:
                 setattr(existing, key, value)
         existing.analyzed_at = datetime.utcnow()
+        return before, _pattern_contribution(existing)
     else:
         # 새로 생성
         new_analysis = TopPostAnalysis(
@@ -554,118 +576,239 @@ def save_post_analysis(db: Session, analysis: Dict):
             data_quality=analysis.get("data_quality", "low")
         )
         db.add(new_analysis)
+        return None, _pattern_contribution(new_analysis)
+
+
+# ==================== 패턴 집계 ====================
+# 카테고리별 상위 1~3위 글의 누적 합계/글 수를 AggregatedPattern에 보관하고 평균/비율은 누적값에서 계산합니다.
+# - 글 저장 시: apply_pattern_changes가 변경분만 더함 (키워드당 카테고리 UPDATE 한 번)
+# - 복구/대량 분석 후: rebuild_aggregated_patterns가 조건부 집계 쿼리 한 번으로 다시 계산
+
+PATTERN_MAX_RANK = 3
+PATTERN_MIN_CONTENT_LENGTH = 100  # 평균/최소/최대는 본문이 이보다 긴 글만 (sample_count)
+
+# 평균 컬럼 -> (합계 컬럼, 원본 컬럼)
+PATTERN_AVERAGES = {
+    "avg_title_length": ("sum_title_length", "title_length"),
+    "avg_content_length": ("sum_content_length", "content_length"),
+    "avg_image_count": ("sum_image_count", "image_count"),
+    "avg_video_count": ("sum_video_count", "video_count"),
+    "avg_heading_count": ("sum_heading_count", "heading_count"),
+    "avg_paragraph_count": ("sum_paragraph_count", "paragraph_count"),
+    "avg_keyword_count": ("sum_keyword_count", "keyword_count"),
+    "avg_keyword_density": ("sum_keyword_density", "keyword_density"),
+}
 
-    db.commit()
+# 비율 컬럼 -> (글 수 컬럼, SQL 조건, 글 판별) - 분모는 sample_count
+PATTERN_RATES = {
+    "title_keyword_rate": (
+        "title_keyword_posts", TopPostAnalysis.title_has_keyword == True, lambda p: bool(p.title_has_keyword)
+    ),
+    "map_usage_rate": ("map_posts", TopPostAnalysis.has_map == True, lambda p: bool(p.has_map)),
+    "video_usage_rate": ("video_posts", TopPostAnalysis.video_count > 0, lambda p: (p.video_count or 0) > 0),
+    "keyword_position_front": (
+        "position_front_posts", TopPostAnalysis.title_keyword_position == 0, lambda p: p.title_keyword_position == 0
+    ),
+    "keyword_position_middle": (
+        "position_middle_posts", TopPostAnalysis.title_keyword_position == 1, lambda p: p.title_keyword_position == 1
+    ),
+    "keyword_position_end": (
+        "position_end_posts", TopPostAnalysis.title_keyword_position == 2, lambda p: p.title_keyword_position == 2
+    ),
+}
 
+# 최소/최대를 기록하는 원본 컬럼 (min_<컬럼>, max_<컬럼>)
+PATTERN_EXTREMES = ("content_length", "image_count")
 
-def update_aggregated_patterns(db: Session, category: str):
-    """카테고리별 패턴 집계 업데이트"""
-    # 상위 1~3위 글만 집계 (rank <= 3)
-    stats = db.query(
-        func.count(TopPostAnalysis.id).label('sample_count'),
-        func.avg(TopPostAnalysis.title_length).label('avg_title_length'),
-        func.avg(TopPostAnalysis.content_length).label('avg_content_length'),
-        func.avg(TopPostAnalysis.image_count).label('avg_image_count'),
-        func.avg(TopPostAnalysis.video_count).label('avg_video_count'),
-        func.avg(TopPostAnalysis.heading_count).label('avg_heading_count'),
-        func.avg(TopPostAnalysis.paragraph_count).label('avg_paragraph_count'),
-        func.avg(TopPostAnalysis.keyword_count).label('avg_keyword_count'),
-        func.avg(TopPostAnalysis.keyword_density).label('avg_keyword_density'),
-        func.min(TopPostAnalysis.content_length).label('min_content_length'),
-        func.max(TopPostAnalysis.content_length).label('max_content_length'),
-        func.min(TopPostAnalysis.image_count).label('min_image_count'),
-        func.max(TopPostAnalysis.image_count).label('max_image_count'),
-    ).filter(
-        TopPostAnalysis.category == category,
-        TopPostAnalysis.rank <= 3,
-        TopPostAnalysis.content_length > 100
-    ).first()
 
-    if not stats or stats.sample_count == 0:
-        return
+def _pattern_contribution(post: TopPostAnalysis) -> Optional[Dict]:
+    """글 하나가 카테고리 패턴에 더하는 값 (집계 대상이 아니면 None)"""
+    if not post.category or post.rank is None or post.rank > PATTERN_MAX_RANK:
+        return None
 
-    # 비율 계산
-    total = db.query(TopPostAnalysis).filter(
-        TopPostAnalysis.category == category,
-        TopPostAnalysis.rank <= 3,
-        TopPostAnalysis.content_length > 100
-    ).count()
-
-    title_keyword_count = db.query(TopPostAnalysis).filter(
-        TopPostAnalysis.category == category,
-        TopPostAnalysis.rank <= 3,
-        TopPostAnalysis.title_has_keyword == True
-    ).count()
-
-    map_count = db.query(TopPostAnalysis).filter(
-        TopPostAnalysis.category == category,
-        TopPostAnalysis.rank <= 3,
-        TopPostAnalysis.has_map == True
-    ).count()
-
-    video_count = db.query(TopPostAnalysis).filter(
-        TopPostAnalysis.category == category,
-        TopPostAnalysis.rank <= 3,
-        TopPostAnalysis.video_count > 0
-    ).count()
+    sampled = (post.content_length or 0) > PATTERN_MIN_CONTENT_LENGTH
+    counts = {"sample_count": 1 if sampled else 0}
+    for sum_column, column in PATTERN_AVERAGES.values():
+        counts[sum_column] = (getattr(post, column) or 0) if sampled else 0
+    for count_column, _, matches in PATTERN_RATES.values():
+        counts[count_column] = 1 if matches(post) else 0
 
-    # 키워드 위치 분포
-    pos_front = db.query(TopPostAnalysis).filter(
-        TopPostAnalysis.category == category,
-        TopPostAnalysis.rank <= 3,
-        TopPostAnalysis.title_keyword_position == 0
-    ).count()
-
-    pos_middle = db.query(TopPostAnalysis).filter(
-        TopPostAnalysis.category == category,
-        TopPostAnalysis.rank <= 3,
-        TopPostAnalysis.title_keyword_position == 1
-    ).count()
-
-    pos_end = db.query(TopPostAnalysis).filter(
-        TopPostAnalysis.category == category,
-        TopPostAnalysis.rank <= 3,
-        TopPostAnalysis.title_keyword_position == 2
-    ).count()
-
-    # 저장
-    existing = db.query(AggregatedPattern).filter(
-        AggregatedPattern.category == category
-    ).first()
+    return {
+        "category": post.category,
+        "counts": counts,
+        "extremes": {column: getattr(post, column) or 0 for column in PATTERN_EXTREMES} if sampled else {},
+    }
 
-    pattern_data = {
-        "category": category,
-        "sample_count": stats.sample_count,
-        "avg_title_length": stats.avg_title_length or 0,
-        "avg_content_length": stats.avg_content_length or 0,
-        "avg_image_count": stats.avg_image_count or 0,
-        "avg_video_count": stats.avg_video_count or 0,
-        "avg_heading_count": stats.avg_heading_count or 0,
-        "avg_paragraph_count": stats.avg_paragraph_count or 0,
-        "avg_keyword_count": stats.avg_keyword_count or 0,
-        "avg_keyword_density": stats.avg_keyword_density or 0,
-        "min_content_length": stats.min_content_length or 0,
-        "max_content_length": stats.max_content_length or 0,
-        "min_image_count": stats.min_image_count or 0,
-        "max_image_count": stats.max_image_count or 0,
-        "title_keyword_rate": title_keyword_count / total if total > 0 else 0,
-        "map_usage_rate": map_count / total if total > 0 else 0,
-        "video_usage_rate": video_count / total if total > 0 else 0,
-        "keyword_position_front": pos_front / total if total > 0 else 0,
-        "keyword_position_middle": pos_middle / total if total > 0 else 0,
-        "keyword_position_end": pos_end / total if total > 0 else 0,
+
+def apply_pattern_changes(db: Session, changes: List[Tuple[Optional[Dict], Optional[Dict]]]):
+    """
+    저장된 글의 (변경 전, 변경 후) 기여분을 카테고리 패턴에 반영 (커밋하지 않음)
+
+    합계는 SQL에서 더하므로 동시에 저장하는 다른 요청과 값이 엇갈리지 않습니다.
+    누적값이 없는 카테고리(신규/이전 버전 데이터)나 최소/최대였던 글이 바뀐 경우만 전체 재집계합니다.
+    """
+    deltas: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+    added: Dict[str, List[Dict]] = defaultdict(list)
+    removed: Dict[str, List[Dict]] = defaultdict(list)
+
+    for before, after in changes:
+        for contribution, sign, bucket in ((before, -1, removed), (after, 1, added)):
+            if not contribution:
+                continue
+            category = contribution["category"]
+            for column, value in contribution["counts"].items():
+                deltas[category][column] += sign * value
+            if contribution["extremes"]:
+                bucket[category].append(contribution["extremes"])
+
+    rebuild = []
+    for category, delta in deltas.items():
+        pattern = db.query(AggregatedPattern).filter(AggregatedPattern.category == category).first()
+        if (
+            pattern is None
+            or pattern.sum_content_length is None
+            or pattern.sample_count + delta["sample_count"] <= 0
+            or _touches_extreme(pattern, removed[category])
+        ):
+            rebuild.append(category)
+            continue
+
+        values = {
+            column: getattr(AggregatedPattern, column) + change
+            for column, change in delta.items() if change
+        }
+        for column in PATTERN_EXTREMES:
+            observed = [extremes[column] for extremes in added[category]]
+            if not observed:
+                continue
+            low, high = min(observed), max(observed)
+            min_column = getattr(AggregatedPattern, f"min_{column}")
+            max_column = getattr(AggregatedPattern, f"max_{column}")
+            # 기존 샘플이 없으면 기존 최소/최대(0)는 무시
+            empty = AggregatedPattern.sample_count <= 0
+            values[f"min_{column}"] = case((empty, low), (min_column > low, low), else_=min_column)
+            values[f"max_{column}"] = case((empty, high), (max_column < high, high), else_=max_column)
+
+        if values:
+            db.execute(
+                update(AggregatedPattern)
+                .where(AggregatedPattern.category == category)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            _refresh_pattern_averages(db, [category])
+            db.expire(pattern)
+
+    if rebuild:
+        # 방금 추가한 글도 재집계에 포함되도록 (autoflush=False 세션)
+        db.flush()
+        rebuild_aggregated_patterns(db, rebuild, commit=False)
+
+
+def _touches_extreme(pattern: AggregatedPattern, removed: List[Dict]) -> bool:
+    """빠지는 글 중 현재 최소/최대값을 가진 글이 있는지 (있으면 증분으로는 새 최소/최대를 알 수 없음)"""
+    for extremes in removed:
+        for column, value in extremes.items():
+            if value <= getattr(pattern, f"min_{column}") or value >= getattr(pattern, f"max_{column}"):
+                return True
+    return False
+
+
+def _refresh_pattern_averages(db: Session, categories: List[str]):
+    """누적 합계/글 수로 평균과 비율 컬럼 다시 계산 (UPDATE 한 번)"""
+    sample_count = AggregatedPattern.sample_count
+    values = {"updated_at": datetime.utcnow()}
+    for avg_column, (sum_column, _) in PATTERN_AVERAGES.items():
+        values[avg_column] = case(
+            (sample_count > 0, getattr(AggregatedPattern, sum_column) * 1.0 / sample_count), else_=0.0
+        )
+    for rate_column, (count_column, _, _) in PATTERN_RATES.items():
+        values[rate_column] = case(
+            (sample_count > 0, getattr(AggregatedPattern, count_column) * 1.0 / sample_count), else_=0.0
+        )
+
+    db.execute(
+        update(AggregatedPattern)
+        .where(AggregatedPattern.category.in_(categories))
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def rebuild_aggregated_patterns(db: Session, categories: Optional[List[str]] = None, commit: bool = True) -> int:
+    """
+    원본 분석 결과로 카테고리 패턴 전체 재집계 (조건부 집계 쿼리 한 번, 복구/대량 분석 후)
+
+    Args:
+        categories: 대상 카테고리 (없으면 분석 결과가 있는 전체 카테고리)
+
+    Returns:
+        재집계한 카테고리 수
+    """
+    sampled = TopPostAnalysis.content_length > PATTERN_MIN_CONTENT_LENGTH
+    columns = [
+        TopPostAnalysis.category,
+        func.sum(case((sampled, 1), else_=0)).label("sample_count"),
+    ]
+    for sum_column, column in PATTERN_AVERAGES.values():
+        columns.append(func.sum(case((sampled, getattr(TopPostAnalysis, column)), else_=0)).label(sum_column))
+    for count_column, condition, _ in PATTERN_RATES.values():
+        columns.append(func.sum(case((condition, 1), else_=0)).label(count_column))
+    for column in PATTERN_EXTREMES:
+        source = getattr(TopPostAnalysis, column)
+        columns.append(func.min(case((sampled, source))).label(f"min_{column}"))
+        columns.append(func.max(case((sampled, source))).label(f"max_{column}"))
+
+    query = db.query(*columns).filter(
+        TopPostAnalysis.rank <= PATTERN_MAX_RANK,
+        TopPostAnalysis.category.isnot(None)
+    )
+    if categories is not None:
+        if not categories:
+            return 0
+        query = query.filter(TopPostAnalysis.category.in_(categories))
+    rows = {row.category: row for row in query.group_by(TopPostAnalysis.category).all()}
+
+    targets = set(rows) if categories is None else set(categories)
+    existing = {
+        pattern.category: pattern
+        for pattern in db.query(AggregatedPattern).filter(AggregatedPattern.category.in_(targets)).all()
     }
 
-    if existing:
-        for key, value in pattern_data.items():
-            if hasattr(existing, key):
-                setattr(existing, key, value)
-        existing.updated_at = datetime.utcnow()
-    else:
-        new_pattern = AggregatedPattern(**pattern_data)
-        db.add(new_pattern)
+    rebuilt = []
+    for category in targets:
+        row = rows.get(category)
+        pattern = existing.get(category)
+        if pattern is None:
+            if row is None:
+                continue
+            pattern = AggregatedPattern(category=category)
+            db.add(pattern)
+
+        pattern.sample_count = row.sample_count if row else 0
+        for sum_column, _ in PATTERN_AVERAGES.values():
+            setattr(pattern, sum_column, (getattr(row, sum_column) if row else 0) or 0)
+        for count_column, _, _ in PATTERN_RATES.values():
+            setattr(pattern, count_column, (getattr(row, count_column) if row else 0) or 0)
+        for column in PATTERN_EXTREMES:
+            setattr(pattern, f"min_{column}", (getattr(row, f"min_{column}") if row else 0) or 0)
+            setattr(pattern, f"max_{column}", (getattr(row, f"max_{column}") if row else 0) or 0)
+        rebuilt.append(pattern)
+
+    if rebuilt:
+        db.flush()
+        _refresh_pattern_averages(db, [pattern.category for pattern in rebuilt])
+        for pattern in rebuilt:
+            db.expire(pattern)
+
+    if commit:
+        db.commit()
+    return len(rebuilt)
 
-    db.commit()
+
+def update_aggregated_patterns(db: Session, category: str):
+    """카테고리별 패턴 집계 업데이트 (전체 재집계)"""
+    rebuild_aggregated_patterns(db, [category])
 
 
 def generate_writing_guide(db: Session, category: str) -> Dict:
@@ -0,0 +1,141 @@
+"""
+분석 통계 집계 벤치마크
+사용자 한 명이 포스팅 10만 건을 가진 임시 SQLite DB에서
+개요/트렌드/비교/리포트 통계의 응답 시간과 메모리 사용량을 측정합니다.
+비교용으로 포스팅 전체를 파이썬으로 읽어오는 기존 방식도 함께 측정합니다.
+
+사용법:
+    python benchmark_analytics.py [--posts 100000] [--skip-legacy]
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import configure_mappers
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.db.database import Base
+import app.models.blog_outreach  # noqa: F401  (User.naver_blogs 관계 대상 등록)
+from app.models import Post, User
+from app.models.post import PostAnalytics, PostStatus
+from app.services.analytics_service import analytics_service
+from app.services.report_service import ReportService
+
+KEYWORDS = [f"키워드{i}" for i in range(300)]
+STATUSES = [PostStatus.DRAFT, PostStatus.PUBLISHED, PostStatus.ARCHIVED]
+
+
+async def build_fixture(engine, post_count: int, seed: int = 42) -> uuid.UUID:
+    """포스팅 post_count건(최근 1년 분포)과 절반 분량의 조회수 데이터 생성"""
+    rng = random.Random(seed)
+    user_id = uuid.uuid4()
+    now = datetime.utcnow()
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(insert(User), [{
+            "id": user_id, "email": "bench@example.com", "hashed_password": "x", "name": "bench",
+        }])
+
+        batch_size = 5000
+        for offset in range(0, post_count, batch_size):
+            posts, analytics = [], []
+            for _ in range(min(batch_size, post_count - offset)):
+                post_id = uuid.uuid4()
+                posts.append({
+                    "id": post_id,
+                    "user_id": user_id,
+                    "title": "벤치마크 포스팅",
+                    "original_content": "원문 " * 50,
+                    "generated_content": "본문 " * 300,
+                    "persuasion_score": round(rng.uniform(0, 100), 1),
+                    "status": rng.choice(STATUSES),
+                    "seo_keywords": rng.sample(KEYWORDS, rng.randint(0, 8)),
+                    "hashtags": [],
+                    "created_at": now - timedelta(minutes=rng.randint(0, 365 * 24 * 60)),
+                })
+                if rng.random() < 0.5:
+                    analytics.append({
+                        "id": uuid.uuid4(), "post_id": post_id,
+                        "views": rng.randint(0, 1000), "inquiries": rng.randint(0, 10),
+                    })
+            await conn.execute(insert(Post), posts)
+            if analytics:
+                await conn.execute(insert(PostAnalytics), analytics)
+    return user_id
+
+
+async def legacy_overview(db: AsyncSession, user_id) -> int:
+    """기존 방식: 포스팅 전체를 ORM 객체로 읽어 파이썬에서 집계"""
+    posts = (await db.execute(select(Post).where(Post.user_id == user_id))).scalars().all()
+    keyword_counts = {}
+    for post in posts:
+        for keyword in (post.seo_keywords or [])[:5]:
+            keyword_counts[keyword] = keyword_counts.get(keyword, 0) + 1
+    return len(posts)
+
+
+async def measure(label: str, session_factory, func, *args):
+    """세션 하나로 func 실행 시간과 파이썬 메모리 최대 사용량 측정"""
+    tracemalloc.start()
+    started = time.perf_counter()
+    async with session_factory() as db:
+        await func(db, *args)
+    elapsed = (time.perf_counter() - started) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} {elapsed:>10.1f}ms {peak / 1024 / 1024:>10.2f}MB")
+    return elapsed
+
+
+async def run(post_count: int, skip_legacy: bool):
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp}/analytics_bench.db")
+        session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+        started = time.perf_counter()
+        user_id = await build_fixture(engine, post_count)
+        print(f"픽스처 생성: 포스팅 {post_count:,}건 ({time.perf_counter() - started:.1f}s)")
+
+        # 첫 쿼리의 매퍼 설정 비용이 측정에 섞이지 않도록 미리 수행
+        configure_mappers()
+        report_service = ReportService()
+        period_end = date.today()
+        period_start = period_end - timedelta(days=30)
+
+        print("=" * 60)
+        print(f"{'항목':<28} {'시간':>12} {'최대 메모리':>10}")
+        await measure("overview", session_factory, analytics_service.get_overview, user_id)
+        await measure("trends (90일)", session_factory, analytics_service.get_trends, user_id, 90)
+        await measure("comparison", session_factory, analytics_service.get_comparison, user_id)
+        await measure(
+            "report (30일)", session_factory,
+            report_service._collect_report_data, user_id, period_start, period_end,
+        )
+        if not skip_legacy:
+            await measure("기존 overview (전체 로드)", session_factory, legacy_overview, user_id)
+        print("=" * 60)
+
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="분석 통계 집계 벤치마크")
+    parser.add_argument("--posts", type=int, default=100_000)
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.posts, args.skip_legacy))
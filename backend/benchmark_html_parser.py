@@ -0,0 +1,257 @@
+"""
+상위글 본문 HTML 파싱 벤치마크
+네이버 모바일 블로그 페이지에서 분석 항목을 뽑는 데 페이지당 몇 ms가 드는지 파서별로 측정합니다.
+
+- 기존 방식: BeautifulSoup(html.parser) + 셀렉터마다 soup.select (약 25회 전체 탐색)
+- 기존 방식 + lxml 트리 빌더
+- 단일 순회 추출 (html_parser.scan_page) - 설치된 백엔드별
+
+저장해 둔 페이지가 있으면 --corpus 폴더의 *.html을 사용하고, 없으면 스마트에디터 구조를 흉내 낸
+페이지를 생성합니다. 모든 방식의 추출 결과가 기존 방식과 같은지도 확인합니다.
+
+사용법:
+    python benchmark_html_parser.py [--corpus saved_pages/] [--pages 200] [--keyword 피부과]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from bs4 import BeautifulSoup
+
+from app.services.html_parser import available_backends, get_backend, LXML_AVAILABLE
+from app.services.top_post_analyzer import (
+    SELECTORS,
+    extract_post_features,
+    get_keyword_position,
+    calculate_keyword_density,
+)
+import app.services.top_post_analyzer as top_post_analyzer
+
+SENTENCES = [
+    "오늘은 피부과에서 받은 레이저 시술 후기를 자세히 남겨보려고 합니다.",
+    "상담부터 시술, 사후 관리까지 단계별로 정리했어요.",
+    "시술 직후에는 붉은기가 조금 있었지만 이틀 정도 지나니 가라앉았습니다.",
+    "가격과 위치, 주차 정보는 글 하단에 정리해 두었습니다.",
+    "개인에 따라 결과에는 차이가 있을 수 있으니 참고만 해주세요.",
+]
+
+
+def legacy_extract(html: str, keyword: str, parser: str) -> dict:
+    """변경 전 analyze_post의 추출 로직 (비교 기준)"""
+    features = {}
+    soup = BeautifulSoup(html, parser)
+
+    title = None
+    for selector in SELECTORS["title"]:
+        if selector.startswith("meta"):
+            meta = soup.select_one(selector)
+            if meta:
+                title = meta.get('content', '')
+                break
+        else:
+            el = soup.select_one(selector)
+            if el:
+                title = el.get_text(strip=True)
+                break
+
+    if title:
+        features["title"] = title
+        features["title_length"] = len(title)
+        features["title_has_keyword"] = keyword.lower() in title.lower()
+        features["title_keyword_position"] = get_keyword_position(title, keyword)
+
+    content = ""
+    for selector in SELECTORS["content"]:
+        el = soup.select_one(selector)
+        if el:
+            content = el.get_text(separator="\n", strip=True)
+            break
+
+    if content:
+        features["content_length"] = len(content)
+        kw_count, kw_density = calculate_keyword_density(content, keyword)
+        features["keyword_count"] = kw_count
+        features["keyword_density"] = kw_density
+        features["data_fetched"] = True
+        paragraphs = [p for p in content.split('\n') if p.strip() and len(p.strip()) > 20]
+        features["paragraph_count"] = len(paragraphs)
+
+    images = []
+    for selector in SELECTORS["images"]:
+        images.extend(soup.select(selector))
+    features["image_count"] = len(set([img.get('src', '') for img in images if img.get('src')]))
+
+    videos = []
+    for selector in SELECTORS["videos"]:
+        videos.extend(soup.select(selector))
+    features["video_count"] = len(videos)
+
+    headings = []
+    for selector in SELECTORS["headings"]:
+        headings.extend(soup.select(selector))
+    features["heading_count"] = len(headings)
+
+    maps = []
+    for selector in SELECTORS["maps"]:
+        maps.extend(soup.select(selector))
+    features["has_map"] = len(maps) > 0
+
+    links = soup.select('a[href*="http"]')
+    external_links = [l for l in links if 'naver.com' not in l.get('href', '')]
+    features["has_link"] = len(external_links) > 0
+
+    quotes = []
+    for selector in SELECTORS["quotes"]:
+        quotes.extend(soup.select(selector))
+    features["has_quote"] = len(quotes) > 0
+
+    lists = []
+    for selector in SELECTORS["lists"]:
+        lists.extend(soup.select(selector))
+    features["has_list"] = len(lists) > 0
+
+    return features
+
+
+def build_page(rng: random.Random, keyword: str) -> str:
+    """스마트에디터 ONE 모바일 본문 구조를 흉내 낸 페이지 (헤더/스크립트/댓글 영역 포함)"""
+    components = []
+    for i in range(rng.randint(25, 60)):
+        kind = rng.random()
+        if kind < 0.45:
+            text = " ".join(rng.choice(SENTENCES) for _ in range(rng.randint(1, 4)))
+            if rng.random() < 0.3:
+                text = text.replace("피부과", keyword, 1)
+            components.append(
+                '<div class="se-component se-text se-l-default"><div class="se-component-content">'
+                f'<div class="se-section se-section-text"><p class="se-text-paragraph"><span>{text}</span></p>'
+                '</div></div></div>'
+            )
+        elif kind < 0.75:
+            n = rng.randint(1, 10**6)
+            components.append(
+                '<div class="se-component se-image"><div class="se-component-content"><div class="se-section se-section-image">'
+                f'<a class="se-module-image-link" data-linktype="img"><img src="https://postfiles.pstatic.net/MjAy{n}/img_{i}.jpg?type=w80_blur" '
+                f'data-lazy-src="https://postfiles.pstatic.net/MjAy{n}/img_{i}.jpg?type=w773" class="se-image-resource egjs-visible"></a>'
+                '</div></div></div>'
+            )
+        elif kind < 0.82:
+            components.append(
+                '<div class="se-component se-sectionTitle"><div class="se-section se-section-sectionTitle">'
+                f'<h3 class="se-section-title"><span>{rng.choice(SENTENCES)[:15]}</span></h3></div></div>'
+            )
+        elif kind < 0.88:
+            components.append(
+                '<div class="se-component se-quotation"><blockquote class="se-quotation-container">'
+                f'<p class="se-text-paragraph">{rng.choice(SENTENCES)}</p></blockquote></div>'
+            )
+        elif kind < 0.92:
+            components.append(
+                '<div class="se-component se-video"><div class="se-section se-section-video">'
+                '<iframe src="https://serviceapi.nmv.naver.com/flash/convertIframeTag.nhn?vid=ABC&outKey=XYZ&type=video"></iframe>'
+                '</div></div>'
+            )
+        elif kind < 0.95:
+            components.append(
+                '<div class="se-component se-placesMap"><div class="se-section se-map">'
+                '<a href="https://map.naver.com/p/entry/place/1234">지도 보기</a></div></div>'
+            )
+        else:
+            components.append(
+                '<div class="se-component se-oglink"><a class="se-oglink-info" '
+                f'href="https://www.example.com/article/{rng.randint(1, 999)}">외부 링크</a></div>'
+            )
+
+    title = f"{keyword} 레이저 시술 솔직 후기 {rng.randint(1, 99)}탄"
+    chrome = "".join(
+        f'<li class="menu_item"><a href="https://m.blog.naver.com/menu{i}">메뉴 {i}</a></li>' for i in range(20)
+    )
+    return (
+        '<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8">'
+        f'<meta property="og:title" content="{title}"><title>{title} : 네이버 블로그</title>'
+        + "".join(f'<script>window.__data{i} = {{"blogId": "user{i}", "logNo": {i}}};</script>' for i in range(15))
+        + '<style>.se-main-container{margin:0}</style></head><body>'
+        + f'<header><ul class="gnb">{chrome}</ul></header>'
+        + '<div id="viewTypeSelector"><div class="se-viewer se-theme-default">'
+        + '<div class="se-component se-documentTitle"><div class="se-title-text">'
+        + f'<span class="se-fs- se-ff-">{title}</span></div></div>'
+        + f'<div class="se-main-container">{"".join(components)}</div></div></div>'
+        + '<div class="comment_area"><!-- 댓글 영역 -->'
+        + "".join(f'<div class="comment"><span class="nick">이웃{i}</span><p>좋은 정보 감사합니다</p></div>' for i in range(10))
+        + '</div></body></html>'
+    )
+
+
+def load_corpus(corpus: str, pages: int, keyword: str):
+    if corpus:
+        paths = sorted(Path(corpus).glob("*.html"))
+        if not paths:
+            sys.exit(f"{corpus}에 *.html 파일이 없습니다")
+        return [p.read_text(encoding="utf-8", errors="replace") for p in paths], f"{corpus} ({len(paths)}개 저장 페이지)"
+
+    rng = random.Random(42)
+    return [build_page(rng, keyword) for _ in range(pages)], f"생성한 모바일 블로그 페이지 {pages}개"
+
+
+def measure(label: str, extract, pages, keyword: str, baseline=None):
+    results = []
+    started = time.perf_counter()
+    for html in pages:
+        results.append(extract(html, keyword))
+    elapsed = time.perf_counter() - started
+
+    mismatches = 0
+    if baseline is not None:
+        mismatches = sum(1 for a, b in zip(results, baseline) if a != b)
+    per_page = elapsed / len(pages) * 1000
+    same = "" if baseline is None else ("  결과 동일" if not mismatches else f"  ❌ 결과 다름 {mismatches}건")
+    print(f"{label:<32} {per_page:8.2f}ms/페이지{same}")
+    return results, per_page
+
+
+def run(corpus: str, pages: int, keyword: str):
+    documents, source = load_corpus(corpus, pages, keyword)
+    size_kb = sum(len(d.encode("utf-8")) for d in documents) / len(documents) / 1024
+
+    print("=" * 60)
+    print(f"코퍼스: {source}, 평균 {size_kb:.1f}KB")
+    print(f"설치된 백엔드: {', '.join(available_backends())}")
+    print("-" * 60)
+
+    baseline, legacy_ms = measure(
+        "기존 (html.parser + select x25)", lambda h, k: legacy_extract(h, k, "html.parser"), documents, keyword
+    )
+    if LXML_AVAILABLE:
+        measure("기존 + lxml 트리 빌더", lambda h, k: legacy_extract(h, k, "lxml"), documents, keyword, baseline)
+
+    best_ms = legacy_ms
+    for name in available_backends():
+        backend = get_backend(name)
+        original = top_post_analyzer.scan_page
+        top_post_analyzer.scan_page = lambda html, groups, _b=backend: original(html, groups, _b)
+        try:
+            _, ms = measure(f"단일 순회 ({name})", extract_post_features, documents, keyword, baseline)
+        finally:
+            top_post_analyzer.scan_page = original
+        best_ms = min(best_ms, ms)
+
+    print("-" * 60)
+    print(f"가장 빠른 방식: 기존 대비 {legacy_ms / best_ms:.1f}배")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="상위글 본문 HTML 파싱 벤치마크")
+    parser.add_argument("--corpus", default=None, help="저장해 둔 네이버 모바일 블로그 페이지(*.html) 폴더")
+    parser.add_argument("--pages", type=int, default=200, help="코퍼스가 없을 때 생성할 페이지 수")
+    parser.add_argument("--keyword", default="피부과")
+    args = parser.parse_args()
+
+    run(args.corpus, args.pages, args.keyword)
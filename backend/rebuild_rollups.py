@@ -0,0 +1,52 @@
+"""
+대시보드 일별 집계 재계산 스크립트
+ROI 전환 이벤트 / 플레이스 리뷰 / 바이럴 성과 이벤트 원본으로 일별 집계 테이블을 다시 만듭니다.
+(최초 백필, 데이터 수동 수정 후 복구, 주기적 점검용)
+
+사용법:
+    python rebuild_rollups.py                 # 전체 기간
+    python rebuild_rollups.py --days 7        # 최근 7일
+    python rebuild_rollups.py --start 2026-01-01 --end 2026-01-31
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.db.database import AsyncSessionLocal, Base, engine
+import app.models  # noqa: F401  (모든 모델 등록)
+import app.models.blog_outreach  # noqa: F401  (User.naver_blogs 관계 대상 등록)
+from app.services.rollup_service import rollup_service
+
+
+async def main(start_date, end_date):
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await rollup_service.ensure(engine)
+
+    print("=" * 60)
+    print(f"일별 집계 재계산: {start_date or '처음'} ~ {end_date or '현재'}")
+    async with AsyncSessionLocal() as db:
+        rebuilt = await rollup_service.rebuild_all(db, start_date=start_date, end_date=end_date)
+    for table, rows in rebuilt.items():
+        print(f"✓ {table}: {rows}행")
+    print("=" * 60)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="대시보드 일별 집계 재계산")
+    parser.add_argument("--start", type=date.fromisoformat, default=None)
+    parser.add_argument("--end", type=date.fromisoformat, default=None)
+    parser.add_argument("--days", type=int, default=None, help="오늘 포함 최근 N일")
+    args = parser.parse_args()
+
+    start = args.start
+    if args.days:
+        start = date.today() - timedelta(days=args.days - 1)
+    asyncio.run(main(start, args.end))
@@ -0,0 +1,147 @@
+"""
+상위글 패턴 집계 증분 갱신 검증
+분석 결과를 무작위로 저장(신규/갱신, 카테고리 이동 포함)하면서
+증분 갱신한 AggregatedPattern이 원본 전체 재집계(rebuild_aggregated_patterns)와 같은지 확인합니다.
+
+- 증분 DB: save_post_analyses(..., update_patterns=True)
+- 기준 DB: 같은 순서로 update_patterns=False 저장 후 매번 전체 재집계
+- 세션은 SessionLocal과 같은 autoflush=False 설정
+
+사용법:
+    python test_aggregated_patterns.py [--steps 300] [--seed 1]
+    pytest test_aggregated_patterns.py
+"""
+
+import argparse
+import math
+import random
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.database import Base
+import app.models  # noqa: F401  (모든 모델 등록)
+import app.models.blog_outreach  # noqa: F401  (User.naver_blogs 관계 대상 등록)
+from app.models.top_post_analysis import TopPostAnalysis, AggregatedPattern
+from app.services.top_post_analyzer import (
+    PATTERN_AVERAGES,
+    PATTERN_RATES,
+    PATTERN_EXTREMES,
+    save_post_analyses,
+    rebuild_aggregated_patterns,
+)
+
+CATEGORIES = ["hospital", "beauty", "restaurant"]
+FIELDS = (
+    ["sample_count"]
+    + list(PATTERN_AVERAGES)
+    + list(PATTERN_RATES)
+    + [f"{bound}_{column}" for column in PATTERN_EXTREMES for bound in ("min", "max")]
+)
+
+
+def make_session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[TopPostAnalysis.__table__, AggregatedPattern.__table__])
+    return sessionmaker(bind=engine, autocommit=False, autoflush=False)()
+
+
+def random_analysis(rng: random.Random, keyword: str, post_url: str, category: str) -> dict:
+    return {
+        "keyword": keyword,
+        "post_url": post_url,
+        "rank": rng.randint(1, 5),
+        "blog_id": "blog",
+        "category": category,
+        "title_length": rng.randint(5, 60),
+        "title_has_keyword": rng.random() < 0.6,
+        "title_keyword_position": rng.choice([-1, 0, 1, 2]),
+        "content_length": rng.choice([0, 50, rng.randint(101, 5000)]),
+        "image_count": rng.randint(0, 30),
+        "video_count": rng.choice([0, 0, 1, 2]),
+        "heading_count": rng.randint(0, 9),
+        "paragraph_count": rng.randint(0, 40),
+        "keyword_count": rng.randint(0, 20),
+        "keyword_density": round(rng.random() * 3, 2),
+        "has_map": rng.random() < 0.3,
+    }
+
+
+def snapshot(db) -> dict:
+    db.expire_all()
+    return {
+        pattern.category: {field: getattr(pattern, field) or 0 for field in FIELDS}
+        for pattern in db.query(AggregatedPattern)
+    }
+
+
+def differences(incremental: dict, rebuilt: dict) -> list:
+    """(카테고리, 컬럼, 증분 값, 재집계 값) 목록"""
+    diffs = []
+    for category in sorted(set(incremental) | set(rebuilt)):
+        left = incremental.get(category, {})
+        right = rebuilt.get(category, {})
+        for field in FIELDS:
+            a, b = left.get(field, 0), right.get(field, 0)
+            if not math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-9):
+                diffs.append((category, field, a, b))
+    return diffs
+
+
+def run(steps: int = 300, seed: int = 1) -> list:
+    """무작위 저장을 재생하며 처음 어긋난 시점의 차이 반환 (없으면 빈 목록)"""
+    rng = random.Random(seed)
+    incremental, reference = make_session(), make_session()
+    urls = [f"https://m.blog.naver.com/blog/{i}" for i in range(60)]
+
+    try:
+        for step in range(steps):
+            keyword = f"키워드{rng.randint(0, 80)}"
+            # 같은 글이 다른 카테고리로 다시 저장되는 경우도 포함
+            category = rng.choice(CATEGORIES)
+            batch = [random_analysis(rng, keyword, rng.choice(urls), category) for _ in range(3)]
+
+            save_post_analyses(incremental, [dict(analysis) for analysis in batch])
+            save_post_analyses(reference, [dict(analysis) for analysis in batch], update_patterns=False)
+            rebuild_aggregated_patterns(reference)
+
+            diffs = differences(snapshot(incremental), snapshot(reference))
+            if diffs:
+                return [(step, *diff) for diff in diffs]
+    finally:
+        incremental.close()
+        reference.close()
+    return []
+
+
+def test_incremental_matches_rebuild():
+    """증분 갱신 결과가 전체 재집계와 같은지 확인"""
+    diffs = run()
+    assert not diffs, "증분/재집계 불일치: " + ", ".join(
+        f"step {step} {category}.{field} {a} != {b}" for step, category, field, a, b in diffs[:5]
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="상위글 패턴 집계 증분 갱신 검증")
+    parser.add_argument("--steps", type=int, default=300, help="저장할 키워드 수")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("상위글 패턴 집계: 증분 갱신 vs 전체 재집계")
+    print("=" * 60)
+    diffs = run(args.steps, args.seed)
+    for step, category, field, a, b in diffs:
+        print(f"  step {step}: {category}.{field} 증분 {a} / 재집계 {b}")
+    print("=" * 60)
+    if diffs:
+        print(f"✗ {len(diffs)}개 컬럼 불일치")
+        sys.exit(1)
+    print(f"✓ 키워드 {args.steps}개 저장 후에도 일치")
@@ -0,0 +1,116 @@
+"""
+비동기 함수 안의 동기 DB 세션 사용 검사
+app/ 아래 모든 모듈의 AST를 훑어 `async def` 본문에서 이벤트 루프를 막는 DB 호출을 찾습니다.
+
+- SessionLocal() 생성 (동기 엔진 커넥션)
+- db.query(...) (동기 Session 전용 API)
+- await 없이 호출한 commit/rollback/flush/refresh/execute/delete/... (동기 Session으로 보임)
+
+중첩된 일반 함수/람다(예: db.run_sync(lambda s: ...))는 별도 스레드 문맥이므로 검사하지 않습니다.
+
+사용법:
+    python test_async_db_usage.py
+    pytest test_async_db_usage.py
+"""
+
+import ast
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+APP_DIR = project_root / "app"
+
+# 세션으로 보는 수신자 이름
+SESSION_RECEIVERS = {"db", "session", "sync_db", "self.db", "self.session"}
+# AsyncSession에는 없는 동기 전용 메서드
+SYNC_ONLY_METHODS = {"query"}
+# AsyncSession에서는 반드시 await해야 하는 메서드
+# (get은 aiohttp ClientSession.get과 겹쳐 제외)
+AWAITABLE_METHODS = {
+    "commit", "rollback", "flush", "refresh", "execute",
+    "delete", "close", "scalar", "scalars", "merge",
+}
+
+
+def _enclosing_async_function(node, parents):
+    """가장 가까운 함수가 async def일 때만 반환"""
+    while node in parents:
+        node = parents[node]
+        if isinstance(node, (ast.FunctionDef, ast.Lambda)):
+            return None
+        if isinstance(node, ast.AsyncFunctionDef):
+            return node
+    return None
+
+
+def find_sync_db_calls(path: Path) -> list:
+    """파일 하나에서 (줄 번호, 함수명, 설명) 목록 반환"""
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    parents = {}
+    for node in ast.walk(tree):
+        for child in ast.iter_child_nodes(node):
+            parents[child] = node
+
+    problems = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        func = _enclosing_async_function(node, parents)
+        if func is None:
+            continue
+
+        target = node.func
+        if isinstance(target, ast.Name) and target.id == "SessionLocal":
+            problems.append((node.lineno, func.name, "SessionLocal()"))
+            continue
+        if not isinstance(target, ast.Attribute):
+            continue
+
+        receiver = ast.unparse(target.value)
+        if receiver not in SESSION_RECEIVERS:
+            continue
+        if target.attr in SYNC_ONLY_METHODS:
+            problems.append((node.lineno, func.name, f"{receiver}.{target.attr}()"))
+        elif target.attr in AWAITABLE_METHODS and not isinstance(
+            parents.get(node), (ast.Await, ast.withitem)
+        ):
+            problems.append((node.lineno, func.name, f"{receiver}.{target.attr}() without await"))
+    return problems
+
+
+def scan() -> dict:
+    """app/ 전체 검사 결과 {상대 경로: 문제 목록}"""
+    results = {}
+    for path in sorted(APP_DIR.rglob("*.py")):
+        problems = find_sync_db_calls(path)
+        if problems:
+            results[str(path.relative_to(project_root))] = problems
+    return results
+
+
+def test_no_sync_db_in_coroutines():
+    """async def 안에서 동기 Session을 쓰는 곳이 없는지 확인"""
+    results = scan()
+    assert not results, "동기 DB 호출: " + ", ".join(
+        f"{path}:{line} {func} {desc}"
+        for path, problems in results.items()
+        for line, func, desc in problems
+    )
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("비동기 함수 내 동기 DB 사용 검사")
+    print("=" * 60)
+    results = scan()
+    for path, problems in results.items():
+        for line, func, desc in problems:
+            print(f"  {path}:{line} [{func}] {desc}")
+    print("=" * 60)
+    if results:
+        print(f"✗ {sum(len(p) for p in results.values())}건 발견")
+        sys.exit(1)
+    print("✓ 문제 없음")
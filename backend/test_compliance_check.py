@@ -0,0 +1,110 @@
+"""
+의료법/금칙어 검사 건수 검증
+ComplianceScanner.all_matches()가 규칙마다 re.finditer로 찾은 결과와 같은지 확인합니다.
+(check()/check_only()는 겹치는 일치도 규칙별로 모두 보고하고, 겹침 정리는 자동 수정에서만 적용)
+
+- 규칙 패턴 조각과 위반 예시 문구를 무작위로 이어 붙인 텍스트 사용
+- 기본 의료법 규칙(대소문자 무시)과 금칙어 규칙 모두 확인
+
+사용법:
+    python test_compliance_check.py [--texts 3000] [--seed 1]
+    pytest test_compliance_check.py
+"""
+
+import argparse
+import random
+import re
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from app.services.compliance_rules import compliance_rule_store
+from app.services.medical_law_checker import medical_law_checker
+
+SAMPLES = [
+    "100% 완치", "반드시 효과", "타병원보다 우수", "다른 병원보다는 뛰어남", "단 3일 완치",
+    "30% 할인", "이벤트 5000 원", "최고급", "No.1", "no.1", "세계 최초", "보장 결과",
+    "누구나 효과", "30% 효과", "5만원", "2회 무료", " ", "요 ", "그리고 ",
+]
+OVERLAPPING_TEXT = "100% 완치를 보장하는 국내 최고 병원, 이벤트 특가 300000원! 무료 상담, 반드시 효과 있는 기적의 치료"
+
+
+def scanners():
+    current = compliance_rule_store.current
+    return {"의료법": current.medical_scanner, "금칙어": current.forbidden_scanner}
+
+
+def finditer_matches(scanner, text: str) -> list:
+    """규칙마다 re.finditer로 찾은 일치 (규칙 순, 위치 순)"""
+    matches = []
+    for index, rule in enumerate(scanner.rules):
+        pattern = re.escape(rule["pattern"]) if rule.get("literal") else rule["pattern"]
+        for match in re.finditer(pattern, text, scanner.flags):
+            if match.end() > match.start():
+                matches.append((match.start(), match.end(), index))
+    return matches
+
+
+def random_text(rng: random.Random, fragments: list) -> str:
+    return "".join(rng.choice(fragments) for _ in range(rng.randint(1, 15)))
+
+
+def run(texts: int = 3000, seed: int = 1) -> list:
+    """불일치 목록 [(검사기, 텍스트, all_matches, finditer)]"""
+    rng = random.Random(seed)
+    fragments = list(SAMPLES)
+    for scanner in scanners().values():
+        # 패턴에서 메타문자를 뺀 조각 (고정 단어/접두어가 들어간 텍스트)
+        fragments += [re.sub(r"\\[sd]|[\\()?:|*+.\[\]{}^$]", "", rule["pattern"])[:12] for rule in scanner.rules]
+
+    mismatches = []
+    for _ in range(texts):
+        text = random_text(rng, fragments)
+        for name, scanner in scanners().items():
+            found = [(start, end, index) for start, end, index, _ in scanner.all_matches(text)]
+            expected = finditer_matches(scanner, text)
+            if found != expected:
+                mismatches.append((name, text, found, expected))
+    return mismatches
+
+
+def test_all_matches_equals_per_rule_finditer():
+    """all_matches()가 규칙별 finditer와 같은지 확인"""
+    mismatches = run()
+    assert not mismatches, "불일치: " + ", ".join(repr(text) for _, text, _, _ in mismatches[:5])
+
+
+def test_check_reports_overlapping_matches():
+    """check()가 겹치는 위반을 규칙별로 모두 보고하는지 확인 (자동 수정 대상보다 많음)"""
+    result = medical_law_checker.check(OVERLAPPING_TEXT)
+    expected = finditer_matches(compliance_rule_store.current.medical_scanner, OVERLAPPING_TEXT)
+    assert result["total_issues"] == len(expected)
+    _, changes = medical_law_checker.auto_fix(OVERLAPPING_TEXT)
+    assert len(changes) < result["total_issues"]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="의료법/금칙어 검사 건수 검증")
+    parser.add_argument("--texts", type=int, default=3000, help="검사할 무작위 텍스트 수")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("검사 건수: all_matches() vs 규칙별 re.finditer")
+    print("=" * 60)
+    mismatches = run(args.texts, args.seed)
+    for name, text, found, expected in mismatches[:10]:
+        print(f"  [{name}] {text!r}")
+        print(f"    all_matches: {found}")
+        print(f"    finditer:    {expected}")
+    result = medical_law_checker.check(OVERLAPPING_TEXT)
+    _, changes = medical_law_checker.auto_fix(OVERLAPPING_TEXT)
+    print(f"  예시 문장: 위반 {result['total_issues']}건 보고, 자동 수정 {len(changes)}건")
+    print("=" * 60)
+    if mismatches:
+        print(f"✗ {len(mismatches)}건 불일치")
+        sys.exit(1)
+    print(f"✓ 텍스트 {args.texts}개 모두 일치")
@@ -0,0 +1,129 @@
+"""
+동시 포스팅 생성 검증 (SQLite 단일 쓰기 커넥션)
+AI 호출이 오래 걸리는 포스팅 생성 두 건을 동시에 실행해
+한쪽이 AI 응답을 기다리는 동안 쓰기 커넥션을 잡아 다른 쪽이 막히지 않는지 확인합니다.
+
+- 임시 파일 DB + WAL 모드, 쓰기 커넥션 대기 시간(SQLITE_WRITER_TIMEOUT) 1초
+- AI 각색/후처리 단계는 각각 AI_DELAY초 걸리는 가짜 구현으로 대체 (대기 시간보다 김)
+- 두 건 모두 성공하고, 포스팅/AI 사용량이 각각 2건 저장되어야 함
+
+사용법:
+    python test_concurrent_post_creation.py
+    pytest test_concurrent_post_creation.py
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 설정을 읽기 전에 임시 DB와 짧은 쓰기 대기 시간 지정
+DB_PATH = Path(tempfile.mkdtemp()) / "concurrent.db"
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{DB_PATH}"
+os.environ["DATABASE_URL_SYNC"] = f"sqlite:///{DB_PATH}"
+os.environ["SQLITE_WAL_MODE"] = "true"
+os.environ["SQLITE_WRITER_TIMEOUT"] = "1"
+os.environ["DEBUG"] = "false"
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import func, select
+
+from app.db.database import AsyncSessionLocal, Base, engine, read_engine
+import app.models  # noqa: F401  (모든 모델 등록)
+import app.models.blog_outreach  # noqa: F401  (User.naver_blogs 관계 대상 등록)
+from app.models import AIUsage, Post
+from app.services.ai_rewrite_engine import ai_rewrite_engine
+from app.services.post_service import PostService, post_service
+
+AI_DELAY = 1.5  # 가짜 AI 단계 소요 시간 (초) - 쓰기 대기 시간보다 길게
+CONTENT = "무릎 관절염은 연골이 닳아 통증과 부기가 생기는 질환입니다. 초기에는 운동과 체중 관리로 증상을 완화할 수 있습니다."
+
+
+async def fake_generate(**kwargs):
+    await asyncio.sleep(AI_DELAY)
+    ai_rewrite_engine.last_usage = {
+        "ai_provider": "gpt",
+        "ai_model": "gpt-4o-mini",
+        "input_tokens": 100,
+        "output_tokens": 200,
+        "total_tokens": 300,
+    }
+    return kwargs["original_content"]
+
+
+async def fake_post_processing(self, content, specialty, location, send_progress, extras_mode):
+    await asyncio.sleep(AI_DELAY)
+    return {
+        "scoring": {"total": 70},
+        "seo": {"keywords": [], "hashtags": []},
+        "analyzing": {},
+        "titles": [],
+        "subtitles": [],
+        "dia_crank": None,
+        "title": {"title": "무릎 관절염 관리", "title_replacements": []},
+    }
+
+
+async def run_concurrent(flows: int = 2) -> dict:
+    """포스팅 생성 flows건을 동시에 실행하고 결과/소요 시간/저장 건수 반환"""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async def create():
+        async with AsyncSessionLocal() as db:
+            return await post_service.create_post(db=db, user_id=None, original_content=CONTENT)
+
+    original_generate = ai_rewrite_engine.generate
+    original_post_processing = PostService._run_post_processing
+    ai_rewrite_engine.generate = fake_generate
+    PostService._run_post_processing = fake_post_processing
+    try:
+        started = time.perf_counter()
+        outcomes = await asyncio.gather(*(create() for _ in range(flows)), return_exceptions=True)
+        elapsed = time.perf_counter() - started
+    finally:
+        ai_rewrite_engine.generate = original_generate
+        PostService._run_post_processing = original_post_processing
+
+    async with AsyncSessionLocal() as db:
+        posts = await db.scalar(select(func.count()).select_from(Post))
+        usages = await db.scalar(select(func.count()).select_from(AIUsage))
+
+    await engine.dispose()
+    await read_engine.dispose()
+
+    return {
+        "errors": [outcome for outcome in outcomes if isinstance(outcome, BaseException)],
+        "elapsed": elapsed,
+        "posts": posts,
+        "usages": usages,
+    }
+
+
+def test_concurrent_create_post():
+    """AI 호출 중 쓰기 커넥션을 잡지 않아 동시 생성이 모두 성공하는지 확인"""
+    result = asyncio.run(run_concurrent())
+    assert not result["errors"], result["errors"]
+    assert result["posts"] == 2
+    assert result["usages"] == 2
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("동시 포스팅 생성 (SQLite 단일 쓰기 커넥션)")
+    print("=" * 60)
+    result = asyncio.run(run_concurrent())
+    print(f"  소요 시간: {result['elapsed']:.2f}s (AI 단계 {AI_DELAY}s x 2)")
+    print(f"  포스팅: {result['posts']}건, AI 사용량: {result['usages']}건")
+    for error in result["errors"]:
+        print(f"  오류: {type(error).__name__}: {error}")
+    print("=" * 60)
+    if result["errors"] or result["posts"] != 2 or result["usages"] != 2:
+        print("✗ 동시 생성 실패")
+        sys.exit(1)
+    print("✓ 두 건 모두 저장")
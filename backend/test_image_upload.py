@@ -0,0 +1,177 @@
+"""
+이미지 업로드 API 검증 (imgBB 호출은 httpx.MockTransport로 대체)
+
+- multipart 본문에 base64가 아닌 원본 바이트가 실림
+- 10개 동시 업로드가 동시성 4 제한 안에서 약 3번의 왕복으로 끝남
+- max_width 지정 시 800px로 축소되어 업로드
+- 크기 제한 초과는 413
+- 이미지가 아닌 파일 / 잘못된 base64 (max_width 지정)는 400
+
+사용법:
+    python test_image_upload.py
+    pytest test_image_upload.py
+"""
+
+import asyncio
+import base64
+import io
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import httpx
+from fastapi import FastAPI
+from PIL import Image
+
+from app.api import images
+from app.services.image_upload_service import ImgBBUploader
+
+ROUND_TRIP = 0.1  # 모의 imgBB 응답 지연 (초)
+
+
+class FakeImgBB:
+    """업로드 요청을 기록하고 동시 처리 수를 측정하는 모의 imgBB"""
+
+    def __init__(self):
+        self.requests = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        self.requests.append(body)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(ROUND_TRIP)
+        finally:
+            self.in_flight -= 1
+        index = len(self.requests)
+        return httpx.Response(200, json={
+            "success": True,
+            "data": {"url": f"https://i.ibb.co/{index}.png", "thumb": {"url": f"https://i.ibb.co/t{index}.png"}},
+        })
+
+
+def png_bytes(width: int = 1600, height: int = 1200) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), (200, 80, 40)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def uploaded_width(body: bytes, original: bytes) -> int:
+    """multipart 본문에서 PNG 부분을 찾아 너비 확인"""
+    start = body.index(original[:8])
+    return Image.open(io.BytesIO(body[start:])).width
+
+
+async def call(method: str, path: str, max_bytes: int = 32 * 1024 * 1024, **kwargs):
+    """모의 imgBB에 연결한 업로더로 images 라우터 호출"""
+    fake = FakeImgBB()
+    uploader = ImgBBUploader(api_key="test", max_bytes=max_bytes, concurrency=4)
+    uploader._client = httpx.AsyncClient(transport=httpx.MockTransport(fake))
+
+    original = images.image_uploader
+    images.image_uploader = uploader
+    try:
+        app = FastAPI()
+        app.include_router(images.router, prefix="/images")
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            started = time.perf_counter()
+            response = await client.request(method, path, **kwargs)
+            elapsed = time.perf_counter() - started
+    finally:
+        images.image_uploader = original
+        await uploader.aclose()
+    return response, fake, elapsed
+
+
+def test_multipart_sends_raw_bytes():
+    """파일이 base64 없이 원본 바이트 그대로 전송되는지 확인"""
+    data = png_bytes(64, 64)
+    response, fake, _ = asyncio.run(call("POST", "/images/upload", files={"file": ("a.png", data, "image/png")}))
+    assert response.status_code == 200, response.text
+    assert len(fake.requests) == 1
+    assert data in fake.requests[0]
+    assert base64.b64encode(data) not in fake.requests[0]
+
+
+def test_multiple_upload_bounded_concurrency():
+    """10개 업로드가 최대 4개씩, 약 3번의 왕복으로 끝나는지 확인"""
+    data = png_bytes(64, 64)
+    files = [("files", (f"{i}.png", data, "image/png")) for i in range(10)]
+    response, fake, elapsed = asyncio.run(call("POST", "/images/upload-multiple", files=files))
+    assert response.status_code == 200, response.text
+    assert len(response.json()["images"]) == 10
+    assert fake.peak == 4
+    assert 3 * ROUND_TRIP <= elapsed < 4 * ROUND_TRIP, f"{elapsed:.2f}s"
+
+
+def test_max_width_downscales():
+    """max_width=800이면 1600px 이미지가 800px로 축소되어 업로드되는지 확인"""
+    data = png_bytes()
+    response, fake, _ = asyncio.run(call(
+        "POST", "/images/upload?max_width=800", files={"file": ("a.png", data, "image/png")}
+    ))
+    assert response.status_code == 200, response.text
+    assert uploaded_width(fake.requests[0], data) == 800
+
+
+def test_oversize_rejected():
+    """크기 제한을 넘으면 업로드 없이 413"""
+    data = png_bytes()
+    response, fake, _ = asyncio.run(call(
+        "POST", "/images/upload", max_bytes=len(data) - 1, files={"file": ("a.png", data, "image/png")}
+    ))
+    assert response.status_code == 413
+    assert not fake.requests
+
+
+def test_non_image_rejected():
+    """이미지가 아닌 파일을 축소하려 하면 500이 아닌 400"""
+    response, fake, _ = asyncio.run(call(
+        "POST", "/images/upload?max_width=800", files={"file": ("a.png", b"not an image", "image/png")}
+    ))
+    assert response.status_code == 400, response.text
+    assert not fake.requests
+
+
+def test_malformed_base64_rejected():
+    """잘못된 base64를 축소하려 하면 500이 아닌 400"""
+    response, fake, _ = asyncio.run(call(
+        "POST", "/images/upload-base64?max_width=800", json={"image": "data:image/png;base64,abc"}
+    ))
+    assert response.status_code == 400, response.text
+    assert not fake.requests
+
+
+if __name__ == "__main__":
+    tests = [
+        test_multipart_sends_raw_bytes,
+        test_multiple_upload_bounded_concurrency,
+        test_max_width_downscales,
+        test_oversize_rejected,
+        test_non_image_rejected,
+        test_malformed_base64_rejected,
+    ]
+
+    print("=" * 60)
+    print("이미지 업로드 API 검증 (모의 imgBB)")
+    print("=" * 60)
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"  ✓ {test.__doc__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"  ✗ {test.__doc__}: {e}")
+    print("=" * 60)
+    if failed:
+        print(f"✗ {failed}개 실패")
+        sys.exit(1)
+    print(f"✓ {len(tests)}개 모두 통과")
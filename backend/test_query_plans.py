@@ -0,0 +1,407 @@
+"""
+쿼리 플랜 회귀 테스트
+자주 호출되는 서비스 쿼리 30개를 빈 DB에서 실제로 실행하면서 발생하는 SELECT/UPDATE/DELETE 문마다
+EXPLAIN QUERY PLAN(SQLite) / EXPLAIN(PostgreSQL)을 함께 수행하고,
+인덱스 없이 테이블 전체를 읽는 쿼리가 하나라도 있으면 실패합니다.
+
+- SQLite: 플랜에 "SCAN <테이블>" (인덱스 미사용 전체 스캔)이 있으면 실패
+- PostgreSQL: enable_seqscan=off 상태에서도 "Seq Scan on <테이블>"이 남으면 실패 (쓸 수 있는 인덱스가 없음)
+- 정렬용 임시 B-tree(USE TEMP B-TREE)는 경고만 출력
+
+사용법:
+    python test_query_plans.py                      # 임시 SQLite DB
+    python test_query_plans.py --verbose            # 쿼리별 플랜 출력
+    python test_query_plans.py --database-url postgresql+asyncpg://.../plan_test \\
+                               --sync-url postgresql://.../plan_test   # 비어 있는 테스트 DB
+    pytest test_query_plans.py
+"""
+
+import argparse
+import asyncio
+import re
+import sys
+import tempfile
+import uuid
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.database import Base
+import app.models  # noqa: F401  (모든 모델 등록)
+import app.models.blog_outreach  # noqa: F401  (User.naver_blogs 관계 대상 등록)
+from app.models import User
+from app.models.blog_outreach import NaverBlog
+from app.models.naver_place import NaverPlace
+from app.models.place_ranking import PlaceKeyword
+from app.models.schedule import PublishSchedule, ScheduleStatus, ScheduleType
+from app.services.post_search import post_search_index
+from app.services.rollup_service import rollup_service
+
+EXPLAINED_STATEMENTS = ("SELECT", "WITH", "UPDATE", "DELETE")
+SQLITE_FULL_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)(?: AS \w+)?$")
+POSTGRES_FULL_SCAN = re.compile(r"Seq Scan on (\w+)")
+
+
+class PlanRecorder:
+    """엔진에서 실행되는 문장마다 같은 커서로 플랜을 먼저 조회해 기록"""
+
+    def __init__(self, dialect: str):
+        self.dialect = dialect
+        self.plans = []
+        self.active = False
+
+    def attach(self, sync_engine):
+        event.listen(sync_engine, "before_cursor_execute", self.before_cursor_execute)
+        if self.dialect == "postgresql":
+            event.listen(sync_engine, "connect", self.disable_seqscan)
+
+    @staticmethod
+    def disable_seqscan(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("SET enable_seqscan = off")
+        cursor.close()
+
+    def before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if not self.active or executemany:
+            return
+        if not statement.lstrip().upper().startswith(EXPLAINED_STATEMENTS):
+            return
+        if self.dialect == "sqlite":
+            cursor.execute("EXPLAIN QUERY PLAN " + statement, parameters)
+            details = [row[3] for row in cursor.fetchall()]
+        else:
+            cursor.execute("EXPLAIN " + statement, parameters)
+            details = [row[0] for row in cursor.fetchall()]
+        self.plans.append((statement, details))
+
+    def full_scans(self, details, tables):
+        """플랜에서 전체 스캔되는 실제 테이블 이름 목록"""
+        pattern = SQLITE_FULL_SCAN if self.dialect == "sqlite" else POSTGRES_FULL_SCAN
+        scanned = []
+        for detail in details:
+            match = pattern.search(detail.strip())
+            if match and match.group(1) in tables:
+                scanned.append(match.group(1))
+        return scanned
+
+
+# ==================== 대상 쿼리 ====================
+
+def _posts_api():
+    from app.api import posts
+    return posts
+
+
+async def posts_list(ctx):
+    await _posts_api().get_posts(
+        page=2, page_size=10, cursor=None, summary=True, current_user=ctx["user"], db=ctx["db"]
+    )
+
+
+async def posts_list_cursor(ctx):
+    await _posts_api().get_posts(
+        page=1, page_size=10, cursor="", summary=True, current_user=ctx["user"], db=ctx["db"]
+    )
+
+
+async def posts_search(ctx):
+    await _posts_api().search_posts(
+        q="임플란트", status_filter=None, is_favorited=None, tag_id=None,
+        min_score=None, max_score=None, date_from="2026-01-01", date_to=None,
+        page=1, page_size=10, cursor=None, summary=True, sort="recent", highlight=False,
+        current_user=ctx["user"], db=ctx["db"],
+    )
+
+
+async def analytics_overview(ctx):
+    from app.services.analytics_service import analytics_service
+    await analytics_service.get_overview(ctx["db"], ctx["user"].id)
+
+
+async def analytics_trends(ctx):
+    from app.services.analytics_service import analytics_service
+    await analytics_service.get_trends(ctx["db"], ctx["user"].id, 30)
+
+
+async def analytics_comparison(ctx):
+    from app.services.analytics_service import analytics_service
+    await analytics_service.get_comparison(ctx["db"], ctx["user"].id)
+
+
+async def monthly_report(ctx):
+    from app.services.report_service import ReportService
+    today = date.today()
+    await ReportService()._collect_report_data(ctx["db"], ctx["user"].id, today - timedelta(days=30), today)
+
+
+async def roi_events(ctx):
+    from app.services.roi_service import ROIService
+    await ROIService().get_events(ctx["db"], str(ctx["user"].id), start_date=date.today() - timedelta(days=30))
+
+
+async def roi_dashboard(ctx):
+    from app.services.roi_service import ROIService
+    today = date.today()
+    await ROIService().get_dashboard(ctx["db"], str(ctx["user"].id), today - timedelta(days=30), today)
+
+
+async def roi_keywords(ctx):
+    from app.services.roi_service import ROIService
+    today = date.today()
+    await ROIService().get_keyword_roi(ctx["db"], str(ctx["user"].id), today - timedelta(days=30), today)
+
+
+async def roi_marketing_costs(ctx):
+    from app.services.roi_service import ROIService
+    today = date.today()
+    await ROIService().get_marketing_costs(ctx["db"], str(ctx["user"].id), today - timedelta(days=30), today)
+
+
+async def ranking_keywords(ctx):
+    from app.services.ranking_service import RankingService
+    await RankingService().get_keywords(ctx["db"], str(ctx["user"].id), str(ctx["place"].id))
+
+
+async def ranking_current(ctx):
+    from app.services.ranking_service import RankingService
+    await RankingService().get_current_rankings(ctx["db"], str(ctx["user"].id))
+
+
+async def ranking_history(ctx):
+    from app.services.ranking_service import RankingService
+    await RankingService().get_ranking_history(ctx["db"], str(ctx["keyword"].id), days=30)
+
+
+async def ranking_alerts(ctx):
+    from app.services.ranking_service import RankingService
+    await RankingService().get_alerts(ctx["db"], str(ctx["user"].id), unread_only=True)
+
+
+async def review_list(ctx):
+    from app.services.review_service import ReviewService
+    await ReviewService().get_reviews(
+        ctx["db"], str(ctx["place"].id), is_replied=False, start_date=date.today() - timedelta(days=30)
+    )
+
+
+async def review_analytics(ctx):
+    from app.services.review_service import ReviewService
+    today = date.today()
+    await ReviewService().get_analytics(ctx["db"], str(ctx["place"].id), today - timedelta(days=30), today)
+
+
+async def performance_summary(ctx):
+    from app.services.performance_tracker import performance_tracker
+    await performance_tracker.get_summary(ctx["db"], str(ctx["user"].id), 30)
+
+
+async def daily_performance(ctx):
+    from app.services.daily_report_service import daily_report_service
+    await daily_report_service._collect_performance_data(ctx["db"], str(ctx["user"].id), date.today())
+
+
+async def schedule_list(ctx):
+    from app.services.schedule_service import schedule_service
+    await schedule_service.get_schedules(ctx["db"], str(ctx["user"].id), status=ScheduleStatus.ACTIVE)
+
+
+async def schedule_pending(ctx):
+    from app.services.schedule_service import schedule_service
+    await schedule_service.get_pending_schedules(ctx["db"])
+
+
+async def schedule_upcoming(ctx):
+    from app.services.schedule_service import schedule_service
+    await schedule_service.get_upcoming_posts(ctx["db"], str(ctx["user"].id), days=7)
+
+
+async def schedule_executions(ctx):
+    from app.services.schedule_service import schedule_service
+    await schedule_service.get_executions(ctx["db"], str(ctx["schedule"].id))
+
+
+async def notification_logs(ctx):
+    from app.services.notification_service import notification_service
+    await notification_service.get_notification_logs(ctx["db"], str(ctx["user"].id))
+
+
+async def competitor_alerts(ctx):
+    from app.services.competitor_service import CompetitorService
+    await CompetitorService().get_alerts(ctx["db"], str(ctx["user"].id), unread_only=True)
+
+
+async def knowledge_questions(ctx):
+    from app.services.knowledge_service import KnowledgeService
+    await KnowledgeService(ctx["db"]).get_questions(str(ctx["user"].id), min_relevance=50)
+
+
+async def top_post_patterns(ctx):
+    from app.services.top_post_analyzer import update_aggregated_patterns
+    update_aggregated_patterns(ctx["sync_db"], "치과")
+
+
+async def lead_top(ctx):
+    from app.services.lead_scoring_service import LeadScoringService
+    await LeadScoringService(ctx["db"]).get_top_leads(str(ctx["user"].id), limit=20)
+
+
+async def lead_unscored(ctx):
+    from app.services.lead_scoring_service import LeadScoringService
+    await LeadScoringService(ctx["db"]).score_blogs_batch(str(ctx["user"].id), limit=10)
+
+
+async def email_daily_limit(ctx):
+    from app.services.email_sender_service import EmailSenderService
+    await EmailSenderService(ctx["db"])._check_daily_limit(str(ctx["user"].id))
+
+
+QUERIES = [
+    ("포스팅 목록 (OFFSET)", posts_list),
+    ("포스팅 목록 (커서)", posts_list_cursor),
+    ("포스팅 검색", posts_search),
+    ("분석 개요", analytics_overview),
+    ("분석 트렌드 (30일)", analytics_trends),
+    ("분석 월간 비교", analytics_comparison),
+    ("월간 리포트 집계", monthly_report),
+    ("ROI 이벤트 목록", roi_events),
+    ("ROI 대시보드", roi_dashboard),
+    ("ROI 키워드별", roi_keywords),
+    ("마케팅 비용 목록", roi_marketing_costs),
+    ("순위 추적 키워드", ranking_keywords),
+    ("현재 순위", ranking_current),
+    ("순위 기록", ranking_history),
+    ("순위 알림", ranking_alerts),
+    ("리뷰 목록", review_list),
+    ("리뷰 분석", review_analytics),
+    ("바이럴 성과 요약", performance_summary),
+    ("일일 리포트 성과", daily_performance),
+    ("예약 발행 목록", schedule_list),
+    ("실행 대기 예약", schedule_pending),
+    ("다가오는 발행", schedule_upcoming),
+    ("예약 실행 기록", schedule_executions),
+    ("알림 발송 기록", notification_logs),
+    ("경쟁사 알림", competitor_alerts),
+    ("지식인 질문 목록", knowledge_questions),
+    ("상위 글 패턴 집계", top_post_patterns),
+    ("상위 리드", lead_top),
+    ("미평가 블로그 스코어링", lead_unscored),
+    ("이메일 일일 발송 한도", email_daily_limit),
+]
+
+
+# ==================== 실행 ====================
+
+async def build_fixture(engine, session_factory):
+    """쿼리가 하위 조회까지 실행되도록 최소한의 행만 생성"""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await post_search_index.ensure(engine)
+    await rollup_service.ensure(engine)
+
+    user_id = uuid.uuid4()
+    async with session_factory() as db:
+        user = User(id=user_id, email=f"plan-{user_id.hex[:8]}@example.com", hashed_password="x", name="plan")
+        place = NaverPlace(id=uuid.uuid4(), user_id=user_id, place_id="plan", place_name="플랜 테스트")
+        keyword = PlaceKeyword(id=uuid.uuid4(), user_id=user_id, place_id=place.id, keyword="플랜 테스트")
+        schedule = PublishSchedule(
+            id=uuid.uuid4(), user_id=user_id, schedule_type=ScheduleType.ONE_TIME,
+            scheduled_time=time(9, 0), status=ScheduleStatus.ACTIVE,
+            next_execution_at=datetime.utcnow() + timedelta(days=1),
+        )
+        db.add_all([user, place, keyword, schedule])
+        await db.commit()
+        await db.execute(insert(NaverBlog), [{
+            "id": str(uuid.uuid4()), "user_id": str(user_id), "blog_id": "plan", "blog_url": "https://blog.naver.com/plan",
+        }])
+        await db.commit()
+    return {"user": user, "place": place, "keyword": keyword, "schedule": schedule}
+
+
+async def run(database_url: str, sync_url: str, verbose: bool = False) -> list:
+    """모든 대상 쿼리의 플랜을 확인하고 전체 스캔 목록 반환 [(라벨, 테이블, SQL)]"""
+    engine = create_async_engine(database_url)
+    sync_engine = create_engine(sync_url)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    sync_session_factory = sessionmaker(bind=sync_engine)
+
+    recorder = PlanRecorder(engine.dialect.name)
+    recorder.attach(engine.sync_engine)
+    recorder.attach(sync_engine)
+    tables = set(Base.metadata.tables)
+
+    failures = []
+    try:
+        ctx = await build_fixture(engine, session_factory)
+        for label, query in QUERIES:
+            recorder.plans = []
+            async with session_factory() as db:
+                sync_db = sync_session_factory()
+                try:
+                    recorder.active = True
+                    await query({**ctx, "db": db, "sync_db": sync_db})
+                finally:
+                    recorder.active = False
+                    sync_db.rollback()
+                    sync_db.close()
+                    await db.rollback()
+
+            scans = []
+            temp_sorts = 0
+            for statement, details in recorder.plans:
+                for table in recorder.full_scans(details, tables):
+                    scans.append((label, table, statement))
+                temp_sorts += any("TEMP B-TREE" in detail for detail in details)
+                if verbose:
+                    print(f"  {' '.join(statement.split())[:140]}")
+                    for detail in details:
+                        print(f"      {detail}")
+            status = "FAIL" if scans else "OK"
+            note = f", 임시 B-tree 정렬 {temp_sorts}개" if temp_sorts else ""
+            print(f"[{status}] {label} ({len(recorder.plans)}개 문장{note})")
+            for _, table, statement in scans:
+                print(f"      전체 스캔: {table} <- {' '.join(statement.split())[:160]}")
+            failures.extend(scans)
+    finally:
+        await engine.dispose()
+        sync_engine.dispose()
+    return failures
+
+
+def test_query_plans():
+    """임시 SQLite DB에서 전체 스캔 쿼리가 없는지 확인"""
+    with tempfile.TemporaryDirectory() as tmp:
+        failures = asyncio.run(run(
+            f"sqlite+aiosqlite:///{tmp}/query_plans.db",
+            f"sqlite:///{tmp}/query_plans.db",
+        ))
+    assert not failures, f"전체 스캔 쿼리 {len(failures)}건: " + ", ".join(
+        f"{label}({table})" for label, table, _ in failures
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="쿼리 플랜 회귀 테스트")
+    parser.add_argument("--database-url", default=None, help="비동기 드라이버 URL (기본: 임시 SQLite)")
+    parser.add_argument("--sync-url", default=None, help="동기 드라이버 URL (--database-url 지정 시 필수)")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("쿼리 플랜 회귀 테스트")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite+aiosqlite:///{tmp}/query_plans.db"
+        sync_url = args.sync_url or f"sqlite:///{tmp}/query_plans.db"
+        failures = asyncio.run(run(database_url, sync_url, args.verbose))
+    print("=" * 60)
+    if failures:
+        print(f"✗ 전체 스캔 {len(failures)}건")
+        sys.exit(1)
+    print(f"✓ 쿼리 {len(QUERIES)}개 모두 인덱스 사용")
@@ -147,9 +147,10 @@ export const postsAPI = {
     return response.data
   },
 
-  list: async (page: number = 1, pageSize: number = 10): Promise<PostListResponse> => {
+  list: async (page: number = 1, pageSize: number = 10, summary: boolean = false): Promise<PostListResponse> => {
+    // summary: 본문/분석 결과 없이 목록 표시용 필드만 조회
     const response = await api.get<PostListResponse>('/api/v1/posts/', {
-      params: { page, page_size: pageSize },
+      params: { page, page_size: pageSize, summary },
     })
     return response.data
   },
@@ -426,6 +427,10 @@ export const postsAPIExtended = {
     date_to?: string
     page?: number
     page_size?: number
+    cursor?: string
+    summary?: boolean
+    sort?: 'recent' | 'relevance'
+    highlight?: boolean
   }) => {
     const queryParams = new URLSearchParams()
     Object.entries(params).forEach(([key, value]) => {
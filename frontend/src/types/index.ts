@@ -196,6 +196,8 @@ export interface PostListResponse {
   page: number
   page_size: number
   total_pages: number
+  next_cursor?: string | null
+  snippets?: Record<string, string> | null
 }
 
 // Profile Types